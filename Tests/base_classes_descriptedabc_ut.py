@@ -6,8 +6,8 @@ Implements unit testing of the module base_classes concerning the class
 DescriptedABC.
 """
 
-__version__ = "0.0.1.3"
-__date__ = "23-07-2018"
+__version__ = "0.0.1.10"
+__date__ = "18-10-2026"
 __status__ = "Testing"
 
 #imports
@@ -17,11 +17,19 @@ __status__ = "Testing"
 import sys
 import unittest
 import inspect
+import collections
+import copy
+import pickle
+import cPickle
 
 #+ my libraries
 
 import pos.base_classes as testmodule
 
+from pos.utils.attr_info import FieldInfo, MethodInfo
+from pos.exceptions import CustomTypeError, NotExistingAttribute
+from pos.exceptions import PrivateAttributeAccess
+
 #helper functions
 
 def MyAbs(gValue):
@@ -256,6 +264,35 @@ class ClassTest3(ClassTest2):
         """
         super(ClassTest3, self).onInit()
 
+class ClassTest4(testmodule.DescriptedABC):
+    """
+    Sub-class of pos.base_classes.DescriptedABC with a plain class field, an
+    instance field and an instance method. Used to test the invalidation of the
+    attributes resolution tables.
+    """
+    
+    ClassValue = 1
+    
+    def onInit(self):
+        """
+        Creates a single instance attribute.
+        """
+        self.InstValue = 2
+    
+    def TestMethod(self):
+        """
+        Simply returns a string
+        """
+        return 'test_method'
+
+class ClassTest5(ClassTest4):
+    """
+    Sub-class of ClassTest4 -|> pos.base_classes.DescriptedABC without any
+    changes.
+    """
+    
+    pass
+
 #+ test cases
 
 class Test_DescriptedABC(unittest.TestCase):
@@ -272,9 +309,12 @@ class Test_DescriptedABC(unittest.TestCase):
         cls.PublicClassFields = []
         cls.PublicClassMethods = list(sorted(['getClassFields',
                                                 'getClassMethods',
-                                                'inspectClassAttribute']))
+                                                'inspectClassAttribute',
+                                                'fromMapping']))
         cls.DirList = list(sorted(cls.PublicClassMethods + cls.PublicClassFields
-                                    + ['getFields', 'getMethods']))
+                                    + ['getFields', 'getMethods',
+                                        'inspectAttribute', 'setFields',
+                                        'fastCopy', 'addFinalizer', 'close']))
     
     def test_IsAbstract(self):
         """
@@ -344,10 +384,13 @@ class Test_ClassTest1(Test_DescriptedABC):
         cls.PublicClassMethods = list(sorted(['getClassFields',
                                                 'getClassMethods',
                                                 'inspectClassAttribute',
+                                                'fromMapping',
                                                 'TestClassMethod',
                                                 'TestStaticMethod']))
         cls.DirList = list(sorted(cls.PublicClassMethods + cls.PublicClassFields
-                                    + ['getFields', 'getMethods', 'TestMethod']
+                                    + ['getFields', 'getMethods', 'TestMethod',
+                                        'inspectAttribute', 'setFields',
+                                        'fastCopy', 'addFinalizer', 'close']
                                     + [Item[0] for Item in cls.Getters]))
     
     def test_HasClassFields(self):
@@ -598,8 +641,11 @@ class Test_ClassTest2(Test_ClassTest1):
         cls.ConstantInstanceFields = ['InstConstInt']
         cls.PublicMethods = list(sorted(['getClassFields','getClassMethods',
                                         'inspectClassAttribute',
+                                        'fromMapping',
                                         'TestClassMethod', 'TestStaticMethod',
                                         'getFields', 'getMethods',
+                                        'inspectAttribute', 'setFields',
+                                        'fastCopy', 'addFinalizer', 'close',
                                         'TestMethod', 'funcAbs',
                                         'funcAbsBuiltin']))
         cls.PublicFields = list(sorted(['ClassInt', 'ClassConstFloat',
@@ -1003,7 +1049,7 @@ class Test_ClassTest2(Test_ClassTest1):
         objTest = self.TestClass()
         self.assertEqual(objTest.getClassFields(), self.PublicClassFields)
         del objTest
-
+    
     def test_getFields(self):
         """
         Checks that the instance method getFields() returns a sorted list of
@@ -1025,7 +1071,7 @@ class Test_ClassTest2(Test_ClassTest1):
         objTest = self.TestClass()
         self.assertEqual(objTest.getClassMethods(), self.PublicClassMethods)
         del objTest
-
+    
     def test_getMethods(self):
         """
         Checks that the instance method getMethods() returns a sorted list of
@@ -1078,15 +1124,627 @@ class Test_ClassTest3(Test_ClassTest2):
         with self.assertRaises(TypeError):
             self.TestClass(a = 1) #should be wrong
 
+class Test_ResolutionTable(unittest.TestCase):
+    """
+    Test cases for the attributes resolution tables of the sub-classes of the
+    class pos.base_classes.DescriptedABC - the changes made to the class
+    attributes after the class creation must be visible to the instances.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = ClassTest4
+        cls.SubClass = ClassTest5
+    
+    def test_NewClassField(self):
+        """
+        Checks that a class attribute created after the instantiation (and after
+        an attempt to read a non-existing attribute) is visible to the instances
+        of the class and its subclass, and that its deletion is also visible.
+        """
+        objTest = self.TestClass()
+        objSubTest = self.SubClass()
+        with self.assertRaises(AttributeError):
+            getattr(objTest, 'NewValue')
+        with self.assertRaises(AttributeError):
+            getattr(objSubTest, 'NewValue')
+        self.TestClass.NewValue = 3
+        self.assertEqual(objTest.NewValue, 3)
+        self.assertEqual(objSubTest.NewValue, 3)
+        del self.TestClass.NewValue
+        with self.assertRaises(AttributeError):
+            getattr(objTest, 'NewValue')
+        with self.assertRaises(AttributeError):
+            getattr(objSubTest, 'NewValue')
+        del objTest
+        del objSubTest
+    
+    def test_ChangeClassField(self):
+        """
+        Checks that a change of the value or of the kind of a class attribute
+        (plain value -> property) is visible to the instances of the class and
+        its subclass.
+        """
+        objTest = self.TestClass()
+        objSubTest = self.SubClass()
+        self.assertEqual(objSubTest.ClassValue, 1)
+        self.TestClass.ClassValue = 5
+        self.assertEqual(objTest.ClassValue, 5)
+        self.assertEqual(objSubTest.ClassValue, 5)
+        self.TestClass.ClassValue = 1
+        self.assertEqual(objTest.ClassValue, 1)
+        self.assertEqual(objSubTest.ClassValue, 1)
+        clsLocal = type('ClassLocal', (self.TestClass, ), {})
+        objLocal = clsLocal()
+        objLocalSub = type('ClassLocalSub', (clsLocal, ), {})()
+        self.assertEqual(objLocalSub.ClassValue, 1)
+        clsLocal.ClassValue = property(lambda self: 'property')
+        self.assertEqual(objLocal.ClassValue, 'property')
+        self.assertEqual(objLocalSub.ClassValue, 'property')
+        self.assertEqual(objTest.ClassValue, 1)
+        del objTest
+        del objSubTest
+        del objLocal
+        del objLocalSub
+    
+    def test_ChangeMethod(self):
+        """
+        Checks that a replacement of a method is visible to the instances of
+        the class and its subclass.
+        """
+        objTest = self.TestClass()
+        objSubTest = self.SubClass()
+        self.assertEqual(objSubTest.TestMethod(), 'test_method')
+        funcOld = self.TestClass.__dict__['TestMethod']
+        self.TestClass.TestMethod = lambda self: 'new_method'
+        self.assertEqual(objTest.TestMethod(), 'new_method')
+        self.assertEqual(objSubTest.TestMethod(), 'new_method')
+        self.TestClass.TestMethod = funcOld
+        self.assertEqual(objTest.TestMethod(), 'test_method')
+        self.assertEqual(objSubTest.TestMethod(), 'test_method')
+        del objTest
+        del objSubTest
+    
+    def test_WriteDispatch(self):
+        """
+        Checks that the assignment and deletion of the attributes via an
+        instance follow the changes of the kind of the class attributes made
+        after the class creation.
+        """
+        clsLocal = type('ClassLocal', (self.TestClass, ), {})
+        objLocal = clsLocal()
+        objOther = clsLocal()
+        objLocal.NewValue = 3
+        self.assertIn('NewValue', objLocal.__dict__)
+        with self.assertRaises(AttributeError):
+            getattr(objOther, 'NewValue')
+        clsLocal.SharedValue = 1
+        objLocal.SharedValue = 2
+        self.assertNotIn('SharedValue', objLocal.__dict__)
+        self.assertEqual(objOther.SharedValue, 2)
+        self.assertEqual(clsLocal.SharedValue, 2)
+        del objLocal.SharedValue
+        with self.assertRaises(AttributeError):
+            getattr(objOther, 'SharedValue')
+        dictStore = {}
+        def setValue(self, gValue):
+            dictStore['value'] = gValue
+        clsLocal.PropValue = property(lambda self: dictStore.get('value'),
+                                                                    setValue)
+        objLocal.PropValue = 5
+        self.assertNotIn('PropValue', objLocal.__dict__)
+        self.assertEqual(objOther.PropValue, 5)
+        with self.assertRaises(AttributeError):
+            del objLocal.PropValue
+        self.assertEqual(self.TestClass.ClassValue, 1)
+        with self.assertRaises(AttributeError):
+            getattr(self.TestClass, 'SharedValue')
+        del objLocal
+        del objOther
+    
+    def test_CachedIntrospection(self):
+        """
+        Checks that the cached introspection results of a class and of its
+        subclasses follow the changes of the class attributes, and that the
+        instance attributes are merged with the cached results.
+        """
+        clsLocal = type('ClassLocal', (self.TestClass, ), {})
+        clsLocalSub = type('ClassLocalSub', (clsLocal, ), {})
+        objTest = clsLocalSub()
+        self.assertEqual(clsLocalSub.getClassFields(), ['ClassValue'])
+        self.assertNotIn('NewValue', dir(clsLocalSub))
+        self.assertEqual(objTest.getFields(), ['ClassValue', 'InstValue'])
+        clsLocal.NewValue = 1
+        clsLocal.NewMethod = staticmethod(MyAbs)
+        self.assertEqual(clsLocalSub.getClassFields(), ['ClassValue',
+                                                                'NewValue'])
+        self.assertIn('NewMethod', clsLocalSub.getClassMethods())
+        self.assertIn('NewValue', dir(clsLocalSub))
+        self.assertIn('NewMethod', objTest.getMethods())
+        objTest.OtherValue = 2
+        objTest.OtherMethod = MyAbs
+        self.assertEqual(objTest.getFields(), ['ClassValue', 'InstValue',
+                                                    'NewValue', 'OtherValue'])
+        self.assertIn('OtherMethod', objTest.getMethods())
+        self.assertIn('OtherValue', dir(objTest))
+        del clsLocal.NewValue
+        self.assertEqual(clsLocalSub.getClassFields(), ['ClassValue'])
+        self.assertNotIn('NewValue', objTest.getFields())
+        self.assertNotIn('NewMethod', self.TestClass.getClassMethods())
+        del objTest
+    
+    def test_PlainMixin(self):
+        """
+        Checks that the direct changes of the class attributes defined in a
+        super class, which is not created by the meta-class (mix-in), are
+        visible to the instances.
+        """
+        class Mixin(object):
+            MixinValue = 1
+            def MixinMethod(self):
+                return 'mixin'
+        clsLocal = type('ClassLocal', (Mixin, self.TestClass), {})
+        objLocal = clsLocal()
+        self.assertEqual(objLocal.MixinValue, 1)
+        self.assertEqual(objLocal.MixinMethod(), 'mixin')
+        Mixin.MixinValue = 2
+        Mixin.MixinMethod = lambda self: 'changed'
+        self.assertEqual(objLocal.MixinValue, 2)
+        self.assertEqual(objLocal.MixinMethod(), 'changed')
+        Mixin.MixinValue = property(lambda self: 'property')
+        self.assertEqual(objLocal.MixinValue, 'property')
+        objLocal.setFields({'InstValue' : 3})
+        self.assertEqual(objLocal.InstValue, 3)
+        del Mixin.MixinMethod
+        with self.assertRaises(AttributeError):
+            getattr(objLocal, 'MixinMethod')
+        self.assertEqual(objLocal.ClassValue, 1)
+        del objLocal
+    
+    def test_MissesBound(self):
+        """
+        Checks that the names not found in the class are stored in its
+        resolution table only up to the bound on its size.
+        """
+        clsLocal = type('ClassLocal', (self.TestClass, ), {})
+        objLocal = clsLocal()
+        iLimit = testmodule._MAX_RESOLUTION
+        for iIndex in range(iLimit + 100):
+            with self.assertRaises(AttributeError):
+                getattr(objLocal, 'Missing{}'.format(iIndex))
+        self.assertLessEqual(len(clsLocal._dictResolution), iLimit)
+        self.assertEqual(objLocal.ClassValue, 1)
+        del objLocal
+    
+    def test_DescriptorOverride(self):
+        """
+        Checks that an assignment to an inherited data descriptor via a
+        subclass keeps the value in a side table, which does not propagate
+        upwards and propagates downwards only to the subclasses without own
+        override. The new values are checked without creation of a new
+        descriptor per assignment, and the inherited descriptor itself is not
+        changed.
+        """
+        objDescriptor = ClassTest1.__dict__['ClassInt']
+        iOldValue = ClassTest2.ClassInt
+        clsSub = type('LocalSub', (ClassTest2, ), {})
+        clsSubSub = type('LocalSubSub', (clsSub, ), {})
+        clsSub.ClassInt = 5.5
+        self.assertEqual(clsSub.ClassInt, 5)
+        self.assertEqual(clsSubSub.ClassInt, 5)
+        self.assertEqual(ClassTest2.ClassInt, iOldValue)
+        self.assertIsInstance(clsSub.__dict__['ClassInt'], IntegerDescriptor)
+        self.assertIs(type(objDescriptor), IntegerDescriptor)
+        self.assertIs(ClassTest1.__dict__['ClassInt'], objDescriptor)
+        clsPlain = type('LocalPlain', (object, ), {'ClassInt' : objDescriptor})
+        self.assertEqual(clsPlain.ClassInt, iOldValue)
+        objCopy = pickle.loads(pickle.dumps(objDescriptor))
+        self.assertIs(type(objCopy), IntegerDescriptor)
+        self.assertEqual(objCopy.Value, iOldValue)
+        clsSubSub.ClassInt = 7
+        self.assertEqual(clsSub.ClassInt, 5)
+        self.assertIsInstance(clsSubSub.__dict__['ClassInt'],
+                                                            IntegerDescriptor)
+        self.assertEqual(ClassTest2.ClassInt, iOldValue)
+        funcInit = IntegerDescriptor.__init__
+        try:
+            IntegerDescriptor.__init__ = None #must not be called
+            clsSubSub.ClassInt = 6.5
+            clsSub.ClassInt = 5
+        finally:
+            IntegerDescriptor.__init__ = funcInit
+        self.assertEqual(clsSubSub.ClassInt, 6)
+        objTest = clsSub()
+        objTest.ClassInt = 8.5
+        self.assertEqual(clsSub.ClassInt, 8)
+        self.assertEqual(objTest.ClassInt, 8)
+        self.assertEqual(clsSubSub().ClassInt, 6)
+        self.assertIs(clsSub.inspectClassAttribute('ClassInt').RealType,
+                                                            IntegerDescriptor)
+        with self.assertRaises(ValueError):
+            clsSub.ClassInt = 'a'
+        self.assertEqual(clsSub.ClassInt, 8)
+        with self.assertRaises(AttributeError):
+            clsSub.ClassConstFloat = 2
+        self.assertNotIn('ClassConstFloat', clsSub.__dict__)
+        del clsSub.ClassInt
+        self.assertEqual(objTest.ClassInt, iOldValue)
+        self.assertEqual(clsSubSub.ClassInt, 6)
+        self.assertEqual(objDescriptor.Value, iOldValue)
+        del objTest
+
+class Test_Inspection(unittest.TestCase):
+    """
+    Test cases for the class method inspectClassAttribute() and the instance
+    method inspectAttribute() of the class pos.base_classes.DescriptedABC.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = ClassTest2
+    
+    def test_ClassFields(self):
+        """
+        Checks the information on the class data fields and properties.
+        """
+        objInfo = self.TestClass.inspectClassAttribute('ClassSimpleInt')
+        self.assertIsInstance(objInfo, FieldInfo)
+        self.assertEqual(objInfo.Name, 'ClassSimpleInt')
+        self.assertIs(objInfo.RealType, int)
+        self.assertIs(objInfo.Type, int)
+        self.assertEqual(objInfo.Access, 'read-write')
+        self.assertEqual(objInfo.Scope, 'class')
+        objInfo = self.TestClass.inspectClassAttribute('ClassInt')
+        self.assertIs(objInfo.RealType, IntegerDescriptor)
+        self.assertEqual(objInfo.Scope, 'class')
+        objInfo = self.TestClass.inspectClassAttribute('RO_String')
+        self.assertIs(objInfo.RealType, property)
+        self.assertEqual(objInfo.Access, 'read-only')
+        self.assertEqual(objInfo.Scope, 'instance')
+        self.assertIsNone(objInfo.Signature)
+        objInfo = self.TestClass.inspectClassAttribute('RW_String')
+        self.assertEqual(objInfo.Access, 'read-write')
+    
+    def test_ClassMethods(self):
+        """
+        Checks the information on the methods, including the lazy extraction
+        of the signature and the reduced docstring.
+        """
+        objInfo = self.TestClass.inspectClassAttribute('getFields')
+        self.assertIsInstance(objInfo, MethodInfo)
+        self.assertEqual(objInfo.Name, 'getFields')
+        self.assertEqual(objInfo._dictParsed, {})
+        self.assertEqual(objInfo.Signature, 'None -> list(str)')
+        self.assertTrue(objInfo.DocString.startswith('Returns as a list'))
+        self.assertNotIn('Signature:', objInfo.DocString)
+        objInfo = self.TestClass.inspectClassAttribute('getClassFields')
+        self.assertIsInstance(objInfo, MethodInfo)
+        self.assertEqual(objInfo.Signature, 'None -> list(str)')
+        objInfo = self.TestClass.inspectClassAttribute('TestStaticMethod')
+        self.assertIsInstance(objInfo, MethodInfo)
+        self.assertIsNone(objInfo.Signature)
+        self.assertEqual(objInfo.DocString, 'Simply returns a string')
+    
+    def test_Cache(self):
+        """
+        Checks that the repeated inspection returns the cached object, and that
+        the cache follows the changes of the class attributes.
+        """
+        clsLocal = type('ClassLocal', (self.TestClass, ), {})
+        objInfo = clsLocal.inspectClassAttribute('ClassSimpleInt')
+        self.assertIs(clsLocal.inspectClassAttribute('ClassSimpleInt'),
+                                                                    objInfo)
+        clsLocal.ClassSimpleInt = 'test'
+        objNewInfo = clsLocal.inspectClassAttribute('ClassSimpleInt')
+        self.assertIsNot(objNewInfo, objInfo)
+        self.assertIs(objNewInfo.RealType, str)
+        self.assertIs(self.TestClass.inspectClassAttribute(
+                                            'ClassSimpleInt').RealType, int)
+    
+    def test_Instance(self):
+        """
+        Checks the information on the instance attributes and the class
+        attributes inspected via an instance.
+        """
+        objTest = self.TestClass()
+        objInfo = objTest.inspectAttribute('SimpleInt')
+        self.assertIsInstance(objInfo, FieldInfo)
+        self.assertIs(objInfo.RealType, int)
+        self.assertEqual(objInfo.Scope, 'instance')
+        objInfo = objTest.inspectAttribute('InstFloat')
+        self.assertIs(objInfo.RealType, FloatDescriptor)
+        objInfo = objTest.inspectAttribute('funcAbs')
+        self.assertIsInstance(objInfo, MethodInfo)
+        self.assertEqual(objInfo.DocString, 'Alias for abs() built-in function')
+        self.assertIs(objTest.inspectAttribute('ClassInt'),
+                            self.TestClass.inspectClassAttribute('ClassInt'))
+        del objTest
+    
+    def test_Errors(self):
+        """
+        Checks the exceptions raised upon inspection of the non-existing and
+        'private' attributes, and with improper argument.
+        """
+        objTest = self.TestClass()
+        for objTarget in (self.TestClass.inspectClassAttribute,
+                                                    objTest.inspectAttribute):
+            with self.assertRaises(NotExistingAttribute):
+                objTarget('NotExisting')
+            with self.assertRaises(PrivateAttributeAccess):
+                objTarget('_string1')
+            with self.assertRaises(CustomTypeError):
+                objTarget(1)
+        with self.assertRaises(NotExistingAttribute):
+            self.TestClass.inspectClassAttribute('SimpleInt')
+        del objTest
+
+class Test_Instrumentation(unittest.TestCase):
+    """
+    Test cases for the opt-in instrumentation of the attribute access of the
+    DescriptedABC sub-classes.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case: a local sub-class to be changed.
+        """
+        self.TestClass = type('LocalTest', (ClassTest2, ), {})
+        testmodule.resetAccessCounters()
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case: the instrumentation is switched off.
+        """
+        testmodule.disableInstrumentation()
+        testmodule.resetAccessCounters()
+    
+    def test_Switch(self):
+        """
+        Checks that the instrumented methods are swapped in and the original
+        methods are put back, and that nothing is counted when switched off.
+        """
+        funcOriginal = testmodule.DescriptedABC.__dict__['__getattribute__']
+        self.assertFalse(testmodule.isInstrumented())
+        testmodule.enableInstrumentation()
+        testmodule.enableInstrumentation()
+        self.assertTrue(testmodule.isInstrumented())
+        self.assertIsNot(testmodule.DescriptedABC.__dict__['__getattribute__'],
+                                                                funcOriginal)
+        testmodule.disableInstrumentation()
+        testmodule.disableInstrumentation()
+        self.assertFalse(testmodule.isInstrumented())
+        self.assertIs(testmodule.DescriptedABC.__dict__['__getattribute__'],
+                                                                funcOriginal)
+        objTest = self.TestClass()
+        self.assertEqual(objTest.SimpleInt, 5)
+        objTest.SimpleInt = 1
+        self.TestClass.ClassSimpleInt = 3
+        self.assertEqual(testmodule.getAccessCounters(), {})
+        del objTest
+    
+    def test_Counters(self):
+        """
+        Checks the counting of the access per attribute, operation and path,
+        as well as the snapshot and reset.
+        """
+        clsTest = self.TestClass
+        testmodule.enableInstrumentation()
+        objTest = clsTest()
+        testmodule.resetAccessCounters()
+        for _ in range(3):
+            self.assertEqual(objTest.SimpleInt, 5)
+        self.assertEqual(objTest.RW_String, 'test_rw')
+        objTest.RW_String = 'test'
+        self.assertEqual(objTest.ClassSimpleInt, 2)
+        self.assertEqual(objTest.TestMethod(), 'test_method')
+        objTest.NewValue = 1
+        del objTest.NewValue
+        clsTest.ClassInt = 3.5
+        clsTest.ClassInt = 4.5
+        self.assertEqual(objTest.ClassInt, 4)
+        clsTest.ClassSimpleInt = 1
+        dictCounters = testmodule.getAccessCounters()
+        self.assertEqual(dictCounters[(clsTest, 'SimpleInt', 'read',
+                                                        'instance dict')], 3)
+        self.assertEqual(dictCounters[(clsTest, 'RW_String', 'read',
+                                                            'property')], 1)
+        self.assertEqual(dictCounters[(clsTest, 'RW_String', 'write',
+                                                            'property')], 1)
+        self.assertEqual(dictCounters[(clsTest, 'ClassSimpleInt', 'read',
+                                                        'class field')], 1)
+        self.assertEqual(dictCounters[(clsTest, 'TestMethod', 'read',
+                                                            'method')], 1)
+        self.assertEqual(dictCounters[(clsTest, 'NewValue', 'write',
+                                                        'instance dict')], 1)
+        self.assertEqual(dictCounters[(clsTest, 'NewValue', 'delete',
+                                                        'instance dict')], 1)
+        self.assertEqual(dictCounters[(clsTest, 'ClassInt', 'class write',
+                                                            'copy-down')], 1)
+        self.assertEqual(dictCounters[(clsTest, 'ClassInt', 'class write',
+                                                    'data descriptor')], 1)
+        self.assertEqual(dictCounters[(clsTest, 'ClassInt', 'read',
+                                                    'data descriptor')], 1)
+        self.assertEqual(dictCounters[(clsTest, 'ClassSimpleInt',
+                                            'class write', 'class field')], 1)
+        objTest.SimpleInt
+        self.assertEqual(dictCounters[(clsTest, 'SimpleInt', 'read',
+                                                        'instance dict')], 3)
+        testmodule.resetAccessCounters()
+        self.assertEqual(testmodule.getAccessCounters(), {})
+        self.assertNotEqual(dictCounters, {}) #snapshot is a copy
+        testmodule.disableInstrumentation()
+        del objTest
+
+class Test_BulkAssignment(unittest.TestCase):
+    """
+    Test cases for the bulk assignment of the attributes via the methods
+    setFields() and fromMapping() of the DescriptedABC sub-classes.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case: local sub-classes to be changed.
+        """
+        self.TestClass = type('LocalTest', (ClassTest2, ), {})
+        self.OtherClass = type('LocalOther', (ClassTest2, ), {})
+    
+    def test_SameAsSequential(self):
+        """
+        Checks that the bulk assignment has the same effect as the assignment
+        of the attributes one by one.
+        """
+        dictValues = {'InstFloat' : 2, 'SimpleInt' : 7, 'RW_String' : 'new',
+                        'ClassSimpleInt' : 3, 'ClassInt' : 4.5, 'NewValue' : 1}
+        objBatch = self.TestClass()
+        objBatch.setFields(dictValues)
+        objSequential = self.OtherClass()
+        for strAttr, gValue in dictValues.items():
+            setattr(objSequential, strAttr, gValue)
+        for strAttr in dictValues:
+            self.assertEqual(getattr(objBatch, strAttr),
+                                            getattr(objSequential, strAttr))
+        self.assertIsInstance(objBatch.InstFloat, float)
+        self.assertEqual(objBatch.ClassInt, 4)
+        self.assertEqual(self.TestClass.ClassSimpleInt, 3)
+        self.assertEqual(ClassTest2.ClassSimpleInt, 2)
+        self.assertIn('ClassInt', self.TestClass.__dict__) #copied down
+        self.assertEqual(objBatch._string1, 'new')
+        self.assertIn('NewValue', objBatch.getFields())
+        del objBatch
+        del objSequential
+    
+    def test_Errors(self):
+        """
+        Checks that the improper assignments raise the same exceptions as the
+        sequential assignment, and that the preceding assignments are kept.
+        """
+        objTest = self.TestClass()
+        with self.assertRaises(CustomTypeError):
+            objTest.setFields([('SimpleInt', 1)])
+        with self.assertRaises(AttributeError):
+            objTest.setFields({'RO_String' : 'test'})
+        with self.assertRaises(AttributeError):
+            objTest.setFields({'InstConstInt' : 1})
+        with self.assertRaises(AttributeError):
+            objTest.setFields(collections.OrderedDict([('SimpleInt', 1),
+                                                        ('ClassConstFloat', 1)]))
+        self.assertEqual(objTest.SimpleInt, 1)
+        self.assertEqual(objTest.InstConstInt, 4)
+        del objTest
+    
+    def test_FromMapping(self):
+        """
+        Checks the creation of an instance from a mapping.
+        """
+        objTest = self.TestClass.fromMapping({'SimpleInt' : 8})
+        self.assertIsInstance(objTest, self.TestClass)
+        self.assertEqual(objTest.SimpleInt, 8)
+        self.assertEqual(objTest.InstFloat, 3.0)
+        with self.assertRaises(CustomTypeError):
+            self.TestClass.fromMapping(1)
+        with self.assertRaises(TypeError):
+            ClassTest1.fromMapping({}) #abstract class
+        del objTest
+
+class Test_PickleCopy(unittest.TestCase):
+    """
+    Test cases for the pickling and copying protocol of the DescriptedABC
+    sub-classes.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case: an instance with changed attributes.
+        """
+        self.TestObject = ClassTest2()
+        self.TestObject.SimpleInt = 7
+        self.TestObject.InstFloat = 1.5
+        self.TestObject.RW_String = 'changed'
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case.
+        """
+        del self.TestObject
+    
+    def checkCopy(self, objCopy):
+        """
+        Helper method to check that the copy has the same values of the
+        attributes as the original object, but is independent of it.
+        """
+        self.assertIsInstance(objCopy, ClassTest2)
+        self.assertIsNot(objCopy, self.TestObject)
+        self.assertEqual(objCopy.SimpleInt, 7)
+        self.assertEqual(objCopy.InstFloat, 1.5)
+        self.assertEqual(objCopy.InstConstInt, 4)
+        self.assertEqual(objCopy.RW_String, 'changed')
+        self.assertEqual(objCopy.RWD_String, 'test_rwd')
+        self.assertEqual(objCopy.getFields(), self.TestObject.getFields())
+        objCopy.InstFloat = 2
+        objCopy.SimpleInt = 8
+        self.assertEqual(self.TestObject.InstFloat, 1.5)
+        self.assertEqual(self.TestObject.SimpleInt, 7)
+        with self.assertRaises(AttributeError):
+            objCopy.InstConstInt = 1
+    
+    def test_GetState(self):
+        """
+        Checks the state of an instance, which is taken directly from the
+        __dict__ without calls of the __get__() methods of the descriptors.
+        """
+        dictState, dictSlots = self.TestObject.__getstate__()
+        self.assertIsNone(dictSlots)
+        self.assertEqual(dictState['SimpleInt'], 7)
+        self.assertIsInstance(dictState['InstFloat'], FloatDescriptor)
+        self.assertIsInstance(dictState['InstConstInt'],
+                                                        ConstIntegerDescriptor)
+    
+    def test_Pickle(self):
+        """
+        Checks the round trip of an instance via pickle and cPickle with all
+        protocols.
+        """
+        for objModule in (pickle, cPickle):
+            for iProtocol in range(3):
+                strData = objModule.dumps(self.TestObject, iProtocol)
+                self.checkCopy(objModule.loads(strData))
+        lstData = cPickle.loads(cPickle.dumps([self.TestObject] * 2, 2))
+        self.assertIs(lstData[0], lstData[1])
+    
+    def test_Copy(self):
+        """
+        Checks the shallow copy via fastCopy() and copy.copy() and the deep
+        copy via copy.deepcopy().
+        """
+        for funcCopy in (lambda objTest: objTest.fastCopy(), copy.copy,
+                                                                copy.deepcopy):
+            self.checkCopy(funcCopy(self.TestObject))
+        objCopy = self.TestObject.fastCopy()
+        self.assertIs(objCopy.funcAbs, self.TestObject.funcAbs)
+        del objCopy
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_DescriptedABC)
 TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_ClassTest1)
 TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_ClassTest2)
 TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_ClassTest3)
+TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolutionTable)
+TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_Inspection)
+TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(Test_Instrumentation)
+TestSuite8 = unittest.TestLoader().loadTestsFromTestCase(Test_BulkAssignment)
+TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(Test_PickleCopy)
 
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4])
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4,
+                    TestSuite5, TestSuite6, TestSuite7, TestSuite8,
+                    TestSuite9])
 
 if __name__ == "__main__":
     sys.stdout.write("Conducting pos.base_classes.DescriptedABC tests...\n")
@@ -0,0 +1,284 @@
+#usr/bin/python
+"""
+Module pos.tests.base_classes_descriptedslotsabc_ut
+
+Implements unit testing of the module base_classes concerning the class
+DescriptedSlotsABC.
+"""
+
+__version__ = "0.0.1.3"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import unittest
+import copy
+import cPickle
+
+#+ my libraries
+
+import pos.base_classes as testmodule
+
+from pos.Tests.base_classes_descriptedabc_ut import IntegerDescriptor
+from pos.Tests.base_classes_descriptedabc_ut import ConstIntegerDescriptor
+
+#classes
+
+#+ helper classes
+
+class SlotsTest1(testmodule.DescriptedSlotsABC):
+    """
+    Non-abstract sub-class of pos.base_classes.DescriptedSlotsABC. Defines
+    two instance fields, a class field, a property and a method.
+    """
+    
+    #class fields
+    
+    _Fields = ('First', 'Second')
+    
+    ClassValue = 1
+    
+    #properties
+    
+    @property
+    def RO_Sum(self):
+        """
+        Read only property, returns the sum of the both fields
+        """
+        return self.First + self.Second
+    
+    #special methods
+    
+    def onInit(self, First = 1, Second = 2):
+        """
+        Assigns the initial values of the fields
+        """
+        self.First = First
+        self.Second = Second
+    
+    #public methods
+    
+    def TestMethod(self):
+        """
+        Simply returns a string
+        """
+        return 'test_method'
+
+class SlotsTest2(SlotsTest1):
+    """
+    Sub-class of SlotsTest1, which adds one more field, which stores a data
+    descriptor, and re-declares an inherited field.
+    """
+    
+    #class fields
+    
+    _Fields = ('Second', 'Third')
+    
+    #special methods
+    
+    def onInit(self, First = 1, Second = 2):
+        """
+        Assigns the initial values of the fields, including the data descriptor
+        """
+        super(SlotsTest2, self).onInit(First, Second)
+        self.Third = IntegerDescriptor(3.5)
+
+class SlotsTest3(SlotsTest1):
+    """
+    Sub-class of SlotsTest1 without own fields table. One of the fields stores
+    a constant data descriptor.
+    """
+    
+    #special methods
+    
+    def onInit(self):
+        """
+        Assigns the initial values of the fields, one of them is 'constant'
+        """
+        self.First = ConstIntegerDescriptor(1)
+
+#+ test cases
+
+class Test_DescriptedSlotsABC(unittest.TestCase):
+    """
+    Test cases for the class pos.base_classes.DescriptedSlotsABC
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = SlotsTest1
+        cls.SubClass = SlotsTest2
+    
+    def test_NoDict(self):
+        """
+        Checks that the instances do not have __dict__, and that the slots are
+        derived from the fields tables without duplicates.
+        """
+        objTest = self.TestClass()
+        with self.assertRaises(AttributeError):
+            getattr(objTest, '__dict__')
+        with self.assertRaises(AttributeError):
+            objTest.NewValue = 1
+        self.assertEqual(self.TestClass.__slots__, ('First', 'Second'))
+        self.assertEqual(self.SubClass.__slots__, ('Third', ))
+        self.assertEqual(SlotsTest3.__slots__, ())
+        objTest = SlotsTest3()
+        with self.assertRaises(AttributeError):
+            getattr(objTest, '__dict__')
+        del objTest
+    
+    def test_GetSet(self):
+        """
+        Checks the read and write access to the fields, class field, property
+        and method.
+        """
+        objTest = self.TestClass(3, 4)
+        self.assertEqual(objTest.First, 3)
+        self.assertEqual(objTest.Second, 4)
+        self.assertEqual(objTest.RO_Sum, 7)
+        self.assertEqual(objTest.ClassValue, 1)
+        self.assertEqual(objTest.TestMethod(), 'test_method')
+        objTest.First = 5
+        self.assertEqual(objTest.RO_Sum, 9)
+        with self.assertRaises(AttributeError):
+            objTest.RO_Sum = 1
+        with self.assertRaises(AttributeError):
+            getattr(objTest, 'Unknown')
+        del objTest.Second
+        with self.assertRaises(AttributeError):
+            getattr(objTest, 'Second')
+        with self.assertRaises(AttributeError):
+            del objTest.Second
+        objTest.Second = 1
+        self.assertEqual(objTest.Second, 1)
+        del objTest
+    
+    def test_ClassField(self):
+        """
+        Checks that an assignment to a class field via an instance changes the
+        class field, as in the case of DescriptedABC.
+        """
+        clsLocal = type('SlotsLocal', (self.TestClass, ), {})
+        objTest = clsLocal()
+        objOther = clsLocal()
+        objTest.ClassValue = 2
+        self.assertEqual(objOther.ClassValue, 2)
+        self.assertEqual(self.TestClass.ClassValue, 1)
+        del objTest
+        del objOther
+    
+    def test_Descriptors(self):
+        """
+        Checks that the data descriptors stored in the slots are accessed via
+        their __get__(), __set__() and __delete__() methods.
+        """
+        objTest = self.SubClass()
+        self.assertEqual(objTest.Third, 3)
+        objTest.Third = 4.5
+        self.assertEqual(objTest.Third, 4)
+        self.assertIsInstance(self.SubClass.Third.__get__(objTest,
+                                        self.SubClass), IntegerDescriptor)
+        objTest = SlotsTest3()
+        self.assertEqual(objTest.First, 1)
+        with self.assertRaises(AttributeError):
+            objTest.First = 2
+        with self.assertRaises(AttributeError):
+            del objTest.First
+        self.assertEqual(objTest.First, 1)
+        del objTest
+    
+    def test_Introspection(self):
+        """
+        Checks the introspection methods: the slots are instance fields, the
+        empty slots are ignored.
+        """
+        self.assertEqual(self.TestClass.getClassFields(), ['ClassValue'])
+        self.assertNotIn('First', dir(self.TestClass))
+        objTest = self.SubClass()
+        self.assertEqual(objTest.getFields(), ['ClassValue', 'First',
+                                                'RO_Sum', 'Second', 'Third'])
+        self.assertIn('TestMethod', objTest.getMethods())
+        self.assertNotIn('onInit', objTest.getMethods())
+        del objTest.First
+        self.assertNotIn('First', objTest.getFields())
+        self.assertNotIn('First', dir(objTest))
+        self.assertIn('Third', dir(objTest))
+        objTest.First = len
+        self.assertIn('First', objTest.getMethods())
+        self.assertNotIn('First', objTest.getFields())
+        objInfo = objTest.inspectAttribute('Second')
+        self.assertIs(objInfo.RealType, int)
+        self.assertEqual(objInfo.Scope, 'instance')
+        self.assertEqual(self.SubClass.inspectClassAttribute('Third').Scope,
+                                                                    'instance')
+        del objTest.Second
+        with self.assertRaises(AttributeError):
+            objTest.inspectAttribute('Second')
+        del objTest
+    
+    def test_SetFields(self):
+        """
+        Checks the bulk assignment of the fields via the methods setFields()
+        and fromMapping().
+        """
+        objTest = self.SubClass.fromMapping({'First' : 5, 'Third' : 7.5})
+        self.assertEqual(objTest.First, 5)
+        self.assertEqual(objTest.Second, 2)
+        self.assertEqual(objTest.Third, 7) #via the data descriptor
+        del objTest.Second
+        objTest.setFields({'Second' : 3, 'First' : 4})
+        self.assertEqual(objTest.RO_Sum, 7)
+        with self.assertRaises(AttributeError):
+            objTest.setFields({'NewValue' : 1})
+        with self.assertRaises(AttributeError):
+            objTest.setFields({'RO_Sum' : 1})
+        with self.assertRaises(testmodule.CustomTypeError):
+            objTest.setFields(None)
+        del objTest
+    
+    def test_PickleCopy(self):
+        """
+        Checks the pickling and copying of the instances: the empty slots
+        remain empty, the data descriptors stored in the slots are restored.
+        """
+        objTest = self.SubClass(5)
+        del objTest.Second
+        for funcCopy in (lambda objTest: cPickle.loads(cPickle.dumps(objTest,
+                                                    2)), copy.copy,
+                            copy.deepcopy, lambda objTest: objTest.fastCopy()):
+            objCopy = funcCopy(objTest)
+            self.assertIsInstance(objCopy, self.SubClass)
+            self.assertEqual(objCopy.First, 5)
+            self.assertEqual(objCopy.Third, 3)
+            with self.assertRaises(AttributeError):
+                getattr(objCopy, 'Second')
+            objCopy.Third = 7
+            self.assertEqual(objTest.Third, 3)
+            del objCopy
+        dictState, dictSlots = objTest.__getstate__()
+        self.assertIsNone(dictState)
+        self.assertEqual(list(sorted(dictSlots.keys())), ['First', 'Third'])
+        with self.assertRaises(testmodule.NotExistingAttribute):
+            objTest.__setstate__((None, {'Unknown' : 1}))
+        del objTest
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_DescriptedSlotsABC)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+if __name__ == "__main__":
+    sys.stdout.write(
+                "Conducting pos.base_classes.DescriptedSlotsABC tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
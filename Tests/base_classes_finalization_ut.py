@@ -0,0 +1,281 @@
+#usr/bin/python
+"""
+Module pos.Tests.base_classes_finalization_ut
+
+Implements unit testing of the module base_classes concerning the garbage
+collection and finalization of the instances of DescriptedABC and
+DescriptedSlotsABC sub-classes: the reference cycles must be collectable, and
+the memory usage must not grow upon repeated creation of such cycles.
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import gc
+import weakref
+import unittest
+
+try:
+    import resource
+except ImportError: #not a Unix platform
+    resource = None
+
+#+ my libraries
+
+import pos.base_classes as testmodule
+
+from pos.Tests.base_classes_descriptedabc_ut import IntegerDescriptor
+from pos.Tests.base_classes_descriptedabc_ut import ConstIntegerDescriptor
+
+#globals
+
+CYCLES = 1000 #number of the reference cycles created per iteration
+
+ITERATIONS = 20 #number of the iterations in the memory usage test
+
+MAX_GROWTH = 4096 #allowed growth of the max RSS, in kB
+
+#classes
+
+#+ helper classes
+
+class DictNode(testmodule.DescriptedABC):
+    """
+    Node of a graph with the fields stored in the instance __dict__, one of
+    them is a data descriptor.
+    """
+    
+    def onInit(self, Value = 1):
+        """
+        Assigns the initial values of the fields
+        """
+        self.Peer = None
+        self.Value = IntegerDescriptor(Value)
+        self.Const = ConstIntegerDescriptor(Value)
+        self.Payload = [Value] * 10
+
+class SlotsNode(testmodule.DescriptedSlotsABC):
+    """
+    Node of a graph with the fields stored in the slots, one of them is a data
+    descriptor.
+    """
+    
+    _Fields = ('Peer', 'Value', 'Const', 'Payload')
+    
+    def onInit(self, Value = 1):
+        """
+        Assigns the initial values of the fields
+        """
+        self.Peer = None
+        self.Value = IntegerDescriptor(Value)
+        self.Const = ConstIntegerDescriptor(Value)
+        self.Payload = [Value] * 10
+
+class EqualDictNode(DictNode):
+    """
+    Node, which instances are all equal to each other and have the same hash.
+    """
+    
+    def __eq__(self, gOther):
+        """
+        Any two nodes are equal.
+        """
+        return isinstance(gOther, DictNode)
+    
+    def __ne__(self, gOther):
+        """
+        Any two nodes are equal.
+        """
+        return not self.__eq__(gOther)
+    
+    def __hash__(self):
+        """
+        Same hash for all nodes.
+        """
+        return 1
+
+class UnhashableSlotsNode(SlotsNode):
+    """
+    Node, which instances are unhashable.
+    """
+    
+    __hash__ = None
+
+#+ helper functions
+
+def buildCycles(clsNode, iNumber):
+    """
+    Creates the specified number of the reference cycles of three nodes each,
+    and returns the weak references to the first node of each cycle. The
+    nodes themselves are not referenced after the return.
+    
+    Signature:
+        class DescriptedABC, int -> list(weakref.ref)
+    """
+    lstRefs = []
+    for iIndex in xrange(iNumber):
+        objFirst = clsNode(iIndex)
+        objSecond = clsNode(iIndex)
+        objThird = clsNode(iIndex)
+        objFirst.Peer = objSecond
+        objSecond.Peer = objThird
+        objThird.Peer = objFirst
+        lstRefs.append(weakref.ref(objFirst))
+    return lstRefs
+
+def getMaxRSS():
+    """
+    Returns the peak resident set size of the process in kB (Linux) or bytes
+    (Mac OS).
+    
+    Signature:
+        None -> int
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+#+ test cases
+
+class Test_Finalization(unittest.TestCase):
+    """
+    Test cases for the garbage collection and finalization of the instances
+    of pos.base_classes.DescriptedABC and DescriptedSlotsABC sub-classes.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClasses = (DictNode, SlotsNode)
+    
+    def setUp(self):
+        """
+        Preparation for each test case: a full garbage collection.
+        """
+        gc.collect()
+        self.Garbage = len(gc.garbage)
+    
+    def test_NoDel(self):
+        """
+        Checks that the classes do not define __del__() method, which makes
+        the reference cycles uncollectable.
+        """
+        for clsTest in self.TestClasses:
+            self.assertFalse(hasattr(clsTest, '__del__'))
+    
+    def test_Cycles(self):
+        """
+        Checks that the reference cycles of the instances are collected, and
+        nothing is put into gc.garbage.
+        """
+        for clsTest in self.TestClasses:
+            lstRefs = buildCycles(clsTest, CYCLES)
+            gc.collect()
+            self.assertEqual(len(gc.garbage), self.Garbage)
+            self.assertTrue(all(objRef() is None for objRef in lstRefs))
+    
+    @unittest.skipIf(resource is None, 'resource module is not available')
+    def test_Memory(self):
+        """
+        Checks that the peak memory usage does not grow upon repeated creation
+        and collection of the reference cycles.
+        """
+        for clsTest in self.TestClasses:
+            buildCycles(clsTest, CYCLES)
+        gc.collect()
+        iStart = getMaxRSS()
+        for _ in xrange(ITERATIONS):
+            for clsTest in self.TestClasses:
+                buildCycles(clsTest, CYCLES)
+            gc.collect()
+        self.assertEqual(len(gc.garbage), self.Garbage)
+        self.assertLess(getMaxRSS() - iStart, MAX_GROWTH)
+    
+    def test_Finalizers(self):
+        """
+        Checks that the registered finalizers are called once - either upon
+        collection of the instance or upon the call of the method close().
+        """
+        lstCalls = []
+        funcRecord = lambda gValue: lstCalls.append(gValue)
+        for clsTest in self.TestClasses:
+            del lstCalls[:]
+            lstRefs = buildCycles(clsTest, 2)
+            objFirst = lstRefs[0]()
+            objSecond = lstRefs[1]()
+            objFirst.addFinalizer(funcRecord, 'first')
+            objSecond.addFinalizer(funcRecord, 'second')
+            objSecond.addFinalizer(funcRecord, gValue = 'second-2')
+            del objFirst
+            gc.collect()
+            self.assertEqual(lstCalls, ['first'])
+            objSecond.close()
+            self.assertEqual(lstCalls, ['first', 'second-2', 'second'])
+            objSecond.close()
+            del objSecond
+            gc.collect()
+            self.assertEqual(len(lstCalls), 3)
+            self.assertEqual(len(gc.garbage), self.Garbage)
+    
+    def test_Identity(self):
+        """
+        Checks that the finalizers are registered per identity of the
+        instance, regardless of its equality and hash.
+        """
+        lstCalls = []
+        funcRecord = lambda gValue: lstCalls.append(gValue)
+        for clsTest in (EqualDictNode, UnhashableSlotsNode):
+            del lstCalls[:]
+            objFirst = clsTest(1)
+            objSecond = clsTest(2)
+            objFirst.addFinalizer(funcRecord, 'first')
+            objSecond.addFinalizer(funcRecord, 'second')
+            objFirst.close()
+            self.assertEqual(lstCalls, ['first'])
+            objFirst.addFinalizer(funcRecord, 'first-2')
+            del objSecond
+            gc.collect()
+            self.assertEqual(lstCalls, ['first', 'second'])
+            iFirst = id(objFirst)
+            del objFirst
+            gc.collect()
+            self.assertEqual(lstCalls, ['first', 'second', 'first-2'])
+            self.assertNotIn(iFirst, testmodule._dictInstanceFinalizers)
+    
+    def test_Close(self):
+        """
+        Checks that the method close() removes all instance attributes,
+        including the 'constant' data descriptors, and that the instance
+        remains usable. Also checks the improper finalizer.
+        """
+        for clsTest in self.TestClasses:
+            objTest = clsTest(2)
+            objTest.close()
+            self.assertEqual(objTest.getFields(), [])
+            with self.assertRaises(AttributeError):
+                getattr(objTest, 'Const')
+            objTest.Value = 3
+            self.assertEqual(objTest.Value, 3)
+            with self.assertRaises(testmodule.CustomTypeError):
+                objTest.addFinalizer(1)
+            objTest.close()
+            del objTest
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Finalization)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+if __name__ == "__main__":
+    sys.stdout.write(
+                "Conducting pos.base_classes finalization tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
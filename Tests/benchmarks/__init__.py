@@ -0,0 +1,11 @@
+#usr/bin/python
+"""
+Package pos.Tests.benchmarks
+
+Performance benchmarks (memory footprint and execution time) for the
+implemented modules; not included into the unit tests aggregation.
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
\ No newline at end of file
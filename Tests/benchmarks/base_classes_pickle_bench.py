@@ -0,0 +1,126 @@
+#usr/bin/python
+"""
+Module pos.Tests.benchmarks.base_classes_pickle_bench
+
+Benchmark of the round trip through pickle protocol 2 and of the copying of
+the instances of the classes derived from pos.base_classes.DescriptedABC and
+pos.base_classes.DescriptedSlotsABC. A plain new-style class with the same
+fields is used as the reference.
+
+Usage:
+    python base_classes_pickle_bench.py [NUMBER_OF_OBJECTS]
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import gc
+import time
+import copy
+import cPickle
+
+#+ my libraries
+
+from pos.Tests.benchmarks.base_classes_slots_bench import DictRecord
+from pos.Tests.benchmarks.base_classes_slots_bench import SlotsRecord
+
+#globals
+
+ITERATIONS = 1000000 #default number of the objects to round trip
+
+#classes
+
+#+ reference class
+
+class PlainRecord(object):
+    """
+    Plain new-style class with the same three fields, pickled by the default
+    protocol of object.
+    """
+    
+    def __init__(self, X = 0, Y = 0.0, Name = ''):
+        """
+        Assigns the initial values of the fields.
+        """
+        self.X = X
+        self.Y = Y
+        self.Name = Name
+
+#functions
+
+def benchmarkClass(clsRecord, iNumber):
+    """
+    Measures the time required to pickle (protocol 2) and unpickle a list of
+    the specified number of instances, as well as to make shallow and deep
+    copies of an instance the specified number of times divided by 10.
+    
+    Signature:
+        class A, int -> tuple(float, float, float, float)
+    
+    Args:
+        clsRecord: class A, the benchmarked class
+        iNumber: int, number of the objects to pickle / unpickle
+    
+    Version 0.0.1.0
+    """
+    lstRecords = [clsRecord(i, 2.0, 'test') for i in xrange(iNumber)]
+    gc.collect()
+    fStart = time.clock()
+    strData = cPickle.dumps(lstRecords, 2)
+    fDump = time.clock() - fStart
+    fStart = time.clock()
+    lstCopy = cPickle.loads(strData)
+    fLoad = time.clock() - fStart
+    if lstCopy[-1].X != iNumber - 1:
+        raise ValueError('Round trip failed')
+    del lstCopy
+    del strData
+    objRecord = lstRecords[0]
+    iCopies = max(iNumber // 10, 1)
+    fStart = time.clock()
+    for _ in xrange(iCopies):
+        copy.copy(objRecord)
+    fCopy = time.clock() - fStart
+    fStart = time.clock()
+    for _ in xrange(iCopies):
+        copy.deepcopy(objRecord)
+    fDeepCopy = time.clock() - fStart
+    del lstRecords
+    gc.collect()
+    return (fDump, fLoad, fCopy * 10, fDeepCopy * 10)
+
+def main(iNumber):
+    """
+    Runs the benchmark for all classes and prints out the results.
+    
+    Signature:
+        int -> None
+    
+    Args:
+        iNumber: int, number of the objects to pickle / unpickle
+    
+    Version 0.0.1.0
+    """
+    sys.stdout.write('{} objects, pickle protocol 2\n'.format(iNumber))
+    sys.stdout.write('{:<12} {:>10} {:>10} {:>10} {:>10}\n'.format('Class',
+                                'Dump, us', 'Load, us', 'Copy, us',
+                                'Deep, us'))
+    for clsRecord in (PlainRecord, DictRecord, SlotsRecord):
+        tupResult = benchmarkClass(clsRecord, iNumber)
+        fScale = 1.0E6 / iNumber
+        sys.stdout.write('{:<12} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f}\n'.format(
+                            clsRecord.__name__,
+                            *[fTime * fScale for fTime in tupResult]))
+        sys.stdout.flush()
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main(ITERATIONS)
@@ -0,0 +1,139 @@
+#usr/bin/python
+"""
+Module pos.Tests.benchmarks.base_classes_slots_bench
+
+Benchmark of the per-instance memory footprint and of the instantiation time
+of the classes derived from pos.base_classes.DescriptedABC (instances with
+__dict__) and pos.base_classes.DescriptedSlotsABC (instances with slots).
+
+Usage:
+    python base_classes_slots_bench.py [NUMBER_OF_INSTANCES]
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import gc
+import timeit
+
+#+ my libraries
+
+from pos.base_classes import DescriptedABC, DescriptedSlotsABC
+
+#globals
+
+ITERATIONS = 100000 #default number of the instances to create
+
+#classes
+
+#+ benchmarked classes
+
+class DictRecord(DescriptedABC):
+    """
+    Record with three fields stored in the __dict__ of the instance.
+    """
+    
+    def onInit(self, X = 0, Y = 0.0, Name = ''):
+        """
+        Assigns the initial values of the fields.
+        """
+        self.X = X
+        self.Y = Y
+        self.Name = Name
+
+class SlotsRecord(DescriptedSlotsABC):
+    """
+    Record with three fields stored in the slots of the instance.
+    """
+    
+    _Fields = ('X', 'Y', 'Name')
+    
+    def onInit(self, X = 0, Y = 0.0, Name = ''):
+        """
+        Assigns the initial values of the fields.
+        """
+        self.X = X
+        self.Y = Y
+        self.Name = Name
+
+#functions
+
+def getInstanceSize(objInstance):
+    """
+    Calculates the memory footprint of an instance in bytes: the size of the
+    object itself plus the size of its __dict__ (if present). The values of
+    the fields are not included, since they may be shared.
+    
+    Signature:
+        DescriptedABC -> int
+    
+    Args:
+        objInstance: DescriptedABC, instance of the benchmarked class
+    
+    Version 0.0.1.0
+    """
+    iResult = sys.getsizeof(objInstance)
+    if type(objInstance).__dictoffset__: #has __dict__
+        iResult += sys.getsizeof(object.__getattribute__(objInstance,
+                                                                '__dict__'))
+    return iResult
+
+def benchmarkClass(clsRecord, iNumber):
+    """
+    Measures the per-instance memory footprint, the time required to create
+    the specified number of instances, and the time of the read and write
+    access to a field.
+    
+    Signature:
+        class DescriptedABC, int -> tuple(int, float, float, float)
+    
+    Args:
+        clsRecord: class DescriptedABC, the benchmarked class
+        iNumber: int, number of the instances to create / accesses to perform
+    
+    Version 0.0.1.0
+    """
+    objRecord = clsRecord(1, 2.0, 'test')
+    iSize = getInstanceSize(objRecord)
+    gc.collect()
+    fCreate = timeit.timeit(lambda : clsRecord(1, 2.0, 'test'),
+                                                            number = iNumber)
+    fRead = timeit.timeit(lambda : objRecord.X, number = iNumber)
+    fWrite = timeit.timeit(lambda : setattr(objRecord, 'X', 2),
+                                                            number = iNumber)
+    return (iSize, fCreate, fRead, fWrite)
+
+def main(iNumber):
+    """
+    Runs the benchmark for both classes and prints out the results.
+    
+    Signature:
+        int -> None
+    
+    Args:
+        iNumber: int, number of the instances to create / accesses to perform
+    
+    Version 0.0.1.0
+    """
+    sys.stdout.write('{} instances / accesses\n'.format(iNumber))
+    sys.stdout.write('{:<12} {:>10} {:>12} {:>10} {:>10}\n'.format('Class',
+                        'Bytes/inst', 'Create, us', 'Read, us', 'Write, us'))
+    for clsRecord in (DictRecord, SlotsRecord):
+        iSize, fCreate, fRead, fWrite = benchmarkClass(clsRecord, iNumber)
+        fScale = 1.0E6 / iNumber
+        sys.stdout.write('{:<12} {:>10} {:>12.3f} {:>10.3f} {:>10.3f}\n'.format(
+                                clsRecord.__name__, iSize, fCreate * fScale,
+                                fRead * fScale, fWrite * fScale))
+    sys.stdout.flush()
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main(ITERATIONS)
@@ -0,0 +1,97 @@
+#usr/bin/python
+"""
+Module pos.Tests.benchmarks.contracts_batch_bench
+
+Benchmark of the throughput of the batch validation of the records against a
+Design by Contract (see pos.utils.contracts.validateBatch) by the number of
+the worker processes, from 1 to the number of the CPUs.
+
+Usage:
+    python contracts_batch_bench.py [NUMBER_OF_RECORDS [RECORDS_PER_TASK]]
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import multiprocessing
+import timeit
+
+#+ my libraries
+
+from pos.utils.contracts import Contract, validateBatch
+
+#globals
+
+RECORDS = 200000 #default number of the records
+
+CHUNK = 2000 #default number of the records per task
+
+CONTRACT = {
+    'Args' : {
+        'iId' : {'Type' : int, 'GE' : 0},
+        'strName' : {'Type' : str, 'MinLength' : 1, 'MaxLength' : 32},
+        'fValue' : {'Type' : (int, float), 'GE' : -100.0, 'LE' : 100.0},
+        'lstTags' : {'Type' : list, 'Elements' : str}
+    }
+}
+
+#functions
+
+def makeRecords(iNumber):
+    """
+    Creates the records, about 1% of them violate the contract.
+    
+    Signature:
+        int -> list(dict)
+    
+    Args:
+        iNumber: int, number of the records
+    
+    Version 0.0.1.0
+    """
+    return [{'iId' : iIndex, 'strName' : 'record{}'.format(iIndex),
+                'fValue' : float(iIndex % 203 - 101),
+                'lstTags' : ['a', 'b', 'c']} for iIndex in xrange(iNumber)]
+
+def main(iNumber, iChunk):
+    """
+    Runs the benchmark and prints out the results.
+    
+    Signature:
+        int, int -> None
+    
+    Args:
+        iNumber: int, number of the records
+        iChunk: int, number of the records per task
+    
+    Version 0.0.1.0
+    """
+    objContract = Contract(CONTRACT)
+    lstRecords = makeRecords(iNumber)
+    sys.stdout.write('{} records, {} per task\n'.format(iNumber, iChunk))
+    sys.stdout.write('{:>8} {:>12} {:>12} {:>10}\n'.format('Workers',
+                                        'Time, s', 'Records/s', 'Speed-up'))
+    fBase = None
+    for iWorkers in range(1, multiprocessing.cpu_count() + 1):
+        fTime = min(timeit.repeat(lambda : validateBatch(objContract,
+                            lstRecords, iWorkers, iChunk), number = 1,
+                                                                repeat = 3))
+        if fBase is None:
+            fBase = fTime
+        sys.stdout.write('{:>8} {:>12.3f} {:>12.0f} {:>10.2f}\n'.format(
+                            iWorkers, fTime, iNumber / fTime, fBase / fTime))
+    sys.stdout.flush()
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2:
+        main(int(sys.argv[1]), int(sys.argv[2]))
+    elif len(sys.argv) > 1:
+        main(int(sys.argv[1]), CHUNK)
+    else:
+        main(RECORDS, CHUNK)
@@ -0,0 +1,129 @@
+#usr/bin/python
+"""
+Module pos.Tests.benchmarks.contracts_switch_bench
+
+Benchmark of the call cost of the functions and methods under the Design by
+Contract control (see pos.utils.contracts) with the checks enabled and
+disabled compared to the undecorated functions and methods.
+
+Usage:
+    python contracts_switch_bench.py [NUMBER_OF_CALLS]
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import timeit
+
+#+ my libraries
+
+from pos.utils.contracts import applyContract
+from pos.utils.contracts import enableContracts, disableContracts
+
+#globals
+
+ITERATIONS = 1000000 #default number of the calls
+
+DBC = {
+    'checked' : {'Args' : {'iValue' : int}},
+    'method' : {'Args' : {'iValue' : {'Type' : int, 'GE' : 0}},
+                'Returns' : int}
+}
+
+#classes
+
+#+ benchmarked classes
+
+class Sample(object):
+    """
+    Class with the undecorated and controlled methods.
+    """
+    
+    def plain_method(self, iValue):
+        """
+        Undecorated method.
+        """
+        return iValue
+    
+    @applyContract(DBC)
+    def method(self, iValue):
+        """
+        Method with the type and value checks on the argument and the result.
+        """
+        return iValue
+
+#functions
+
+#+ benchmarked functions
+
+def plain(iValue):
+    """
+    Undecorated function.
+    """
+    return iValue
+
+@applyContract(DBC)
+def checked(iValue):
+    """
+    Function with the simple type check.
+    """
+    return iValue
+
+#+ benchmark
+
+def measure(iNumber):
+    """
+    Measures the time per call in microseconds of the undecorated and
+    controlled function and method with the current state of the checks.
+    
+    Signature:
+        int -> tuple(float, float, float, float)
+    
+    Args:
+        iNumber: int, number of the calls
+    
+    Version 0.0.1.0
+    """
+    objSample = Sample()
+    fScale = 1.0E6 / iNumber
+    return tuple(fScale * min(timeit.repeat(funcCall, number = iNumber,
+                                                                repeat = 3))
+                    for funcCall in (lambda : plain(1), lambda : checked(1),
+                                    lambda : objSample.plain_method(1),
+                                    lambda : objSample.method(1)))
+
+def main(iNumber):
+    """
+    Runs the benchmark with the checks enabled and disabled and prints out
+    the results.
+    
+    Signature:
+        int -> None
+    
+    Args:
+        iNumber: int, number of the calls
+    
+    Version 0.0.1.0
+    """
+    sys.stdout.write('{} calls, time per call in us\n'.format(iNumber))
+    sys.stdout.write('{:<10} {:>10} {:>10} {:>10} {:>10}\n'.format('Checks',
+                        'Plain', 'Checked', 'Plain m.', 'Checked m.'))
+    for strState, funcSwitch in (('enabled', enableContracts),
+                                    ('disabled', disableContracts)):
+        funcSwitch(__name__)
+        strLine = '{:<10} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f}\n'
+        sys.stdout.write(strLine.format(strState, *measure(iNumber)))
+    enableContracts(__name__)
+    sys.stdout.flush()
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main(ITERATIONS)
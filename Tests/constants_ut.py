@@ -0,0 +1,194 @@
+#usr/bin/python
+"""
+Module pos.Tests.constants_ut
+
+Implements unit testing of the module constants.
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import copy
+import cPickle
+import unittest
+
+#+ my libraries
+
+import pos.constants as testmodule
+
+from pos.exceptions import ConstantAssignment, ConstantAttributeAssignment
+
+#classes
+
+#+ helper classes
+
+class Limits(testmodule.ConstantNamespace):
+    """
+    Constant namespace with the mutable containers and a method.
+    """
+    
+    MAX_SIZE = 1024
+    
+    NAMES = ['first', 'second']
+    
+    CODES = {'ok' : 0, 'failed' : [1, 2]}
+    
+    FLAGS = set([1, 2])
+    
+    def getDouble(self):
+        """
+        Test method, not a constant.
+        """
+        return 2 * self.MAX_SIZE
+
+class ExtendedLimits(Limits):
+    """
+    Subclass adding and redefining the constants.
+    """
+    
+    MIN_SIZE = 1
+    
+    MAX_SIZE = 2048
+
+#+ test cases
+
+class Test_FrozenMapping(unittest.TestCase):
+    """
+    Test cases for the class pos.constants.FrozenMapping
+    """
+    
+    def test_ReadOnly(self):
+        """
+        Checks the read access and the forbidden modifications.
+        """
+        objTest = testmodule.FrozenMapping({'a' : 1}, b = 2)
+        self.assertIsInstance(objTest, dict)
+        self.assertEqual(objTest['a'], 1)
+        self.assertEqual(objTest.get('b'), 2)
+        self.assertEqual(sorted(objTest.keys()), ['a', 'b'])
+        for funcModify in (lambda: objTest.__setitem__('c', 3),
+                            lambda: objTest.__delitem__('a'),
+                            objTest.clear, lambda: objTest.pop('a'),
+                            objTest.popitem,
+                            lambda: objTest.setdefault('c', 3),
+                            lambda: objTest.update({'c' : 3})):
+            with self.assertRaises(ConstantAssignment):
+                funcModify()
+        with self.assertRaises(ConstantAssignment):
+            testmodule.FrozenMapping.__init__(objTest, {'c' : 3})
+        with self.assertRaises(ConstantAssignment):
+            objTest.__init__()
+        self.assertEqual(objTest, {'a' : 1, 'b' : 2})
+    
+    def test_HashPickle(self):
+        """
+        Checks the hashing, pickling and copying.
+        """
+        objTest = testmodule.FrozenMapping({'a' : 1, 'b' : (1, 2)})
+        self.assertEqual(hash(objTest),
+                                hash(testmodule.FrozenMapping(objTest)))
+        self.assertIs(copy.copy(objTest), objTest)
+        self.assertIs(copy.deepcopy(objTest), objTest)
+        for iProtocol in range(3):
+            objCopy = cPickle.loads(cPickle.dumps(objTest, iProtocol))
+            self.assertIsInstance(objCopy, testmodule.FrozenMapping)
+            self.assertEqual(objCopy, objTest)
+        with self.assertRaises(TypeError):
+            hash(testmodule.FrozenMapping({'a' : [1]}))
+
+class Test_ConstantNamespace(unittest.TestCase):
+    """
+    Test cases for the class pos.constants.ConstantNamespace
+    """
+    
+    def test_Freeze(self):
+        """
+        Checks the freezing of the mutable containers and the constants
+        mapping.
+        """
+        self.assertEqual(Limits.NAMES, ('first', 'second'))
+        self.assertEqual(Limits.FLAGS, frozenset([1, 2]))
+        self.assertIsInstance(Limits.CODES, testmodule.FrozenMapping)
+        self.assertEqual(Limits.CODES['failed'], (1, 2))
+        dictConstants = Limits.getConstants()
+        self.assertIsInstance(dictConstants, testmodule.FrozenMapping)
+        self.assertEqual(sorted(dictConstants), ['CODES', 'FLAGS', 'MAX_SIZE',
+                                                                    'NAMES'])
+        self.assertIs(dictConstants['NAMES'], Limits.NAMES)
+        dictConstants = ExtendedLimits.getConstants()
+        self.assertEqual(dictConstants['MAX_SIZE'], 2048)
+        self.assertEqual(dictConstants['MIN_SIZE'], 1)
+        self.assertEqual(Limits.getConstants()['MAX_SIZE'], 1024)
+        self.assertEqual(Limits.getClassFields(), ['CODES', 'FLAGS',
+                                                        'MAX_SIZE', 'NAMES'])
+    
+    def test_Access(self):
+        """
+        Checks the read access from the class and the instances.
+        """
+        objTest = Limits()
+        self.assertEqual(objTest.MAX_SIZE, 1024)
+        self.assertEqual(objTest.getDouble(), 2048)
+        self.assertEqual(ExtendedLimits().getDouble(), 4096)
+        self.assertIs(objTest.NAMES, Limits.NAMES)
+        self.assertIs(type(objTest).__getattribute__, object.__getattribute__)
+        self.assertIsInstance(objTest, Limits)
+        self.assertNotIsInstance(1, Limits)
+        self.assertTrue(issubclass(ExtendedLimits, Limits))
+        with self.assertRaises(AttributeError):
+            objTest.Unknown
+    
+    def test_Modification(self):
+        """
+        Checks that any assignment or deletion raises an exception.
+        """
+        objTest = Limits()
+        for gTarget in (Limits, ExtendedLimits, objTest):
+            for strAttr in ('MAX_SIZE', 'NewValue', 'getDouble', '_private'):
+                with self.assertRaises(ConstantAttributeAssignment):
+                    setattr(gTarget, strAttr, 1)
+                with self.assertRaises(ConstantAttributeAssignment):
+                    delattr(gTarget, strAttr)
+        with self.assertRaises(ConstantAssignment):
+            Limits.CODES['ok'] = 1
+        with self.assertRaises(ConstantAttributeAssignment):
+            objTest.setFields({'MAX_SIZE' : 1})
+        self.assertEqual(Limits.MAX_SIZE, 1024)
+        for strAttr in ('_abc_other', '_abc_'):
+            with self.assertRaises(ConstantAttributeAssignment):
+                setattr(Limits, strAttr, 1)
+        self.assertFalse(hasattr(Limits, '_abc_other'))
+    
+    def test_Finalizer(self):
+        """
+        Checks that the finalizers can be registered for the instances.
+        """
+        lstCalls = []
+        objTest = Limits()
+        objTest.addFinalizer(lstCalls.append, 'closed')
+        objTest.close()
+        self.assertEqual(lstCalls, ['closed'])
+        objTest.addFinalizer(lstCalls.append, 'collected')
+        del objTest
+        self.assertEqual(lstCalls, ['closed', 'collected'])
+        self.assertEqual(Limits().MAX_SIZE, 1024)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_FrozenMapping)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_ConstantNamespace)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting pos.constants module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -0,0 +1,228 @@
+#usr/bin/python
+"""
+Module pos.Tests.enumerations_ut
+
+Implements unit testing of the module enumerations.
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import copy
+import cPickle
+import unittest
+
+#+ my libraries
+
+import pos.enumerations as testmodule
+
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.exceptions import ConstantAttributeAssignment, NotExistingAttribute
+
+#classes
+
+#+ helper classes
+
+class Color(testmodule.Enumeration):
+    """
+    Enumeration with the integer values and a method.
+    """
+    
+    RED = 1
+    
+    GREEN = 2
+    
+    BLUE = 4
+    
+    def isWarm(self):
+        """
+        Test method available for the members.
+        """
+        return self is Color.RED
+
+class Level(testmodule.Enumeration):
+    """
+    Enumeration with the string values.
+    """
+    
+    LOW = 'low'
+    
+    HIGH = 'high'
+
+#+ test cases
+
+class Test_Enumeration(unittest.TestCase):
+    """
+    Test cases for the class pos.enumerations.Enumeration
+    """
+    
+    def test_Members(self):
+        """
+        Checks the members, their properties and the look-up tables.
+        """
+        self.assertIsInstance(Color.RED, Color)
+        self.assertEqual(list(Color), [Color.RED, Color.GREEN, Color.BLUE])
+        self.assertEqual(len(Color), 3)
+        self.assertEqual(Color.GREEN.Name, 'GREEN')
+        self.assertEqual(Color.GREEN.Value, 2)
+        self.assertEqual([objMember.Bit for objMember in Color], [1, 2, 4])
+        self.assertTrue(Color.RED.isWarm())
+        self.assertFalse(Color.BLUE.isWarm())
+        self.assertIs(Color(4), Color.BLUE)
+        self.assertIs(Color(Color.BLUE), Color.BLUE)
+        self.assertIs(Color.fromValue(1), Color.RED)
+        self.assertIs(Color.fromName('GREEN'), Color.GREEN)
+        self.assertIs(Level('low'), Level.LOW)
+        self.assertIn(Color.RED, Color)
+        self.assertIn('RED', Color)
+        self.assertNotIn(Level.LOW, Color)
+        self.assertNotIn(1, Color)
+        self.assertNotEqual(Color.RED, 1)
+        self.assertNotEqual(Color.RED, Color.GREEN)
+        self.assertEqual(str(Color.RED), 'Color.RED')
+        self.assertEqual(repr(Level.LOW), "<Level.LOW: 'low'>")
+        self.assertEqual(dir(Color), ['BLUE', 'Bit', 'GREEN', 'Name', 'RED',
+                                'Value', 'fromName', 'fromValue', 'isWarm'])
+        with self.assertRaises(CustomValueError):
+            Color(3)
+        with self.assertRaises(CustomValueError):
+            Color([1])
+        with self.assertRaises(CustomValueError):
+            Color(Level.LOW)
+        with self.assertRaises(NotExistingAttribute):
+            Color.fromName('YELLOW')
+        with self.assertRaises(CustomTypeError):
+            Color.fromName(1)
+    
+    def test_Constants(self):
+        """
+        Checks that the members cannot be created, changed or deleted, and
+        that an enumeration with the members cannot be subclassed.
+        """
+        with self.assertRaises(ConstantAttributeAssignment):
+            Color.RED = 5
+        with self.assertRaises(ConstantAttributeAssignment):
+            del Color.RED
+        with self.assertRaises(AttributeError):
+            Color.RED.Value = 5
+        with self.assertRaises(AttributeError):
+            Color.RED.NewAttribute = 5
+        with self.assertRaises(TypeError):
+            class Extended(Color):
+                YELLOW = 8
+        with self.assertRaises(CustomValueError):
+            class Duplicate(testmodule.Enumeration):
+                FIRST = 1
+                SECOND = 1
+        with self.assertRaises(CustomValueError):
+            class Unhashable(testmodule.Enumeration):
+                FIRST = [1]
+    
+    def test_Identity(self):
+        """
+        Checks that the identity of the members is preserved upon copying and
+        pickling.
+        """
+        for objMember in Color:
+            self.assertIs(copy.copy(objMember), objMember)
+            self.assertIs(copy.deepcopy([objMember])[0], objMember)
+            for iProtocol in range(3):
+                self.assertIs(cPickle.loads(cPickle.dumps(objMember,
+                                                    iProtocol)), objMember)
+
+class Test_FlagSet(unittest.TestCase):
+    """
+    Test cases for the class pos.enumerations.FlagSet
+    """
+    
+    def test_Init(self):
+        """
+        Checks the creation of the flag sets from the members and bitmasks.
+        """
+        clsFlagSet = Color.FlagSet
+        self.assertTrue(issubclass(clsFlagSet, testmodule.FlagSet))
+        self.assertIs(Level.FlagSet, Level.FlagSet)
+        self.assertIsNot(Level.FlagSet, clsFlagSet)
+        objTest = clsFlagSet(Color.RED, Color.BLUE)
+        self.assertEqual(objTest.Mask, 5)
+        self.assertEqual(clsFlagSet.fromMask(5), objTest)
+        self.assertEqual(Color.RED | Color.BLUE, objTest)
+        self.assertEqual(clsFlagSet().Mask, 0)
+        with self.assertRaises(CustomTypeError):
+            clsFlagSet(1)
+        with self.assertRaises(CustomTypeError):
+            clsFlagSet(Level.LOW)
+        with self.assertRaises(CustomTypeError):
+            clsFlagSet.fromMask('1')
+        with self.assertRaises(CustomValueError):
+            clsFlagSet.fromMask(8)
+        with self.assertRaises(CustomValueError):
+            clsFlagSet.fromMask(-1)
+    
+    def test_Operations(self):
+        """
+        Checks the set operations, comparisons and membership.
+        """
+        clsFlagSet = Color.FlagSet
+        objFirst = clsFlagSet(Color.RED, Color.GREEN)
+        objSecond = clsFlagSet(Color.GREEN, Color.BLUE)
+        self.assertEqual((objFirst | objSecond).Mask, 7)
+        self.assertEqual((objFirst & objSecond).Mask, 2)
+        self.assertEqual((objFirst ^ objSecond).Mask, 5)
+        self.assertEqual((objFirst - objSecond).Mask, 1)
+        self.assertEqual((~objFirst).Mask, 4)
+        self.assertEqual((objFirst | Color.BLUE).Mask, 7)
+        self.assertEqual((Color.BLUE | objFirst).Mask, 7)
+        self.assertEqual((objFirst & Color.RED).Mask, 1)
+        self.assertIn(Color.RED, objFirst)
+        self.assertNotIn(Color.BLUE, objFirst)
+        self.assertNotIn(Level.LOW, objFirst)
+        self.assertNotIn(1, objFirst)
+        self.assertTrue(clsFlagSet(Color.RED) <= objFirst)
+        self.assertFalse(objSecond <= objFirst)
+        self.assertTrue(objFirst >= clsFlagSet())
+        self.assertEqual(list(objFirst), [Color.RED, Color.GREEN])
+        self.assertEqual(len(objFirst), 2)
+        self.assertFalse(clsFlagSet())
+        self.assertTrue(objFirst)
+        self.assertEqual(len(set([objFirst, clsFlagSet.fromMask(3)])), 1)
+        self.assertNotEqual(objFirst, 3)
+        self.assertNotEqual(Level.FlagSet.fromMask(3), objFirst)
+        self.assertEqual(repr(objFirst), 'ColorFlagSet(Color.RED, Color.GREEN)')
+        with self.assertRaises(TypeError):
+            objFirst | Level.LOW
+        with self.assertRaises(TypeError):
+            objFirst & 1
+        with self.assertRaises(AttributeError):
+            objFirst.Mask = 0
+    
+    def test_Pickle(self):
+        """
+        Checks the pickling and copying of the flag sets.
+        """
+        objTest = Color.RED | Color.BLUE
+        for iProtocol in range(3):
+            objCopy = cPickle.loads(cPickle.dumps(objTest, iProtocol))
+            self.assertIs(type(objCopy), Color.FlagSet)
+            self.assertEqual(objCopy, objTest)
+        self.assertEqual(copy.copy(objTest), objTest)
+        self.assertEqual(copy.deepcopy(objTest), objTest)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Enumeration)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_FlagSet)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting pos.enumerations module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -5,8 +5,8 @@ Module pos.Tests.pos_all_ut
 Aggregation of the unit tests for all modules within pos library
 """
 
-__version__ = "0.0.1.2"
-__date__ = "03-07-2018"
+__version__ = "0.0.2.1"
+__date__ = "18-10-2026"
 __status__ = "Testing"
 
 #imports
@@ -21,13 +21,31 @@ import unittest
 import pos.Tests.utils.utils_all_ut as ut
 import pos.Tests.exceptions_ut as exceptions
 import pos.Tests.base_classes_descriptedabc_ut as descripted
+import pos.Tests.base_classes_descriptedslotsabc_ut as descripted_slots
+import pos.Tests.base_classes_finalization_ut as finalization
+import pos.Tests.record_arrays_ut as record_arrays
+import pos.Tests.typed_fields_ut as typed_fields
+import pos.Tests.enumerations_ut as enumerations
+import pos.Tests.constants_ut as constants
+import pos.Tests.typed_containers_ut as typed_containers
+import pos.Tests.struct_records_ut as struct_records
+import pos.Tests.record_store_ut as record_store
 
 #classes
 
 #+ test suite
 
 TestSuite = unittest.TestSuite([ut.TestSuite, exceptions.TestSuite,
-                                descripted.TestSuite])
+                                descripted.TestSuite,
+                                descripted_slots.TestSuite,
+                                finalization.TestSuite,
+                                record_arrays.TestSuite,
+                                typed_fields.TestSuite,
+                                enumerations.TestSuite,
+                                constants.TestSuite,
+                                typed_containers.TestSuite,
+                                struct_records.TestSuite,
+                                record_store.TestSuite])
 
 if __name__ == "__main__":
     sys.stdout.write("Conducting pos library tests...\n")
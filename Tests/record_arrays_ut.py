@@ -0,0 +1,203 @@
+#usr/bin/python
+"""
+Module pos.Tests.record_arrays_ut
+
+Implements unit testing of the module record_arrays.
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import array
+import unittest
+
+#+ my libraries
+
+import pos.record_arrays as testmodule
+
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.exceptions import NotExistingAttribute
+from pos.Tests.base_classes_descriptedabc_ut import ClassTest1, ClassTest2
+from pos.Tests.base_classes_descriptedslotsabc_ut import SlotsTest1
+
+#classes
+
+#+ test cases
+
+class Test_DescriptedRecordArray(unittest.TestCase):
+    """
+    Test cases for the class pos.record_arrays.DescriptedRecordArray
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.DescriptedRecordArray
+    
+    def test_Init(self):
+        """
+        Checks the columns defined by the schema, their types and the default
+        values, as well as the improper arguments.
+        """
+        objTest = self.TestClass(ClassTest2, 3)
+        self.assertIs(objTest.Schema, ClassTest2)
+        self.assertEqual(objTest.Fields, ('InstConstInt', 'InstFloat',
+                                                                'SimpleInt'))
+        self.assertEqual(len(objTest), 3)
+        gColumn = objTest.getColumn('InstFloat')
+        self.assertIsInstance(gColumn, array.array)
+        self.assertEqual(gColumn.typecode, 'd')
+        self.assertEqual(list(gColumn), [3.0, 3.0, 3.0])
+        objTest = self.TestClass(SlotsTest1, dictTypecodes = {'First' : None})
+        self.assertEqual(objTest.Fields, ('First', 'Second'))
+        self.assertEqual(len(objTest), 0)
+        self.assertIsInstance(objTest.getColumn('First'), list)
+        with self.assertRaises(CustomTypeError):
+            self.TestClass(int)
+        with self.assertRaises(CustomTypeError):
+            self.TestClass(SlotsTest1, 1.0)
+        with self.assertRaises(CustomValueError):
+            self.TestClass(SlotsTest1, -1)
+        with self.assertRaises(NotExistingAttribute):
+            self.TestClass(SlotsTest1, dictTypecodes = {'Third' : 'l'})
+        with self.assertRaises(TypeError):
+            self.TestClass(ClassTest1) #abstract schema
+    
+    def test_RowViews(self):
+        """
+        Checks the read and write access to the columns via the row views, as
+        well as the properties, methods and class fields of the schema.
+        """
+        objTest = self.TestClass(SlotsTest1, 3)
+        objRow = objTest[1]
+        self.assertIsInstance(objRow, SlotsTest1)
+        self.assertEqual(objRow.First, 1)
+        self.assertEqual(objRow.RO_Sum, 3)
+        self.assertEqual(objRow.ClassValue, 1)
+        self.assertEqual(objRow.TestMethod(), 'test_method')
+        objRow.First = 10
+        self.assertEqual(objTest[-2].RO_Sum, 12)
+        self.assertEqual(list(objTest.getColumn('First')), [1, 10, 1])
+        self.assertEqual([objRow.First for objRow in objTest], [1, 10, 1])
+        self.assertEqual([objRow.First for objRow in objTest[1:]], [10, 1])
+        with self.assertRaises(TypeError):
+            objRow.First = 1.5
+        with self.assertRaises(AttributeError):
+            del objRow.First
+        with self.assertRaises(AttributeError):
+            objRow.NewValue = 1
+        with self.assertRaises(IndexError):
+            objTest[3]
+        with self.assertRaises(IndexError):
+            objTest[-4]
+        with self.assertRaises(CustomTypeError):
+            objTest['1']
+        self.assertIn('First', objRow.getFields())
+        self.assertNotIn('_lstColumns', dir(objRow))
+    
+    def test_Descriptors(self):
+        """
+        Checks that the assignments via the row views to the fields holding
+        data descriptors are checked and converted by those descriptors.
+        """
+        objTest = self.TestClass(ClassTest2, 2)
+        objRow = objTest[0]
+        self.assertEqual(objRow.InstConstInt, 4)
+        with self.assertRaises(AttributeError):
+            objRow.InstConstInt = 7
+        self.assertEqual(objRow.InstConstInt, 4)
+        self.assertEqual(list(objTest.getColumn('InstConstInt')), [4, 4])
+        objRow.InstFloat = '2.5' #converted by FloatDescriptor
+        self.assertEqual(objTest[0].InstFloat, 2.5)
+        self.assertEqual(objTest[1].InstFloat, 3.0)
+        with self.assertRaises(ValueError):
+            objRow.InstFloat = 'a'
+        self.assertEqual(objRow.InstFloat, 2.5)
+        objRow.SimpleInt = 6
+        self.assertEqual(list(objTest.getColumn('SimpleInt')), [6, 5])
+    
+    def test_BulkDescriptors(self):
+        """
+        Checks that the methods append(), extend() and setColumn() reject and
+        convert the values of the fields holding data descriptors in the same
+        way as the assignments via the row views, and that the descriptors of
+        the schema instances are not changed.
+        """
+        objTest = self.TestClass(ClassTest2)
+        objRecord = ClassTest2()
+        objTest.append(objRecord)
+        objTest.append({'InstFloat' : '1.5', 'SimpleInt' : 2})
+        self.assertEqual(list(objTest.getColumn('InstFloat')), [3.0, 1.5])
+        with self.assertRaises(AttributeError):
+            objTest.append({'InstConstInt' : 7})
+        with self.assertRaises(ValueError):
+            objTest.extend([{'InstFloat' : 'a'}])
+        self.assertEqual(len(objTest), 2)
+        self.assertEqual(list(objTest.getColumn('InstConstInt')), [4, 4])
+        with self.assertRaises(AttributeError):
+            objTest.setColumn('InstConstInt', [4, 7])
+        self.assertEqual(list(objTest.getColumn('InstConstInt')), [4, 4])
+        objTest.setColumn('InstConstInt', [4, 4])
+        with self.assertRaises(ValueError):
+            objTest.setColumn('InstFloat', [1.0, 'a'])
+        objTest.setColumn('InstFloat', ['0.5', 2])
+        self.assertEqual(list(objTest.getColumn('InstFloat')), [0.5, 2.0])
+        objTest[0].InstFloat = 7
+        self.assertEqual(objRecord.InstFloat, 3.0)
+        self.assertEqual(ClassTest2().InstFloat, 3.0)
+    
+    def test_AppendExtend(self):
+        """
+        Checks the addition of the rows from the records and the mappings.
+        """
+        objTest = self.TestClass(SlotsTest1)
+        objTest.append()
+        objTest.append({'Second' : 5})
+        objTest.extend([SlotsTest1(3, 4), {'First' : 7}])
+        self.assertEqual(len(objTest), 4)
+        self.assertEqual(list(objTest.getColumn('First')), [1, 1, 3, 7])
+        self.assertEqual(list(objTest.getColumn('Second')), [2, 5, 4, 2])
+        with self.assertRaises(TypeError):
+            objTest.append({'Second' : 'a'})
+        self.assertEqual(len(objTest), 4)
+        self.assertEqual(len(objTest.getColumn('First')), 4)
+    
+    def test_Columns(self):
+        """
+        Checks the bulk read and write access to the columns.
+        """
+        objTest = self.TestClass(ClassTest2, 2)
+        gColumn = objTest.getColumn('SimpleInt')
+        gColumn[0] = 7
+        self.assertEqual(objTest[0].SimpleInt, 5) #copy is returned
+        objTest.setColumn('SimpleInt', [1, 2])
+        self.assertEqual(objTest[1].SimpleInt, 2)
+        objTest.setColumn('InstFloat', array.array('d', [0.5, 1.5]))
+        self.assertEqual(objTest[1].InstFloat, 1.5)
+        with self.assertRaises(CustomValueError):
+            objTest.setColumn('SimpleInt', [1, 2, 3])
+        with self.assertRaises(TypeError):
+            objTest.setColumn('SimpleInt', [1.0, 2.0])
+        with self.assertRaises(NotExistingAttribute):
+            objTest.getColumn('Unknown')
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_DescriptedRecordArray)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting pos.record_arrays module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
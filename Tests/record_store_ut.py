@@ -0,0 +1,256 @@
+#usr/bin/python
+"""
+Module pos.Tests.record_store_ut
+
+Implements unit testing of the module record_store.
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import tempfile
+import unittest
+
+#+ my libraries
+
+import pos.record_store as testmodule
+
+from pos.base_classes import DescriptedABC
+from pos.struct_records import StructRecordABC
+from pos.typed_fields import UInt16, Int8, BoundedFloat
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.exceptions import NotExistingAttribute
+
+#classes
+
+#+ helper classes
+
+class Sample(StructRecordABC):
+    """
+    Struct record schema.
+    """
+    
+    _Layout = (('Counter', UInt16()),
+                ('Level', Int8(-1)),
+                ('Temperature', BoundedFloat(20.0, -40.0, 125.0)))
+
+class Point(DescriptedABC):
+    """
+    DescriptedABC schema with the numeric fields.
+    """
+    
+    def onInit(self):
+        """
+        Assigns the default values.
+        """
+        self.X = 0.0
+        self.Y = 0.0
+        self.Id = 0
+
+class Named(DescriptedABC):
+    """
+    DescriptedABC schema with a not fixed size field.
+    """
+    
+    def onInit(self):
+        """
+        Assigns the default values.
+        """
+        self.Name = 'a'
+
+class Tracked(testmodule.RecordStore):
+    """
+    Record store keeping the references to its instances, including those
+    failed to initialize.
+    """
+    
+    Instances = []
+    
+    def _create(self, clsRecord, iCapacity):
+        self.Instances.append(self)
+        super(Tracked, self)._create(clsRecord, iCapacity)
+
+class FailingMap(object):
+    """
+    Replacement of the mmap module failing to map a file.
+    """
+    
+    @staticmethod
+    def mmap(*args, **kwargs):
+        raise EnvironmentError('mapping failure')
+
+#+ test cases
+
+class Test_RecordStore(unittest.TestCase):
+    """
+    Test cases for the class pos.record_store.RecordStore
+    """
+    
+    def setUp(self):
+        """
+        Creates the path of the temporary file.
+        """
+        iHandle, self.Path = tempfile.mkstemp()
+        os.close(iHandle)
+    
+    def tearDown(self):
+        """
+        Removes the temporary file.
+        """
+        os.remove(self.Path)
+    
+    def test_Write(self):
+        """
+        Checks the creation of a file, appending and modification of the
+        records and the growth of the file.
+        """
+        with testmodule.RecordStore(self.Path, Sample, 'w', 2) as objStore:
+            self.assertFalse(objStore.ReadOnly)
+            self.assertIs(objStore.Schema, Sample)
+            self.assertEqual(objStore.Fields, ('Counter', 'Level',
+                                                                'Temperature'))
+            self.assertEqual(objStore.append(), 0)
+            self.assertEqual(objStore.append({'Counter' : 5}), 1)
+            objRecord = Sample()
+            objRecord.Level = 7
+            self.assertEqual(objStore.append(objRecord), 2)
+            objStore.extend([{'Counter' : iIndex} for iIndex in range(10)])
+            self.assertEqual(len(objStore), 13)
+            objStore[0].Temperature = -1.5
+            self.assertEqual(objStore[-1].Counter, 9)
+            self.assertEqual(objStore[2].getValues(), (0, 7, 20.0))
+            self.assertEqual(len(objStore[1:3]), 2)
+            with self.assertRaises(CustomValueError):
+                objStore.append({'Counter' : -1})
+            with self.assertRaises(CustomTypeError):
+                objStore.extend([{'Counter' : 1}, {'Level' : 1.5}])
+            self.assertEqual(len(objStore), 13)
+            with self.assertRaises(IndexError):
+                objStore[13]
+            with self.assertRaises(CustomTypeError):
+                objStore['a']
+        self.assertEqual((os.path.getsize(self.Path) - 13 * 11) % 8, 0)
+        with testmodule.RecordStore(self.Path, Sample, 'r+') as objStore:
+            self.assertEqual(objStore[0].Temperature, -1.5)
+            objStore.append({'Counter' : 100})
+        with testmodule.RecordStore(self.Path) as objStore:
+            self.assertEqual(len(objStore), 14)
+            self.assertEqual(objStore[13].Counter, 100)
+    
+    def test_Read(self):
+        """
+        Checks the read-only access without the schema, the column scans and
+        the iteration.
+        """
+        with testmodule.RecordStore(self.Path, Sample, 'w') as objStore:
+            objStore.extend([{'Counter' : iIndex, 'Level' : iIndex % 100}
+                                            for iIndex in xrange(2500)])
+        with testmodule.RecordStore(self.Path) as objStore:
+            self.assertTrue(objStore.ReadOnly)
+            clsRecord = objStore.Schema
+            self.assertIsNot(clsRecord, Sample)
+            self.assertEqual(clsRecord.__name__, 'Sample')
+            self.assertEqual(clsRecord.Temperature.Field.Max, 125.0)
+            self.assertEqual(len(objStore), 2500)
+            self.assertEqual(list(objStore.getColumn('Counter')),
+                                                            range(2500))
+            self.assertEqual(list(objStore.getColumn('Level')),
+                            [tupValues[1] for tupValues
+                                            in objStore.iterValues()])
+            self.assertEqual(list(objStore.getColumn('Temperature')),
+                                                            [20.0] * 2500)
+            self.assertEqual([objView.Counter for objView in objStore][:3],
+                                                                    [0, 1, 2])
+            self.assertEqual(sum(objView.Counter for objView
+                        in objStore.iterRecords(True)), sum(range(2500)))
+            with self.assertRaises(NotExistingAttribute):
+                objStore.getColumn('Unknown')
+            with self.assertRaises(TypeError):
+                objStore.append()
+            with self.assertRaises(TypeError):
+                objStore[0].Counter = 1
+    
+    def test_Refresh(self):
+        """
+        Checks that a reader sees the records appended by a writer after the
+        refresh.
+        """
+        objWriter = testmodule.RecordStore(self.Path, Sample, 'w', 1)
+        objReader = testmodule.RecordStore(self.Path, Sample)
+        objWriter.extend([{'Counter' : 1}, {'Counter' : 2}])
+        objWriter.flush()
+        self.assertEqual(len(objReader), 0)
+        self.assertEqual(objReader.refresh(), 2)
+        self.assertEqual(objReader[1].Counter, 2)
+        objWriter.close()
+        objReader.close()
+        objReader.close()
+    
+    def test_Closed(self):
+        """
+        Checks the clear failure of the access to a closed store, and that the
+        file is closed if the creation of a new store fails.
+        """
+        objStore = testmodule.RecordStore(self.Path, Sample, 'w')
+        objStore.append()
+        objStore.close()
+        for funcAccess in (objStore.append,
+                            lambda: objStore.extend([{'Counter' : 1}]),
+                            lambda: objStore.getColumn('Counter'),
+                            lambda: objStore[0], objStore.iterRecords,
+                            objStore.iterValues, objStore.refresh,
+                            objStore.flush):
+            with self.assertRaises(ValueError):
+                funcAccess()
+        modMap = testmodule.mmap
+        testmodule.mmap = FailingMap
+        try:
+            with self.assertRaises(EnvironmentError):
+                Tracked(self.Path, Sample, 'w')
+        finally:
+            testmodule.mmap = modMap
+        self.assertIsNone(Tracked.Instances[-1]._objFile)
+    
+    def test_DescriptedSchema(self):
+        """
+        Checks the conversion of a DescriptedABC schema and the compatibility
+        checks.
+        """
+        with testmodule.RecordStore(self.Path, Point, 'w') as objStore:
+            self.assertEqual(objStore.Fields, ('Id', 'X', 'Y'))
+            objPoint = Point()
+            objPoint.X = 1.5
+            objPoint.Id = 3
+            objStore.append(objPoint)
+        with testmodule.RecordStore(self.Path, Point) as objStore:
+            self.assertEqual(objStore[0].getValues(), (3, 1.5, 0.0))
+        with self.assertRaises(CustomValueError):
+            testmodule.RecordStore(self.Path, Sample)
+        with self.assertRaises(CustomTypeError):
+            testmodule.RecordStore(self.Path, Named, 'w')
+        with self.assertRaises(CustomTypeError):
+            testmodule.RecordStore(self.Path, int, 'w')
+        with self.assertRaises(CustomValueError):
+            testmodule.RecordStore(self.Path, None, 'w')
+        with self.assertRaises(CustomValueError):
+            testmodule.RecordStore(self.Path, Point, 'a')
+        with open(self.Path, 'wb') as objFile:
+            objFile.write('not a record store file')
+        with self.assertRaises(CustomValueError):
+            testmodule.RecordStore(self.Path)
+
+#+ test suites
+
+TestSuite = unittest.TestLoader().loadTestsFromTestCase(Test_RecordStore)
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting pos.record_store module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -0,0 +1,240 @@
+#usr/bin/python
+"""
+Module pos.Tests.struct_records_ut
+
+Implements unit testing of the module struct_records.
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import copy
+import mmap
+import struct
+import cPickle
+import tempfile
+import unittest
+
+#+ my libraries
+
+import pos.struct_records as testmodule
+
+from pos.typed_fields import UInt16, UInt64, Int8, BoundedFloat
+from pos.exceptions import CustomTypeError, CustomValueError
+
+#classes
+
+#+ helper classes
+
+class Sample(testmodule.StructRecordABC):
+    """
+    Record with the struct fields and a plain slot.
+    """
+    
+    _Layout = (('Counter', UInt16()),
+                ('Level', Int8(-1)),
+                ('Temperature', BoundedFloat(20.0, -40.0, 125.0)))
+    
+    _Fields = ('Label', )
+    
+    Version = 1
+    
+    def onInit(self, Label = 'sample'):
+        """
+        Assigns the initial value of the plain slot.
+        """
+        self.Label = Label
+
+ExtendedSample = testmodule.makeStructRecord('ExtendedSample',
+                                        [('Total', UInt64(5)),
+                                        ('Level', Int8(0, 0, 10))],
+                                        clsBase = Sample)
+
+#+ test cases
+
+class Test_Layout(unittest.TestCase):
+    """
+    Test cases for the binary layout computed by the meta-class and by the
+    function makeStructRecord().
+    """
+    
+    def test_Layout(self):
+        """
+        Checks the order, offsets and sizes of the struct fields.
+        """
+        self.assertEqual(Sample.getStructFields(), ['Counter', 'Level',
+                                                            'Temperature'])
+        self.assertEqual(Sample.getRecordSize(), 11)
+        self.assertEqual(Sample.Temperature.Offset, 3)
+        self.assertEqual(Sample.Counter.Format, '<H')
+        self.assertEqual(Sample.getClassFields(), ['Version'])
+        self.assertEqual(ExtendedSample.getStructFields(), ['Counter', 'Level',
+                                                    'Temperature', 'Total'])
+        self.assertEqual(ExtendedSample.getRecordSize(), 19)
+        self.assertEqual(ExtendedSample.Total.Offset, 11)
+        self.assertTrue(issubclass(ExtendedSample, Sample))
+        clsBigEndian = testmodule.makeStructRecord('BigEndian',
+                                            [('Value', UInt16(258))], '>')
+        self.assertEqual(str(clsBigEndian().getBuffer()), '\x01\x02')
+        self.assertEqual(testmodule.StructRecordABC.getRecordSize(), 0)
+    
+    def test_Errors(self):
+        """
+        Checks the improper fields tables and byte orders.
+        """
+        with self.assertRaises(CustomTypeError):
+            testmodule.makeStructRecord('Bad', [('Value', 1)])
+        with self.assertRaises(CustomTypeError):
+            testmodule.makeStructRecord('Bad', [UInt16()])
+        with self.assertRaises(CustomValueError):
+            testmodule.makeStructRecord('Bad', [('Value', UInt16()),
+                                                        ('Value', UInt16())])
+        with self.assertRaises(CustomValueError):
+            testmodule.makeStructRecord('Bad', [('Value', UInt16())], '@')
+        with self.assertRaises(CustomTypeError):
+            testmodule.makeStructRecord('Bad', [('Value', UInt16())],
+                                                                clsBase = int)
+
+class Test_StructRecordABC(unittest.TestCase):
+    """
+    Test cases for the class pos.struct_records.StructRecordABC
+    """
+    
+    def test_Access(self):
+        """
+        Checks the default values, the checked assignment and the forbidden
+        deletion of the struct fields of an instance with the own buffer.
+        """
+        objTest = Sample()
+        self.assertEqual(objTest.getValues(), (0, -1, 20.0))
+        self.assertEqual(objTest.Label, 'sample')
+        self.assertIsInstance(objTest.getBuffer(), bytearray)
+        objTest.Counter = 65535
+        objTest.Temperature = 3
+        self.assertEqual(objTest.Counter, 65535)
+        self.assertIsInstance(objTest.Temperature, float)
+        self.assertEqual(struct.unpack('<Hbd', str(objTest.getBuffer())),
+                                                            (65535, -1, 3.0))
+        for gValue in (65536, -1):
+            with self.assertRaises(CustomValueError):
+                objTest.Counter = gValue
+        for gValue in (1.5, '1', None):
+            with self.assertRaises(CustomTypeError):
+                objTest.Counter = gValue
+        self.assertEqual(objTest.Counter, 65535)
+        with self.assertRaises(AttributeError):
+            del objTest.Counter
+        with self.assertRaises(AttributeError):
+            Sample.Counter = 1
+        with self.assertRaises(AttributeError):
+            objTest.Unknown = 1
+        objTest.setFields({'Level' : 3, 'Label' : 'bulk'})
+        self.assertEqual(objTest.Level, 3)
+        self.assertEqual(objTest.Label, 'bulk')
+        objTest = ExtendedSample()
+        self.assertEqual(objTest.getValues(), (0, 0, 20.0, 5))
+        with self.assertRaises(CustomValueError):
+            objTest.Level = 11
+        objTest.close()
+        self.assertEqual(objTest.getValues(), (0, 0, 20.0, 5))
+    
+    def test_Views(self):
+        """
+        Checks the views over the external buffers.
+        """
+        iSize = Sample.getRecordSize()
+        bytBuffer = bytearray(iSize * 3 + 2)
+        lstViews = list(Sample.iterBuffer(bytBuffer))
+        self.assertEqual(len(lstViews), 3)
+        for iIndex, objView in enumerate(lstViews):
+            objView.Counter = iIndex + 1
+            self.assertEqual(objView.getOffset(), iIndex * iSize)
+            self.assertIs(objView.getBuffer(), bytBuffer)
+            with self.assertRaises(AttributeError):
+                objView.Label
+        self.assertEqual([tupValues[0] for tupValues
+                                    in Sample.iterValues(bytBuffer)], [1, 2, 3])
+        self.assertEqual(list(Sample.iterValues(bytBuffer, iSize, 1)),
+                                                            [(2, 0, 0.0)])
+        lstViews = list(Sample.iterBuffer(bytBuffer, bReuse = True))
+        self.assertIs(lstViews[0], lstViews[-1])
+        objView = Sample.fromBuffer(memoryview(bytBuffer), iSize)
+        objView.Level = -5
+        self.assertEqual(Sample.fromBuffer(bytBuffer, iSize).Level, -5)
+        objView.close()
+        self.assertEqual(objView.getValues(), (0, -1, 20.0))
+        self.assertEqual(Sample.fromBuffer(bytBuffer, iSize).Level, -5)
+        objView = Sample.fromBuffer(str(bytBuffer))
+        self.assertEqual(objView.Counter, 1)
+        with self.assertRaises(TypeError):
+            objView.Counter = 2
+        with self.assertRaises(CustomValueError):
+            Sample.fromBuffer(bytBuffer, 3 * iSize)
+        with self.assertRaises(CustomValueError):
+            Sample.fromBuffer(bytBuffer, -1)
+        with self.assertRaises(CustomTypeError):
+            Sample.fromBuffer([0] * iSize)
+        with self.assertRaises(CustomTypeError):
+            list(Sample.iterValues(bytBuffer, 1.0))
+    
+    def test_Mmap(self):
+        """
+        Checks the views over a memory mapped file.
+        """
+        iSize = Sample.getRecordSize()
+        objFile = tempfile.TemporaryFile()
+        try:
+            objFile.write(str(Sample().getBuffer()) * 4)
+            objFile.flush()
+            objMap = mmap.mmap(objFile.fileno(), 0)
+            for iIndex, objView in enumerate(Sample.iterBuffer(objMap,
+                                                            bReuse = True)):
+                objView.Counter = iIndex
+            objMap.flush()
+            objMap.close()
+            objMap = mmap.mmap(objFile.fileno(), 0, access = mmap.ACCESS_READ)
+            self.assertEqual([objView.Counter for objView
+                                in Sample.iterBuffer(objMap)], [0, 1, 2, 3])
+            with self.assertRaises(TypeError):
+                Sample.fromBuffer(objMap, iSize).Counter = 5
+            objMap.close()
+        finally:
+            objFile.close()
+    
+    def test_PickleCopy(self):
+        """
+        Checks that the copies of the views own new buffers.
+        """
+        bytBuffer = bytearray(Sample.getRecordSize() * 2)
+        objView = Sample.fromBuffer(bytBuffer, Sample.getRecordSize())
+        objView.Counter = 300
+        objView.Label = 'pickled'
+        for objCopy in (cPickle.loads(cPickle.dumps(objView, 2)),
+                        copy.copy(objView), copy.deepcopy(objView),
+                        objView.fastCopy()):
+            self.assertIsInstance(objCopy, Sample)
+            self.assertEqual(objCopy.getValues(), (300, 0, 0.0))
+            self.assertEqual(objCopy.Label, 'pickled')
+            self.assertEqual(objCopy.getOffset(), 0)
+            self.assertIsNot(objCopy.getBuffer(), bytBuffer)
+            objCopy.Counter = 1
+            self.assertEqual(objView.Counter, 300)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Layout)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_StructRecordABC)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting pos.struct_records module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
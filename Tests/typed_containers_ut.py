@@ -0,0 +1,348 @@
+#usr/bin/python
+"""
+Module pos.Tests.typed_containers_ut
+
+Implements unit testing of the module typed_containers.
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import copy
+import array
+import cPickle
+import unittest
+
+#+ my libraries
+
+import pos.typed_containers as testmodule
+
+from pos.exceptions import CustomTypeError, CustomValueError
+
+#classes
+
+#+ helper classes
+
+class Base(object):
+    """
+    Element type for the tests.
+    """
+    pass
+
+class Derived(Base):
+    """
+    Narrower element type for the tests.
+    """
+    pass
+
+class Inconsistent(object):
+    """
+    Element failing only the first conversion into float.
+    """
+    
+    def __init__(self):
+        self.Calls = 0
+    
+    def __float__(self):
+        self.Calls += 1
+        if self.Calls == 1:
+            raise TypeError('first conversion')
+        return 1.0
+
+#+ test cases
+
+class Test_TypedList(unittest.TestCase):
+    """
+    Test cases for the class pos.typed_containers.TypedList
+    """
+    
+    def test_Storage(self):
+        """
+        Checks the storage type chosen for the declared element type.
+        """
+        objTest = testmodule.TypedList(int, [1, 2, 3])
+        self.assertIsInstance(objTest._gData, array.array)
+        self.assertEqual(objTest._gData.typecode, 'l')
+        objTest = testmodule.TypedList(float, [1, 2.5])
+        self.assertIsInstance(objTest._gData, array.array)
+        self.assertEqual(objTest[0], 1.0)
+        self.assertIsInstance(objTest[0], float)
+        objTest = testmodule.TypedList(str, 'abc')
+        self.assertIsInstance(objTest._gData, list)
+        self.assertEqual(objTest, ['a', 'b', 'c'])
+        self.assertIs(objTest.ElementType, str)
+        with self.assertRaises(CustomTypeError):
+            testmodule.TypedList(1)
+        with self.assertRaises(CustomTypeError):
+            testmodule.TypedList(int, [1, '2'])
+    
+    def test_Insertion(self):
+        """
+        Checks the validation upon insertion and the atomicity of the bulk
+        operations.
+        """
+        for clsElement, tupGood, gBad in ((int, (1, 2, 3), 1.5),
+                                            (str, ('a', 'b', 'c'), 1),
+                                            (Base, (Base(), Derived(),
+                                                            Base()), 'a')):
+            objTest = testmodule.TypedList(clsElement)
+            objTest.append(tupGood[0])
+            objTest.extend(tupGood[1:])
+            objTest.insert(0, tupGood[2])
+            objTest[1] = tupGood[1]
+            objTest += [tupGood[0]]
+            self.assertEqual(len(objTest), 5)
+            lstCopy = list(objTest)
+            for funcModify in (lambda: objTest.append(gBad),
+                                lambda: objTest.insert(0, gBad),
+                                lambda: objTest.extend([tupGood[0], gBad]),
+                                lambda: objTest.__setitem__(0, gBad),
+                                lambda: objTest.__setitem__(slice(0, 2),
+                                                        [tupGood[0], gBad]),
+                                lambda: objTest.__iadd__([gBad])):
+                with self.assertRaises(CustomTypeError):
+                    funcModify()
+            self.assertEqual(list(objTest), lstCopy)
+        objTest = testmodule.TypedList(int)
+        with self.assertRaises(CustomValueError):
+            objTest.append(2**70)
+        with self.assertRaises(CustomValueError):
+            objTest.extend([1, 2**70])
+        self.assertEqual(len(objTest), 0)
+        objTest = testmodule.TypedList(float)
+        with self.assertRaises(CustomTypeError):
+            objTest.extend([1.0, Inconsistent()])
+        self.assertEqual(len(objTest), 0)
+    
+    def test_Sequence(self):
+        """
+        Checks the sequence methods.
+        """
+        objTest = testmodule.TypedList(int, [3, 1, 2])
+        objSlice = objTest[1:]
+        self.assertIsInstance(objSlice, testmodule.TypedList)
+        self.assertIs(objSlice.ElementType, int)
+        self.assertEqual(objSlice, [1, 2])
+        self.assertEqual(objTest[-1], 2)
+        self.assertIn(1, objTest)
+        self.assertNotIn('a', objTest)
+        self.assertEqual(objTest.index(2), 2)
+        self.assertEqual(objTest.count(3), 1)
+        self.assertEqual(objTest.count('a'), 0)
+        objTest.sort()
+        self.assertEqual(objTest, [1, 2, 3])
+        objTest.reverse()
+        self.assertEqual(objTest, (3, 2, 1))
+        self.assertEqual(objTest.pop(), 1)
+        objTest.remove(3)
+        del objTest[0]
+        self.assertEqual(len(objTest), 0)
+        with self.assertRaises(ValueError):
+            objTest.index('a')
+        with self.assertRaises(TypeError):
+            hash(objTest)
+    
+    def test_PickleCopy(self):
+        """
+        Checks the pickling and copying.
+        """
+        objTest = testmodule.TypedList(float, [1.5, 2.5])
+        for objCopy in (cPickle.loads(cPickle.dumps(objTest, 2)),
+                        copy.copy(objTest), copy.deepcopy(objTest)):
+            self.assertIsInstance(objCopy, testmodule.TypedList)
+            self.assertIs(objCopy.ElementType, float)
+            self.assertEqual(objCopy, objTest)
+            objCopy.append(1.0)
+            self.assertEqual(len(objTest), 2)
+        self.assertEqual(repr(objTest), 'TypedList(float, [1.5, 2.5])')
+
+class Test_TypedDict(unittest.TestCase):
+    """
+    Test cases for the class pos.typed_containers.TypedDict
+    """
+    
+    def test_Insertion(self):
+        """
+        Checks the validation upon insertion and the atomicity of the bulk
+        operations.
+        """
+        objTest = testmodule.TypedDict(str, int, {'a' : 1}, b = 2)
+        self.assertIs(objTest.KeyType, str)
+        self.assertIs(objTest.ValueType, int)
+        objTest['c'] = 3
+        objTest.update([('d', 4)])
+        self.assertEqual(objTest.setdefault('e', 5), 5)
+        self.assertEqual(objTest.setdefault('a', 10), 1)
+        self.assertEqual(objTest, {'a' : 1, 'b' : 2, 'c' : 3, 'd' : 4,
+                                                                    'e' : 5})
+        for funcModify in (lambda: objTest.__setitem__(1, 1),
+                            lambda: objTest.__setitem__('f', 'f'),
+                            lambda: objTest.update({'f' : 1, 'g' : 'g'}),
+                            lambda: objTest.update(f = 1.0),
+                            lambda: objTest.setdefault('f')):
+            with self.assertRaises(CustomTypeError):
+                funcModify()
+        self.assertEqual(len(objTest), 5)
+        with self.assertRaises(CustomTypeError):
+            testmodule.TypedDict(str, int, {1 : 1})
+        with self.assertRaises(CustomTypeError):
+            testmodule.TypedDict(str, 1)
+    
+    def test_Mapping(self):
+        """
+        Checks the mapping methods, copying and pickling.
+        """
+        objTest = testmodule.TypedDict(str, Base, a = Derived())
+        self.assertEqual(objTest.keys(), ['a'])
+        self.assertIn('a', objTest)
+        with self.assertRaises(TypeError):
+            ['a'] in objTest
+        self.assertIsNone(objTest.get('b'))
+        self.assertIsInstance(objTest.pop('a'), Derived)
+        self.assertEqual(len(objTest), 0)
+        objTest = testmodule.TypedDict(str, int, a = 1, b = 2)
+        self.assertEqual(sorted(objTest.iteritems()), [('a', 1), ('b', 2)])
+        self.assertEqual(sorted(objTest.values()), [1, 2])
+        for objCopy in (cPickle.loads(cPickle.dumps(objTest, 2)),
+                        copy.copy(objTest), copy.deepcopy(objTest),
+                        objTest.copy()):
+            self.assertIsInstance(objCopy, testmodule.TypedDict)
+            self.assertIs(objCopy.ValueType, int)
+            self.assertEqual(objCopy, objTest)
+            objCopy['c'] = 3
+            self.assertEqual(len(objTest), 2)
+        objTest.clear()
+        self.assertEqual(objTest, {})
+
+class Test_TypedSet(unittest.TestCase):
+    """
+    Test cases for the class pos.typed_containers.TypedSet
+    """
+    
+    def test_Insertion(self):
+        """
+        Checks the validation upon insertion and the atomicity of the bulk
+        operations.
+        """
+        objTest = testmodule.TypedSet(int, [1, 2])
+        self.assertIs(objTest.ElementType, int)
+        objTest.add(3)
+        objTest.update([4], set([5]))
+        objTest |= [6]
+        self.assertEqual(objTest, set(range(1, 7)))
+        for funcModify in (lambda: objTest.add('a'),
+                            lambda: objTest.update([7], ['a']),
+                            lambda: objTest.__ior__([7, 'a'])):
+            with self.assertRaises(CustomTypeError):
+                funcModify()
+        self.assertEqual(len(objTest), 6)
+        with self.assertRaises(CustomTypeError):
+            objTest | set(['a'])
+        with self.assertRaises(CustomTypeError):
+            testmodule.TypedSet(int, ['a'])
+    
+    def test_Set(self):
+        """
+        Checks the set operations, copying and pickling.
+        """
+        objFirst = testmodule.TypedSet(int, [1, 2, 3])
+        objSecond = testmodule.TypedSet(int, [3, 4])
+        for objResult, setExpected in ((objFirst | objSecond, set([1, 2, 3, 4])),
+                                        (objFirst & objSecond, set([3])),
+                                        (objFirst - objSecond, set([1, 2])),
+                                        (objFirst ^ objSecond, set([1, 2, 4]))):
+            self.assertIsInstance(objResult, testmodule.TypedSet)
+            self.assertIs(objResult.ElementType, int)
+            self.assertEqual(objResult, setExpected)
+        self.assertTrue(objFirst >= set([1]))
+        self.assertNotIn([1], objFirst)
+        objFirst.discard(1)
+        objFirst.remove(2)
+        self.assertEqual(objFirst, set([3]))
+        with self.assertRaises(KeyError):
+            objFirst.remove(2)
+        for objCopy in (cPickle.loads(cPickle.dumps(objSecond, 2)),
+                        copy.copy(objSecond), copy.deepcopy(objSecond),
+                        objSecond.copy()):
+            self.assertIsInstance(objCopy, testmodule.TypedSet)
+            self.assertEqual(objCopy, objSecond)
+            objCopy.add(10)
+            self.assertEqual(len(objSecond), 2)
+        with self.assertRaises(TypeError):
+            hash(objSecond)
+
+class Test_checkElements(unittest.TestCase):
+    """
+    Test cases for the function pos.typed_containers.checkElements()
+    """
+    
+    def test_Typed(self):
+        """
+        Checks the comparison of the declared types of the typed containers.
+        """
+        objList = testmodule.TypedList(Derived, [Derived()])
+        self.assertTrue(testmodule.checkElements(objList, Derived))
+        self.assertTrue(testmodule.checkElements(objList, Base))
+        self.assertTrue(testmodule.checkElements(objList))
+        self.assertFalse(testmodule.checkElements(objList, int))
+        objList = testmodule.TypedList(Base, [Derived()])
+        self.assertFalse(testmodule.checkElements(objList, Derived))
+        objSet = testmodule.TypedSet(int, [1])
+        self.assertTrue(testmodule.checkElements(objSet, int))
+        self.assertFalse(testmodule.checkElements(objSet, str))
+        objDict = testmodule.TypedDict(str, Derived)
+        self.assertTrue(testmodule.checkElements(objDict, str, Base))
+        self.assertTrue(testmodule.checkElements(objDict, None, Derived))
+        self.assertFalse(testmodule.checkElements(objDict, str, int))
+        self.assertFalse(testmodule.checkElements(objDict, int))
+    
+    def test_Plain(self):
+        """
+        Checks the scan of the plain containers.
+        """
+        self.assertTrue(testmodule.checkElements([1, 2], int))
+        self.assertFalse(testmodule.checkElements([1, '2'], int))
+        self.assertTrue(testmodule.checkElements({'a' : 1}, str, int))
+        self.assertFalse(testmodule.checkElements({'a' : 1}, str, str))
+        self.assertFalse(testmodule.checkElements(['a'], str, str))
+        self.assertTrue(testmodule.checkElements(set(), int))
+    
+    def test_Bulk(self):
+        """
+        Checks that the content of a typed container with a covered declared
+        type is accepted by the bulk operations without re-validation.
+        """
+        objSource = testmodule.TypedList(Derived, [Derived(), Derived()])
+        objTarget = testmodule.TypedList(Base)
+        objTarget.extend(objSource)
+        self.assertEqual(len(objTarget), 2)
+        objTarget = testmodule.TypedSet(Base)
+        objTarget.update(testmodule.TypedSet(Derived, objSource))
+        self.assertEqual(len(objTarget), 2)
+        objTarget = testmodule.TypedDict(str, Base)
+        objTarget.update(testmodule.TypedDict(str, Derived, a = Derived()))
+        self.assertEqual(objTarget.keys(), ['a'])
+        objTarget = testmodule.TypedList(float, [1.0])
+        objTarget.extend(testmodule.TypedList(float, [2.0]))
+        self.assertEqual(objTarget, [1.0, 2.0])
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_TypedList)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_TypedDict)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_TypedSet)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_checkElements)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting pos.typed_containers module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
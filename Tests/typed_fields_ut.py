@@ -0,0 +1,286 @@
+#usr/bin/python
+"""
+Module pos.Tests.typed_fields_ut
+
+Implements unit testing of the module typed_fields.
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import gc
+import weakref
+import copy
+import cPickle
+import unittest
+
+#+ my libraries
+
+import pos.typed_fields as testmodule
+
+from pos.exceptions import CustomTypeError, CustomValueError
+
+#classes
+
+#+ helper classes
+
+class Telemetry(testmodule.TypedRecordABC):
+    """
+    Record with the typed fields and a plain slot.
+    """
+    
+    _Fields = ('Label', )
+    
+    Counter = testmodule.UInt16()
+    
+    Level = testmodule.Int8(-1)
+    
+    Temperature = testmodule.BoundedFloat(20.0, -40.0, 125.0)
+    
+    Version = 1
+    
+    def onInit(self, Label = 'sensor'):
+        """
+        Assigns the initial value of the plain slot.
+        """
+        self.Label = Label
+
+class ExtendedTelemetry(Telemetry):
+    """
+    Subclass adding and narrowing the typed fields.
+    """
+    
+    Level = testmodule.Int8(0, 0, 10)
+    
+    Total = testmodule.UInt64(5)
+
+#+ test cases
+
+class Test_TypedField(unittest.TestCase):
+    """
+    Test cases for the typed field classes of the module pos.typed_fields.
+    """
+    
+    def test_Bounds(self):
+        """
+        Checks the natural and narrowed ranges of the fields, the default
+        values and the improper arguments.
+        """
+        tupRanges = ((testmodule.UInt8, 0, 2**8 - 1),
+                        (testmodule.UInt16, 0, 2**16 - 1),
+                        (testmodule.UInt32, 0, 2**32 - 1),
+                        (testmodule.UInt64, 0, 2**64 - 1),
+                        (testmodule.Int8, -2**7, 2**7 - 1),
+                        (testmodule.Int16, -2**15, 2**15 - 1),
+                        (testmodule.Int32, -2**31, 2**31 - 1),
+                        (testmodule.Int64, -2**63, 2**63 - 1))
+        for clsField, iMin, iMax in tupRanges:
+            objField = clsField()
+            self.assertEqual(objField.Min, iMin)
+            self.assertEqual(objField.Max, iMax)
+            self.assertEqual(objField.Default, 0)
+            self.assertIsNone(objField.Name)
+            with self.assertRaises(CustomValueError):
+                clsField(iMax + 1)
+            with self.assertRaises(CustomValueError):
+                clsField(gMin = iMin - 1)
+            with self.assertRaises(CustomTypeError):
+                clsField(1.0)
+        objField = testmodule.UInt8(gMin = 10, gMax = 20)
+        self.assertEqual(objField.Default, 10)
+        objField = testmodule.BoundedFloat(gMin = -1, gMax = 1)
+        self.assertEqual(objField.Default, 0)
+        self.assertIsInstance(objField.Min, float)
+        with self.assertRaises(CustomValueError):
+            testmodule.BoundedFloat(gMin = 1.0, gMax = -1.0)
+        with self.assertRaises(CustomValueError):
+            testmodule.BoundedFloat(2.0, -1.0, 1.0)
+        with self.assertRaises(CustomTypeError):
+            testmodule.BoundedFloat('1.0')
+    
+    def test_Unbound(self):
+        """
+        Checks that a field not declared in a TypedRecordABC subclass cannot
+        be used via an instance.
+        """
+        class Plain(object):
+            Value = testmodule.UInt8()
+        self.assertIsInstance(Plain.Value, testmodule.UInt8)
+        objTest = Plain()
+        with self.assertRaises(AttributeError):
+            objTest.Value
+        with self.assertRaises(AttributeError):
+            objTest.Value = 1
+
+class Test_TypedRecordABC(unittest.TestCase):
+    """
+    Test cases for the class pos.typed_fields.TypedRecordABC
+    """
+    
+    def test_Access(self):
+        """
+        Checks the default values, the checked assignment and the forbidden
+        deletion of the typed fields.
+        """
+        objTest = Telemetry()
+        objOther = Telemetry()
+        self.assertEqual(objTest.Counter, 0)
+        self.assertEqual(objTest.Level, -1)
+        self.assertEqual(objTest.Temperature, 20.0)
+        self.assertEqual(objTest.Label, 'sensor')
+        objTest.Counter = 65535
+        objTest.Temperature = 3
+        self.assertEqual(objTest.Counter, 65535)
+        self.assertEqual(objTest.Temperature, 3.0)
+        self.assertIsInstance(objTest.Temperature, float)
+        self.assertEqual(objOther.Counter, 0)
+        for gValue in (65536, -1):
+            with self.assertRaises(CustomValueError):
+                objTest.Counter = gValue
+        for gValue in (1.5, '1', None):
+            with self.assertRaises(CustomTypeError):
+                objTest.Counter = gValue
+        for gValue in (-40.5, 125.5, float('nan')):
+            with self.assertRaises(CustomValueError):
+                objTest.Temperature = gValue
+        self.assertEqual(objTest.Counter, 65535)
+        self.assertEqual(objTest.Temperature, 3.0)
+        with self.assertRaises(AttributeError):
+            del objTest.Counter
+        with self.assertRaises(AttributeError):
+            objTest.Unknown = 1
+        objTest.Label = 'other'
+        self.assertEqual(objTest.Label, 'other')
+    
+    def test_ClassLevel(self):
+        """
+        Checks the class level access to the typed fields and the subclasses.
+        """
+        self.assertIsInstance(Telemetry.Counter, testmodule.UInt16)
+        self.assertEqual(Telemetry.Counter.Name, 'Counter')
+        with self.assertRaises(AttributeError):
+            Telemetry.Counter = 1
+        with self.assertRaises(AttributeError):
+            ExtendedTelemetry.Counter = 1
+        with self.assertRaises(AttributeError):
+            del Telemetry.Counter
+        self.assertIsNot(ExtendedTelemetry.Counter, Telemetry.Counter)
+        self.assertEqual(Telemetry.getTypedFields(), ['Counter', 'Level',
+                                                                'Temperature'])
+        self.assertEqual(ExtendedTelemetry.getTypedFields(), ['Counter',
+                                            'Level', 'Temperature', 'Total'])
+        self.assertEqual(Telemetry.getClassFields(), ['Version'])
+        objTest = ExtendedTelemetry()
+        self.assertEqual(objTest.Level, 0)
+        self.assertEqual(objTest.Total, 5)
+        objTest.Total = 2**64 - 1
+        self.assertEqual(objTest.Total, 2**64 - 1)
+        with self.assertRaises(CustomValueError):
+            objTest.Level = 11
+        self.assertEqual(objTest.getFields(), ['Counter', 'Label', 'Level',
+                                        'Temperature', 'Total', 'Version'])
+    
+    def test_Rows(self):
+        """
+        Checks the allocation and re-use of the rows of the slab.
+        """
+        gc.collect()
+        objSlab = Telemetry._objSlab
+        iStart = len(objSlab)
+        lstTest = [Telemetry() for _ in xrange(10)]
+        self.assertEqual(len(objSlab), iStart + 10)
+        lstTest[0].Counter = 10
+        del lstTest
+        self.assertEqual(len(objSlab), iStart)
+        objTest = Telemetry()
+        self.assertEqual(objTest.Counter, 0)
+        self.assertEqual(len(ExtendedTelemetry._objSlab), 0)
+        objTest.Counter = 5
+        objTest.close()
+        self.assertEqual(objTest.Counter, 0)
+        self.assertEqual(objTest.getFields(), ['Counter', 'Level',
+                                                    'Temperature', 'Version'])
+        objTest.Counter = 5
+        self.assertEqual(objTest.Counter, 5)
+    
+    def test_Cycles(self):
+        """
+        Checks that the reference cycles of the instances are collected,
+        nothing is put into gc.garbage, and the rows are released.
+        """
+        self.assertFalse(hasattr(Telemetry, '__del__'))
+        gc.collect()
+        iGarbage = len(gc.garbage)
+        objSlab = Telemetry._objSlab
+        iStart = len(objSlab)
+        lstRefs = []
+        for _ in xrange(100):
+            objFirst = Telemetry()
+            objSecond = Telemetry(objFirst)
+            objFirst.Label = objSecond
+            objFirst.Counter = 1
+            lstRefs.append(weakref.ref(objFirst))
+        del objFirst, objSecond
+        gc.collect()
+        self.assertEqual(len(gc.garbage), iGarbage)
+        self.assertTrue(all(objRef() is None for objRef in lstRefs))
+        self.assertEqual(len(objSlab), iStart)
+        objTest = Telemetry()
+        self.assertEqual(objTest.Counter, 0)
+    
+    def test_SetFields(self):
+        """
+        Checks the bulk assignment including the typed fields.
+        """
+        objTest = Telemetry()
+        objTest.setFields({'Counter' : 7, 'Label' : 'bulk',
+                                                        'Temperature' : 1.5})
+        self.assertEqual(objTest.Counter, 7)
+        self.assertEqual(objTest.Label, 'bulk')
+        self.assertEqual(objTest.Temperature, 1.5)
+        objTest = Telemetry.fromMapping({'Level' : 3}, 'mapped')
+        self.assertEqual(objTest.Level, 3)
+        self.assertEqual(objTest.Label, 'mapped')
+        with self.assertRaises(CustomValueError):
+            objTest.setFields({'Level' : 300})
+        with self.assertRaises(CustomTypeError):
+            objTest.setFields([('Level', 1)])
+    
+    def test_PickleCopy(self):
+        """
+        Checks the pickling and copying of the instances.
+        """
+        objTest = Telemetry('pickled')
+        objTest.Counter = 300
+        objTest.Temperature = -5.5
+        dictState = objTest.__getstate__()[1]
+        self.assertEqual(dictState, {'Label' : 'pickled', 'Counter' : 300,
+                                    'Level' : -1, 'Temperature' : -5.5})
+        for objCopy in (cPickle.loads(cPickle.dumps(objTest, 2)),
+                        copy.copy(objTest), copy.deepcopy(objTest),
+                        objTest.fastCopy()):
+            self.assertIsInstance(objCopy, Telemetry)
+            self.assertEqual(objCopy.Counter, 300)
+            self.assertEqual(objCopy.Temperature, -5.5)
+            self.assertEqual(objCopy.Label, 'pickled')
+            objCopy.Counter = 1
+            self.assertEqual(objTest.Counter, 300)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_TypedField)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_TypedRecordABC)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting pos.typed_fields module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -0,0 +1,238 @@
+#usr/bin/python
+"""
+Module pos.tests.utils.contract_files_ut
+
+Implements unit testing of the module pos.utils.contract_files.
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import shutil
+import tempfile
+import collections
+import json
+import unittest
+
+#+ my libraries
+
+import pos.utils.contract_files as testmodule
+
+from pos.utils.contracts import applyContract
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.exceptions import DCArgumentType, DCArgumentValue, DCReturnValue
+
+#globals
+
+TABLE = {
+    'scale' : {
+        'Args' : {
+            'gValue' : ['int', 'float'],
+            'gFactor' : {'Type' : ['int', 'float'], 'GT' : 0, 'LE' : 100},
+            'strMode' : {'In' : ['round', 'floor']}
+        },
+        'Keywords' : ['strMode'],
+        'Returns' : {'Type' : 'float', 'GE' : 0}
+    },
+    'summarize' : {
+        'Args' : {
+            'dictData' : {'Keys' : 'basestring',
+                            'Items' : {'count' : 'int'},
+                            'Elements' : {'Type' : 'list',
+                                            'Items' : [[0, 'float']]}},
+            'clsResult' : {'SubClass' : 'collections.Mapping'},
+            'gSource' : {'Attributes' : {'name' : 'basestring', 'read' : None}}
+        },
+        'Returns' : None
+    },
+    'stream' : {
+        'Args' : {'seqData' : {'Stream' : {'Elements' : 'int',
+                                                        'MaxLength' : 2}}}
+    }
+}
+
+#classes
+
+#+ test cases
+
+class Test_ContractFiles(unittest.TestCase):
+    """
+    Test cases for the loading of the JSON contract files and their cache.
+    """
+    
+    def setUp(self):
+        """
+        Creates a temporary folder with a contract file.
+        """
+        self.Folder = tempfile.mkdtemp()
+        self.Path = os.path.join(self.Folder, 'table.json')
+        self.writeTable(TABLE)
+    
+    def tearDown(self):
+        """
+        Removes the temporary folder.
+        """
+        shutil.rmtree(self.Folder)
+    
+    def writeTable(self, gTable, strPath = None):
+        """
+        Writes a table as a JSON file.
+        """
+        with open(strPath or self.Path, 'wb') as fileSource:
+            if isinstance(gTable, basestring):
+                fileSource.write(gTable)
+            else:
+                json.dump(gTable, fileSource)
+    
+    def checkTable(self, objTable):
+        """
+        Checks the loaded table by binding its contracts.
+        """
+        self.assertEqual(list(objTable), ['scale', 'stream', 'summarize'])
+        
+        @applyContract(objTable)
+        def scale(gValue, gFactor = 1, strMode = 'round', **kwargs):
+            return float(gValue * gFactor)
+        
+        @applyContract(objTable)
+        def summarize(dictData, clsResult = dict, gSource = None):
+            return None
+        
+        @applyContract(objTable)
+        def stream(seqData):
+            return list(seqData)
+        
+        self.assertEqual(scale(2, 1.5), 3.0)
+        with self.assertRaises(DCArgumentValue):
+            scale(1, 101)
+        with self.assertRaises(DCArgumentValue):
+            scale(1, bAny = 1)
+        with self.assertRaises(DCReturnValue):
+            scale(-1, 1)
+        self.assertIsNone(summarize({'a' : [1.0, 1], 'count' : 1},
+                                                    collections.OrderedDict))
+        with self.assertRaises(DCArgumentType):
+            summarize({'a' : [1]})
+        with self.assertRaises(DCArgumentType):
+            summarize({}, list)
+        with self.assertRaises(DCArgumentType):
+            summarize({}, gSource = 1)
+        self.assertEqual(stream(iter([1, 2])), [1, 2])
+        with self.assertRaises(DCArgumentValue):
+            stream(iter([1, 2, 3]))
+    
+    def test_Load(self):
+        """
+        Checks the loading with the creation and the use of the cache.
+        """
+        strCache = testmodule.getCachePath(self.Path)
+        self.assertEqual(strCache, self.Path + testmodule.CACHE_SUFFIX)
+        self.assertFalse(os.path.exists(strCache))
+        self.checkTable(testmodule.loadContractFile(self.Path, False))
+        self.assertFalse(os.path.exists(strCache))
+        self.checkTable(testmodule.loadContractFile(self.Path))
+        self.assertTrue(os.path.exists(strCache))
+        funcNormalize = testmodule._normalizeTable
+        try:
+            testmodule._normalizeTable = None #must not be called
+            self.checkTable(testmodule.loadContractFile(self.Path))
+        finally:
+            testmodule._normalizeTable = funcNormalize
+        self.assertEqual(sorted(os.listdir(self.Folder)),
+                        ['table.json', 'table.json' + testmodule.CACHE_SUFFIX])
+    
+    def test_Invalidation(self):
+        """
+        Checks that the changed source and the damaged cache are detected.
+        """
+        testmodule.loadContractFile(self.Path)
+        strCache = testmodule.getCachePath(self.Path)
+        self.writeTable({'scale' : {'Args' : {'gValue' : 'str'}}})
+        objTable = testmodule.loadContractFile(self.Path)
+        self.assertEqual(list(objTable), ['scale'])
+        self.assertTrue(objTable.getContract('scale').checkArgument(
+                                                            'gValue', 'a'))
+        with open(strCache, 'wb') as fileCache:
+            fileCache.write('damaged')
+        self.assertEqual(list(testmodule.loadContractFile(self.Path)),
+                                                                    ['scale'])
+        self.assertEqual(list(testmodule.loadContractFile(self.Path)),
+                                                                    ['scale'])
+    
+    def test_Errors(self):
+        """
+        Checks the validation of the contract files.
+        """
+        strCache = testmodule.getCachePath(self.Path)
+        for gTable in ('{"a" : ', [], {'f' : []}, {'f' : {'Args' : []}},
+                        {'f' : {'Args' : {'a' : 1}}},
+                        {'f' : {'Keywords' : 'a'}},
+                        {'f' : {'Args' : {'a' : {'Items' : 1}}}},
+                        {'f' : {'Args' : {'a' : {'Items' : [[1]]}}}},
+                        {'f' : {'Args' : {'a' : {'Type' : []}}}},
+                        {'f' : {'Unknown' : 'int'}},
+                        {'f' : {'Args' : {'a' : {'Unknown' : 1}}}},
+                        {'f' : {'Args' : {'a' : {'Stream' : {'Keys' : 1}}}}},
+                        {'f' : {'Args' : {'a' : 'Unknown'}}},
+                        {'f' : {'Args' : {'a' : 'unknown.module.Class'}}},
+                        {'f' : {'Args' : {'a' : 'len'}}},
+                        {'f' : {'Args' : {'a' : {'GE' : 0,
+                                                'MinLength' : -1}}}}):
+            self.writeTable(gTable)
+            with self.assertRaises((CustomTypeError, CustomValueError)):
+                testmodule.loadContractFile(self.Path)
+            self.assertFalse(os.path.exists(strCache))
+        with self.assertRaises(IOError):
+            testmodule.loadContractFile(self.Path + '.missing')
+        with self.assertRaises(CustomTypeError):
+            testmodule.loadContractFile(1)
+    
+    def test_Folder(self):
+        """
+        Checks the precompilation of a folder and the command line entry
+        point.
+        """
+        strSubFolder = os.path.join(self.Folder, 'sub')
+        os.mkdir(strSubFolder)
+        strOther = os.path.join(strSubFolder, 'other.json')
+        self.writeTable({'f' : {'Returns' : 'int'}}, strOther)
+        strWrong = os.path.join(strSubFolder, 'wrong.json')
+        self.writeTable({'f' : 1}, strWrong)
+        lstResult = testmodule.precompileFolder(self.Folder, False)
+        self.assertEqual(lstResult, [(self.Path, None)])
+        lstResult = testmodule.precompileFolder(self.Folder)
+        self.assertEqual([strPath for strPath, _ in lstResult],
+                                            [self.Path, strOther, strWrong])
+        self.assertIsNone(lstResult[1][1])
+        self.assertIn('CustomTypeError', lstResult[2][1])
+        self.assertTrue(os.path.exists(testmodule.getCachePath(strOther)))
+        self.assertFalse(os.path.exists(testmodule.getCachePath(strWrong)))
+        with self.assertRaises(CustomValueError):
+            testmodule.precompileFolder(self.Path)
+        objStdout, objStderr = sys.stdout, sys.stderr
+        try:
+            sys.stdout = sys.stderr = open(os.devnull, 'w')
+            self.assertEqual(testmodule.main([]), 2)
+            self.assertEqual(testmodule.main([strSubFolder]), 1)
+            os.remove(strWrong)
+            self.assertEqual(testmodule.main([self.Folder]), 0)
+            self.assertEqual(testmodule.main([self.Path]), 1)
+        finally:
+            sys.stdout.close()
+            sys.stdout, sys.stderr = objStdout, objStderr
+
+#+ test suites
+
+TestSuite = unittest.TestLoader().loadTestsFromTestCase(Test_ContractFiles)
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting pos.utils.contract_files module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
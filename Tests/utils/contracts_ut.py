@@ -0,0 +1,1090 @@
+#usr/bin/python
+"""
+Module pos.tests.utils.contracts_ut
+
+Implements unit testing of the module pos.utils.contracts.
+"""
+
+__version__ = "0.0.1.6"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import abc
+import array
+import collections
+import ctypes
+import pickle
+import time
+import types
+import unittest
+
+try:
+    import numpy
+except ImportError: #NumPy is not installed
+    numpy = None
+
+#+ my libraries
+
+import pos.utils.contracts as testmodule
+
+from pos.base_classes import DescriptedABC
+from pos.exceptions import CustomTypeError, CustomValueError, NotInDCError
+from pos.exceptions import DesignContractError
+from pos.exceptions import DCArgumentType, DCArgumentValue
+from pos.exceptions import DCReturnType, DCReturnValue
+
+#globals
+
+DBC = {
+    'scale' : {
+        'Args' : {
+            'gValue' : (int, float),
+            'gFactor' : {'Type' : (int, float), 'GT' : 0, 'LE' : 100},
+            'strMode' : {'In' : ('round', 'floor')}
+        },
+        'Returns' : {'Type' : float, 'GE' : 0}
+    },
+    'join' : {
+        'Args' : {'strSep' : str, 'bStrip' : bool},
+        'VarArgs' : {'MinLength' : 1, 'MaxLength' : 3,
+                        'Items' : {0 : {'Type' : str, 'NE' : ''}},
+                        'Elements' : [str, int]},
+        'Keywords' : ('bStrip', )
+    },
+    'summarize' : {
+        'Args' : {
+            'dictData' : {'Keys' : str, 'Items' : {'count' : int},
+                            'Elements' : {'Type' : list, 'Elements' : float}},
+            'gHandler' : {'Callable' : True},
+            'gSource' : {'Attributes' : {'name' : str, 'read' : None}},
+            'clsResult' : {'SubClass' : collections.Mapping}
+        },
+        'Returns' : int
+    },
+    'Value' : {'Args' : {'gValue' : {'Type' : int, 'NotIn' : (13, )}},
+                'Returns' : int},
+    'create' : {'Args' : {'iSize' : {'Type' : int, 'NotType' : bool}},
+                'Returns' : list},
+    'check' : {'Args' : {'gValue' : [None, {'Type' : int, 'GE' : 0}]}}
+}
+
+#helper functions
+
+@testmodule.applyContract(DBC)
+def scale(gValue, gFactor = 1, strMode = 'round', **kwargs):
+    """
+    Controlled function with the default value parameters and the keyword
+    arguments placeholder.
+    """
+    if kwargs.get('bNegative', False):
+        return -1.0
+    return float(gValue * gFactor)
+
+@testmodule.applyContract(DBC)
+def join(strSep, *args, **kwargs):
+    """
+    Controlled function with the optional positional arguments.
+    """
+    return strSep.join(str(gItem) for gItem in args)
+
+@testmodule.applyContract(DBC)
+def summarize(dictData, gHandler, gSource, clsResult = dict):
+    """
+    Controlled function with the container, callable, duck typing and
+    subclass checks.
+    """
+    return len(dictData)
+
+def plain(gValue):
+    """
+    Function without contract.
+    """
+    return gValue
+
+#classes
+
+#+ helper classes
+
+class Source(object):
+    """
+    Class satisfying the duck typing check.
+    """
+    
+    name = 'source'
+    
+    def read(self):
+        """
+        Does nothing.
+        """
+        pass
+
+class Controlled(object):
+    """
+    Class with the controlled methods and property.
+    """
+    
+    def __init__(self):
+        """
+        Initialization.
+        """
+        self._iValue = 1
+    
+    def getValue(self):
+        """
+        Getter.
+        """
+        return self._iValue
+    
+    def setValue(self, gValue):
+        """
+        Setter.
+        """
+        self._iValue = gValue
+        if gValue == 7:
+            return gValue
+    
+    Value = testmodule.applyContract(DBC, 'Value')(property(getValue,
+                                                                setValue))
+    
+    @testmodule.applyContract(DBC)
+    @classmethod
+    def create(cls, iSize):
+        """
+        Class method.
+        """
+        if iSize > 10:
+            return None
+        return [cls] * iSize
+    
+    @staticmethod
+    @testmodule.applyContract(DBC)
+    def check(gValue):
+        """
+        Static method.
+        """
+        return gValue
+    
+    @testmodule.applyContract(DBC, 'check')
+    def method(self, gValue):
+        """
+        Instance method.
+        """
+        return gValue
+
+class DescriptedControlled(DescriptedABC):
+    """
+    DescriptedABC subclass with a controlled method, which resolution is
+    cached by the meta-class.
+    """
+    
+    def onInit(self):
+        """
+        No fields.
+        """
+        pass
+    
+    @testmodule.applyContract(DBC, 'check')
+    def method(self, gValue):
+        """
+        Instance method.
+        """
+        return gValue
+
+class ControlledMixin(object):
+    """
+    Plain class with a controlled method, inherited by a DescriptedABC
+    subclass.
+    """
+    
+    @testmodule.applyContract(DBC, 'check')
+    def mixinMethod(self, gValue):
+        """
+        Instance method.
+        """
+        return gValue
+
+class DescriptedMixed(ControlledMixin, DescriptedABC):
+    """
+    DescriptedABC subclass inheriting a controlled method from a plain class.
+    """
+    
+    def onInit(self):
+        """
+        No fields.
+        """
+        pass
+
+class CountingMeta(abc.ABCMeta):
+    """
+    ABC meta-class counting the isinstance() and issubclass() checks.
+    """
+    
+    Checks = 0
+    
+    def __instancecheck__(cls, gValue):
+        """
+        Counts and forwards the check.
+        """
+        CountingMeta.Checks += 1
+        return super(CountingMeta, cls).__instancecheck__(gValue)
+    
+    def __subclasscheck__(cls, clsValue):
+        """
+        Counts and forwards the check.
+        """
+        CountingMeta.Checks += 1
+        return super(CountingMeta, cls).__subclasscheck__(clsValue)
+
+class Readable(object):
+    """
+    ABC with the virtual subclasses.
+    """
+    
+    __metaclass__ = CountingMeta
+
+class Stream(object):
+    """
+    Class to be registered as a virtual subclass.
+    """
+    
+    pass
+
+#+ test cases
+
+class Test_Compilation(unittest.TestCase):
+    """
+    Test cases for the compilation of the contracts and the binding.
+    """
+    
+    def test_Contract(self):
+        """
+        Checks the compiled contract inspection.
+        """
+        objContract = testmodule.Contract(DBC['scale'], 'scale')
+        self.assertEqual(objContract.Name, 'scale')
+        self.assertEqual(objContract.Arguments, ('gFactor', 'gValue',
+                                                                'strMode'))
+        self.assertTrue(objContract.checkArgument('gFactor', 100))
+        self.assertFalse(objContract.checkArgument('gFactor', 0))
+        self.assertFalse(objContract.checkArgument('gValue', '1'))
+        self.assertTrue(objContract.checkArgument('unknown', '1'))
+        self.assertTrue(objContract.checkResult(1.0))
+        self.assertFalse(objContract.checkResult(-1.0))
+        self.assertTrue(objContract.checkVarArgs(('a', 'b')))
+        objContract = testmodule.Contract(DBC['join'])
+        self.assertFalse(objContract.checkVarArgs(()))
+        self.assertFalse(objContract.checkVarArgs(('', )))
+        self.assertTrue(objContract.checkVarArgs(('a', 1, 'b')))
+        self.assertIs(scale.Contract.Name, 'scale')
+        self.assertEqual(scale.__name__, 'scale')
+        self.assertEqual(scale.__wrapped__(1, 2), 2.0)
+    
+    def test_Table(self):
+        """
+        Checks the look-up table of the contracts.
+        """
+        objTable = testmodule.ContractTable(DBC)
+        self.assertEqual(len(objTable), len(DBC))
+        self.assertIn('join', objTable)
+        self.assertEqual(list(objTable), sorted(DBC))
+        objContract = objTable.getContract('join')
+        self.assertIs(objTable.getContract('join'), objContract)
+        with self.assertRaises(NotInDCError):
+            objTable.getContract('plain')
+        funcChecked = testmodule.applyContract(objTable, 'check')(plain)
+        self.assertEqual(funcChecked(1), 1)
+        with self.assertRaises(DCArgumentValue):
+            funcChecked(-1)
+        with self.assertRaises(CustomTypeError):
+            testmodule.ContractTable({'a' : 1})
+    
+    def test_Errors(self):
+        """
+        Checks the errors in the contracts definitions and binding.
+        """
+        with self.assertRaises(NotInDCError):
+            testmodule.applyContract(DBC)(plain)
+        self.assertIsInstance(NotInDCError('plain'), DesignContractError)
+        for gContract in (1, {'Args' : []}, {'Args' : {1 : int}},
+                            {'Args' : {'a' : 1}}, {'Keywords' : 'a'},
+                            {'Args' : {'a' : {'Type' : 1}}},
+                            {'Args' : {'a' : {'MinLength' : 1.0}}},
+                            {'Args' : {'a' : {'In' : 1}}},
+                            {'Args' : {'a' : {'Items' : [int]}}}):
+            with self.assertRaises(CustomTypeError):
+                testmodule.Contract(gContract)
+        for gContract in ({'Unknown' : {}}, {'Args' : {'a' : {}}},
+                            {'Args' : {'a' : {'Unknown' : 1}}},
+                            {'Args' : {'a' : []}},
+                            {'Args' : {'a' : {'MinLength' : -1}}},
+                            {'Args' : {'a' : {'MinLength' : 2,
+                                                    'MaxLength' : 1}}}):
+            with self.assertRaises(CustomValueError):
+                testmodule.Contract(gContract)
+        with self.assertRaises(CustomValueError):
+            testmodule.applyContract(DBC, 'check')(lambda x: x)
+        with self.assertRaises(CustomValueError):
+            testmodule.applyContract(DBC, 'join')(lambda strSep: strSep)
+        with self.assertRaises(CustomTypeError):
+            testmodule.applyContract(DBC, 'check')(len)
+        with self.assertRaises(CustomTypeError):
+            testmodule.applyContract([DBC])
+        with self.assertRaises(CustomTypeError):
+            testmodule.applyContract(DBC, 1)
+
+class Test_Checks(unittest.TestCase):
+    """
+    Test cases for the checks performed by the controlled functions and
+    methods.
+    """
+    
+    def test_Arguments(self):
+        """
+        Checks the type and value checks on the named arguments passed as the
+        positional or keyword arguments.
+        """
+        self.assertEqual(scale(2, 1.5), 3.0)
+        self.assertEqual(scale(gFactor = 2, gValue = 3), 6.0)
+        self.assertEqual(scale(1, strMode = 'floor', bAny = 1), 1.0)
+        for tupArgs, dictKwargs in ((('1', ), {}), ((1, '2'), {}),
+                                    ((), {'gValue' : None})):
+            with self.assertRaises(DCArgumentType):
+                scale(*tupArgs, **dictKwargs)
+        for tupArgs, dictKwargs in (((1, 0), {}), ((1, 101), {}),
+                                    ((1, ), {'strMode' : 'ceil'}),
+                                    ((1, 1, 'ceil'), {})):
+            with self.assertRaises(DCArgumentValue) as objContext:
+                scale(*tupArgs, **dictKwargs)
+            self.assertIsInstance(objContext.exception, DesignContractError)
+        with self.assertRaises(DCReturnValue):
+            scale(1, bNegative = True)
+        with self.assertRaises(TypeError):
+            scale()
+    
+    def test_VarArgs(self):
+        """
+        Checks the optional positional arguments and the keyword names checks.
+        """
+        self.assertEqual(join(',', 'a', 1), 'a,1')
+        self.assertEqual(join(',', 'a', bStrip = True), 'a')
+        with self.assertRaises(DCArgumentValue):
+            join(',')
+        with self.assertRaises(DCArgumentValue):
+            join(',', 'a', 'b', 'c', 'd')
+        with self.assertRaises(DCArgumentValue):
+            join(',', '')
+        with self.assertRaises(DCArgumentType):
+            join(',', 1)
+        with self.assertRaises(DCArgumentType):
+            join(',', 'a', 1.0)
+        with self.assertRaises(DCArgumentType):
+            join(',', 'a', bStrip = 1)
+        with self.assertRaises(DCArgumentValue) as objContext:
+            join(',', 'a', bUnknown = True)
+        self.assertEqual(objContext.exception.args[0], 'bUnknown')
+    
+    def test_Containers(self):
+        """
+        Checks the mapping, callable, duck typing and subclass checks.
+        """
+        dictData = {'count' : 2, 'x' : [1.0, 2.0], 'y' : []}
+        self.assertEqual(summarize(dictData, len, Source()), 3)
+        self.assertEqual(summarize({}, Source, Source(),
+                                    collections.OrderedDict), 0)
+        for tupArgs in (([], len, Source()), ({1 : []}, len, Source()),
+                        ({'count' : 1.0}, len, Source()),
+                        ({'x' : (1.0, )}, len, Source()),
+                        ({'x' : [1.0, 1]}, len, Source()),
+                        ({}, 1, Source()), ({}, len, object()),
+                        ({}, len, Source(), list)):
+            with self.assertRaises(DCArgumentType):
+                summarize(*tupArgs)
+        objSource = Source()
+        objSource.name = 1
+        with self.assertRaises(DCArgumentType):
+            summarize({}, len, objSource)
+    
+    def test_Methods(self):
+        """
+        Checks the controlled property, class, static and instance methods.
+        """
+        objTest = Controlled()
+        self.assertEqual(objTest.Value, 1)
+        objTest.Value = 5
+        self.assertEqual(objTest.Value, 5)
+        with self.assertRaises(DCArgumentValue):
+            objTest.Value = 13
+        with self.assertRaises(DCArgumentType):
+            objTest.Value = 1.0
+        with self.assertRaises(DCReturnType):
+            objTest.Value = 7
+        objTest._iValue = '1'
+        with self.assertRaises(DCReturnType):
+            objTest.Value
+        self.assertEqual(Controlled.create(2), [Controlled, Controlled])
+        self.assertEqual(objTest.create(0), [])
+        with self.assertRaises(DCArgumentType):
+            Controlled.create(True)
+        with self.assertRaises(DCReturnType):
+            Controlled.create(11)
+        self.assertIsNone(Controlled.check(None))
+        self.assertEqual(objTest.check(gValue = 2), 2)
+        with self.assertRaises(DCArgumentValue):
+            objTest.check(-1)
+        with self.assertRaises(DCArgumentType):
+            Controlled.check('1')
+        self.assertEqual(objTest.method(1), 1)
+        with self.assertRaises(DCArgumentValue):
+            objTest.method(gValue = -1)
+
+class Test_Switch(unittest.TestCase):
+    """
+    Test cases for the run-time enabling / disabling of the checks.
+    """
+    
+    def tearDown(self):
+        """
+        Restores the enabled state.
+        """
+        testmodule.enableContracts()
+    
+    def checkDisabled(self):
+        """
+        Checks that all controlled functions and methods of this module are
+        unchecked.
+        """
+        self.assertFalse(hasattr(scale, 'Contract'))
+        self.assertEqual(scale(1, 0), 0.0)
+        self.assertEqual(join(',', ''), '')
+        objTest = Controlled()
+        objTest.Value = 13
+        self.assertEqual(objTest.Value, 13)
+        self.assertEqual(Controlled.create(True), [Controlled])
+        self.assertEqual(Controlled.check(-1), -1)
+        self.assertEqual(objTest.method(-1), -1)
+        self.assertEqual(DescriptedControlled().method(-1), -1)
+        self.assertEqual(DescriptedMixed().mixinMethod(-1), -1)
+    
+    def checkEnabled(self):
+        """
+        Checks that all controlled functions and methods of this module are
+        checked.
+        """
+        self.assertIs(scale.Contract.Name, 'scale')
+        with self.assertRaises(DCArgumentValue):
+            scale(1, 0)
+        with self.assertRaises(DCArgumentValue):
+            join(',', '')
+        objTest = Controlled()
+        with self.assertRaises(DCArgumentValue):
+            objTest.Value = 13
+        with self.assertRaises(DCArgumentType):
+            Controlled.create(True)
+        with self.assertRaises(DCArgumentValue):
+            Controlled.check(-1)
+        with self.assertRaises(DCArgumentValue):
+            objTest.method(-1)
+        with self.assertRaises(DCArgumentValue):
+            DescriptedControlled().method(-1)
+        with self.assertRaises(DCArgumentValue):
+            DescriptedMixed().mixinMethod(-1)
+    
+    def test_Module(self):
+        """
+        Checks the switch for a single module.
+        """
+        self.checkEnabled()
+        self.assertTrue(testmodule.areContractsEnabled(__name__))
+        iVersion = DescriptedMixed._iVersion
+        self.assertEqual(testmodule.disableContracts(__name__), 9)
+        self.assertGreater(DescriptedMixed._iVersion, iVersion)
+        self.assertFalse(testmodule.areContractsEnabled(__name__))
+        self.assertTrue(testmodule.areContractsEnabled())
+        self.checkDisabled()
+        self.assertEqual(testmodule.disableContracts(__name__), 0)
+        self.assertEqual(testmodule.enableContracts(__name__), 9)
+        self.checkEnabled()
+        with self.assertRaises(CustomTypeError):
+            testmodule.enableContracts(1)
+    
+    def test_Global(self):
+        """
+        Checks the global switch and the decoration while the checks are
+        disabled.
+        """
+        testmodule.disableContracts()
+        self.assertFalse(testmodule.areContractsEnabled(__name__))
+        self.checkDisabled()
+        funcTest = testmodule.applyContract(DBC, 'check')(plain)
+        self.assertIsNot(funcTest, plain)
+        self.assertEqual(funcTest(-1), -1)
+        testmodule.enableContracts(__name__)
+        self.assertFalse(testmodule.areContractsEnabled())
+        self.checkEnabled()
+        self.assertEqual(plain(-1), -1)
+        testmodule.enableContracts()
+        self.checkEnabled()
+
+class Test_Sampling(unittest.TestCase):
+    """
+    Test cases for the sampling policies and the call sites counters.
+    """
+    
+    def makeSite(self, objSampling):
+        """
+        Creates a controlled function with the sampling policy.
+        """
+        
+        def sampled(gValue):
+            return gValue
+        
+        return testmodule.applyContract(DBC, 'check', objSampling)(sampled)
+    
+    def countViolations(self, funcTest, iCalls):
+        """
+        Calls the function with the wrong argument and counts the raised
+        exceptions.
+        """
+        iResult = 0
+        for _ in range(iCalls):
+            try:
+                funcTest(-1)
+            except DesignContractError:
+                iResult += 1
+        return iResult
+    
+    def test_EveryNth(self):
+        """
+        Checks one in N calls policy and the statistics.
+        """
+        objSampling = testmodule.SampleEveryNth(3)
+        self.assertEqual(objSampling.Period, 3)
+        funcTest = self.makeSite(objSampling)
+        testmodule.resetContractStats(__name__)
+        self.assertEqual(self.countViolations(funcTest, 10), 4)
+        self.assertEqual(funcTest(5), 5)
+        dictStats = testmodule.getContractStats(__name__)[
+                                                    __name__ + '.sampled']
+        self.assertEqual(dictStats, {'Calls' : 11, 'Checks' : 4,
+                                        'Violations' : 4, 'Rate' : 4.0 / 11})
+        self.assertIn(__name__ + '.sampled', testmodule.getContractStats())
+        testmodule.resetContractStats()
+        self.assertEqual(testmodule.getContractStats(__name__)[
+                                        __name__ + '.sampled']['Rate'], 0.0)
+    
+    def test_FirstThenEveryNth(self):
+        """
+        Checks the first K calls then one in N calls policy.
+        """
+        objSampling = testmodule.SampleFirstThenEveryNth(5, 10)
+        self.assertEqual((objSampling.First, objSampling.Period), (5, 10))
+        funcTest = self.makeSite(objSampling)
+        self.assertEqual(self.countViolations(funcTest, 5), 5)
+        self.assertEqual(self.countViolations(funcTest, 30), 3)
+        funcTest = self.makeSite(testmodule.SampleFirstThenEveryNth(0, 1))
+        self.assertEqual(self.countViolations(funcTest, 7), 7)
+    
+    def test_TimeBudget(self):
+        """
+        Checks the time budget policy.
+        """
+        objSampling = testmodule.SampleTimeBudget(0.5)
+        self.assertEqual(objSampling.Fraction, 0.5)
+        funcTest = self.makeSite(objSampling)
+        iViolations = self.countViolations(funcTest, 1000)
+        self.assertGreaterEqual(iViolations, 1)
+        self.assertLess(iViolations, 1000)
+        funcTest = self.makeSite(testmodule.SampleTimeBudget(1))
+        self.assertEqual(funcTest(1), 1)
+        self.assertEqual(testmodule.SampleTimeBudget(0.1).Window, 0.1)
+    
+    def test_TimeBudgetIdle(self):
+        """
+        Checks that an idle period, either before or after the first call,
+        does not allow a burst of the checks in the following hot loop.
+        """
+        for bFirst in (False, True):
+            funcTest = self.makeSite(testmodule.SampleTimeBudget(0.01, 0.01))
+            if bFirst:
+                self.assertEqual(self.countViolations(funcTest, 1), 1)
+            time.sleep(0.3)
+            self.assertLess(self.countViolations(funcTest, 2000), 100)
+    
+    def test_Errors(self):
+        """
+        Checks the improper policies parameters.
+        """
+        for gValue in (1.0, '1', True):
+            with self.assertRaises(CustomTypeError):
+                testmodule.SampleEveryNth(gValue)
+        with self.assertRaises(CustomValueError):
+            testmodule.SampleEveryNth(0)
+        with self.assertRaises(CustomValueError):
+            testmodule.SampleFirstThenEveryNth(-1, 1)
+        with self.assertRaises(CustomTypeError):
+            testmodule.SampleTimeBudget('1')
+        for gValue in (0, 1.5, -0.1):
+            with self.assertRaises(CustomValueError):
+                testmodule.SampleTimeBudget(gValue)
+        with self.assertRaises(CustomTypeError):
+            testmodule.SampleTimeBudget(0.5, '1')
+        with self.assertRaises(CustomValueError):
+            testmodule.SampleTimeBudget(0.5, 0)
+        with self.assertRaises(CustomTypeError):
+            testmodule.applyContract(DBC, 'check', 1)
+        with self.assertRaises(TypeError):
+            testmodule.SamplingPolicy()
+
+class Test_TypeCache(unittest.TestCase):
+    """
+    Test cases for the cache of the type checks verdicts.
+    """
+    
+    def test_Cache(self):
+        """
+        Checks that the repeated checks with the same types skip the ABC
+        machinery and that the registration of a virtual subclass or the
+        explicit clearing invalidates the cache.
+        """
+        objTable = {'read' : {'Args' : {'gSource' : [Readable, dict],
+                                        'clsSource' : {'SubClass' : Readable},
+                                        'gOther' : {'NotType' : Readable}}}}
+        
+        @testmodule.applyContract(objTable)
+        def read(gSource, clsSource = Readable, gOther = None):
+            return gSource
+        
+        with self.assertRaises(DCArgumentType):
+            read(Stream())
+        self.assertEqual(read({}), {})
+        iChecks = CountingMeta.Checks
+        self.assertGreater(iChecks, 0)
+        for _ in range(5):
+            with self.assertRaises(DCArgumentType):
+                read(Stream())
+        self.assertEqual(read({'a' : 1}), {'a' : 1})
+        self.assertEqual(CountingMeta.Checks, iChecks)
+        Readable.register(Stream)
+        objStream = Stream()
+        self.assertIs(read(objStream), objStream)
+        self.assertIs(read(objStream, Stream), objStream)
+        with self.assertRaises(DCArgumentType):
+            read(objStream, gOther = objStream)
+        with self.assertRaises(DCArgumentType):
+            read(objStream, dict)
+        with self.assertRaises(DCArgumentType):
+            read(objStream, 1)
+        read(objStream, Stream, 1)
+        iChecks = CountingMeta.Checks
+        for _ in range(5):
+            read(objStream, Stream, 1)
+        self.assertEqual(CountingMeta.Checks, iChecks)
+        testmodule.clearTypeCaches()
+        read(objStream, Stream, 1)
+        self.assertGreater(CountingMeta.Checks, iChecks)
+
+class Test_Vectorized(unittest.TestCase):
+    """
+    Test cases for the vectorized checks of the numeric arrays.
+    """
+    
+    def setUp(self):
+        """
+        Creates the controlled functions with the vectorizable and not
+        vectorizable rules on the elements.
+        """
+        objTable = {
+            'bounded' : {'Args' : {'seqData' : {'Elements' : {'Type' : float,
+                                            'GE' : 0.0, 'LT' : 1.0}}}},
+            'counts' : {'Args' : {'seqData' : {'Elements' : {'Type' : int,
+                                                'NE' : 0, 'LE' : 200}}}},
+            'indexed' : {'Args' : {'seqData' : {'Items' : {0 : {'GT' : 10}},
+                                                'Elements' : int}}},
+            'rows' : {'Args' : {'seqData' : {'Elements' : {'Elements' : {
+                                                'Type' : int, 'GE' : 0}}}}}
+        }
+        
+        @testmodule.applyContract(objTable)
+        def bounded(seqData):
+            return len(seqData)
+        
+        @testmodule.applyContract(objTable)
+        def counts(seqData):
+            return len(seqData)
+        
+        @testmodule.applyContract(objTable)
+        def indexed(seqData):
+            return len(seqData)
+        
+        @testmodule.applyContract(objTable)
+        def rows(seqData):
+            return len(seqData)
+        
+        self.bounded = bounded
+        self.counts = counts
+        self.indexed = indexed
+        self.rows = rows
+    
+    def test_Array(self):
+        """
+        Checks the array.array arguments: the passed checks, the index of the
+        first offending element and the type checks by the typecode.
+        """
+        arrData = array.array('d', [0.001 * iIndex for iIndex in range(1000)])
+        self.assertEqual(self.bounded(arrData), 1000)
+        self.assertEqual(self.bounded(array.array('d')), 0)
+        arrData[700] = 1.0
+        arrData[500] = -0.5
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.bounded(arrData)
+        self.assertIn('seqData[500]', str(objContext.exception))
+        arrData[500] = 0.5
+        arrData[300] = float('nan')
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.bounded(arrData)
+        self.assertIn('seqData[300]', str(objContext.exception))
+        with self.assertRaises(DCArgumentType):
+            self.bounded(array.array('l', [1, 2]))
+        arrCounts = array.array('l', range(1, 201))
+        self.assertEqual(self.counts(arrCounts), 200)
+        arrCounts[150] = 0
+        arrCounts[100] = 201
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.counts(arrCounts)
+        self.assertIn('seqData[100]', str(objContext.exception))
+        with self.assertRaises(DCArgumentType):
+            self.counts(array.array('L', [1, 2])) #elements are long
+        self.assertEqual(self.counts(array.array('c', 'abc')[:0]), 0)
+        with self.assertRaises(DCArgumentType):
+            self.counts(array.array('c', 'abc'))
+        self.assertEqual(self.indexed(array.array('i', [11, 0])), 2)
+        with self.assertRaises(DCArgumentValue):
+            self.indexed(array.array('i', [10, 0]))
+    
+    def test_Buffer(self):
+        """
+        Checks the memoryview arguments, which elements are the decoded
+        numbers, not the characters.
+        """
+        self.assertEqual(self.counts(memoryview(bytearray([1, 200, 3]))), 3)
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.counts(memoryview(bytearray([1, 2, 0, 3])))
+        self.assertIn('seqData[2]', str(objContext.exception))
+        with self.assertRaises(DCArgumentValue):
+            self.counts(memoryview(bytearray([255])))
+        with self.assertRaises(DCArgumentType):
+            self.bounded(memoryview('abc'))
+    
+    def test_BufferFormats(self):
+        """
+        Checks the memoryview arguments with the explicit byte order, with the
+        formats not supported by the array module and the multi-dimensional
+        ones - the latter are checked element by element.
+        """
+        objBuffer = memoryview((ctypes.c_double * 3)(0.5, 0.0, 1.0))
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.bounded(objBuffer)
+        self.assertIn('seqData[2]', str(objContext.exception))
+        self.assertEqual(self.bounded(objBuffer[:2]), 2)
+        objBuffer = memoryview((ctypes.c_uint64 * 3)(1, 200, 3))
+        self.assertEqual(self.counts(objBuffer), 3)
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.counts(memoryview((ctypes.c_uint64 * 3)(1, 201, 3)))
+        self.assertIn('seqData[1]', str(objContext.exception))
+        objBuffer = memoryview((ctypes.c_bool * 2)(True, False))
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.counts(objBuffer)
+        self.assertIn('seqData[1]', str(objContext.exception))
+        with self.assertRaises(DCArgumentType):
+            self.bounded(objBuffer)
+        if sys.byteorder == 'little':
+            clsForeign = ctypes.c_int32.__ctype_be__
+        else:
+            clsForeign = ctypes.c_int32.__ctype_le__
+        self.assertEqual(self.counts(memoryview((clsForeign * 2)(1, 2))), 2)
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.counts(memoryview((clsForeign * 3)(1, 0, 3)))
+        self.assertIn('seqData[1]', str(objContext.exception))
+        objBuffer = memoryview(((ctypes.c_int32 * 2) * 2)((1, 2), (3, 0)))
+        self.assertEqual(self.rows(objBuffer), 2)
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.rows(memoryview(((ctypes.c_int32 * 2) * 2)((1, 2), (-3, 0))))
+        self.assertIn('seqData[1][0]', str(objContext.exception))
+    
+    def test_Sequence(self):
+        """
+        Checks that the generic sequences give the same results.
+        """
+        self.assertEqual(self.bounded([0.5, 0.0]), 2)
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.bounded((0.5, 0.0, 1.5, -1.0))
+        self.assertIn('seqData[2]', str(objContext.exception))
+        with self.assertRaises(DCArgumentType):
+            self.counts([1, 2.0])
+        with self.assertRaises(DCArgumentType):
+            self.counts('abc')
+    
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_Numpy(self):
+        """
+        Checks the numpy.ndarray arguments.
+        """
+        arrData = numpy.linspace(0.0, 0.999, 1000)
+        self.assertEqual(self.bounded(arrData), 1000)
+        arrData[700] = float('nan')
+        arrData[800] = 2.0
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.bounded(arrData)
+        self.assertIn('seqData[700]', str(objContext.exception))
+        with self.assertRaises(DCArgumentType):
+            self.bounded(numpy.zeros(3, dtype = numpy.int8))
+        self.assertEqual(self.bounded(numpy.zeros((2, 3))[:0]), 0)
+
+class Test_Streams(unittest.TestCase):
+    """
+    Test cases for the lazy checks of the iterators and generators.
+    """
+    
+    def setUp(self):
+        """
+        Creates the controlled functions with the 'Stream' rules on the
+        arguments and the result.
+        """
+        objTable = {
+            'total' : {'Args' : {
+                        'seqData' : {'Stream' : {'Elements' : (int, float),
+                                        'MinLength' : 2, 'MaxLength' : 5}},
+                        'seqWeights' : {'Stream' : {'Elements' : {'GT' : 0}}}}},
+            'produce' : {'Args' : {'iSize' : int},
+                            'Returns' : {'Type' : types.GeneratorType,
+                                        'Stream' : {'Elements' : str,
+                                                            'Length' : 3}}}
+        }
+        
+        @testmodule.applyContract(objTable)
+        def total(seqData, seqWeights = (1, ), **kwargs):
+            self.Passed = seqData
+            list(seqWeights)
+            return sum(seqData)
+        
+        @testmodule.applyContract(objTable)
+        def produce(iSize, gItem = 'a'):
+            return (gItem for _ in xrange(iSize))
+        
+        self.total = total
+        self.produce = produce
+    
+    def test_Arguments(self):
+        """
+        Checks the lazy checks of the iterator arguments and the eager checks
+        of the other iterables.
+        """
+        self.assertEqual(self.total(iter([1, 2.5, 3])), 6.5)
+        self.assertEqual(self.total(seqData = (x for x in (1, 2))), 3)
+        lstData = [1, 2]
+        self.assertEqual(self.total(lstData), 3)
+        self.assertIs(self.Passed, lstData)
+        lstConsumed = []
+        
+        def generate():
+            for gItem in (1, 2, 'a', 3):
+                lstConsumed.append(gItem)
+                yield gItem
+        
+        with self.assertRaises(DCArgumentType):
+            self.total(generate())
+        self.assertEqual(lstConsumed, [1, 2, 'a'])
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.total(iter([1]))
+        self.assertIn('length >= 2', str(objContext.exception))
+        with self.assertRaises(DCArgumentValue):
+            self.total(xrange(6).__iter__())
+        self.Passed = None
+        with self.assertRaises(DCArgumentValue):
+            self.total([1, 2, 3, 4, 5, 6])
+        self.assertIsNone(self.Passed)
+        with self.assertRaises(DCArgumentType):
+            self.total(1)
+        with self.assertRaises(DCArgumentValue) as objContext:
+            self.total([1, 2], seqWeights = iter([1, 0]))
+        self.assertIn('seqWeights[1]', str(objContext.exception))
+    
+    def test_ConstantMemory(self):
+        """
+        Checks that a long stream is not buffered.
+        """
+        objTable = {'count' : {'Args' : {'seqData' : {'Stream' : {
+                                    'Elements' : int, 'MinLength' : 1}}},
+                                'Returns' : int}}
+        
+        @testmodule.applyContract(objTable)
+        def count(seqData):
+            iResult = 0
+            for _ in seqData:
+                iResult += 1
+            return iResult
+        
+        self.assertEqual(count(iter(xrange(100000))), 100000)
+    
+    def test_Result(self):
+        """
+        Checks the lazy checks of a returned generator.
+        """
+        self.assertEqual(list(self.produce(3)), ['a', 'a', 'a'])
+        with self.assertRaises(DCReturnType):
+            list(self.produce(3, 1))
+        objResult = self.produce(2)
+        self.assertEqual(next(objResult), 'a')
+        self.assertEqual(next(objResult), 'a')
+        with self.assertRaises(DCReturnValue):
+            next(objResult)
+        with self.assertRaises(DCReturnValue):
+            list(self.produce(4))
+    
+    def test_Sampling(self):
+        """
+        Checks that the violations found upon the consumption are counted.
+        """
+        objTable = {'first' : {'Args' : {
+                        'seqData' : {'Stream' : {'Elements' : int}}}}}
+        
+        def first(seqData):
+            return list(seqData)
+        
+        funcTest = testmodule.applyContract(objTable, 'first',
+                                    testmodule.SampleEveryNth(1))(first)
+        testmodule.resetContractStats(__name__)
+        self.assertEqual(funcTest(iter([1, 2])), [1, 2])
+        with self.assertRaises(DCArgumentType):
+            funcTest(iter([1, 'a']))
+        with self.assertRaises(DCArgumentType):
+            funcTest(['a'])
+        dictStats = testmodule.getContractStats(__name__)[
+                                                        __name__ + '.first']
+        self.assertEqual(dictStats['Violations'], 2)
+    
+    def test_Contract(self):
+        """
+        Checks the compilation errors and the contract inspection.
+        """
+        objContract = testmodule.Contract({'Args' : {'a' : {'Stream' : {
+                                                        'Elements' : int}}},
+                                    'Returns' : {'Stream' : {'Length' : 1}}})
+        self.assertEqual(objContract.Arguments, ('a', ))
+        self.assertTrue(objContract.checkArgument('a', [1, 2]))
+        self.assertFalse(objContract.checkArgument('a', [1, 'b']))
+        self.assertFalse(objContract.checkArgument('a', 1))
+        self.assertTrue(objContract.checkArgument('a', iter(['b'])))
+        self.assertTrue(objContract.checkResult((1, )))
+        self.assertFalse(objContract.checkResult(()))
+        for gContract in ({'Args' : {'a' : {'Stream' : {'Unknown' : 1}}}},
+                        {'Args' : {'a' : {'Elements' : {'Stream' : {}}}}},
+                        {'VarArgs' : {'Stream' : {}}},
+                        {'Args' : {'a' : {'Stream' : {'MinLength' : -1}}}}):
+            with self.assertRaises(CustomValueError):
+                testmodule.Contract(gContract)
+        with self.assertRaises(CustomTypeError):
+            testmodule.Contract({'Args' : {'a' : {'Stream' : int}}})
+
+class Test_Batch(unittest.TestCase):
+    """
+    Test cases for the validation of the batches of records.
+    """
+    
+    def test_Record(self):
+        """
+        Checks the validation of a single record.
+        """
+        objContract = testmodule.Contract(DBC['scale'], 'scale')
+        self.assertEqual(objContract.checkRecord({'gValue' : 1,
+                                                        'gFactor' : 2}), [])
+        self.assertEqual(objContract.checkRecord({'gValue' : '1',
+                                'gFactor' : 0, 'strMode' : 'ceil', 'x' : 1}),
+                            [('gFactor: > 0', '0'),
+                            ('gValue: type int or float', "'1'"),
+                            ('strMode: in {!r}'.format(('round', 'floor')),
+                                                                "'ceil'")])
+        self.assertEqual(objContract.checkRecord((1, 200), ('gValue',
+                                    'gFactor')), [('gFactor: <= 100', '200')])
+        self.assertEqual(objContract.checkRecord((1, 2))[0][0],
+                        'record: type dict, or tuple with the field names')
+        objContract = testmodule.Contract(DBC['join'])
+        self.assertEqual(objContract.checkRecord([',', '', 'a'], ['strSep']),
+                                                [('*args[0]: != \'\'', "''")])
+        objContract = testmodule.Contract({'Args' : {'a' : {'Stream' : {
+                                    'Elements' : int, 'MaxLength' : 2}}}})
+        self.assertEqual(objContract.checkRecord({'a' : [1, 2, 3]}),
+                                                [('a: length <= 2', '3')])
+        self.assertEqual(objContract.checkRecord({'a' : [1, 'x' * 100]}),
+                            [('a[1]: type int', "'" + 'x' * 76 + '...')])
+    
+    def test_Pickle(self):
+        """
+        Checks that a contract is re-compiled when unpickled.
+        """
+        objContract = testmodule.Contract(DBC['summarize'], 'summarize')
+        objCopy = pickle.loads(pickle.dumps(objContract, 2))
+        self.assertEqual(objCopy.Name, 'summarize')
+        self.assertEqual(objCopy.Arguments, objContract.Arguments)
+        self.assertFalse(objCopy.checkArgument('clsResult', list))
+    
+    def test_Batch(self):
+        """
+        Checks the batch validation in the current process and in a pool.
+        """
+        lstRecords = [{'gValue' : iIndex % 7, 'gFactor' : iIndex % 5}
+                                                    for iIndex in range(100)]
+        lstRecords[50] = (1, 1)
+        lstRecords[60] = {'gValue' : None}
+        lstExpected = [(iIndex, 'gFactor: > 0', '0')
+                    for iIndex in range(0, 100, 5) if not (iIndex in (50, 60))]
+        lstExpected.insert(10, (50, 'record: type dict, or tuple with the '
+                                                'field names', '(1, 1)'))
+        lstExpected.insert(12, (60, 'gValue: type int or float', 'None'))
+        objContract = testmodule.Contract(DBC['scale'])
+        self.assertEqual(testmodule.validateBatch(objContract, lstRecords),
+                                                                lstExpected)
+        self.assertEqual(testmodule.validateBatch(objContract,
+                                    iter(lstRecords), 2, 7), lstExpected)
+        lstExpected[10] = (50, 'gFactor: > 0', '0')
+        lstRecords[50] = (1, 0)
+        self.assertEqual(testmodule.validateBatch(scale, lstRecords,
+                                                iChunk = 1), lstExpected)
+        self.assertEqual(testmodule.validateBatch(objContract, lstRecords,
+                            seqFields = ['gValue', 'gFactor']), lstExpected)
+        self.assertEqual(testmodule.validateBatch(scale, [], 2), [])
+        for tupArgs, dictKwargs in (((plain, []), {}),
+                                    ((objContract, [], 1.0), {}),
+                                    ((objContract, [], 1, True), {}),
+                                    ((objContract, []), {'seqFields' : 'a'}),
+                                    ((objContract, []), {'seqFields' : [1]})):
+            with self.assertRaises(CustomTypeError):
+                testmodule.validateBatch(*tupArgs, **dictKwargs)
+        for tupArgs in ((objContract, [], 0), (objContract, [], 1, 0)):
+            with self.assertRaises(CustomValueError):
+                testmodule.validateBatch(*tupArgs)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Compilation)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_Checks)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_Switch)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_Sampling)
+TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_TypeCache)
+TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_Vectorized)
+TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(Test_Streams)
+TestSuite8 = unittest.TestLoader().loadTestsFromTestCase(Test_Batch)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4,
+                    TestSuite5, TestSuite6, TestSuite7, TestSuite8])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting pos.utils.contracts module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
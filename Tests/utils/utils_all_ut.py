@@ -5,8 +5,8 @@ Module pos.Tests.utils.utils_all_ut
 Aggregation of the unit tests for all modules within pos.utils package
 """
 
-__version__ = "0.0.1.1"
-__date__ = "18-07-2018"
+__version__ = "0.0.1.3"
+__date__ = "18-10-2026"
 __status__ = "Testing"
 
 #imports
@@ -20,12 +20,15 @@ import unittest
 
 import pos.Tests.utils.traceback_ut as tb
 import pos.Tests.utils.docstring_parsers_ut as dsp
+import pos.Tests.utils.contracts_ut as contracts
+import pos.Tests.utils.contract_files_ut as contract_files
 
 #classes
 
 #+ test suite
 
-TestSuite = unittest.TestSuite([tb.TestSuite, dsp.TestSuite])
+TestSuite = unittest.TestSuite([tb.TestSuite, dsp.TestSuite,
+                                contracts.TestSuite, contract_files.TestSuite])
 
 if __name__ == "__main__":
     sys.stdout.write("Conducting pos.utils package tests...\n")
@@ -10,14 +10,29 @@ Modules:
         access scheme and the classes introspection functionality
     exceptions - custom exceptions with the added functionality of the exception
         traceback
+    record_arrays - columnar storage of the records sharing the same schema
+        defined by a DescriptedABC subclass
+    typed_fields - typed numeric fields (fixed width integers, bounded floats)
+        stored in the per class array slabs
+    enumerations - enumeration types with the interned members and the bitmask
+        flag sets
+    constants - frozen constant namespaces and read-only mappings
+    typed_containers - list, dictionary and set with the elements validated
+        upon insertion
+    struct_records - records with the fixed width fields as views over the
+        struct packed binary buffers
+    record_store - memory mapped file of the fixed size records with the
+        self-describing header
 """
 
 __author__ = "Anton Azarov"
 __copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
 __license__ = "GPL"
-__version__ = "0.0.1.3"
-__date__ = "26-10-2018"
+__version__ = "0.0.2.0"
+__date__ = "18-10-2026"
 __status__ = "Development"
 __maintainer__ = "a.azarov@diagnoptics.com"
 
-__all__ = ['utils', 'exceptions', 'base_classes']
\ No newline at end of file
+__all__ = ['utils', 'exceptions', 'base_classes', 'record_arrays',
+            'typed_fields', 'enumerations', 'constants',
+            'typed_containers', 'struct_records', 'record_store']
\ No newline at end of file
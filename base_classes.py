@@ -9,10 +9,20 @@ Classes:
     DescriptedABC: support for the data descriptors access methods in the case
         of the instance attributes and the class attributes accessed from a
         class without instantiation; also implements the basic introspection
+    DescriptedSlotsABC: same as DescriptedABC, but the instances do not have
+        __dict__, the instance attributes are stored in the slots derived from
+        the declared fields table _Fields
+
+Functions:
+    enableInstrumentation(): None -> None
+    disableInstrumentation(): None -> None
+    isInstrumented(): None -> bool
+    getAccessCounters(): None -> dict(tuple(class, str, str, str) -> int)
+    resetAccessCounters(): None -> None
 """
 
-__version__ = "0.0.1.3"
-__date__ = "23-07-2018"
+__version__ = "0.0.1.9"
+__date__ = "18-10-2026"
 __status__ = "Development"
 
 #imports
@@ -20,14 +30,1130 @@ __status__ = "Development"
 #+ standard libraries
 
 import abc
+import collections
+import copy
+import copy_reg
 import inspect
+import types
+import weakref
 
 #+ this library modules
 
 from pos.utils.attr_info import FieldInfo, MethodInfo
+from pos.exceptions import CustomTypeError, NotExistingAttribute
+from pos.exceptions import PrivateAttributeAccess
+
+#globals
+
+#+ kinds of the class attributes stored in the resolution tables
+
+_ATTR_NONE = 0 #not found in the class or its super classes
+
+_ATTR_PLAIN = 1 #plain value, not a descriptor
+
+_ATTR_METHOD = 2 #non-data descriptor: function, class or static method
+
+_ATTR_PROPERTY = 3 #property
+
+_ATTR_DESCRIPTOR = 4 #custom data descriptor
+
+_ATTR_SLOT = 5 #slot of the instances (member descriptor)
+
+_ATTR_OVERRIDE = 6 #own value of an inherited data descriptor (side table)
+
+#+ bound on the size of a resolution table, up to which the names not found in
+#+ the class are also stored (negative entries)
+
+_MAX_RESOLUTION = 1024
+
+#+ caches of the types of the instance attributes values -> has __get__(),
+#+ __set__() or __delete__() methods
+
+_dictValueGetters = {}
+
+_dictValueSetters = {}
+
+_dictValueDeleters = {}
+
+#+ instrumentation: counters of the attribute access per (class, attribute,
+#+ operation, path) and the original (not instrumented) methods per (class,
+#+ method name)
+
+_dictAccessCounters = {}
+
+_dictOriginalMethods = {}
+
+#+ finalization: registered finalizers per id of the weak reference to the
+#+ instance, and the ids of those weak references per id of the (alive)
+#+ instance - by identity, not by equality
+
+_dictFinalizers = {}
+
+_dictInstanceFinalizers = {}
+
+#+ overrides of the inherited data descriptors: the values specific to the
+#+ subclasses per class and per name of the attribute (side table), the
+#+ classes of the overrides per class of the descriptors and vice versa, and
+#+ the scratch copies of the descriptors checking the new values per id of the
+#+ descriptor
+
+_dictOverrides = weakref.WeakKeyDictionary()
+
+_dictOverrideTypes = {}
+
+_dictOverrideBases = {}
+
+_dictOverrideTrials = {}
+
+#functions
+
+#+ helper functions for the resolution tables
+
+def _classifyAttribute(objValue):
+    """
+    Helper function to determine the kind of a class attribute in terms of the
+    attribute resolution scheme: plain value, non-data descriptor (functions,
+    class and static methods), property, a custom data descriptor, a slot or
+    an override of an inherited data descriptor. The check is performed on the
+    type of the value, as in the descriptors protocol.
+    
+    Signature:
+        type A -> int
+    
+    Args:
+        objValue: any type, the value of a class attribute as found in the
+            __dict__ of a class
+    
+    Version 0.0.1.2
+    """
+    typValue = type(objValue)
+    if typValue is types.MemberDescriptorType:
+        iResult = _ATTR_SLOT
+    elif typValue in _dictOverrideBases:
+        iResult = _ATTR_OVERRIDE
+    elif isinstance(objValue, property):
+        iResult = _ATTR_PROPERTY
+    elif hasattr(typValue, '__get__'):
+        if hasattr(typValue, '__set__') or hasattr(typValue, '__delete__'):
+            iResult = _ATTR_DESCRIPTOR
+        else:
+            iResult = _ATTR_METHOD
+    else:
+        iResult = _ATTR_PLAIN
+    return iResult
+
+def _checkValue(gValue, strMethod, dictCache):
+    """
+    Helper function to check if the value of an instance attribute is to be
+    accessed via its __get__(), __set__() or __delete__() method, i.e. it is a
+    descriptor stored as an instance attribute, but not a function or a method.
+    The result is cached per type of the value in the passed dictionary, except
+    for the instances of the old-style classes.
+    
+    Signature:
+        type A, str, dict -> bool
+    
+    Args:
+        gValue: any type, the value of an instance attribute
+        strMethod: string, name of the descriptor method to look for
+        dictCache: dictionary, cache of the results per type of the value
+    
+    Version 0.0.1.1
+    """
+    typValue = type(gValue)
+    if typValue is types.InstanceType: #old-style class - check the object
+        bResult = hasattr(gValue, strMethod)
+    else:
+        bCond1 = hasattr(typValue, strMethod)
+        bCond2 = issubclass(typValue, (types.FunctionType, types.MethodType))
+        bResult = bCond1 and not bCond2
+        dictCache[typValue] = bResult
+    return bResult
+
+def _resolveAttribute(clsOwner, strAttr):
+    """
+    Helper function to find a class attribute along the MRO of a class and to
+    determine its kind. The result is stored in the resolution table of the
+    class (if it is already created) and is also returned as a tuple of the
+    kind of the attribute, its value as found in the __dict__ of the class or
+    one of its super classes and that class itself (owner). The names, which
+    are not found, are stored only as long as the table holds less than
+    _MAX_RESOLUTION entries.
+    
+    Signature:
+        class A, str -> tuple(int, type B, class C OR None)
+    
+    Args:
+        clsOwner: class A, class to resolve the attribute for
+        strAttr: string, name of the attribute
+    
+    Version 0.0.1.2
+    """
+    for clsBase in clsOwner.__mro__:
+        dictVars = clsBase.__dict__
+        if strAttr in dictVars:
+            objValue = dictVars[strAttr]
+            tupEntry = (_classifyAttribute(objValue), objValue, clsBase)
+            break
+    else:
+        tupEntry = (_ATTR_NONE, None, None)
+    dictTable = clsOwner.__dict__.get('_dictResolution', None)
+    if not (dictTable is None):
+        if tupEntry[0] != _ATTR_NONE or len(dictTable) < _MAX_RESOLUTION:
+            dictTable[strAttr] = tupEntry
+    return tupEntry
+
+def _isCurrent(tupEntry, strAttr):
+    """
+    Helper function to check if an entry of the resolution table is still up
+    to date, i.e. the owner class still holds the same value of the attribute
+    in its __dict__. Thus the changes of the super classes, which are not
+    created by the meta-class (e.g. mix-ins), are also detected.
+    
+    Signature:
+        tuple(int, type A, class B OR None), str -> bool
+    
+    Args:
+        tupEntry: tuple(int, type A, class B OR None), entry of the resolution
+            table
+        strAttr: string, name of the attribute
+    
+    Version 0.0.1.0
+    """
+    iKind, objValue, clsBase = tupEntry
+    if iKind == _ATTR_NONE:
+        bResult = True
+    else:
+        dictVars = clsBase.__dict__
+        bResult = (strAttr in dictVars) and (dictVars[strAttr] is objValue)
+    return bResult
+
+def _getResolution(clsOwner, strAttr):
+    """
+    Helper function to get the entry of the resolution table of a class for
+    the specific attribute, which is resolved if not found in the table, if
+    the table is not yet created or if the entry is out of date.
+    
+    Signature:
+        class A, str -> tuple(int, type B, class C OR None)
+    
+    Args:
+        clsOwner: class A, class to resolve the attribute for
+        strAttr: string, name of the attribute
+    
+    Version 0.0.1.1
+    """
+    dictTable = clsOwner.__dict__.get('_dictResolution', None)
+    if (dictTable is None) or not (strAttr in dictTable):
+        tupEntry = _resolveAttribute(clsOwner, strAttr)
+    else:
+        tupEntry = dictTable[strAttr]
+        if not _isCurrent(tupEntry, strAttr):
+            tupEntry = _resolveAttribute(clsOwner, strAttr)
+    return tupEntry
+
+def _buildResolutionTable(clsOwner):
+    """
+    Helper function to fill the resolution table of a class with all
+    attributes defined in the class itself and its super classes. Called
+    upon creation of a class by its meta-class.
+    
+    In the case of the single inheritance from a class, which also has the
+    resolution table, the entries of that table are reused, and only the
+    attributes defined in the class itself are classified, instead of the
+    walk over the entire MRO.
+    
+    Signature:
+        class A -> None
+    
+    Args:
+        clsOwner: class A, class to build the resolution table for
+    
+    Version 0.0.1.2
+    """
+    dictTable = clsOwner.__dict__['_dictResolution']
+    tupBases = clsOwner.__bases__
+    if len(tupBases) == 1:
+        dictParent = tupBases[0].__dict__.get('_dictResolution', None)
+    else:
+        dictParent = None
+    if dictParent is None:
+        tupClasses = tuple(reversed(clsOwner.__mro__))
+    else: #the entries of the super class are up to date
+        dictTable.update(dictParent)
+        tupClasses = (clsOwner, )
+    for clsBase in tupClasses: #own definitions take priority
+        for strAttr, objValue in clsBase.__dict__.items():
+            dictTable[strAttr] = (_classifyAttribute(objValue), objValue,
+                                                                        clsBase)
+
+def _invalidateAttribute(clsOwner, strAttr):
+    """
+    Helper function to remove an entry from the resolution table of a class
+    and all its (direct and indirect) subclasses and to bump their versions
+    counters, thus invalidating the cached introspection results. Called by
+    the meta-class upon assignment or deletion of a class attribute. Change of
+    the super classes ('__bases__') clears the tables entirely.
+    
+    Signature:
+        class A, str -> None
+    
+    Args:
+        clsOwner: class A, class, which attribute has been changed
+        strAttr: string, name of the changed attribute
+    
+    Version 0.0.1.1
+    """
+    lstClasses = [clsOwner]
+    while len(lstClasses):
+        clsCurrent = lstClasses.pop()
+        dictTable = clsCurrent.__dict__.get('_dictResolution', None)
+        if not (dictTable is None):
+            if strAttr == '__bases__':
+                dictTable.clear()
+            else:
+                dictTable.pop(strAttr, None)
+                dictTable.pop('_iVersion', None)
+            type.__setattr__(clsCurrent, '_iVersion',
+                                            clsCurrent.__dict__['_iVersion'] + 1)
+        lstClasses.extend(type.__subclasses__(clsCurrent))
+
+#+ helper functions for the introspection
+
+def _getCached(clsOwner, strKey, funcBuild):
+    """
+    Helper function to get a cached introspection result for a class. The
+    result is re-built using the passed function if it is not cached yet, or
+    if the version counter of the class has been changed since it was cached.
+    
+    Signature:
+        class A, str, function(class A -> type B) -> type B
+    
+    Args:
+        clsOwner: class A, class to be inspected, created by DescriptedABC_Meta
+        strKey: string, name of the cached result
+        funcBuild: function, builds the result for the class
+    
+    Version 0.0.1.0
+    """
+    dictVars = clsOwner.__dict__
+    iVersion = dictVars['_iVersion']
+    dictCache = dictVars['_dictIntrospection']
+    tupEntry = dictCache.get(strKey, None)
+    if (tupEntry is None) or (tupEntry[0] != iVersion):
+        tupEntry = (iVersion, funcBuild(clsOwner))
+        dictCache[strKey] = tupEntry
+    return tupEntry[1]
+
+def _buildSlots(clsOwner):
+    """
+    Helper function to find all slots of the instances of a class, including
+    the inherited ones.
+    
+    Signature:
+        class A -> tuple(tuple(str, member_descriptor))
+    
+    Args:
+        clsOwner: class A, class to be inspected
+    
+    Version 0.0.1.0
+    """
+    setSeen = set()
+    lstResult = []
+    for clsBase in clsOwner.__mro__:
+        for strAttr, objValue in clsBase.__dict__.items():
+            bCond1 = type(objValue) is types.MemberDescriptorType
+            bCond2 = not (strAttr in setSeen)
+            if bCond1 and bCond2:
+                setSeen.add(strAttr)
+                lstResult.append((strAttr, objValue))
+    return tuple(lstResult)
+
+def _buildClassDir(clsOwner):
+    """
+    Helper function to find the names of all 'public' class attributes, except
+    for the slots and the method onInit().
+    
+    Signature:
+        class A -> frozenset(str)
+    
+    Args:
+        clsOwner: class A, class to be inspected
+    
+    Version 0.0.1.0
+    """
+    setResult = set()
+    for clsBase in type.__getattribute__(clsOwner, '__mro__'):
+        for strAttr, objValue in type.__getattribute__(clsBase,
+                                                        '__dict__').items():
+            bCond1 = not strAttr.startswith('_')
+            bCond2 = strAttr != 'onInit'
+            bCond3 = type(objValue) is not types.MemberDescriptorType
+            if bCond1 and bCond2 and bCond3:
+                setResult.add(strAttr)
+    return frozenset(setResult)
+
+def _buildClassFields(clsOwner):
+    """
+    Helper function to find the names of all 'public' class data fields, see
+    DescriptedABC.getClassFields().
+    
+    Signature:
+        class A -> tuple(str)
+    
+    Args:
+        clsOwner: class A, class to be inspected
+    
+    Version 0.0.1.0
+    """
+    setResult = set()
+    for clsBase in clsOwner.__mro__:
+        for strAttr, objValue in clsBase.__dict__.items():
+            bCond1 = not isinstance(objValue, (staticmethod, classmethod))
+            bCond2 = not inspect.isfunction(objValue)
+            bCond3 = not isinstance(objValue, (property,
+                                                types.MemberDescriptorType))
+            bCond4 = not strAttr.startswith('_')
+            if bCond1 and bCond2 and bCond3 and bCond4:
+                setResult.add(strAttr)
+    return tuple(sorted(setResult))
+
+def _buildClassMethods(clsOwner):
+    """
+    Helper function to find the names of all 'public' class and static
+    methods, see DescriptedABC.getClassMethods().
+    
+    Signature:
+        class A -> tuple(str)
+    
+    Args:
+        clsOwner: class A, class to be inspected
+    
+    Version 0.0.1.0
+    """
+    setResult = set()
+    for clsBase in clsOwner.__mro__:
+        for strAttr, objValue in clsBase.__dict__.items():
+            bCond1 = isinstance(objValue, (staticmethod, classmethod))
+            bCond2 = not strAttr.startswith('_')
+            if bCond1 and bCond2:
+                setResult.add(strAttr)
+    return tuple(sorted(setResult))
+
+def _buildFields(clsOwner):
+    """
+    Helper function to find the names of all 'public' class attributes, which
+    are data fields from the point of view of an instance (including the
+    properties), see DescriptedABC.getFields().
+    
+    Signature:
+        class A -> frozenset(str)
+    
+    Args:
+        clsOwner: class A, class to be inspected
+    
+    Version 0.0.1.0
+    """
+    setResult = set()
+    for clsBase in clsOwner.__mro__:
+        for strAttr, objValue in clsBase.__dict__.items():
+            bCond1 = not isinstance(objValue, (staticmethod, classmethod,
+                                                types.MemberDescriptorType))
+            bCond2 = not inspect.isfunction(objValue)
+            bCond3 = not strAttr.startswith('_')
+            if bCond1 and bCond2 and bCond3:
+                setResult.add(strAttr)
+    return frozenset(setResult)
+
+def _buildMethods(clsOwner):
+    """
+    Helper function to find the names of all 'public' class attributes, which
+    are methods from the point of view of an instance, except for onInit(),
+    see DescriptedABC.getMethods().
+    
+    Signature:
+        class A -> frozenset(str)
+    
+    Args:
+        clsOwner: class A, class to be inspected
+    
+    Version 0.0.1.0
+    """
+    setResult = set()
+    for clsBase in clsOwner.__mro__:
+        for strAttr, objValue in clsBase.__dict__.items():
+            bCond1 = isinstance(objValue, (staticmethod, classmethod))
+            bCond2 = inspect.ismethod(objValue)
+            bCond3 = inspect.isfunction(objValue)
+            bCond4 = not (strAttr.startswith('_') or strAttr == 'onInit')
+            if (bCond1 or bCond2 or bCond3) and bCond4:
+                setResult.add(strAttr)
+    return frozenset(setResult)
+
+def _isMethodValue(gValue):
+    """
+    Helper function to check if the value of an instance attribute is a
+    method, function or built-in function.
+    
+    Signature:
+        type A -> bool
+    
+    Args:
+        gValue: any type, value of an instance attribute
+    
+    Version 0.0.1.0
+    """
+    bCond1 = inspect.ismethod(gValue)
+    bCond2 = inspect.isfunction(gValue)
+    bCond3 = inspect.isbuiltin(gValue)
+    return bCond1 or bCond2 or bCond3
+
+def _buildAttributeInfo(strAttr, gValue, strScope):
+    """
+    Helper function to create the information object on an attribute. The
+    class and static methods, functions and methods are described by the
+    MethodInfo instances, any other values - by the FieldInfo instances. The
+    signature and the reduced docstring are extracted from the docstring of a
+    method or property only upon the first access to the respective fields.
+    
+    Signature:
+        str, type A, str -> pos.utils.attr_info.FieldInfo
+                                OR pos.utils.attr_info.MethodInfo
+    
+    Args:
+        strAttr: string, name of the attribute
+        gValue: type A, value of the attribute as found in the __dict__ of the
+            instance / class or in the slot of the instance
+        strScope: string, 'class' or 'instance' - where the value is found
+    
+    Version 0.0.1.3
+    """
+    if isinstance(gValue, (staticmethod, classmethod)):
+        objInfo = MethodInfo(gValue.__func__.__doc__)
+    elif _isMethodValue(gValue):
+        objInfo = MethodInfo(getattr(gValue, '__doc__', None))
+    else:
+        if isinstance(gValue, property):
+            objInfo = FieldInfo(gValue.__doc__)
+            strScope = 'instance'
+            if gValue.fset is None:
+                objInfo.Access = 'read-only'
+        elif type(gValue) is types.MemberDescriptorType:
+            objInfo = FieldInfo()
+            strScope = 'instance'
+        elif _classifyAttribute(gValue) in (_ATTR_DESCRIPTOR, _ATTR_OVERRIDE):
+            objInfo = FieldInfo(getattr(gValue, '__doc__', None))
+        else:
+            objInfo = FieldInfo()
+            objInfo.Type = type(gValue)
+        if objInfo.Access is None:
+            objInfo.Access = 'read-write'
+        objInfo.RealType = _dictOverrideBases.get(type(gValue), type(gValue))
+        objInfo.Scope = strScope
+    objInfo.Name = strAttr
+    return objInfo
+
+def _buildInfoTable(clsOwner):
+    """
+    Helper function to create an empty cache of the information objects on the
+    attributes of a class, which is filled upon the inspection of the
+    attributes.
+    
+    Signature:
+        class A -> dict(str -> pos.utils.attr_info.AttributeInfo)
+    
+    Args:
+        clsOwner: class A, class to be inspected, not used
+    
+    Version 0.0.1.0
+    """
+    return {}
+
+def _buildSlotMembers(clsOwner):
+    """
+    Helper function to map the names of the slots of the instances of a class,
+    including the inherited ones, onto the respective member descriptors.
+    
+    Signature:
+        class A -> dict(str -> member_descriptor)
+    
+    Args:
+        clsOwner: class A, class to be inspected
+    
+    Version 0.0.1.0
+    """
+    return dict(_getCached(clsOwner, 'slots', _buildSlots))
+
+def _copyValues(dictValues):
+    """
+    Helper function to make a copy of the instance attributes values mapping,
+    in which the data descriptors stored as the values are also copied
+    (shallow), since they hold the actual values of the attributes, whereas
+    all other values are shared.
+    
+    Signature:
+        dict(str -> type A) -> dict(str -> type A)
+    
+    Args:
+        dictValues: dict(str -> type A), the names and values of the instance
+            attributes
+    
+    Version 0.0.1.0
+    """
+    dictResult = dict(dictValues)
+    for strAttr, gValue in dictResult.iteritems():
+        bGetter = _dictValueGetters.get(type(gValue), None)
+        if bGetter is None:
+            bGetter = _checkValue(gValue, '__get__', _dictValueGetters)
+        if bGetter:
+            dictResult[strAttr] = copy.copy(gValue)
+    return dictResult
+
+def _getInstanceItems(objInstance):
+    """
+    Helper function to get the names and values of the instance attributes,
+    either stored in the __dict__ of the instance or in its slots. The 'empty'
+    slots are ignored.
+    
+    Signature:
+        type A -> list(tuple(str, type B))
+    
+    Args:
+        objInstance: type A, an instance of a class created by
+            DescriptedABC_Meta
+    
+    Version 0.0.1.1
+    """
+    clsOwner = type(objInstance)
+    if clsOwner.__dictoffset__: #instances have __dict__
+        lstResult = object.__getattribute__(objInstance, '__dict__').items()
+    else:
+        lstResult = []
+    for strAttr, objMember in _getCached(clsOwner, 'slots', _buildSlots):
+        try:
+            gValue = objMember.__get__(objInstance, clsOwner)
+        except AttributeError: #empty slot
+            pass
+        else:
+            if not (gValue is _EMPTY_SLOT):
+                lstResult.append((strAttr, gValue))
+    return lstResult
+
+#+ overrides of the inherited data descriptors
+
+def _getOverridden(self, objInstance, clsOwner):
+    """
+    The __get__() method of the overrides of the inherited data descriptors.
+    Returns the value specific to the class holding the override, which is
+    kept in the side table.
+    
+    Signature:
+        type A, class B -> type C
+    
+    Args:
+        objInstance: type A, an instance of the class, the class itself or None
+        clsOwner: class B, the class, not used
+    
+    Version 0.0.1.1
+    """
+    return self._dictOverrideValues[self._strOverrideName]
+
+def _setOverridden(self, objInstance, gValue):
+    """
+    The __set__() method of the overrides of the inherited data descriptors.
+    Checks the new value and stores it in the side table as the value specific
+    to the class holding the override.
+    
+    Signature:
+        type A, type B -> None
+    
+    Args:
+        objInstance: type A, an instance of the class or the class itself
+        gValue: type B, the new value
+    
+    Raises:
+        AttributeError: the overridden descriptor is 'constant'
+        TypeError, ValueError: the value is not accepted
+    
+    Version 0.0.1.1
+    """
+    if isinstance(objInstance, type):
+        clsOwner = objInstance
+    else:
+        clsOwner = type(objInstance)
+    self._dictOverrideValues[self._strOverrideName] = _checkOverride(
+                                    self._objOverridden, clsOwner, gValue)
+
+def _checkOverride(objDescriptor, clsOwner, gValue):
+    """
+    Helper function to check and convert a new value of an overridden data
+    descriptor. The value is assigned to and read back from a scratch copy
+    of the descriptor, which is made only once per descriptor, thus the
+    descriptor itself is never changed.
+    
+    Signature:
+        type A, class B, type C -> type D
+    
+    Args:
+        objDescriptor: type A, the overridden data descriptor
+        clsOwner: class B, the class, which attribute is changed
+        gValue: type C, the new value
+    
+    Raises:
+        AttributeError: the descriptor is 'constant'
+        TypeError, ValueError: the value is not accepted
+    
+    Version 0.0.1.1
+    """
+    iKey = id(objDescriptor)
+    tupEntry = _dictOverrideTrials.get(iKey, None)
+    if tupEntry is None:
+        tupEntry = (objDescriptor, copy.copy(objDescriptor))
+        _dictOverrideTrials[iKey] = tupEntry
+    objTrial = tupEntry[1]
+    objTrial.__set__(clsOwner, gValue)
+    return objTrial.__get__(clsOwner, clsOwner)
+
+def _getOverrideType(typDescriptor):
+    """
+    Helper function to get the class of the overrides of the data descriptors
+    of the specific class, which is created once per class of the descriptors
+    as its subclass, thus the overrides pass the same isinstance() checks as
+    the overridden descriptors. The overrides do not hold any state of the
+    overridden descriptor, only the reference to it, the name of the attribute
+    and the row of the side table with the values.
+    
+    Signature:
+        class A -> class B
+    
+    Args:
+        typDescriptor: class A, class of the overridden descriptor
+    
+    Raises:
+        TypeError: the class cannot be sub-classed with the slots, e.g. it is
+            a built-in type
+    
+    Version 0.0.1.0
+    """
+    typOverride = _dictOverrideTypes.get(typDescriptor, None)
+    if typOverride is None:
+        dictNamespace = {'__slots__' : ('_dictOverrideValues',
+                                        '_objOverridden', '_strOverrideName'),
+                            '__module__' : typDescriptor.__module__,
+                            '__doc__' : typDescriptor.__doc__,
+                            '__get__' : _getOverridden,
+                            '__set__' : _setOverridden}
+        typOverride = type(typDescriptor)(typDescriptor.__name__,
+                                            (typDescriptor, ), dictNamespace)
+        _dictOverrideTypes[typDescriptor] = typOverride
+        _dictOverrideBases[typOverride] = typDescriptor
+    return typOverride
+
+def _addOverride(clsOwner, strAttr, objDescriptor, gValue):
+    """
+    Helper function to override a data descriptor inherited by a class. The
+    checked value is stored in the side table row of the class, and the class
+    gets the override object pointing to that row, whereas the inherited
+    descriptor is re-used for the checks of the values, but is not changed.
+    
+    Signature:
+        class A, str, type B, type C -> None
+    
+    Args:
+        clsOwner: class A, the class, which attribute is changed
+        strAttr: string, name of the attribute
+        objDescriptor: type B, the inherited data descriptor
+        gValue: type C, the new value
+    
+    Raises:
+        AttributeError: the descriptor is 'constant'
+        TypeError, ValueError: the value is not accepted, or the class of the
+            descriptor cannot be sub-classed
+    
+    Version 0.0.1.0
+    """
+    gNewValue = _checkOverride(objDescriptor, clsOwner, gValue)
+    typOverride = _getOverrideType(type(objDescriptor))
+    dictValues = _dictOverrides.get(clsOwner, None)
+    if dictValues is None:
+        dictValues = {}
+        _dictOverrides[clsOwner] = dictValues
+    dictValues[strAttr] = gNewValue
+    objOverride = object.__new__(typOverride)
+    object.__setattr__(objOverride, '_dictOverrideValues', dictValues)
+    object.__setattr__(objOverride, '_objOverridden', objDescriptor)
+    object.__setattr__(objOverride, '_strOverrideName', strAttr)
+    type.__setattr__(clsOwner, strAttr, objOverride)
+    _invalidateAttribute(clsOwner, strAttr)
+
+#+ finalization of the instances
+
+def _onCollected(objRef):
+    """
+    Helper function - callback of the weak reference to an instance, which is
+    called after the instance has been garbage collected. Unregisters and calls
+    the registered finalizer.
+    
+    Signature:
+        weakref.ref -> None
+    
+    Args:
+        objRef: weakref.ref, the dead weak reference
+    
+    Version 0.0.1.1
+    """
+    iKey = id(objRef)
+    tupEntry = _dictFinalizers.pop(iKey, None)
+    if not (tupEntry is None):
+        _, iInstance, funcCallback, tupArgs, dictKwargs = tupEntry
+        lstKeys = _dictInstanceFinalizers.get(iInstance, None)
+        if not (lstKeys is None):
+            lstKeys.remove(iKey)
+            if not lstKeys:
+                del _dictInstanceFinalizers[iInstance]
+        funcCallback(*tupArgs, **dictKwargs)
+
+def _runFinalizers(objInstance):
+    """
+    Helper function to call all finalizers registered for an instance in the
+    reversed order of their registration. The finalizers are unregistered,
+    thus they are not called again when the instance is garbage collected.
+    
+    Signature:
+        DescriptedABC -> None
+    
+    Args:
+        objInstance: DescriptedABC, instance being closed
+    
+    Version 0.0.1.1
+    """
+    for iKey in reversed(_dictInstanceFinalizers.pop(id(objInstance), [])):
+        tupEntry = _dictFinalizers.pop(iKey, None)
+        if not (tupEntry is None):
+            _, _, funcCallback, tupArgs, dictKwargs = tupEntry
+            funcCallback(*tupArgs, **dictKwargs)
+
+#+ instrumentation of the attribute access
+
+def _countAccess(clsOwner, strAttr, strOperation, strPath):
+    """
+    Helper function to increment the attribute access counter.
+    
+    Signature:
+        class A, str, str, str -> None
+    
+    Args:
+        clsOwner: class A, class of the instance or the class itself
+        strAttr: string, name of the attribute
+        strOperation: string, 'read', 'write', 'delete' (via instance) or
+            'class write', 'class delete' (via class)
+        strPath: string, the resolution path
+    
+    Version 0.0.1.0
+    """
+    tupKey = (clsOwner, strAttr, strOperation, strPath)
+    try:
+        _dictAccessCounters[tupKey] += 1
+    except KeyError:
+        _dictAccessCounters[tupKey] = 1
+
+def _getInstancePath(objInstance, strAttr, bRead):
+    """
+    Helper function to determine the resolution path of the attribute access
+    via an instance: 'instance dict', 'slot', 'property', 'data descriptor',
+    'method', 'class field' or 'missing'. As in the resolution scheme, upon
+    reading the properties and data descriptors of the class take precedence
+    over the instance __dict__, whereas upon writing and deletion the instance
+    __dict__ is checked first.
+    
+    Signature:
+        DescriptedABC, str, bool -> str
+    
+    Args:
+        objInstance: DescriptedABC, instance being accessed
+        strAttr: string, name of the attribute
+        bRead: bool, True for the read access
+    
+    Version 0.0.1.1
+    """
+    clsOwner = type(objInstance)
+    iKind = _getResolution(clsOwner, strAttr)[0]
+    if clsOwner.__dictoffset__:
+        bInDict = strAttr in object.__getattribute__(objInstance, '__dict__')
+    else:
+        bInDict = False
+    if bInDict and not (bRead and (iKind >= _ATTR_PROPERTY)):
+        strPath = 'instance dict'
+    elif iKind == _ATTR_SLOT:
+        strPath = 'slot'
+    elif iKind == _ATTR_PROPERTY:
+        strPath = 'property'
+    elif iKind == _ATTR_DESCRIPTOR or iKind == _ATTR_OVERRIDE:
+        strPath = 'data descriptor'
+    elif iKind == _ATTR_METHOD:
+        strPath = 'method'
+    elif iKind == _ATTR_PLAIN:
+        strPath = 'class field'
+    elif clsOwner.__dictoffset__ and not bRead:
+        strPath = 'instance dict'
+    else:
+        strPath = 'missing'
+    return strPath
+
+def _getClassPath(clsOwner, strAttr, bWrite):
+    """
+    Helper function to determine the resolution path of the assignment or
+    deletion of a class attribute via the class: 'property', 'data
+    descriptor', 'copy-down' (inherited data descriptor copied into the
+    class), 'class field' or 'missing'.
+    
+    Signature:
+        class DescriptedABC, str, bool -> str
+    
+    Args:
+        clsOwner: class DescriptedABC, class being changed
+        strAttr: string, name of the attribute
+        bWrite: bool, True for the assignment, False for the deletion
+    
+    Version 0.0.1.1
+    """
+    iKind, _, clsBase = _getResolution(clsOwner, strAttr)
+    if iKind == _ATTR_PROPERTY:
+        strPath = 'property'
+    elif iKind == _ATTR_DESCRIPTOR or iKind == _ATTR_OVERRIDE:
+        if clsBase is clsOwner:
+            strPath = 'data descriptor'
+        elif bWrite:
+            strPath = 'copy-down'
+        else:
+            strPath = 'missing'
+    elif iKind == _ATTR_NONE or ((clsBase is not clsOwner) and not bWrite):
+        strPath = 'missing' if not bWrite else 'class field'
+    else:
+        strPath = 'class field'
+    return strPath
+
+def _makeCountedGetter(funcOriginal):
+    """
+    Helper function to create the instrumented version of the method
+    __getattribute__() of a class.
+    
+    Signature:
+        function -> function
+    
+    Args:
+        funcOriginal: function, the original __getattribute__()
+    
+    Version 0.0.1.0
+    """
+    def __getattribute__(self, strAttr):
+        _countAccess(type(self), strAttr, 'read',
+                                    _getInstancePath(self, strAttr, True))
+        return funcOriginal(self, strAttr)
+    return __getattribute__
+
+def _makeCountedSetter(funcOriginal):
+    """
+    Helper function to create the instrumented version of the method
+    __setattr__() of a class.
+    
+    Signature:
+        function -> function
+    
+    Args:
+        funcOriginal: function, the original __setattr__()
+    
+    Version 0.0.1.0
+    """
+    def __setattr__(self, strAttr, gValue):
+        _countAccess(type(self), strAttr, 'write',
+                                    _getInstancePath(self, strAttr, False))
+        funcOriginal(self, strAttr, gValue)
+    return __setattr__
+
+def _makeCountedDeleter(funcOriginal):
+    """
+    Helper function to create the instrumented version of the method
+    __delattr__() of a class.
+    
+    Signature:
+        function -> function
+    
+    Args:
+        funcOriginal: function, the original __delattr__()
+    
+    Version 0.0.1.0
+    """
+    def __delattr__(self, strAttr):
+        _countAccess(type(self), strAttr, 'delete',
+                                    _getInstancePath(self, strAttr, False))
+        funcOriginal(self, strAttr)
+    return __delattr__
+
+def _makeCountedClassSetter(funcOriginal):
+    """
+    Helper function to create the instrumented version of the method
+    __setattr__() of a meta-class.
+    
+    Signature:
+        function -> function
+    
+    Args:
+        funcOriginal: function, the original __setattr__()
+    
+    Version 0.0.1.0
+    """
+    def __setattr__(self, strAttr, gValue):
+        _countAccess(self, strAttr, 'class write',
+                                            _getClassPath(self, strAttr, True))
+        funcOriginal(self, strAttr, gValue)
+    return __setattr__
+
+def _makeCountedClassDeleter(funcOriginal):
+    """
+    Helper function to create the instrumented version of the method
+    __delattr__() of a meta-class.
+    
+    Signature:
+        function -> function
+    
+    Args:
+        funcOriginal: function, the original __delattr__()
+    
+    Version 0.0.1.0
+    """
+    def __delattr__(self, strAttr):
+        _countAccess(self, strAttr, 'class delete',
+                                            _getClassPath(self, strAttr, False))
+        funcOriginal(self, strAttr)
+    return __delattr__
+
+def _getInstrumentedMethods():
+    """
+    Helper function to list the instrumented methods and the factories of
+    their instrumented versions.
+    
+    Signature:
+        None -> list(tuple(class, str, function))
+    
+    Version 0.0.1.0
+    """
+    return [(DescriptedABC_Meta, '__setattr__', _makeCountedClassSetter),
+            (DescriptedABC_Meta, '__delattr__', _makeCountedClassDeleter),
+            (DescriptedABC, '__getattribute__', _makeCountedGetter),
+            (DescriptedABC, '__setattr__', _makeCountedSetter),
+            (DescriptedABC, '__delattr__', _makeCountedDeleter),
+            (DescriptedSlotsABC, '__getattribute__', _makeCountedGetter),
+            (DescriptedSlotsABC, '__setattr__', _makeCountedSetter),
+            (DescriptedSlotsABC, '__delattr__', _makeCountedDeleter)]
+
+def enableInstrumentation():
+    """
+    Switches on the counting of the attribute access (read, write, delete)
+    via the instances of DescriptedABC subclasses and the assignment and
+    deletion of the class attributes, per class, attribute and resolution
+    path. The attribute access methods of DescriptedABC, DescriptedSlotsABC and
+    DescriptedABC_Meta are replaced by the instrumented versions, which count
+    the access and call the original methods. Does nothing if the
+    instrumentation is already on.
+    
+    Signature:
+        None -> None
+    
+    Version 0.0.1.0
+    """
+    if not len(_dictOriginalMethods):
+        for clsTarget, strMethod, funcFactory in _getInstrumentedMethods():
+            funcOriginal = clsTarget.__dict__[strMethod]
+            _dictOriginalMethods[(clsTarget, strMethod)] = funcOriginal
+            type.__setattr__(clsTarget, strMethod, funcFactory(funcOriginal))
+            if '_dictResolution' in clsTarget.__dict__:
+                _invalidateAttribute(clsTarget, strMethod)
+
+def disableInstrumentation():
+    """
+    Switches off the counting of the attribute access by putting the original
+    attribute access methods back in place, thus the disabled instrumentation
+    does not cost anything. The counters are not reset. Does nothing if the
+    instrumentation is already off.
+    
+    Signature:
+        None -> None
+    
+    Version 0.0.1.0
+    """
+    for (clsTarget, strMethod), funcOriginal in _dictOriginalMethods.items():
+        type.__setattr__(clsTarget, strMethod, funcOriginal)
+        if '_dictResolution' in clsTarget.__dict__:
+            _invalidateAttribute(clsTarget, strMethod)
+    _dictOriginalMethods.clear()
+
+def isInstrumented():
+    """
+    Checks if the counting of the attribute access is on.
+    
+    Signature:
+        None -> bool
+    
+    Version 0.0.1.0
+    """
+    return bool(len(_dictOriginalMethods))
+
+def getAccessCounters():
+    """
+    Returns a snapshot (copy) of the attribute access counters as a dictionary
+    mapping the tuples (class, attribute name, operation, path) onto the
+    number of the access events. The operation is one of 'read', 'write' and
+    'delete' (via an instance) or 'class write' and 'class delete' (via the
+    class itself). The path is one of 'instance dict', 'slot', 'property',
+    'data descriptor', 'method', 'class field', 'copy-down' or 'missing'.
+    
+    Signature:
+        None -> dict(tuple(class, str, str, str) -> int)
+    
+    Version 0.0.1.0
+    """
+    return dict(_dictAccessCounters)
+
+def resetAccessCounters():
+    """
+    Resets all attribute access counters.
+    
+    Signature:
+        None -> None
+    
+    Version 0.0.1.0
+    """
+    _dictAccessCounters.clear()
 
 #classes
 
+#+ helper classes
+
+class _EmptySlot(object):
+    """
+    Marker class, its single instance is stored in the not assigned (empty)
+    slots of the instances of DescriptedSlotsABC subclasses, thus the state
+    of a slot can be checked without catching AttributeError.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ()
+    
+    def __repr__(self):
+        """
+        Special method. Returns the string representation of the marker.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return '<empty slot>'
+
+_EMPTY_SLOT = _EmptySlot()
+
 #+metaclasses
 
 class DescriptedABC_Meta(abc.ABCMeta):
@@ -40,9 +1166,59 @@ class DescriptedABC_Meta(abc.ABCMeta):
     least, one underscore) are ignored by the built-in functions dir() and
     help().
     
-    Version 0.0.1.2
+    Each class created by this meta-class keeps a resolution table, which maps
+    the names of its attributes (including the inherited ones) onto their kind
+    (plain value, function / method, property, custom data descriptor), the
+    value found in the __dict__ of the class or its super class and that class
+    itself (owner). The table is built upon creation of the class, and its
+    entries are invalidated whenever the __dict__ of the class is changed via
+    this meta-class. An entry is also re-resolved upon use if the owner class
+    no longer holds the same value, thus the direct changes of the super
+    classes not created by this meta-class (e.g. mix-ins) are detected as well,
+    except for a new attribute of such a class shadowing the attribute of
+    another class further along the MRO.
+    
+    An assignment to a data descriptor inherited from a super class via a
+    subclass places an override into the subclass, which points to the value
+    specific to the subclass kept in a side table per class, and the entry of
+    the resolution table is resolved directly into that value. The inherited
+    descriptor itself is re-used for the checks of the new values, but it is
+    never changed.
+    
+    Each class also keeps a version counter, which is bumped whenever the
+    resolution table of the class is invalidated (including the changes of its
+    super classes), and the cache of the introspection results, which are
+    re-built only if the version has been changed.
+    
+    Version 0.0.1.9
     """
     
+    def __new__(mcs, strName, tupBases, dictAttributes):
+        """
+        Special method - creation of a new class. Adds the empty resolution
+        table, the version counter and the empty introspection cache into the
+        namespace of the class being created, and fills the resolution table
+        after the class is created.
+        
+        Signature:
+            str, tuple(class A), dict -> class B
+        
+        Args:
+            strName: string, name of the class to be created
+            tupBases: tuple of classes, the super classes
+            dictAttributes: dictionary, the namespace of the class
+        
+        Version 0.0.1.1
+        """
+        dictNamespace = dict(dictAttributes)
+        dictNamespace['_dictResolution'] = {}
+        dictNamespace['_iVersion'] = 0
+        dictNamespace['_dictIntrospection'] = {}
+        clsNew = super(DescriptedABC_Meta, mcs).__new__(mcs, strName, tupBases,
+                                                                dictNamespace)
+        _buildResolutionTable(clsNew)
+        return clsNew
+    
     def __setattr__(self, strAttr, gValue):
         """
         Special method. Ensures that the __set__() descriptor is called if
@@ -51,11 +1227,19 @@ class DescriptedABC_Meta(abc.ABCMeta):
         instance.
         
         The side effect is that if the value of the class attribute being a data
-        descriptor inherited from a super class is changed, a 'local' copy of
-        that attribute is created in the subclass, and only its value is
-        changed, so the change does not propagate upwards. The downwards
-        propagation of the change happens only down to a subclass, which has
-        already 'decoupled' that class attribute.
+        descriptor inherited from a super class is changed, a 'local' override
+        of that attribute is created in the subclass, which keeps its own value
+        in a side table, so the change does not propagate upwards. The new
+        value is checked by a scratch copy of the inherited descriptor made
+        once per descriptor, and the descriptor itself is not changed. The
+        downwards propagation of the change happens only down to a subclass,
+        which has already 'decoupled' that class attribute. Deletion of the
+        override restores the inherited value.
+        
+        The owner of the attribute is taken from the resolution table of the
+        class instead of the MRO walk. If the __dict__ of the class is changed,
+        the corresponding entries of the resolution tables of this class and
+        all its subclasses are invalidated.
         
         Signature:
             str, type A -> None
@@ -64,29 +1248,27 @@ class DescriptedABC_Meta(abc.ABCMeta):
             strAttr: string, name of the attribute to be changed in value
             gValue: any type, value to be assigned to the attribute
         
-        Version 0.0.1.1
+        Version 0.0.1.6
         """
-        lstMRO = type.__getattribute__(self, '__mro__')
-        for objBase in lstMRO: #go through the MRO
-            dictVars = type.__getattribute__(objBase, '__dict__')
-            if strAttr in dictVars: #found in a dictionary (own or super)
-                objTemp = dictVars[strAttr]
-                if hasattr(objTemp, '__set__'): #via descriptor
-                    if objBase is lstMRO[0]: #own
-                        objTemp.__set__(self, gValue)
-                    elif not isinstance(objTemp, property):
-                        #inherited data descriptor but not a property
-                        #-> copy into own class and try to set
-                        type.__setattr__(self, strAttr,
-                                objTemp.__class__(objTemp.__get__(self, self)))
-                        objTrial = type.__getattribute__(
-                                                    self, '__dict__')[strAttr]
-                        objTrial.__set__(self, gValue)
-                else: #via usual way, not a data descriptor / property
-                    type.__setattr__(self, strAttr, gValue)
-                break
-        else: # doesn't exist yet -> create own class field
+        iKind, objTemp, clsBase = _getResolution(self, strAttr)
+        if iKind == _ATTR_NONE: # doesn't exist yet -> create own class field
+            type.__setattr__(self, strAttr, gValue)
+            _invalidateAttribute(self, strAttr)
+        elif iKind != _ATTR_SLOT and hasattr(objTemp, '__set__'):
+            #via descriptor, except for the slots of the instances
+            if clsBase is self: #own, including an override
+                objTemp.__set__(self, gValue)
+            elif iKind == _ATTR_OVERRIDE:
+                #override of a super class -> own override of the same
+                #descriptor with own value, if it is accepted
+                _addOverride(self, strAttr, objTemp._objOverridden, gValue)
+            elif iKind != _ATTR_PROPERTY:
+                #inherited data descriptor but not a property
+                #-> override with own value, if it is accepted
+                _addOverride(self, strAttr, objTemp, gValue)
+        else: #via usual way, not a data descriptor / property
             type.__setattr__(self, strAttr, gValue)
+            _invalidateAttribute(self, strAttr)
     
     def __delattr__(self, strAttr):
         """
@@ -95,21 +1277,31 @@ class DescriptedABC_Meta(abc.ABCMeta):
         resolution scheme is used. Applied to the calls on the class, not on its
         instance.
         
+        If the __dict__ of the class is changed, the corresponding entries of
+        the resolution tables of this class and all its subclasses are
+        invalidated. Deletion of an override of an inherited data descriptor
+        restores the inherited value.
+        
         Signature:
             str -> None
         
         Args:
             strAttr: string, name of the attribute to be deleted.
         
-        Version 0.0.1.0
+        Version 0.0.1.4
         """
-        dictVars = type.__getattribute__(self, '__dict__')
-        if strAttr in dictVars: #found in the class dictionary
-            objTemp = dictVars[strAttr]
-            if hasattr(objTemp, '__delete__'): #via descriptor
+        iKind, objTemp, clsBase = _getResolution(self, strAttr)
+        if (iKind != _ATTR_NONE) and (clsBase is self): #own class attribute
+            if iKind == _ATTR_OVERRIDE: #own value -> restore the inherited one
+                del objTemp._dictOverrideValues[strAttr]
+                type.__delattr__(self, strAttr)
+                _invalidateAttribute(self, strAttr)
+            elif iKind != _ATTR_SLOT and hasattr(objTemp, '__delete__'):
+                #via descriptor, except for the slots of the instances
                 objTemp.__delete__(self)
             else: #via usual way
                 type.__delattr__(self, strAttr)
+                _invalidateAttribute(self, strAttr)
         else: #not in the class dictionary -> will lead to AttributeError
             type.__delattr__(self, strAttr)
     
@@ -121,22 +1313,74 @@ class DescriptedABC_Meta(abc.ABCMeta):
         and help(). Returns the sorted alphabetically list of ALL 'public' class
         data fields and class / static / instance methods available at the class
         level (without instantiation), including all inherited ones, but
-        excluding the special 'public' instance method onInit().
+        excluding the special 'public' instance method onInit() and the slots
+        of the instances. The result is cached per class.
         
         Signature:
             None -> None
         
+        Version 0.0.1.2
+        """
+        return list(sorted(_getCached(self, 'dir', _buildClassDir)))
+
+class DescriptedSlotsABC_Meta(DescriptedABC_Meta):
+    """
+    Meta-class for DescriptedSlotsABC. Same as DescriptedABC_Meta, but also
+    derives the __slots__ of the class being created from the fields table
+    _Fields (tuple of the names of the instance attributes) declared in its
+    namespace, unless the __slots__ are defined explicitly. The names of the
+    fields already stored in the slots of the super classes are skipped, thus
+    a subclass may either re-declare the full table or only add new fields.
+    A class without its own fields table gets empty __slots__, so its
+    instances do not have __dict__ as well.
+    
+    The member descriptors of all slots of the class, including the inherited
+    ones, are stored in the class attribute _tupSlots.
+    
+    Version 0.0.1.0
+    """
+    
+    def __new__(mcs, strName, tupBases, dictAttributes):
+        """
+        Special method - creation of a new class. Adds the __slots__ derived
+        from the fields table _Fields into the namespace of the class being
+        created, if it does not define them explicitly.
+        
+        Signature:
+            str, tuple(class A), dict -> class B
+        
+        Args:
+            strName: string, name of the class to be created
+            tupBases: tuple of classes, the super classes
+            dictAttributes: dictionary, the namespace of the class
+        
         Version 0.0.1.0
         """
-        strlstAttributes = []
-        for objBase in type.__getattribute__(self, '__mro__'): #go through MRO
-            for strName in type.__getattribute__(objBase, '__dict__').keys():
-                bCond1 = not strName.startswith('_')
-                bCond2 = not (strName in strlstAttributes)
-                bCond3 = strName != 'onInit'
-                if bCond1 and bCond2 and bCond3:
-                    strlstAttributes.append(strName)
-        return list(sorted(strlstAttributes))
+        if not ('__slots__' in dictAttributes):
+            gFields = dictAttributes.get('_Fields', ())
+            if isinstance(gFields, basestring):
+                gFields = (gFields, )
+            strlstInherited = []
+            for clsBase in tupBases:
+                for clsParent in clsBase.__mro__:
+                    gSlots = clsParent.__dict__.get('__slots__', ())
+                    if isinstance(gSlots, basestring):
+                        gSlots = (gSlots, )
+                    strlstInherited.extend(gSlots)
+            strlstSlots = []
+            for strField in gFields:
+                bCond1 = not (strField in strlstInherited)
+                bCond2 = not (strField in strlstSlots)
+                if bCond1 and bCond2:
+                    strlstSlots.append(strField)
+            dictAttributes = dict(dictAttributes)
+            dictAttributes['__slots__'] = tuple(strlstSlots)
+        clsNew = super(DescriptedSlotsABC_Meta, mcs).__new__(mcs, strName,
+                                                    tupBases, dictAttributes)
+        tupSlots = tuple(objMember for _, objMember in _buildSlots(clsNew))
+        type.__setattr__(clsNew, '_tupSlots', tupSlots)
+        _invalidateAttribute(clsNew, '_tupSlots')
+        return clsNew
 
 #+ ABCs
 
@@ -162,25 +1406,42 @@ class DescriptedABC(object):
     least, one underscore), are hidden from all introspection methods, including
     the built-in functions dir() and help().
     
+    The class itself defines empty __slots__, thus its subclasses without own
+    __slots__ get __dict__ as usual, whereas the subclasses of
+    DescriptedSlotsABC have dict-less instances.
+    
+    The class does not define __del__(), so the instances caught in the
+    reference cycles are collected by the garbage collector. The resources
+    held by an instance should be released either explicitly by the method
+    close() or by the finalizers registered with the method addFinalizer(),
+    which are called via the weak reference callbacks.
+    
     Class methods:
+        fromMapping(): dict(str -> type A)/, *args, **kwargs/ -> DescriptedABC
         getClassFields(): None -> list(str)
         getClassInfo(): None -> str
         getClassMethods(): None -> list(str)
-        inspectClassAttribute(): str -> ???
+        inspectClassAttribute(): str -> FieldInfo OR MethodInfo
     
     Methods:
         getFields(): None -> list(str)
         getInfo(): None -> str
         getMethods(): None -> list(str)
-        inspectAttribute(): str -> ???
+        addFinalizer(): callable/, *args, **kwargs/ -> None
+        close(): None -> None
+        fastCopy(): None -> DescriptedABC
+        inspectAttribute(): str -> FieldInfo OR MethodInfo
+        setFields(): dict(str -> type A) -> None
     
-    Version 0.0.1.3
+    Version 0.0.1.8
     """
     
     #class fields
     
     __metaclass__ = DescriptedABC_Meta
     
+    __slots__ = () #the subclasses without __slots__ get __dict__ as usual
+    
     #special methods
     
     def __init__(self, *args, **kwargs):
@@ -223,27 +1484,52 @@ class DescriptedABC(object):
     def __getattribute__(self, strAttr):
         """
         Special method. Ensures that the __get__() descriptor is called if the
-        attribute to be deleted has it, otherwise the standard attribute
+        attribute to be read has it, otherwise the standard attribute
         resolution scheme is used.
         
+        The class attributes are looked up in the resolution table of the class,
+        so a read of a class attribute costs a single dictionary look-up and
+        the check that the owner class still holds the same value, and the
+        data descriptors (including properties) of the class take precedence
+        over the instance attributes, as in the standard scheme.
+        
         Signature:
             str -> type A
         
         Args:
-            strAttr: string, name of the attribute to be deleted.
+            strAttr: string, name of the attribute to be read.
         
-        Version 0.0.1.1
+        Version 0.0.1.4
         """
-        objOwner = object.__getattribute__(self, '__class__')
-        objTemp = object.__getattribute__(self, strAttr)
-        if inspect.ismethod(objTemp) or inspect.isfunction(objTemp):
-            #static, class and normal functions
-            objResult = objTemp
-        elif hasattr(objTemp, '__get__'):
-            #properties and custom defined data descriptors
-            objResult = objTemp.__get__(self, objOwner)
+        clsOwner = type(self)
+        try:
+            iKind, objValue, clsBase = clsOwner._dictResolution[strAttr]
+            if iKind and not (clsBase.__dict__[strAttr] is objValue):
+                raise KeyError(strAttr) #changed bypassing the meta-class
+        except KeyError: #not resolved yet or out of date
+            iKind, objValue, clsBase = _resolveAttribute(clsOwner, strAttr)
+        if iKind >= _ATTR_PROPERTY:
+            #properties, custom defined data descriptors and overrides
+            if iKind == _ATTR_OVERRIDE: #own value in the side table
+                objResult = objValue._dictOverrideValues[strAttr]
+            else:
+                objResult = objValue.__get__(self, clsOwner)
         else:
-            objResult = objTemp
+            dictInstance = object.__getattribute__(self, '__dict__')
+            if strAttr in dictInstance: #instance attribute
+                objResult = dictInstance[strAttr]
+                bGetter = _dictValueGetters.get(type(objResult), None)
+                if bGetter is None:
+                    bGetter = _checkValue(objResult, '__get__',
+                                                            _dictValueGetters)
+                if bGetter: #data descriptor stored in the instance
+                    objResult = objResult.__get__(self, clsOwner)
+            elif iKind == _ATTR_METHOD: #static, class and normal functions
+                objResult = objValue.__get__(self, clsOwner)
+            elif iKind == _ATTR_PLAIN: #class data attribute
+                objResult = objValue
+            else: #not found -> standard scheme, e.g. AttributeError
+                objResult = object.__getattribute__(self, strAttr)
         return objResult
     
     def __setattr__(self, strAttr, gValue):
@@ -252,6 +1538,10 @@ class DescriptedABC(object):
         the attribute to be changed has it. Otherwise, the standard attribute
         resolution scheme is used.
         
+        The kind of a class attribute (property or another kind, handled by
+        the meta-class) is taken from the resolution table of the class instead
+        of the MRO walk.
+        
         Signature:
             str, type A -> None
         
@@ -259,27 +1549,31 @@ class DescriptedABC(object):
             strAttr: string, name of the attribute to be changed in value
             gValue: any type, value to be assigned to the attribute
         
-        Version 0.0.1.1
+        Version 0.0.1.3
         """
-        if strAttr in object.__getattribute__(self, '__dict__'):#instance field
-            objTemp = object.__getattribute__(self, strAttr)
-            if hasattr(objTemp, '__set__'): #data descriptor
+        dictInstance = object.__getattribute__(self, '__dict__')
+        if strAttr in dictInstance: #instance field
+            objTemp = dictInstance[strAttr]
+            bSetter = _dictValueSetters.get(type(objTemp), None)
+            if bSetter is None:
+                bSetter = _checkValue(objTemp, '__set__', _dictValueSetters)
+            if bSetter: #data descriptor
                 objTemp.__set__(self, gValue)
             else: #usual type
                 object.__setattr__(self, strAttr, gValue)
         else: #check if it is a class field
-            if hasattr(self.__class__, strAttr):
-                for clsBase in self.__class__.__mro__:
-                    dictVars = type.__getattribute__(clsBase, '__dict__')
-                    if strAttr in dictVars:
-                        objTemp = dictVars[strAttr]
-                        if isinstance(objTemp, property): #property
-                            object.__setattr__(self, strAttr, gValue)
-                        else: #another type of the class attribute
-                            setattr(self.__class__, strAttr, gValue)
-                        break
-            else: # doesn't exist yet -> create
+            clsOwner = type(self)
+            try:
+                iKind, objValue, clsBase = clsOwner._dictResolution[strAttr]
+                if iKind and not (clsBase.__dict__[strAttr] is objValue):
+                    raise KeyError(strAttr) #changed bypassing the meta-class
+            except KeyError: #not resolved yet or out of date
+                iKind = _resolveAttribute(clsOwner, strAttr)[0]
+            if iKind == _ATTR_PROPERTY or iKind == _ATTR_NONE:
+                #property or doesn't exist yet -> create
                 object.__setattr__(self, strAttr, gValue)
+            else: #another type of the class attribute
+                setattr(clsOwner, strAttr, gValue)
     
     def __delattr__(self, strAttr):
         """
@@ -287,50 +1581,42 @@ class DescriptedABC(object):
         the attribute to be deleted has it. Otherwise, the standard attribute
         resolution scheme is used.
         
+        The kind of a class attribute (property or another kind, handled by
+        the meta-class) is taken from the resolution table of the class instead
+        of the MRO walk.
+        
         Signature:
             str -> None
         
         Args:
             strAttr: string, name of the attribute to be deleted.
         
-        Version 0.0.1.1
+        Version 0.0.1.3
         """
-        if strAttr in object.__getattribute__(self, '__dict__'):#instance field
-            objTemp = object.__getattribute__(self, strAttr)
-            if hasattr(objTemp, '__delete__'): #data descriptor ?
+        dictInstance = object.__getattribute__(self, '__dict__')
+        if strAttr in dictInstance: #instance field
+            objTemp = dictInstance[strAttr]
+            bDeleter = _dictValueDeleters.get(type(objTemp), None)
+            if bDeleter is None:
+                bDeleter = _checkValue(objTemp, '__delete__',
+                                                            _dictValueDeleters)
+            if bDeleter: #data descriptor ?
                 objTemp.__delete__(self)
             else: #usual type
                 object.__delattr__(self, strAttr)
         else: #check if it is a class field
-            if hasattr(self.__class__, strAttr): #class field
-                for clsBase in self.__class__.__mro__:
-                    dictVars = type.__getattribute__(clsBase, '__dict__')
-                    if strAttr in dictVars:
-                        objTemp = dictVars[strAttr]
-                        if isinstance(objTemp, property): #property
-                            object.__delattr__(self, strAttr)
-                        else: #another type of the class attribute
-                            delattr(self.__class__, strAttr)
-                        break
-            else: # doesn't exist yet, should raise attribute error exception
+            clsOwner = type(self)
+            try:
+                iKind, objValue, clsBase = clsOwner._dictResolution[strAttr]
+                if iKind and not (clsBase.__dict__[strAttr] is objValue):
+                    raise KeyError(strAttr) #changed bypassing the meta-class
+            except KeyError: #not resolved yet or out of date
+                iKind = _resolveAttribute(clsOwner, strAttr)[0]
+            if iKind == _ATTR_PROPERTY or iKind == _ATTR_NONE:
+                #property or doesn't exist, should raise attribute error
                 object.__delattr__(self, strAttr)
-    
-    def __del__(self):
-        """
-        Special method. Ensures proper deletion of the instance attributes,
-        even those that are 'constant' (being data descriptors).
-        
-        Signature:
-            None -> None
-        
-        Version 0.0.1.0
-        """
-        dictDict = object.__getattribute__(self, '__dict__')
-        strlstTemp = dictDict.keys()
-        for strAttr in strlstTemp:
-            del dictDict[strAttr]
-        del strlstTemp
-        del dictDict
+            else: #another type of the class attribute
+                delattr(clsOwner, strAttr)
     
     def __dir__(self):
         """
@@ -340,20 +1626,117 @@ class DescriptedABC(object):
         functions dir() and help(). Returns the sorted alphabetically list of
         ALL 'public' class and instance data fields and class / static /
         instance methods available at the instance level, including all the
-        inherited ones, excluding the special 'public' method onInit()
+        inherited ones, excluding the special 'public' method onInit(). The
+        class level part of the result is cached per class.
         
         Signature:
             None -> None
         
+        Version 0.0.1.2
+        """
+        setAttributes = set(strName for strName, _ in _getInstanceItems(self)
+                                                if not strName.startswith('_'))
+        setAttributes |= _getCached(type(self), 'dir', _buildClassDir)
+        return list(sorted(setAttributes))
+    
+    def __getstate__(self):
+        """
+        Special method. Returns the state of the instance for pickling and
+        copying as a tuple of the instance __dict__ itself (not a copy) and the
+        mapping of the names of the assigned slots onto their values, either
+        can be None if the instances do not have __dict__ / slots. The values
+        are taken directly from the storage, thus the data descriptors stored
+        as the instance attributes are included as they are.
+        
+        Signature:
+            None -> tuple(dict(str -> type A) OR None, dict(str -> type B)
+                OR None)
+        
         Version 0.0.1.0
         """
-        strlstAttributes = DescriptedABC_Meta.__dir__(self.__class__)
-        for strName in object.__getattribute__(self, '__dict__').keys():
-            bCond1 = not strName.startswith('_')
-            bCond2 = not (strName in strlstAttributes)
-            if bCond1 and bCond2:
-                strlstAttributes.append(strName)
-        return list(sorted(strlstAttributes))
+        clsOwner = type(self)
+        if clsOwner.__dictoffset__: #instances have __dict__
+            dictState = object.__getattribute__(self, '__dict__')
+        else:
+            dictState = None
+        tupSlots = _getCached(clsOwner, 'slots', _buildSlots)
+        if len(tupSlots):
+            dictSlots = {}
+            for strAttr, objMember in tupSlots:
+                try:
+                    gValue = objMember.__get__(self, clsOwner)
+                except AttributeError: #empty slot
+                    gValue = _EMPTY_SLOT
+                if not (gValue is _EMPTY_SLOT):
+                    dictSlots[strAttr] = gValue
+        else:
+            dictSlots = None
+        return (dictState, dictSlots)
+    
+    def __setstate__(self, tupState):
+        """
+        Special method. Restores the state of the instance (see the method
+        __getstate__()) upon unpickling and copying, writing the values
+        directly into the instance __dict__ and slots, i.e. without calls of
+        __setattr__() and the __set__() methods of the data descriptors.
+        
+        Signature:
+            tuple(dict(str -> type A) OR None, dict(str -> type B) OR None)
+                -> None
+        
+        Args:
+            tupState: tuple(dict(str -> type A) OR None, dict(str -> type B)
+                OR None), the values of the attributes stored in the __dict__
+                and in the slots of the instance
+        
+        Raises:
+            pos.exceptions.NotExistingAttribute: the instances of the class do
+                not have a slot, for which a value is passed
+        
+        Version 0.0.1.0
+        """
+        dictState, dictSlots = tupState
+        if dictState:
+            object.__getattribute__(self, '__dict__').update(dictState)
+        if dictSlots:
+            clsOwner = type(self)
+            dictMembers = _getCached(clsOwner, 'slot_members',
+                                                            _buildSlotMembers)
+            for strAttr, gValue in dictSlots.iteritems():
+                objMember = dictMembers.get(strAttr, None)
+                if objMember is None:
+                    raise NotExistingAttribute(strAttr, clsOwner)
+                objMember.__set__(self, gValue)
+    
+    def __reduce_ex__(self, iProtocol):
+        """
+        Special method. Implements the pickling protocol: the instance is
+        re-created as an empty (not initialized) object of the same class, and
+        its state is restored by the method __setstate__(). The same format is
+        used for all pickle protocols.
+        
+        Signature:
+            int -> tuple(function, tuple(class A), tuple(dict OR None,
+                dict OR None))
+        
+        Args:
+            iProtocol: int, the pickle protocol, not used
+        
+        Version 0.0.1.0
+        """
+        clsOwner = type(self)
+        return (copy_reg.__newobj__, (clsOwner, ), self.__getstate__())
+    
+    def __copy__(self):
+        """
+        Special method. Support for copy.copy() - see the method fastCopy().
+        
+        Signature:
+            None -> DescriptedABC
+        
+        Version 0.0.1.0
+        """
+        return self.fastCopy()
     
     #public class methods
     
@@ -365,24 +1748,15 @@ class DescriptedABC(object):
         from the class without instantiation). An attribute is considered to be
         'public' only if name doesn't start with an underscore (including the
         special / magic attributes). The returned list is sorted alphabetically.
+        The slots of the instances are not considered as class fields. The
+        result is cached per class.
         
         Signature:
             None -> list(str)
         
-        Version 0.0.1.0
+        Version 0.0.1.2
         """
-        strlstTemp = []
-        for clsBase in cls.__mro__:
-            for strAttr, objValue in clsBase.__dict__.items():
-                bCond1 = not isinstance(objValue, (staticmethod, classmethod))
-                bCond2 = not inspect.isfunction(objValue)
-                bCond3 = not isinstance(objValue, property)
-                bCond4 = not strAttr.startswith('_')
-                bCond5 = not (strAttr in strlstTemp)
-                bCond = bCond1 and bCond2 and bCond3 and bCond4 and bCond5
-                if bCond:
-                    strlstTemp.append(strAttr)
-        return list(sorted(strlstTemp))
+        return list(_getCached(cls, 'class_fields', _buildClassFields))
     
     @classmethod
     def getClassMethods(cls):
@@ -392,27 +1766,25 @@ class DescriptedABC(object):
         from the class without instantiation). An attribute is considered to be
         'public' only if name doesn't start with an underscore (including the
         special / magic attributes). The returned list is sorted alphabetically.
+        The result is cached per class.
         
         Signature:
             None -> list(str)
         
-        Version 0.0.1.0
+        Version 0.0.1.1
         """
-        strlstTemp = []
-        for clsBase in cls.__mro__:
-            for strAttr, objValue in clsBase.__dict__.items():
-                bCond1 = isinstance(objValue, (staticmethod, classmethod))
-                bCond2 = not strAttr.startswith('_')
-                bCond3 = not (strAttr in strlstTemp)
-                bCond = bCond1 and bCond2 and bCond3
-                if bCond:
-                    strlstTemp.append(strAttr)
-        return list(sorted(strlstTemp))
+        return list(_getCached(cls, 'class_methods', _buildClassMethods))
     
     @classmethod
     def inspectClassAttribute(cls, strAttr):
         """
-        
+        Returns the information on a 'public' class attribute (including the
+        inherited ones) as an instance of FieldInfo for the data fields,
+        properties and slots, or MethodInfo for the methods. The fields Name,
+        RealType, Access and Scope (for FieldInfo) are filled immediately,
+        whereas Signature and DocString - upon the first access to them. The
+        result is cached per class, and the same object is returned upon the
+        repeated inspection of the same attribute.
         
         Signature:
             str -> pos.utils.attr_info.FieldInfo
@@ -421,11 +1793,58 @@ class DescriptedABC(object):
         Args:
             strAttr: string, name of the class attribute to be inspected
         
+        Raises:
+            pos.exceptions.CustomTypeError: the argument is not a string
+            pos.exceptions.PrivateAttributeAccess: the name of the attribute
+                starts with an underscore
+            pos.exceptions.NotExistingAttribute: the class does not have such
+                attribute
+        
+        Version 0.0.1.1
+        """
+        if not isinstance(strAttr, basestring):
+            raise CustomTypeError(strAttr, basestring)
+        dictInfo = _getCached(cls, 'attributes', _buildInfoTable)
+        objInfo = dictInfo.get(strAttr, None)
+        if objInfo is None:
+            if strAttr.startswith('_'):
+                raise PrivateAttributeAccess(strAttr, cls)
+            iKind, objValue, _ = _getResolution(cls, strAttr)
+            if iKind == _ATTR_NONE:
+                raise NotExistingAttribute(strAttr, cls)
+            objInfo = _buildAttributeInfo(strAttr, objValue, 'class')
+            dictInfo[strAttr] = objInfo
+        return objInfo
+    
+    @classmethod
+    def fromMapping(cls, dictMapping, *args, **kwargs):
+        """
+        Creates a new instance of the class, passing all positional and
+        keyword arguments except for the first one into the initialization
+        method, and assigns the values of the attributes from the passed
+        mapping in a single batch - see the method setFields().
+        
+        Signature:
+            dict(str -> type A)/, *args, **kwargs/ -> DescriptedABC
+        
+        Args:
+            dictMapping: dict(str -> type A), mapping of the names of the
+                attributes onto their values
+            *args: (optional), any amount of arguments of any types, passed into
+                the method onInit()
+            **kwargs: (optional), keyword, any amount of arguments of any types,
+                passed into the method onInit()
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the first argument is not a mapping
+        
         Version 0.0.1.0
         """
-        for clsBase in cls.__mro__:
-            for strAttr, objValue in clsBase.__dict__.items():
-                pass
+        if not isinstance(dictMapping, collections.Mapping):
+            raise CustomTypeError(dictMapping, collections.Mapping)
+        objNew = cls(*args, **kwargs)
+        objNew.setFields(dictMapping)
+        return objNew
     
     #public instance methods
     
@@ -436,33 +1855,20 @@ class DescriptedABC(object):
         data attributes or properties) which can be called from an instance of
         a class. An attribute is considered to be 'public' only if name doesn't
         start with an underscore (including the special / magic attributes).
-        The returned list is sorted alphabetically.
+        The returned list is sorted alphabetically. The instance attributes
+        stored in the slots are included only if they are assigned. The class
+        level part of the result is cached per class.
         
         Signature:
             None -> list(str)
         
-        Version 0.0.1.0
+        Version 0.0.1.2
         """
-        strlstTemp = []
-        for strAttr, objValue in self.__dict__.items():
-            bCond1 = not inspect.ismethod(objValue)
-            bCond2 = not inspect.isfunction(objValue)
-            bCond3 = not inspect.isbuiltin(objValue)
-            bCond4 = not strAttr.startswith('_')
-            bCond5 = not (strAttr in strlstTemp)
-            bCond = bCond1 and bCond2 and bCond3 and bCond4 and bCond5
-            if bCond:
-                strlstTemp.append(strAttr)
-        for clsBase in self.__class__.__mro__:
-            for strAttr, objValue in clsBase.__dict__.items():
-                bCond1 = not isinstance(objValue, (staticmethod, classmethod))
-                bCond2 = not inspect.isfunction(objValue)
-                bCond3 = not strAttr.startswith('_')
-                bCond4 = not (strAttr in strlstTemp)
-                bCond = bCond1 and bCond2 and bCond3 and bCond4
-                if bCond:
-                    strlstTemp.append(strAttr)
-        return list(sorted(strlstTemp))
+        setResult = set(strAttr for strAttr, objValue in _getInstanceItems(self)
+                        if not (strAttr.startswith('_') or
+                                                    _isMethodValue(objValue)))
+        setResult |= _getCached(type(self), 'fields', _buildFields)
+        return list(sorted(setResult))
     
     def getMethods(self):
         """
@@ -471,31 +1877,462 @@ class DescriptedABC(object):
         methods references stored as instance attributes) which can be called
         from an instance of a class. An attribute is considered to be 'public'
         only if name doesn't start with an underscore (including the special /
-        magic attributes). The returned list is sorted alphabetically.
+        magic attributes). The returned list is sorted alphabetically. The class
+        level part of the result is cached per class.
         
         Signature:
             None -> list(str)
         
+        Version 0.0.1.2
+        """
+        setResult = set(strAttr for strAttr, objValue in _getInstanceItems(self)
+                        if _isMethodValue(objValue) and
+                                                not strAttr.startswith('_'))
+        setResult |= _getCached(type(self), 'methods', _buildMethods)
+        return list(sorted(setResult))
+    
+    def inspectAttribute(self, strAttr):
+        """
+        Returns the information on a 'public' instance or class attribute as an
+        instance of FieldInfo for the data fields and properties, or MethodInfo
+        for the methods. The information on the class attributes is obtained
+        via the class method inspectClassAttribute() and is cached per class,
+        whereas the information on the instance attributes (stored in the
+        __dict__ or the slots) is created on each call.
+        
+        Signature:
+            str -> pos.utils.attr_info.FieldInfo
+                    OR pos.utils.attr_info.MethodInfo
+        
+        Args:
+            strAttr: string, name of the attribute to be inspected
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the argument is not a string
+            pos.exceptions.PrivateAttributeAccess: the name of the attribute
+                starts with an underscore
+            pos.exceptions.NotExistingAttribute: the instance does not have
+                such attribute
+        
         Version 0.0.1.0
         """
-        strlstTemp = []
-        for strAttr, objValue in self.__dict__.items():
-            bCond1 = inspect.ismethod(objValue)
-            bCond2 = inspect.isfunction(objValue)
-            bCond3 = inspect.isbuiltin(objValue)
-            bCond4 = not strAttr.startswith('_')
-            bCond5 = not (strAttr in strlstTemp)
-            bCond = (bCond1 or bCond2 or bCond3) and bCond4 and bCond5
-            if bCond:
-                strlstTemp.append(strAttr)
-        for clsBase in self.__class__.__mro__:
-            for strAttr, objValue in clsBase.__dict__.items():
-                bCond1 = isinstance(objValue, (staticmethod, classmethod))
-                bCond2 = inspect.ismethod(objValue)
-                bCond3 = inspect.isfunction(objValue)
-                bCond4 = not (strAttr.startswith('_') or strAttr == 'onInit')
-                bCond5 = not (strAttr in strlstTemp)
-                bCond = (bCond1 or bCond2 or bCond3) and bCond4 and bCond5
-                if bCond:
-                    strlstTemp.append(strAttr)
-        return list(sorted(strlstTemp))
+        if not isinstance(strAttr, basestring):
+            raise CustomTypeError(strAttr, basestring)
+        if strAttr.startswith('_'):
+            raise PrivateAttributeAccess(strAttr, self.__class__)
+        clsOwner = type(self)
+        if clsOwner.__dictoffset__: #instances have __dict__
+            dictInstance = object.__getattribute__(self, '__dict__')
+        else:
+            dictInstance = {}
+        if strAttr in dictInstance:
+            objInfo = _buildAttributeInfo(strAttr, dictInstance[strAttr],
+                                                                    'instance')
+        else:
+            iKind, objValue, _ = _getResolution(clsOwner, strAttr)
+            if iKind == _ATTR_SLOT:
+                try:
+                    gValue = objValue.__get__(self, clsOwner)
+                except AttributeError: #empty slot
+                    gValue = _EMPTY_SLOT
+                if gValue is _EMPTY_SLOT:
+                    raise NotExistingAttribute(strAttr, clsOwner)
+                objInfo = _buildAttributeInfo(strAttr, gValue, 'instance')
+            else:
+                objInfo = clsOwner.inspectClassAttribute(strAttr)
+        return objInfo
+    
+    def addFinalizer(self, funcCallback, *args, **kwargs):
+        """
+        Registers a callable to be called with the passed positional and
+        keyword arguments either when the instance is garbage collected or
+        when its method close() is called, whichever happens first. The
+        callable and its arguments must not refer to the instance itself,
+        otherwise it would be never collected. Several finalizers may be
+        registered for the same instance. The finalizers are registered per
+        identity of the instance, regardless of its equality and hash.
+        
+        Signature:
+            callable/, *args, **kwargs/ -> None
+        
+        Args:
+            funcCallback: callable, the finalizer
+            *args: (optional), any amount of arguments of any types, passed into
+                the finalizer
+            **kwargs: (optional), keyword, any amount of arguments of any types,
+                passed into the finalizer
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the first argument is not callable
+        
+        Version 0.0.1.1
+        """
+        if not callable(funcCallback):
+            raise CustomTypeError(funcCallback, collections.Callable)
+        objRef = weakref.ref(self, _onCollected)
+        iKey = id(objRef)
+        iInstance = id(self)
+        _dictFinalizers[iKey] = (objRef, iInstance, funcCallback, args, kwargs)
+        _dictInstanceFinalizers.setdefault(iInstance, []).append(iKey)
+    
+    def close(self):
+        """
+        Releases the resources held by the instance: calls the registered
+        finalizers (see the method addFinalizer()) and removes all instance
+        attributes (including those being data descriptors) from the __dict__
+        and the slots. The instance remains usable, and the instance attributes
+        can be assigned again. Repeated calls are harmless.
+        
+        Signature:
+            None -> None
+        
+        Version 0.0.1.0
+        """
+        _runFinalizers(self)
+        clsOwner = type(self)
+        if clsOwner.__dictoffset__: #instances have __dict__
+            object.__getattribute__(self, '__dict__').clear()
+        for _, objMember in _getCached(clsOwner, 'slots', _buildSlots):
+            try:
+                objMember.__delete__(self)
+            except AttributeError: #empty slot
+                pass
+    
+    def fastCopy(self):
+        """
+        Returns a shallow copy of the instance, which is created without a call
+        of the initialization method onInit(). The values of the instance
+        attributes are shared with the original object, except for the data
+        descriptors stored as the instance attributes, which are copied
+        (shallow) since they hold the actual values.
+        
+        Signature:
+            None -> DescriptedABC
+        
+        Version 0.0.1.0
+        """
+        clsOwner = type(self)
+        objNew = clsOwner.__new__(clsOwner)
+        dictState, dictSlots = self.__getstate__()
+        if dictState:
+            dictState = _copyValues(dictState)
+        if dictSlots:
+            dictSlots = _copyValues(dictSlots)
+        objNew.__setstate__((dictState, dictSlots))
+        return objNew
+    
+    def setFields(self, dictMapping):
+        """
+        Assigns the values of several attributes at once with the same result
+        as assignment of them one by one, i.e. the __set__() method of the data
+        descriptors stored in the instance is called, a property is set via its
+        setter, a class field is changed at the class level, etc. The whole
+        batch is resolved against the instance __dict__ and the resolution
+        table of the class in a single pass, without the per-attribute calls
+        of __setattr__(). If an assignment fails, the preceding ones are not
+        undone, as in the case of the sequential assignment.
+        
+        Signature:
+            dict(str -> type A) -> None
+        
+        Args:
+            dictMapping: dict(str -> type A), mapping of the names of the
+                attributes onto their values
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the argument is not a mapping
+        
+        Version 0.0.1.1
+        """
+        if not (type(dictMapping) is dict
+                        or isinstance(dictMapping, collections.Mapping)):
+            raise CustomTypeError(dictMapping, collections.Mapping)
+        clsOwner = type(self)
+        getEntry = clsOwner._dictResolution.get
+        dictInstance = object.__getattribute__(self, '__dict__')
+        getSetter = _dictValueSetters.get
+        funcSet = object.__setattr__
+        for strAttr, gValue in dictMapping.iteritems():
+            tupEntry = getEntry(strAttr, None)
+            if (tupEntry is None) or not _isCurrent(tupEntry, strAttr):
+                #not resolved yet or out of date
+                tupEntry = _resolveAttribute(clsOwner, strAttr)
+            iKind = tupEntry[0]
+            if strAttr in dictInstance: #instance field
+                objTemp = dictInstance[strAttr]
+                bSetter = getSetter(type(objTemp), None)
+                if bSetter is None:
+                    bSetter = _checkValue(objTemp, '__set__', _dictValueSetters)
+                if bSetter: #data descriptor
+                    objTemp.__set__(self, gValue)
+                elif iKind < _ATTR_PROPERTY: #not shadowed by the class
+                    dictInstance[strAttr] = gValue
+                else: #usual type
+                    funcSet(self, strAttr, gValue)
+            elif iKind == _ATTR_PROPERTY or iKind == _ATTR_NONE:
+                #property or doesn't exist yet -> create
+                funcSet(self, strAttr, gValue)
+            else: #another type of the class attribute
+                setattr(clsOwner, strAttr, gValue)
+
+class DescriptedSlotsABC(DescriptedABC):
+    """
+    Abstract Base Class with the same modified attribute resolution scheme and
+    introspection functionality as DescriptedABC, but its instances do not
+    have __dict__. Instead, the instance attributes are stored in the slots,
+    which are derived by the meta-class from the fields table _Fields - tuple
+    of the names of the instance attributes - declared by each subclass. Thus,
+    only the declared instance attributes can be created, but the memory
+    footprint of each instance is considerably smaller.
+    
+    The subclasses which are supposed to be instantiated must declare the
+    class attribute _Fields and override the method onInit(), where they are
+    supposed to assign the initial values of the declared fields. A subclass
+    may either re-declare the full fields table or only add new fields.
+    
+    Note: same as for DescriptedABC, a data descriptor stored as a value of an
+    instance attribute (slot) is accessed via its __get__(), __set__() and
+    __delete__() methods, whereas the slots, which are not assigned yet, are
+    ignored by the introspection methods. The instances support the weak
+    references, thus the finalizers can be registered for them.
+    
+    Class methods:
+        fromMapping(): dict(str -> type A)/, *args, **kwargs/ -> DescriptedABC
+        getClassFields(): None -> list(str)
+        getClassInfo(): None -> str
+        getClassMethods(): None -> list(str)
+        inspectClassAttribute(): str -> FieldInfo OR MethodInfo
+    
+    Methods:
+        getFields(): None -> list(str)
+        getInfo(): None -> str
+        getMethods(): None -> list(str)
+        addFinalizer(): callable/, *args, **kwargs/ -> None
+        close(): None -> None
+        fastCopy(): None -> DescriptedABC
+        inspectAttribute(): str -> FieldInfo OR MethodInfo
+        setFields(): dict(str -> type A) -> None
+    
+    Version 0.0.1.2
+    """
+    
+    #class fields
+    
+    __metaclass__ = DescriptedSlotsABC_Meta
+    
+    __slots__ = ('__weakref__', ) #support of the finalizers
+    
+    _Fields = ()
+    
+    #special methods
+    
+    def __new__(cls, *args, **kwargs):
+        """
+        Special method - creation of a new instance. Marks all slots of the
+        instance as empty (not assigned).
+        
+        Signature:
+            /*args, **kwargs/ -> DescriptedSlotsABC
+        
+        Args:
+            *args: (optional), any amount of arguments of any types, not used
+            **kwargs: (optional), keyword, any amount of arguments of any types,
+                not used
+        
+        Version 0.0.1.0
+        """
+        objNew = object.__new__(cls)
+        for objMember in cls._tupSlots:
+            objMember.__set__(objNew, _EMPTY_SLOT)
+        return objNew
+    
+    def __getattribute__(self, strAttr):
+        """
+        Special method. Ensures that the __get__() descriptor is called if the
+        attribute to be read has it, otherwise the standard attribute
+        resolution scheme is used. The instance attributes are read from the
+        slots, without any access to the (non-existing) __dict__.
+        
+        Signature:
+            str -> type A
+        
+        Args:
+            strAttr: string, name of the attribute to be read.
+        
+        Raises:
+            AttributeError: the attribute is not found, or the slot is empty
+        
+        Version 0.0.1.2
+        """
+        clsOwner = type(self)
+        try:
+            iKind, objValue, clsBase = clsOwner._dictResolution[strAttr]
+            if iKind and not (clsBase.__dict__[strAttr] is objValue):
+                raise KeyError(strAttr) #changed bypassing the meta-class
+        except KeyError: #not resolved yet or out of date
+            iKind, objValue, clsBase = _resolveAttribute(clsOwner, strAttr)
+        if iKind == _ATTR_SLOT: #instance attribute
+            objResult = objValue.__get__(self, clsOwner)
+            if objResult is _EMPTY_SLOT:
+                raise AttributeError(strAttr)
+            bGetter = _dictValueGetters.get(type(objResult), None)
+            if bGetter is None:
+                bGetter = _checkValue(objResult, '__get__', _dictValueGetters)
+            if bGetter:
+                objResult = objResult.__get__(self, clsOwner)
+        elif iKind >= _ATTR_METHOD:
+            #properties, data and non-data descriptors and overrides
+            if iKind == _ATTR_OVERRIDE: #own value in the side table
+                objResult = objValue._dictOverrideValues[strAttr]
+            else:
+                objResult = objValue.__get__(self, clsOwner)
+        elif iKind == _ATTR_PLAIN:
+            objResult = objValue
+        else: #should raise the standard AttributeError
+            objResult = object.__getattribute__(self, strAttr)
+        return objResult
+    
+    def __setattr__(self, strAttr, gValue):
+        """
+        Special method. Ensures that the __set__() descriptor is called if
+        the attribute to be changed has it. Otherwise, the standard attribute
+        resolution scheme is used. Only the declared instance attributes
+        (slots) can be assigned at the instance level.
+        
+        Signature:
+            str, type A -> None
+        
+        Args:
+            strAttr: string, name of the attribute to be changed in value
+            gValue: any type, value to be assigned to the attribute
+        
+        Version 0.0.1.1
+        """
+        clsOwner = type(self)
+        try:
+            iKind, objValue, clsBase = clsOwner._dictResolution[strAttr]
+            if iKind and not (clsBase.__dict__[strAttr] is objValue):
+                raise KeyError(strAttr) #changed bypassing the meta-class
+        except KeyError: #not resolved yet or out of date
+            iKind, objValue, clsBase = _resolveAttribute(clsOwner, strAttr)
+        if iKind == _ATTR_SLOT: #instance attribute
+            objTemp = objValue.__get__(self, clsOwner)
+            bSetter = _dictValueSetters.get(type(objTemp), None)
+            if bSetter is None:
+                bSetter = _checkValue(objTemp, '__set__', _dictValueSetters)
+            if bSetter: #data descriptor
+                objTemp.__set__(self, gValue)
+            else: #usual type or empty slot
+                objValue.__set__(self, gValue)
+        elif iKind == _ATTR_PROPERTY or iKind == _ATTR_NONE:
+            #property or doesn't exist -> AttributeError, no __dict__
+            object.__setattr__(self, strAttr, gValue)
+        else: #another type of the class attribute
+            setattr(clsOwner, strAttr, gValue)
+    
+    def __delattr__(self, strAttr):
+        """
+        Special method. Ensures that the __delete__() descriptor is called if
+        the attribute to be deleted has it. Otherwise, the standard attribute
+        resolution scheme is used. A deleted slot is marked as empty.
+        
+        Signature:
+            str -> None
+        
+        Args:
+            strAttr: string, name of the attribute to be deleted.
+        
+        Raises:
+            AttributeError: the attribute is not found, or the slot is empty
+        
+        Version 0.0.1.1
+        """
+        clsOwner = type(self)
+        try:
+            iKind, objValue, clsBase = clsOwner._dictResolution[strAttr]
+            if iKind and not (clsBase.__dict__[strAttr] is objValue):
+                raise KeyError(strAttr) #changed bypassing the meta-class
+        except KeyError: #not resolved yet or out of date
+            iKind, objValue, clsBase = _resolveAttribute(clsOwner, strAttr)
+        if iKind == _ATTR_SLOT: #instance attribute
+            objTemp = objValue.__get__(self, clsOwner)
+            if objTemp is _EMPTY_SLOT:
+                raise AttributeError(strAttr)
+            bDeleter = _dictValueDeleters.get(type(objTemp), None)
+            if bDeleter is None:
+                bDeleter = _checkValue(objTemp, '__delete__',
+                                                            _dictValueDeleters)
+            if bDeleter: #data descriptor
+                objTemp.__delete__(self)
+            else: #usual type
+                objValue.__set__(self, _EMPTY_SLOT)
+        elif iKind == _ATTR_PROPERTY or iKind == _ATTR_NONE:
+            #property or doesn't exist, should raise attribute error
+            object.__delattr__(self, strAttr)
+        else: #another type of the class attribute
+            delattr(clsOwner, strAttr)
+    
+    #public instance methods
+    
+    def close(self):
+        """
+        Releases the resources held by the instance: calls the registered
+        finalizers (see the method addFinalizer()) and marks all slots as
+        empty. The instance remains usable, and the instance attributes can be
+        assigned again. Repeated calls are harmless.
+        
+        Signature:
+            None -> None
+        
+        Version 0.0.1.0
+        """
+        _runFinalizers(self)
+        for objMember in type(self)._tupSlots:
+            objMember.__set__(self, _EMPTY_SLOT)
+    
+    def setFields(self, dictMapping):
+        """
+        Assigns the values of several attributes at once with the same result
+        as assignment of them one by one - see DescriptedABC.setFields(). The
+        whole batch is resolved against the resolution table of the class in a
+        single pass, and the values of the instance attributes are written
+        directly into the slots.
+        
+        Signature:
+            dict(str -> type A) -> None
+        
+        Args:
+            dictMapping: dict(str -> type A), mapping of the names of the
+                attributes onto their values
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the argument is not a mapping
+        
+        Version 0.0.1.1
+        """
+        if not (type(dictMapping) is dict
+                        or isinstance(dictMapping, collections.Mapping)):
+            raise CustomTypeError(dictMapping, collections.Mapping)
+        clsOwner = type(self)
+        getEntry = clsOwner._dictResolution.get
+        getSetter = _dictValueSetters.get
+        for strAttr, gValue in dictMapping.iteritems():
+            tupEntry = getEntry(strAttr, None)
+            if (tupEntry is None) or not _isCurrent(tupEntry, strAttr):
+                #not resolved yet or out of date
+                tupEntry = _resolveAttribute(clsOwner, strAttr)
+            iKind, objValue, _ = tupEntry
+            if iKind == _ATTR_SLOT: #instance attribute
+                objTemp = objValue.__get__(self, clsOwner)
+                bSetter = getSetter(type(objTemp), None)
+                if bSetter is None:
+                    bSetter = _checkValue(objTemp, '__set__', _dictValueSetters)
+                if bSetter: #data descriptor
+                    objTemp.__set__(self, gValue)
+                else: #usual type or empty slot
+                    objValue.__set__(self, gValue)
+            elif iKind == _ATTR_PROPERTY or iKind == _ATTR_NONE:
+                #property or doesn't exist -> AttributeError, no __dict__
+                object.__setattr__(self, strAttr, gValue)
+            else: #another type of the class attribute
+                setattr(clsOwner, strAttr, gValue)
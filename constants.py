@@ -0,0 +1,519 @@
+#usr/bin/python
+"""
+Module pos.constants
+
+Constant namespaces resembling the constants of the static typed languages:
+the class body of a ConstantNamespace subclass is frozen upon creation of the
+class - the mutable containers are replaced by their immutable counterparts,
+all constants are collected into a read-only mapping, and any assignment or
+deletion, either on the class or on an instance, raises
+ConstantAttributeAssignment. The reads do not involve the modified attribute
+resolution of DescriptedABC and cost the same as those of a plain class
+attribute.
+
+Classes:
+    FrozenMapping: read-only dictionary
+    ConstantNamespace_Meta: meta-class of the constant namespaces
+    ConstantNamespace: base class of the constant namespaces
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+
+#imports
+
+#+ standard libraries
+
+import collections
+
+#+ my libraries
+
+from pos.base_classes import DescriptedABC, DescriptedABC_Meta
+from pos.base_classes import _classifyAttribute, _invalidateAttribute
+from pos.base_classes import _ATTR_PLAIN
+from pos.exceptions import CustomTypeError
+from pos.exceptions import ConstantAssignment, ConstantAttributeAssignment
+
+#globals
+
+#+ names of the private caches of the abc module, which are re-assigned by the
+#+ isinstance() and issubclass() checks
+
+_ABC_CACHES = frozenset(['_abc_cache', '_abc_negative_cache',
+                            '_abc_negative_cache_version', '_abc_registry'])
+
+#functions
+
+#+ helper functions
+
+def _freezeValue(gValue):
+    """
+    Helper function to replace the mutable built-in containers by their
+    immutable counterparts, recursively: list and tuple -> tuple, set and
+    frozenset -> frozenset, dict -> FrozenMapping. Any other value is returned
+    as it is.
+    
+    Signature:
+        type A -> type B
+    
+    Args:
+        gValue: type A, the value to freeze
+    
+    Version 0.0.1.0
+    """
+    typValue = type(gValue)
+    if typValue is list or typValue is tuple:
+        gResult = tuple(_freezeValue(gItem) for gItem in gValue)
+    elif typValue is set or typValue is frozenset:
+        gResult = frozenset(_freezeValue(gItem) for gItem in gValue)
+    elif typValue is dict:
+        gResult = FrozenMapping((gKey, _freezeValue(gItem))
+                                        for gKey, gItem in gValue.iteritems())
+    else:
+        gResult = gValue
+    return gResult
+
+#classes
+
+#+ helper classes
+
+class FrozenMapping(dict):
+    """
+    Read-only dictionary: the read access is inherited from the built-in dict
+    (thus it is as fast), whereas any modification raises ConstantAssignment,
+    including a repeated call of the initialization method. Unlike dict, it is
+    hashable if all values are hashable.
+    
+    Version 0.0.1.1
+    """
+    
+    #class fields
+    
+    __slots__ = ('_bInitialized', )
+    
+    #special methods
+    
+    def __init__(self, *args, **kwargs):
+        """
+        Initialization. Accepts the same arguments as the built-in dict, but
+        it can be called only once.
+        
+        Signature:
+            /dict OR seq(tuple(type A, type B)), **kwargs/ -> None
+        
+        Args:
+            *args: (optional), a mapping or a sequence of the key - value
+                pairs
+            **kwargs: (optional), keyword, the items
+        
+        Raises:
+            pos.exceptions.ConstantAssignment: the mapping is already
+                initialized
+        
+        Version 0.0.1.0
+        """
+        try:
+            object.__getattribute__(self, '_bInitialized')
+        except AttributeError: #first call
+            dict.__init__(self, *args, **kwargs)
+            object.__setattr__(self, '_bInitialized', True)
+        else:
+            raise ConstantAssignment(type(self).__name__)
+    
+    def __setitem__(self, gKey, gValue):
+        """
+        Assignment of the items is not allowed.
+        
+        Signature:
+            type A, type B -> None
+        
+        Raises:
+            pos.exceptions.ConstantAssignment: always
+        
+        Version 0.0.1.0
+        """
+        raise ConstantAssignment(type(self).__name__)
+    
+    def __delitem__(self, gKey):
+        """
+        Deletion of the items is not allowed.
+        
+        Signature:
+            type A -> None
+        
+        Raises:
+            pos.exceptions.ConstantAssignment: always
+        
+        Version 0.0.1.0
+        """
+        raise ConstantAssignment(type(self).__name__)
+    
+    def __hash__(self):
+        """
+        Special method - hash of the mapping.
+        
+        Signature:
+            None -> int
+        
+        Raises:
+            TypeError: a value is not hashable
+        
+        Version 0.0.1.0
+        """
+        return hash(frozenset(self.iteritems()))
+    
+    def __reduce__(self):
+        """
+        Special method. Implements the pickling protocol: the mapping is
+        re-created from a plain dictionary, not item by item.
+        
+        Signature:
+            None -> tuple(class FrozenMapping, tuple(dict))
+        
+        Version 0.0.1.0
+        """
+        return (type(self), (dict(self), ))
+    
+    def __copy__(self):
+        """
+        Special method. Support for copy.copy() - the mapping itself.
+        
+        Signature:
+            None -> FrozenMapping
+        
+        Version 0.0.1.0
+        """
+        return self
+    
+    def __deepcopy__(self, dictMemo):
+        """
+        Special method. Support for copy.deepcopy() - the mapping itself, since
+        the values are supposed to be immutable.
+        
+        Signature:
+            dict -> FrozenMapping
+        
+        Args:
+            dictMemo: dict, the memo of the already copied objects, not used
+        
+        Version 0.0.1.0
+        """
+        return self
+    
+    def __repr__(self):
+        """
+        Special method - the string representation of the mapping.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return '{}({})'.format(type(self).__name__, dict.__repr__(self))
+    
+    #public methods
+    
+    def clear(self):
+        """
+        Modification is not allowed.
+        
+        Signature:
+            None -> None
+        
+        Raises:
+            pos.exceptions.ConstantAssignment: always
+        
+        Version 0.0.1.0
+        """
+        raise ConstantAssignment(type(self).__name__)
+    
+    def pop(self, *args):
+        """
+        Modification is not allowed.
+        
+        Signature:
+            type A/, type B/ -> None
+        
+        Raises:
+            pos.exceptions.ConstantAssignment: always
+        
+        Version 0.0.1.0
+        """
+        raise ConstantAssignment(type(self).__name__)
+    
+    def popitem(self):
+        """
+        Modification is not allowed.
+        
+        Signature:
+            None -> None
+        
+        Raises:
+            pos.exceptions.ConstantAssignment: always
+        
+        Version 0.0.1.0
+        """
+        raise ConstantAssignment(type(self).__name__)
+    
+    def setdefault(self, *args):
+        """
+        Modification is not allowed.
+        
+        Signature:
+            type A/, type B/ -> None
+        
+        Raises:
+            pos.exceptions.ConstantAssignment: always
+        
+        Version 0.0.1.0
+        """
+        raise ConstantAssignment(type(self).__name__)
+    
+    def update(self, *args, **kwargs):
+        """
+        Modification is not allowed.
+        
+        Signature:
+            /dict, **kwargs/ -> None
+        
+        Raises:
+            pos.exceptions.ConstantAssignment: always
+        
+        Version 0.0.1.0
+        """
+        raise ConstantAssignment(type(self).__name__)
+
+#+ meta-class
+
+class ConstantNamespace_Meta(DescriptedABC_Meta):
+    """
+    Meta-class of the constant namespaces. Upon creation of a class, freezes
+    each 'public' plain class attribute (not a function, method, property or
+    any other descriptor) - see the function _freezeValue() - and collects
+    all of them, including the inherited ones, into the read-only mapping
+    stored as the class attribute _dictConstants. The instances of the class
+    do not have __dict__, unless __slots__ are defined explicitly.
+    
+    After the creation, any assignment to or deletion of a class attribute
+    raises ConstantAttributeAssignment. The only exception are the private
+    caches of the abc module (see _ABC_CACHES), which are re-assigned by the
+    isinstance() and issubclass() checks.
+    
+    Version 0.0.1.1
+    """
+    
+    def __new__(mcs, strName, tupBases, dictAttributes):
+        """
+        Special method - creation of a new class. Freezes the constants.
+        
+        Signature:
+            str, tuple(class A), dict -> class B
+        
+        Args:
+            strName: string, name of the class to be created
+            tupBases: tuple of classes, the super classes
+            dictAttributes: dictionary, the namespace of the class
+        
+        Version 0.0.1.0
+        """
+        dictNamespace = dict(dictAttributes)
+        dictNamespace.setdefault('__slots__', ())
+        dictNamespace['_bFrozen'] = False
+        dictConstants = {}
+        for clsBase in reversed(tupBases):
+            dictConstants.update(getattr(clsBase, '_dictConstants', {}))
+        for strAttr, gValue in dictAttributes.iteritems():
+            if not strAttr.startswith('_'):
+                if _classifyAttribute(gValue) == _ATTR_PLAIN:
+                    gValue = _freezeValue(gValue)
+                    dictNamespace[strAttr] = gValue
+                    dictConstants[strAttr] = gValue
+                else:
+                    dictConstants.pop(strAttr, None)
+        dictNamespace['_dictConstants'] = FrozenMapping(dictConstants)
+        clsNew = super(ConstantNamespace_Meta, mcs).__new__(mcs, strName,
+                                                    tupBases, dictNamespace)
+        type.__setattr__(clsNew, '_bFrozen', True)
+        _invalidateAttribute(clsNew, '_bFrozen')
+        return clsNew
+    
+    def __setattr__(self, strAttr, gValue):
+        """
+        Special method. Any assignment to a class attribute after creation of
+        the class is not allowed.
+        
+        Signature:
+            str, type A -> None
+        
+        Args:
+            strAttr: string, name of the attribute to be changed in value
+            gValue: any type, value to be assigned to the attribute
+        
+        Raises:
+            pos.exceptions.ConstantAttributeAssignment: the class is frozen
+        
+        Version 0.0.1.1
+        """
+        bCond1 = type.__getattribute__(self, '_bFrozen')
+        if bCond1 and not (strAttr in _ABC_CACHES):
+            raise ConstantAttributeAssignment(strAttr, self)
+        super(ConstantNamespace_Meta, self).__setattr__(strAttr, gValue)
+    
+    def __delattr__(self, strAttr):
+        """
+        Special method. Any deletion of a class attribute is not allowed.
+        
+        Signature:
+            str -> None
+        
+        Args:
+            strAttr: string, name of the attribute to be deleted
+        
+        Raises:
+            pos.exceptions.ConstantAttributeAssignment: always
+        
+        Version 0.0.1.0
+        """
+        raise ConstantAttributeAssignment(strAttr, self)
+
+#+ main classes
+
+class ConstantNamespace(DescriptedABC):
+    """
+    Base class of the constant namespaces, e.g.
+    
+        class Limits(ConstantNamespace):
+            MAX_SIZE = 1024
+            CODES = {'ok' : 0, 'failed' : 1} #frozen into FrozenMapping
+    
+    The constants are read from the class or from an instance as the plain
+    class attributes: the instances use the standard object.__getattribute__()
+    instead of the descriptors dispatch of DescriptedABC. Any assignment or
+    deletion raises ConstantAttributeAssignment. The methods, properties and
+    other descriptors defined in the class body are not constants; they are
+    not frozen and are not included into the constants mapping. A subclass
+    inherits the constants of its super classes and may add or redefine them
+    in its class body. The instances support the weak references, thus the
+    finalizers can be registered with the method addFinalizer().
+    
+    Class methods:
+        fromMapping(): dict(str -> type A)/, *args, **kwargs/ -> DescriptedABC
+        getClassFields(): None -> list(str)
+        getClassInfo(): None -> str
+        getClassMethods(): None -> list(str)
+        getConstants(): None -> FrozenMapping
+        inspectClassAttribute(): str -> FieldInfo OR MethodInfo
+    
+    Methods:
+        getFields(): None -> list(str)
+        getInfo(): None -> str
+        getMethods(): None -> list(str)
+        inspectAttribute(): str -> FieldInfo OR MethodInfo
+        setFields(): dict(str -> type A) -> None
+        addFinalizer(): callable/, *args, **kwargs/ -> None
+        close(): None -> None
+    
+    Version 0.0.1.1
+    """
+    
+    #class fields
+    
+    __metaclass__ = ConstantNamespace_Meta
+    
+    __slots__ = ('__weakref__', ) #for the finalizers
+    
+    #special methods
+    
+    __getattribute__ = object.__getattribute__
+    
+    def __setattr__(self, strAttr, gValue):
+        """
+        Special method. Any assignment is not allowed.
+        
+        Signature:
+            str, type A -> None
+        
+        Args:
+            strAttr: string, name of the attribute to be changed in value
+            gValue: any type, value to be assigned to the attribute
+        
+        Raises:
+            pos.exceptions.ConstantAttributeAssignment: always
+        
+        Version 0.0.1.0
+        """
+        raise ConstantAttributeAssignment(strAttr, type(self))
+    
+    def __delattr__(self, strAttr):
+        """
+        Special method. Any deletion is not allowed.
+        
+        Signature:
+            str -> None
+        
+        Args:
+            strAttr: string, name of the attribute to be deleted
+        
+        Raises:
+            pos.exceptions.ConstantAttributeAssignment: always
+        
+        Version 0.0.1.0
+        """
+        raise ConstantAttributeAssignment(strAttr, type(self))
+    
+    def onInit(self, *args, **kwargs):
+        """
+        Does nothing, the instances do not have own attributes.
+        
+        Signature:
+            /*args, **kwargs/ -> None
+        
+        Args:
+            *args: (optional), any amount of arguments of any types, not used
+            **kwargs: (optional), keyword, any amount of arguments of any types,
+                not used
+        
+        Version 0.0.1.0
+        """
+        pass
+    
+    #public instance methods
+    
+    def setFields(self, dictMapping):
+        """
+        Bulk assignment is not allowed, unless the mapping is empty.
+        
+        Signature:
+            dict(str -> type A) -> None
+        
+        Args:
+            dictMapping: dict(str -> type A), mapping of the names of the
+                attributes onto their values
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the argument is not a mapping
+            pos.exceptions.ConstantAttributeAssignment: the mapping is not
+                empty
+        
+        Version 0.0.1.0
+        """
+        if not isinstance(dictMapping, collections.Mapping):
+            raise CustomTypeError(dictMapping, collections.Mapping)
+        for strAttr in dictMapping:
+            raise ConstantAttributeAssignment(strAttr, type(self))
+    
+    #public class methods
+    
+    @classmethod
+    def getConstants(cls):
+        """
+        Returns the read-only mapping of the names of all constants of the
+        class, including the inherited ones, onto their values.
+        
+        Signature:
+            None -> FrozenMapping
+        
+        Version 0.0.1.0
+        """
+        return cls._dictConstants
@@ -0,0 +1,860 @@
+#usr/bin/python
+"""
+Module pos.enumerations
+
+Enumeration types resembling the static typed languages: the members of an
+enumeration are interned singletons (instances of the enumeration class
+itself), which are compared by identity, and the look-up by name and by value
+goes through the dictionaries built once upon creation of the class. Each
+enumeration also has a companion flag set type, which stores a combination of
+the members as an integer bitmask, so the union, intersection and membership
+check are single integer operations.
+
+Classes:
+    Enumeration_Meta: meta-class of the enumerations
+    FlagSet: base class of the flag sets of the enumeration members
+    Enumeration: base class of the enumerations
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+
+#imports
+
+#+ my libraries
+
+from pos.base_classes import DescriptedABC_Meta
+from pos.base_classes import _classifyAttribute, _invalidateAttribute
+from pos.base_classes import _ATTR_PLAIN
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.exceptions import ConstantAttributeAssignment, NotExistingAttribute
+
+#functions
+
+#+ helper functions
+
+def _getMember(clsEnumeration, strName):
+    """
+    Helper function to get a member of an enumeration by name, used for the
+    unpickling of the members.
+    
+    Signature:
+        class Enumeration, str -> Enumeration
+    
+    Args:
+        clsEnumeration: class Enumeration, the enumeration
+        strName: string, name of the member
+    
+    Version 0.0.1.0
+    """
+    return clsEnumeration.fromName(strName)
+
+def _getFlagSet(clsEnumeration, iMask):
+    """
+    Helper function to create a flag set of an enumeration from the bitmask,
+    used for the unpickling of the flag sets.
+    
+    Signature:
+        class Enumeration, int -> FlagSet
+    
+    Args:
+        clsEnumeration: class Enumeration, the enumeration
+        iMask: int, the bitmask
+    
+    Version 0.0.1.0
+    """
+    return clsEnumeration.FlagSet.fromMask(iMask)
+
+#classes
+
+#+ meta-class
+
+class Enumeration_Meta(DescriptedABC_Meta):
+    """
+    Meta-class of the enumerations. Upon creation of a class, replaces each
+    'public' plain class attribute (not a function, method, property or any
+    other descriptor) by a member - an instance of the class holding the name,
+    the value and the bit of the member - and builds the look-up tables by
+    name and by value. The members are ordered by their values and get the
+    bits in this order. The companion flag set class is also created.
+    
+    The class object itself is callable with a value (or a member) and returns
+    the respective member, it also supports iteration over the members, len()
+    and the 'in' check for the members and their names. The members cannot be
+    re-assigned or deleted, and an enumeration with members cannot be
+    subclassed.
+    
+    Properties:
+        FlagSet: class FlagSet, the companion flag set class
+    
+    Version 0.0.1.0
+    """
+    
+    def __new__(mcs, strName, tupBases, dictAttributes):
+        """
+        Special method - creation of a new class. Creates the members and the
+        look-up tables.
+        
+        Signature:
+            str, tuple(class A), dict -> class B
+        
+        Args:
+            strName: string, name of the class to be created
+            tupBases: tuple of classes, the super classes
+            dictAttributes: dictionary, the namespace of the class
+        
+        Raises:
+            TypeError: a super class is an enumeration with members
+            pos.exceptions.CustomValueError: two members have the same value,
+                or the value is not hashable
+        
+        Version 0.0.1.0
+        """
+        for clsBase in tupBases:
+            if getattr(clsBase, '_dictByName', None):
+                raise TypeError('cannot extend enumeration {}'.format(
+                                                            clsBase.__name__))
+        dictNamespace = dict(dictAttributes)
+        dictNamespace.setdefault('__slots__', ())
+        dictNamespace['_dictByName'] = {} #filled after the class creation
+        clsNew = super(Enumeration_Meta, mcs).__new__(mcs, strName, tupBases,
+                                                                dictNamespace)
+        lstItems = []
+        for strAttr, gValue in dictAttributes.items():
+            bCond1 = not strAttr.startswith('_')
+            if bCond1 and _classifyAttribute(gValue) == _ATTR_PLAIN:
+                lstItems.append((gValue, strAttr))
+        lstItems.sort()
+        dictByName = type.__getattribute__(clsNew, '_dictByName')
+        dictByValue = {}
+        for iIndex, (gValue, strAttr) in enumerate(lstItems):
+            try:
+                bCond = gValue in dictByValue
+            except TypeError: #not hashable
+                raise CustomValueError(gValue, "'hashable'")
+            if bCond:
+                raise CustomValueError(gValue, "'unique value of {}'".format(
+                                                                    strName))
+            objMember = object.__new__(clsNew)
+            objMember._strName = strAttr
+            objMember._gValue = gValue
+            objMember._iBit = 1 << iIndex
+            dictByName[strAttr] = objMember
+            dictByValue[gValue] = objMember
+            type.__setattr__(clsNew, strAttr, objMember)
+        tupMembers = tuple(dictByName[strAttr] for _, strAttr in lstItems)
+        clsFlagSet = type('{}FlagSet'.format(strName), (FlagSet, ),
+                            {'__slots__' : (),
+                            '__module__' : dictAttributes.get('__module__',
+                                                                __name__),
+                            '_clsEnumeration' : clsNew,
+                            '_iAll' : (1 << len(tupMembers)) - 1})
+        for strAttr, gValue in (('_dictByValue', dictByValue),
+                                ('_tupMembers', tupMembers),
+                                ('_clsFlagSet', clsFlagSet)):
+            type.__setattr__(clsNew, strAttr, gValue)
+        for strAttr in dictByName.keys() + ['_dictByValue', '_tupMembers',
+                                                                '_clsFlagSet']:
+            _invalidateAttribute(clsNew, strAttr)
+        return clsNew
+    
+    def __call__(self, gValue):
+        """
+        Special method - returns the member with the value; a member of this
+        enumeration is returned as it is. The members are never created.
+        
+        Signature:
+            type A -> Enumeration
+        
+        Args:
+            gValue: type A, the value of the member or the member itself
+        
+        Raises:
+            pos.exceptions.CustomValueError: there is no member with the value
+        
+        Version 0.0.1.0
+        """
+        try:
+            objResult = self._dictByValue[gValue]
+        except (KeyError, TypeError): #TypeError - not hashable
+            if type(gValue) is not self:
+                raise CustomValueError(gValue, "'value of {}'".format(
+                                                                self.__name__))
+            objResult = gValue
+        return objResult
+    
+    def __setattr__(self, strAttr, gValue):
+        """
+        Special method. The re-assignment of the members is not allowed, any
+        other class attribute is processed as by DescriptedABC_Meta.
+        
+        Signature:
+            str, type A -> None
+        
+        Args:
+            strAttr: string, name of the attribute to be changed in value
+            gValue: any type, value to be assigned to the attribute
+        
+        Raises:
+            pos.exceptions.ConstantAttributeAssignment: the attribute is a
+                member
+        
+        Version 0.0.1.0
+        """
+        if strAttr in type.__getattribute__(self, '_dictByName'):
+            raise ConstantAttributeAssignment(strAttr, self)
+        super(Enumeration_Meta, self).__setattr__(strAttr, gValue)
+    
+    def __delattr__(self, strAttr):
+        """
+        Special method. The deletion of the members is not allowed, any other
+        class attribute is processed as by DescriptedABC_Meta.
+        
+        Signature:
+            str -> None
+        
+        Args:
+            strAttr: string, name of the attribute to be deleted
+        
+        Raises:
+            pos.exceptions.ConstantAttributeAssignment: the attribute is a
+                member
+        
+        Version 0.0.1.0
+        """
+        if strAttr in type.__getattribute__(self, '_dictByName'):
+            raise ConstantAttributeAssignment(strAttr, self)
+        super(Enumeration_Meta, self).__delattr__(strAttr)
+    
+    def __iter__(self):
+        """
+        Special method - iteration over the members in the order of their
+        values.
+        
+        Signature:
+            None -> iterator(Enumeration)
+        
+        Version 0.0.1.0
+        """
+        return iter(self._tupMembers)
+    
+    def __len__(self):
+        """
+        Special method - the number of the members.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return len(self._tupMembers)
+    
+    def __contains__(self, gItem):
+        """
+        Special method - checks if the item is a member of this enumeration or
+        the name of a member.
+        
+        Signature:
+            type A -> bool
+        
+        Args:
+            gItem: type A, the item to check
+        
+        Version 0.0.1.0
+        """
+        if type(gItem) is self:
+            bResult = True
+        else:
+            try:
+                bResult = gItem in self._dictByName
+            except TypeError: #not hashable
+                bResult = False
+        return bResult
+    
+    #properties
+    
+    @property
+    def FlagSet(self):
+        """
+        Getter property for the companion flag set class.
+        
+        Signature:
+            None -> class FlagSet
+        
+        Version 0.0.1.0
+        """
+        return self._clsFlagSet
+
+#+ main classes
+
+class FlagSet(object):
+    """
+    Base class of the flag sets - immutable combinations of the members of an
+    enumeration stored as an integer bitmask. Each enumeration has its own
+    flag set subclass, e.g. Color.FlagSet(Color.RED, Color.BLUE), which is
+    created by the meta-class.
+    
+    The set operations | (union), & (intersection), - (difference), ^
+    (symmetric difference) and ~ (complement) accept another flag set of the
+    same enumeration or a member, the comparisons <= and >= check the subset
+    and superset relations, and the 'in' check of a member is a single bitwise
+    AND. The flag sets are hashable, iterable (members in the order of their
+    values) and support len().
+    
+    Properties:
+        Mask: int, the bitmask
+    
+    Class methods:
+        fromMask(): int -> FlagSet
+    
+    Version 0.0.1.0
+    """
+    
+    #class fields
+    
+    __slots__ = ('_iMask', )
+    
+    _clsEnumeration = None
+    
+    _iAll = 0
+    
+    #special methods
+    
+    def __init__(self, *args):
+        """
+        Initialization.
+        
+        Signature:
+            /*args/ -> None
+        
+        Args:
+            *args: (optional), any number of the members of the enumeration
+        
+        Raises:
+            pos.exceptions.CustomTypeError: an argument is not a member of the
+                enumeration
+        
+        Version 0.0.1.0
+        """
+        clsEnumeration = self._clsEnumeration
+        iMask = 0
+        for objMember in args:
+            if type(objMember) is not clsEnumeration:
+                raise CustomTypeError(objMember, clsEnumeration)
+            iMask |= objMember._iBit
+        self._iMask = iMask
+    
+    def __getMask(self, gOther):
+        """
+        Returns the bitmask of another flag set of the same enumeration or of a
+        member, or None for any other object.
+        
+        Signature:
+            type A -> int OR None
+        
+        Args:
+            gOther: type A, another operand
+        
+        Version 0.0.1.0
+        """
+        typOther = type(gOther)
+        if typOther is type(self):
+            iResult = gOther._iMask
+        elif typOther is self._clsEnumeration:
+            iResult = gOther._iBit
+        else:
+            iResult = None
+        return iResult
+    
+    def __or__(self, gOther):
+        """
+        Special method - union.
+        
+        Signature:
+            FlagSet OR Enumeration -> FlagSet
+        
+        Args:
+            gOther: FlagSet OR Enumeration, another flag set or a member
+        
+        Version 0.0.1.0
+        """
+        iMask = self.__getMask(gOther)
+        if iMask is None:
+            gResult = NotImplemented
+        else:
+            gResult = self.fromMask(self._iMask | iMask)
+        return gResult
+    
+    __ror__ = __or__
+    
+    def __and__(self, gOther):
+        """
+        Special method - intersection.
+        
+        Signature:
+            FlagSet OR Enumeration -> FlagSet
+        
+        Args:
+            gOther: FlagSet OR Enumeration, another flag set or a member
+        
+        Version 0.0.1.0
+        """
+        iMask = self.__getMask(gOther)
+        if iMask is None:
+            gResult = NotImplemented
+        else:
+            gResult = self.fromMask(self._iMask & iMask)
+        return gResult
+    
+    __rand__ = __and__
+    
+    def __xor__(self, gOther):
+        """
+        Special method - symmetric difference.
+        
+        Signature:
+            FlagSet OR Enumeration -> FlagSet
+        
+        Args:
+            gOther: FlagSet OR Enumeration, another flag set or a member
+        
+        Version 0.0.1.0
+        """
+        iMask = self.__getMask(gOther)
+        if iMask is None:
+            gResult = NotImplemented
+        else:
+            gResult = self.fromMask(self._iMask ^ iMask)
+        return gResult
+    
+    __rxor__ = __xor__
+    
+    def __sub__(self, gOther):
+        """
+        Special method - difference.
+        
+        Signature:
+            FlagSet OR Enumeration -> FlagSet
+        
+        Args:
+            gOther: FlagSet OR Enumeration, another flag set or a member
+        
+        Version 0.0.1.0
+        """
+        iMask = self.__getMask(gOther)
+        if iMask is None:
+            gResult = NotImplemented
+        else:
+            gResult = self.fromMask(self._iMask & ~iMask)
+        return gResult
+    
+    def __invert__(self):
+        """
+        Special method - complement, i.e. all other members.
+        
+        Signature:
+            None -> FlagSet
+        
+        Version 0.0.1.0
+        """
+        return self.fromMask(self._iAll & ~self._iMask)
+    
+    def __contains__(self, objMember):
+        """
+        Special method - checks if the member is in the set.
+        
+        Signature:
+            type A -> bool
+        
+        Args:
+            objMember: type A, the member to check
+        
+        Version 0.0.1.0
+        """
+        return (type(objMember) is self._clsEnumeration and
+                                        (self._iMask & objMember._iBit) != 0)
+    
+    def __eq__(self, gOther):
+        """
+        Special method - equality of two flag sets of the same enumeration.
+        
+        Signature:
+            type A -> bool
+        
+        Args:
+            gOther: type A, another object
+        
+        Version 0.0.1.0
+        """
+        return type(gOther) is type(self) and gOther._iMask == self._iMask
+    
+    def __ne__(self, gOther):
+        """
+        Special method - inequality, see __eq__().
+        
+        Signature:
+            type A -> bool
+        
+        Args:
+            gOther: type A, another object
+        
+        Version 0.0.1.0
+        """
+        return not self.__eq__(gOther)
+    
+    def __le__(self, gOther):
+        """
+        Special method - checks if this set is a subset of another one.
+        
+        Signature:
+            FlagSet -> bool
+        
+        Args:
+            gOther: FlagSet, another flag set of the same enumeration
+        
+        Version 0.0.1.0
+        """
+        if type(gOther) is not type(self):
+            return NotImplemented
+        return (self._iMask & ~gOther._iMask) == 0
+    
+    def __ge__(self, gOther):
+        """
+        Special method - checks if this set is a superset of another one.
+        
+        Signature:
+            FlagSet -> bool
+        
+        Args:
+            gOther: FlagSet, another flag set of the same enumeration
+        
+        Version 0.0.1.0
+        """
+        if type(gOther) is not type(self):
+            return NotImplemented
+        return (gOther._iMask & ~self._iMask) == 0
+    
+    def __hash__(self):
+        """
+        Special method - hash of the set.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return hash((type(self), self._iMask))
+    
+    def __nonzero__(self):
+        """
+        Special method - True for a non-empty set.
+        
+        Signature:
+            None -> bool
+        
+        Version 0.0.1.0
+        """
+        return self._iMask != 0
+    
+    def __len__(self):
+        """
+        Special method - the number of the members in the set.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return bin(self._iMask).count('1')
+    
+    def __iter__(self):
+        """
+        Special method - iteration over the members in the set in the order of
+        their values.
+        
+        Signature:
+            None -> iterator(Enumeration)
+        
+        Version 0.0.1.0
+        """
+        iMask = self._iMask
+        return iter([objMember
+                        for objMember in self._clsEnumeration._tupMembers
+                                                if iMask & objMember._iBit])
+    
+    def __repr__(self):
+        """
+        Special method - the string representation of the set.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return '{}({})'.format(type(self).__name__,
+                            ', '.join(str(objMember) for objMember in self))
+    
+    def __reduce__(self):
+        """
+        Special method. Implements the pickling protocol: the set is restored
+        from the bitmask via its enumeration, since the flag set class itself
+        is created dynamically.
+        
+        Signature:
+            None -> tuple(function, tuple(class Enumeration, int))
+        
+        Version 0.0.1.0
+        """
+        return (_getFlagSet, (self._clsEnumeration, self._iMask))
+    
+    #properties
+    
+    @property
+    def Mask(self):
+        """
+        Getter property for the bitmask.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return self._iMask
+    
+    #public class methods
+    
+    @classmethod
+    def fromMask(cls, iMask):
+        """
+        Creates a flag set from the bitmask.
+        
+        Signature:
+            int -> FlagSet
+        
+        Args:
+            iMask: int, the bitmask
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the bitmask is not an integer
+            pos.exceptions.CustomValueError: the bitmask has the bits not
+                assigned to any member
+        
+        Version 0.0.1.0
+        """
+        if not (type(iMask) is int or isinstance(iMask, (int, long))):
+            raise CustomTypeError(iMask, int)
+        if iMask & ~cls._iAll or iMask < 0:
+            raise CustomValueError(iMask, "'bitmask of {}'".format(
+                                                cls._clsEnumeration.__name__))
+        objResult = object.__new__(cls)
+        objResult._iMask = iMask
+        return objResult
+
+class Enumeration(object):
+    """
+    Base class of the enumerations, e.g.
+    
+        class Color(Enumeration):
+            RED = 1
+            GREEN = 2
+            BLUE = 3
+    
+    Each 'public' plain class attribute becomes a member - an instance of the
+    class, which is an interned singleton: Color.RED is Color(1) is
+    Color.fromName('RED'). The members are compared by identity and hashed by
+    identity, they are not equal to their values, and they cannot be created,
+    re-assigned or deleted. The members are also preserved by identity upon
+    copying and pickling.
+    
+    The companion flag set class Color.FlagSet stores a combination of the
+    members as an integer bitmask, e.g. Color.RED | Color.BLUE.
+    
+    Properties:
+        Bit: int, the bit of the member in the flag set bitmask
+        Name: string, name of the member
+        Value: type A, value of the member
+    
+    Class methods:
+        fromName(): str -> Enumeration
+        fromValue(): type A -> Enumeration
+    
+    Version 0.0.1.0
+    """
+    
+    #class fields
+    
+    __metaclass__ = Enumeration_Meta
+    
+    __slots__ = ('_strName', '_gValue', '_iBit')
+    
+    #special methods
+    
+    def __repr__(self):
+        """
+        Special method - the string representation of the member.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return '<{}.{}: {!r}>'.format(type(self).__name__, self._strName,
+                                                                self._gValue)
+    
+    def __str__(self):
+        """
+        Special method - the qualified name of the member.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return '{}.{}'.format(type(self).__name__, self._strName)
+    
+    def __reduce__(self):
+        """
+        Special method. Implements the pickling protocol: the member is
+        restored by name, thus the identity is preserved.
+        
+        Signature:
+            None -> tuple(function, tuple(class Enumeration, str))
+        
+        Version 0.0.1.0
+        """
+        return (_getMember, (type(self), self._strName))
+    
+    def __copy__(self):
+        """
+        Special method. Support for copy.copy() - the member itself.
+        
+        Signature:
+            None -> Enumeration
+        
+        Version 0.0.1.0
+        """
+        return self
+    
+    def __deepcopy__(self, dictMemo):
+        """
+        Special method. Support for copy.deepcopy() - the member itself.
+        
+        Signature:
+            dict -> Enumeration
+        
+        Args:
+            dictMemo: dict, the memo of the already copied objects, not used
+        
+        Version 0.0.1.0
+        """
+        return self
+    
+    def __or__(self, gOther):
+        """
+        Special method - the flag set of this and another member of the same
+        enumeration, or the union with a flag set.
+        
+        Signature:
+            Enumeration OR FlagSet -> FlagSet
+        
+        Args:
+            gOther: Enumeration OR FlagSet, another member or a flag set
+        
+        Version 0.0.1.0
+        """
+        clsFlagSet = type(self)._clsFlagSet
+        return clsFlagSet.fromMask(self._iBit) | gOther
+    
+    __ror__ = __or__
+    
+    #properties
+    
+    @property
+    def Bit(self):
+        """
+        Getter property for the bit of the member in the flag set bitmask.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return self._iBit
+    
+    @property
+    def Name(self):
+        """
+        Getter property for the name of the member.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return self._strName
+    
+    @property
+    def Value(self):
+        """
+        Getter property for the value of the member.
+        
+        Signature:
+            None -> type A
+        
+        Version 0.0.1.0
+        """
+        return self._gValue
+    
+    #public class methods
+    
+    @classmethod
+    def fromName(cls, strName):
+        """
+        Returns the member with the name.
+        
+        Signature:
+            str -> Enumeration
+        
+        Args:
+            strName: string, name of the member
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the name is not a string
+            pos.exceptions.NotExistingAttribute: there is no member with the
+                name
+        
+        Version 0.0.1.0
+        """
+        try:
+            objResult = cls._dictByName[strName]
+        except KeyError:
+            if not isinstance(strName, basestring):
+                raise CustomTypeError(strName, basestring)
+            raise NotExistingAttribute(strName, cls)
+        except TypeError: #not hashable
+            raise CustomTypeError(strName, basestring)
+        return objResult
+    
+    @classmethod
+    def fromValue(cls, gValue):
+        """
+        Returns the member with the value.
+        
+        Signature:
+            type A -> Enumeration
+        
+        Args:
+            gValue: type A, value of the member
+        
+        Raises:
+            pos.exceptions.CustomValueError: there is no member with the value
+        
+        Version 0.0.1.0
+        """
+        try:
+            objResult = cls._dictByValue[gValue]
+        except (KeyError, TypeError): #TypeError - not hashable
+            raise CustomValueError(gValue, "'value of {}'".format(
+                                                                cls.__name__))
+        return objResult
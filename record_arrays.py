@@ -0,0 +1,690 @@
+#usr/bin/python
+"""
+Module pos.record_arrays
+
+Columnar storage of the records sharing the same schema defined by a
+DescriptedABC subclass: each instance field of the schema is stored as a
+contiguous column (array.array for the integer and floating point values,
+list for any other type), whereas the records are accessed via lightweight row
+views - instances of a dynamically created subclass of the schema. The fields
+holding data descriptors keep their checks: all values written into such
+columns, via the row views as well as in bulk, are checked and converted by
+private copies of the descriptors, assigned to a private scratch instance of
+the schema.
+
+Classes:
+    DescriptedRecordArray: columnar container of the records
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+
+#imports
+
+#+ standard libraries
+
+import array
+import copy
+import collections
+
+#+ my libraries
+
+from pos.base_classes import DescriptedABC
+from pos.base_classes import _getInstanceItems, _isMethodValue
+from pos.base_classes import _invalidateAttribute, _checkValue
+from pos.base_classes import _dictValueSetters
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.exceptions import NotExistingAttribute
+
+#globals
+
+#+ default array type codes of the columns per type of the value; any other
+#+ type is stored in a list
+
+DEFAULT_TYPECODES = {int : 'l', float : 'd'}
+
+#+ cache of the row view classes per schema and fields
+
+_dictViewClasses = {}
+
+#functions
+
+#+ helper functions
+
+def _setRowAttribute(self, strAttr, gValue):
+    """
+    Replacement for the __setattr__() method of the row view classes. The
+    assignment to a column field is redirected into the respective column,
+    any other assignment is processed by the schema class.
+    
+    Signature:
+        str, type A -> None
+    
+    Args:
+        strAttr: string, name of the attribute to be changed in value
+        gValue: any type, value to be assigned to the attribute
+    
+    Version 0.0.1.0
+    """
+    clsOwner = type(self)
+    objField = clsOwner.__dict__.get(strAttr, None)
+    if type(objField) is _ColumnField:
+        objField.__set__(self, gValue)
+    else:
+        super(clsOwner, self).__setattr__(strAttr, gValue)
+
+def _reprRow(self):
+    """
+    Replacement for the __repr__() method of the row view classes.
+    
+    Signature:
+        None -> str
+    
+    Version 0.0.1.0
+    """
+    clsOwner = type(self)
+    strlstValues = ['{}={!r}'.format(strName, getattr(self, strName))
+                                            for strName in clsOwner._tupFields]
+    return '{}({})'.format(clsOwner.__name__, ', '.join(strlstValues))
+
+def _getViewClass(clsSchema, tupFields):
+    """
+    Helper function to create (or to get the cached) row view class for the
+    schema class and the columns. The view class is a subclass of the schema
+    with three slots (references to the list of the columns and to the list of
+    the checks of the values of the fields, and the row index) and one data
+    descriptor per column, which shadows the respective field of the schema.
+    
+    Signature:
+        class DescriptedABC, tuple(str) -> class DescriptedABC
+    
+    Args:
+        clsSchema: class DescriptedABC, the schema class
+        tupFields: tuple(str), names of the columns
+    
+    Version 0.0.1.2
+    """
+    tupKey = (clsSchema, tupFields)
+    clsView = _dictViewClasses.get(tupKey, None)
+    if clsView is None:
+        dictNamespace = {'__slots__' : ('_lstColumns', '_lstChecks',
+                                                                '_iIndex'),
+                            '__setattr__' : _setRowAttribute,
+                            '__repr__' : _reprRow,
+                            '_tupFields' : tupFields,
+                            '__module__' : clsSchema.__module__}
+        clsView = type(clsSchema)('{}Row'.format(clsSchema.__name__),
+                                                (clsSchema, ), dictNamespace)
+        objColumns = clsView.__dict__['_lstColumns']
+        objChecks = clsView.__dict__['_lstChecks']
+        objIndex = clsView.__dict__['_iIndex']
+        for iColumn, strName in enumerate(tupFields):
+            type.__setattr__(clsView, strName, _ColumnField(strName, iColumn,
+                                            objColumns, objChecks, objIndex))
+            _invalidateAttribute(clsView, strName)
+        _dictViewClasses[tupKey] = clsView
+    return clsView
+
+#classes
+
+#+ helper classes
+
+class _FieldCheck(object):
+    """
+    Check of the values of a field of the schema holding a data descriptor.
+    A value is assigned to and read back from a private copy of the descriptor
+    as the attribute of a private scratch instance of the schema, thus it is
+    checked and converted in the same way as upon the assignment to the field
+    of a schema instance, whereas neither the original descriptor nor any
+    other instance is changed.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('_objDescriptor', '_objScratch')
+    
+    def __init__(self, objDescriptor, objScratch):
+        """
+        Initialization.
+        
+        Signature:
+            type A, DescriptedABC -> None
+        
+        Args:
+            objDescriptor: type A, the data descriptor of the field, which is
+                copied
+            objScratch: DescriptedABC, the private scratch instance of the
+                schema
+        
+        Version 0.0.1.0
+        """
+        self._objDescriptor = copy.copy(objDescriptor)
+        self._objScratch = objScratch
+    
+    def __call__(self, gValue):
+        """
+        Checks and converts a value.
+        
+        Signature:
+            type A -> type B
+        
+        Args:
+            gValue: type A, the value to check
+        
+        Raises:
+            AttributeError: the descriptor does not allow the assignment
+            Exception: any other exception raised by the descriptor upon the
+                assignment
+        
+        Version 0.0.1.0
+        """
+        objScratch = self._objScratch
+        self._objDescriptor.__set__(objScratch, gValue)
+        return self._objDescriptor.__get__(objScratch, type(objScratch))
+
+class _ColumnField(object):
+    """
+    Data descriptor of the row view classes, redirects the read and write
+    access to the respective element of a column. If the field of the schema
+    holds a data descriptor, the assigned value is checked and converted by
+    the check of the column (see _FieldCheck) before it is stored in the
+    column. The deletion is not allowed.
+    
+    Version 0.0.1.2
+    """
+    
+    __slots__ = ('Name', '_iColumn', '_getColumns', '_getChecks', '_getIndex')
+    
+    def __init__(self, strName, iColumn, objColumns, objChecks, objIndex):
+        """
+        Initialization.
+        
+        Signature:
+            str, int, member_descriptor, member_descriptor,
+                member_descriptor -> None
+        
+        Args:
+            strName: string, name of the field / column
+            iColumn: int, index of the column
+            objColumns: member_descriptor, slot of the view class referencing
+                the list of the columns
+            objChecks: member_descriptor, slot of the view class referencing
+                the list of the checks of the values (None for the plain
+                values) per column
+            objIndex: member_descriptor, slot of the view class storing the
+                index of the row
+        
+        Version 0.0.1.2
+        """
+        self.Name = strName
+        self._iColumn = iColumn
+        self._getColumns = objColumns.__get__
+        self._getChecks = objChecks.__get__
+        self._getIndex = objIndex.__get__
+    
+    def __get__(self, objRow, clsOwner):
+        """
+        Returns the element of the column for the row, or the descriptor itself
+        if accessed via the class.
+        
+        Signature:
+            type A, class A -> type B
+        
+        Args:
+            objRow: type A, row view instance or None
+            clsOwner: class A, the view class
+        
+        Version 0.0.1.0
+        """
+        if objRow is None or isinstance(objRow, type):
+            gResult = self
+        else:
+            gResult = self._getColumns(objRow)[self._iColumn][
+                                                        self._getIndex(objRow)]
+        return gResult
+    
+    def __set__(self, objRow, gValue):
+        """
+        Sets the element of the column for the row. The value is checked and
+        converted by the check of the column, if any.
+        
+        Signature:
+            type A, type B -> None
+        
+        Args:
+            objRow: type A, row view instance
+            gValue: type B, the value to assign
+        
+        Raises:
+            AttributeError: assignment via the view class, or the data
+                descriptor of the field does not allow the assignment
+            TypeError: the value is not compatible with the array type code
+            Exception: any other exception raised by the data descriptor of
+                the field upon the assignment
+        
+        Version 0.0.1.2
+        """
+        if isinstance(objRow, type):
+            raise AttributeError("can't set column {}".format(self.Name))
+        funcCheck = self._getChecks(objRow)[self._iColumn]
+        if not (funcCheck is None):
+            gValue = funcCheck(gValue)
+        self._getColumns(objRow)[self._iColumn][
+                                            self._getIndex(objRow)] = gValue
+    
+    def __delete__(self, objRow):
+        """
+        Deletion of the column elements is not allowed.
+        
+        Signature:
+            type A -> None
+        
+        Args:
+            objRow: type A, row view instance
+        
+        Raises:
+            AttributeError: always
+        
+        Version 0.0.1.0
+        """
+        raise AttributeError("can't delete column {}".format(self.Name))
+
+#+ main classes
+
+class DescriptedRecordArray(object):
+    """
+    Columnar container of the records sharing the same schema defined by a
+    non-abstract DescriptedABC (or DescriptedSlotsABC) subclass. A prototype
+    instance of the schema is created without arguments; its 'public'
+    instance data fields (the __dict__ entries or the assigned slots) define
+    the columns, and their values define the default values of the new rows
+    and the type of each column: array.array with the type code defined by
+    the type of the default value (see DEFAULT_TYPECODES, can be overridden
+    per field) or list for any other type.
+    
+    Indexing returns a row view - an instance of a subclass of the schema,
+    which reads and writes the column elements via data descriptors, whereas
+    the properties, methods and class fields of the schema work as usual.
+    The row views are created upon each access, do not store any data
+    themselves, and cannot be used to delete the fields. If a field of the
+    prototype holds a data descriptor, all values written into that column
+    are checked and converted by a private copy of the descriptor assigned to
+    the prototype, which is kept as the private scratch instance, e.g. a
+    'constant' field cannot be re-assigned.
+    
+    The entire columns can be read and written with the methods getColumn()
+    and setColumn(), which do not involve the per row attribute access. Same
+    as the methods append() and extend(), they fill the columns as upon
+    creation of the records: the values equal to the default value of a
+    column are stored as they are, whereas any other value written into a
+    column with a data descriptor is checked one by one in the same way as
+    via the row views; the other columns are written in bulk.
+    
+    Properties:
+        Schema: class DescriptedABC, the schema class
+        Fields: tuple(str), names of the columns
+    
+    Methods:
+        append(): /DescriptedABC OR dict/ -> None
+        extend(): seq(DescriptedABC OR dict) -> None
+        getColumn(): str -> array.array OR list
+        setColumn(): str, seq(type A) -> None
+    
+    Version 0.0.1.0
+    """
+    
+    #special methods
+    
+    def __init__(self, clsSchema, iLength = 0, dictTypecodes = None):
+        """
+        Initialization. Creates the columns of the specified length filled with
+        the default values.
+        
+        Signature:
+            class DescriptedABC/, int, dict(str -> str OR None)/ -> None
+        
+        Args:
+            clsSchema: class DescriptedABC, the non-abstract schema class
+            iLength: (optional) non-negative int, initial number of the rows,
+                defaults to zero
+            dictTypecodes: (optional) dict(str -> str OR None), explicit
+                array type codes per field; None value means list storage
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the schema is not a subclass of
+                DescriptedABC, or the length is not an integer
+            pos.exceptions.CustomValueError: the length is negative
+            pos.exceptions.NotExistingAttribute: the explicit type code is
+                defined for an unknown field
+        
+        Version 0.0.1.2
+        """
+        bCond1 = isinstance(clsSchema, type)
+        if not (bCond1 and issubclass(clsSchema, DescriptedABC)):
+            raise CustomTypeError(clsSchema, DescriptedABC)
+        if not isinstance(iLength, (int, long)) or isinstance(iLength, bool):
+            raise CustomTypeError(iLength, int)
+        if iLength < 0:
+            raise CustomValueError(iLength, "'non-negative'")
+        objPrototype = clsSchema()
+        dictDefaults = dict((strName, gValue) for strName, gValue
+                            in _getInstanceItems(objPrototype)
+                            if not (strName.startswith('_') or
+                                                    _isMethodValue(gValue)))
+        tupFields = tuple(sorted(dictDefaults.keys()))
+        if dictTypecodes is None:
+            dictTypecodes = {}
+        for strName in dictTypecodes:
+            if not (strName in dictDefaults):
+                raise NotExistingAttribute(strName, clsSchema)
+        self._clsSchema = clsSchema
+        self._tupFields = tupFields
+        self._dictIndexes = dict((strName, iColumn)
+                                for iColumn, strName in enumerate(tupFields))
+        self._lstDefaults = [getattr(objPrototype, strName)
+                                                    for strName in tupFields]
+        self._lstChecks = []
+        for strName in tupFields:
+            gValue = dictDefaults[strName]
+            bSetter = _dictValueSetters.get(type(gValue), None)
+            if bSetter is None:
+                bSetter = _checkValue(gValue, '__set__', _dictValueSetters)
+            if bSetter:
+                self._lstChecks.append(_FieldCheck(gValue, objPrototype))
+            else:
+                self._lstChecks.append(None)
+        self._lstTypecodes = []
+        self._lstColumns = []
+        for strName, gDefault in zip(tupFields, self._lstDefaults):
+            if strName in dictTypecodes:
+                strTypecode = dictTypecodes[strName]
+            else:
+                strTypecode = DEFAULT_TYPECODES.get(type(gDefault), None)
+            self._lstTypecodes.append(strTypecode)
+            if strTypecode is None:
+                self._lstColumns.append([gDefault] * iLength)
+            else:
+                self._lstColumns.append(array.array(strTypecode,
+                                                        [gDefault]) * iLength)
+        self._clsView = _getViewClass(clsSchema, tupFields)
+        self._iLength = iLength
+    
+    def __len__(self):
+        """
+        Returns the number of the rows.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return self._iLength
+    
+    def __getitem__(self, gIndex):
+        """
+        Returns a row view for an integer index (negative indexes are counted
+        from the end), or a list of the row views for a slice.
+        
+        Signature:
+            int OR slice -> DescriptedABC OR list(DescriptedABC)
+        
+        Args:
+            gIndex: int OR slice, index of the row(s)
+        
+        Raises:
+            IndexError: the index is out of range
+            pos.exceptions.CustomTypeError: the index is neither integer nor
+                slice
+        
+        Version 0.0.1.0
+        """
+        if isinstance(gIndex, slice):
+            gResult = [self._getView(iIndex)
+                        for iIndex in xrange(*gIndex.indices(self._iLength))]
+        elif isinstance(gIndex, (int, long)):
+            iIndex = gIndex
+            if iIndex < 0:
+                iIndex += self._iLength
+            if iIndex < 0 or iIndex >= self._iLength:
+                raise IndexError('record index out of range')
+            gResult = self._getView(iIndex)
+        else:
+            raise CustomTypeError(gIndex, int)
+        return gResult
+    
+    def __iter__(self):
+        """
+        Iterates over the row views.
+        
+        Signature:
+            None -> iterator(DescriptedABC)
+        
+        Version 0.0.1.0
+        """
+        for iIndex in xrange(self._iLength):
+            yield self._getView(iIndex)
+    
+    #'private' / helper methods
+    
+    def _getView(self, iIndex):
+        """
+        Creates a row view for a valid, non-negative row index.
+        
+        Signature:
+            int -> DescriptedABC
+        
+        Args:
+            iIndex: int, index of the row
+        
+        Version 0.0.1.2
+        """
+        clsView = self._clsView
+        objView = object.__new__(clsView)
+        dictVars = clsView.__dict__
+        dictVars['_lstColumns'].__set__(objView, self._lstColumns)
+        dictVars['_lstChecks'].__set__(objView, self._lstChecks)
+        dictVars['_iIndex'].__set__(objView, iIndex)
+        return objView
+    
+    def _checkValues(self, iColumn, seqValues):
+        """
+        Checks and converts the values to be written into a column with a
+        data descriptor; the values equal to the default value of the column
+        are not checked. Any other column gets the values as they are.
+        
+        Signature:
+            int, seq(type A) -> seq(type B)
+        
+        Args:
+            iColumn: int, index of the column
+            seqValues: seq(type A), the values to be written
+        
+        Raises:
+            AttributeError: the descriptor does not allow the assignment
+            Exception: any other exception raised by the descriptor upon the
+                assignment
+        
+        Version 0.0.1.0
+        """
+        funcCheck = self._lstChecks[iColumn]
+        if not (funcCheck is None):
+            gDefault = self._lstDefaults[iColumn]
+            seqValues = [gValue if (type(gValue) is type(gDefault) and
+                                    gValue == gDefault) else funcCheck(gValue)
+                                                    for gValue in seqValues]
+        return seqValues
+    
+    def _getColumnIndex(self, strName):
+        """
+        Returns the index of the column.
+        
+        Signature:
+            str -> int
+        
+        Args:
+            strName: string, name of the column
+        
+        Raises:
+            pos.exceptions.NotExistingAttribute: unknown column
+        
+        Version 0.0.1.0
+        """
+        iColumn = self._dictIndexes.get(strName, None)
+        if iColumn is None:
+            raise NotExistingAttribute(strName, self._clsSchema)
+        return iColumn
+    
+    #properties
+    
+    @property
+    def Schema(self):
+        """
+        Getter property. Returns the schema class.
+        
+        Signature:
+            None -> class DescriptedABC
+        
+        Version 0.0.1.0
+        """
+        return self._clsSchema
+    
+    @property
+    def Fields(self):
+        """
+        Getter property. Returns the names of the columns.
+        
+        Signature:
+            None -> tuple(str)
+        
+        Version 0.0.1.0
+        """
+        return self._tupFields
+    
+    #public methods
+    
+    def append(self, gRecord = None):
+        """
+        Appends a row. Its values are taken from the fields of the passed
+        schema instance (or other object) or from the passed mapping; the
+        missing fields get the default values.
+        
+        Signature:
+            /type A OR dict(str -> type B)/ -> None
+        
+        Args:
+            gRecord: (optional) type A OR dict(str -> type B), the source of
+                the values, defaults to None - all values are default
+        
+        Raises:
+            TypeError: a value is not compatible with the column type code
+            AttributeError: the data descriptor of a field does not allow
+                the assignment
+            Exception: any other exception raised by the data descriptor of a
+                field upon the assignment
+        
+        Version 0.0.1.1
+        """
+        if gRecord is None:
+            lstValues = self._lstDefaults
+        else:
+            if isinstance(gRecord, collections.Mapping):
+                lstValues = [gRecord.get(strName, gDefault)
+                                    for strName, gDefault
+                                    in zip(self._tupFields, self._lstDefaults)]
+            else:
+                lstValues = [getattr(gRecord, strName, gDefault)
+                                    for strName, gDefault
+                                    in zip(self._tupFields, self._lstDefaults)]
+            for iColumn, funcCheck in enumerate(self._lstChecks):
+                if not (funcCheck is None):
+                    lstValues[iColumn] = self._checkValues(iColumn,
+                                                    [lstValues[iColumn]])[0]
+        iAppended = 0
+        try:
+            for gColumn, gValue in zip(self._lstColumns, lstValues):
+                gColumn.append(gValue)
+                iAppended += 1
+        except Exception:
+            for gColumn in self._lstColumns[:iAppended]: #keep columns aligned
+                gColumn.pop()
+            raise
+        self._iLength += 1
+    
+    def extend(self, seqRecords):
+        """
+        Appends the rows, see the method append().
+        
+        Signature:
+            seq(type A OR dict(str -> type B)) -> None
+        
+        Args:
+            seqRecords: seq(type A OR dict(str -> type B)), the sources of the
+                values of the rows
+        
+        Raises:
+            TypeError: a value is not compatible with the column type code
+            AttributeError: the data descriptor of a field does not allow
+                the assignment
+            Exception: any other exception raised by the data descriptor of a
+                field upon the assignment
+        
+        Version 0.0.1.1
+        """
+        for gRecord in seqRecords:
+            self.append(gRecord)
+    
+    def getColumn(self, strName):
+        """
+        Returns a copy of an entire column as array.array or list.
+        
+        Signature:
+            str -> array.array OR list
+        
+        Args:
+            strName: string, name of the column
+        
+        Raises:
+            pos.exceptions.NotExistingAttribute: unknown column
+        
+        Version 0.0.1.0
+        """
+        return self._lstColumns[self._getColumnIndex(strName)][:]
+    
+    def setColumn(self, strName, seqValues):
+        """
+        Replaces the values of an entire column. The length of the passed
+        sequence must be equal to the number of the rows.
+        
+        Signature:
+            str, seq(type A) -> None
+        
+        Args:
+            strName: string, name of the column
+            seqValues: seq(type A), the new values
+        
+        Raises:
+            pos.exceptions.NotExistingAttribute: unknown column
+            pos.exceptions.CustomValueError: length mismatch
+            TypeError: a value is not compatible with the column type code
+            AttributeError: the data descriptor of the field does not allow
+                the assignment
+            Exception: any other exception raised by the data descriptor of
+                the field upon the assignment
+        
+        Version 0.0.1.1
+        """
+        iColumn = self._getColumnIndex(strName)
+        seqValues = self._checkValues(iColumn, seqValues)
+        strTypecode = self._lstTypecodes[iColumn]
+        if strTypecode is None:
+            gColumn = list(seqValues)
+        elif isinstance(seqValues, array.array) and (
+                                            seqValues.typecode == strTypecode):
+            gColumn = seqValues[:]
+        else:
+            gColumn = array.array(strTypecode, seqValues)
+        if len(gColumn) != self._iLength:
+            raise CustomValueError(len(gColumn),
+                                        "'equal to {}'".format(self._iLength))
+        self._lstColumns[iColumn] = gColumn
@@ -0,0 +1,806 @@
+#usr/bin/python
+"""
+Module pos.record_store
+
+File backed storage of the fixed size records sharing the same schema. The
+records are kept in a memory mapped file after a small header, which
+describes the binary layout (names, struct formats, defaults and bounds of
+the fields), so another process can open the file read-only without the
+schema class and read the records without copying or parsing them.
+
+The schema is either a StructRecordABC subclass (see pos.struct_records),
+which is used as it is, or any other non-abstract DescriptedABC subclass,
+whose 'public' instance data fields with the integer or floating point default
+values (as for pos.record_arrays.DescriptedRecordArray) are converted into a
+struct record class with Int64 and BoundedFloat fields in the alphabetical
+order.
+
+File format (little-endian):
+    8 bytes - magic string
+    uint32 - offset of the first record (size of the header)
+    uint32 - size of a record
+    uint64 - number of the records
+    JSON description of the layout, padded with spaces to 8 bytes alignment
+    records
+
+Classes:
+    RecordStore: memory mapped file of the records
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+
+#imports
+
+#+ standard libraries
+
+import os
+import collections
+import array
+import struct
+import mmap
+import json
+
+#+ my libraries
+
+from pos.base_classes import DescriptedABC
+from pos.base_classes import _getInstanceItems, _isMethodValue
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.exceptions import NotExistingAttribute
+from pos.struct_records import StructRecordABC, makeStructRecord
+from pos.struct_records import STRUCT_FORMATS, _getFormat
+from pos.typed_fields import Int64, BoundedFloat
+
+#globals
+
+#+ header of the file
+
+MAGIC = 'POSRST01'
+
+_HEADER = struct.Struct('<8sIIQ')
+
+_COUNT = struct.Struct('<Q')
+
+_COUNT_OFFSET = 16
+
+#+ typed field classes per struct format character
+
+_FIELD_CLASSES = dict((strFormat, clsField)
+                            for clsField, strFormat in STRUCT_FORMATS.items())
+
+#+ number of the records unpacked at once by the column scans
+
+_CHUNK = 1024
+
+#+ initial capacity of a new file in records
+
+DEFAULT_CAPACITY = 1024
+
+#functions
+
+#+ helper functions
+
+def _getStructClass(clsSchema):
+    """
+    Helper function to obtain the struct record class of a schema: a
+    StructRecordABC subclass is returned as it is, any other DescriptedABC
+    subclass is converted using its prototype instance.
+    
+    Signature:
+        class DescriptedABC -> class StructRecordABC
+    
+    Args:
+        clsSchema: class DescriptedABC, the schema
+    
+    Raises:
+        pos.exceptions.CustomTypeError: the schema is not a DescriptedABC
+            subclass, or a default value is neither int nor float
+        pos.exceptions.CustomValueError: the schema has no fields
+    
+    Version 0.0.1.0
+    """
+    if not (isinstance(clsSchema, type) and issubclass(clsSchema,
+                                                            DescriptedABC)):
+        raise CustomTypeError(clsSchema, DescriptedABC)
+    if issubclass(clsSchema, StructRecordABC):
+        clsResult = clsSchema
+    else:
+        objPrototype = clsSchema()
+        lstLayout = []
+        for strName, gValue in sorted(_getInstanceItems(objPrototype)):
+            if strName.startswith('_') or _isMethodValue(gValue):
+                continue
+            if type(gValue) is float:
+                lstLayout.append((strName, BoundedFloat(gValue)))
+            elif type(gValue) in (int, long):
+                lstLayout.append((strName, Int64(gValue)))
+            else:
+                raise CustomTypeError(gValue, int)
+        del objPrototype
+        clsResult = makeStructRecord(clsSchema.__name__, lstLayout)
+    if not clsResult.getStructFields():
+        raise CustomValueError(clsSchema, "'schema with fields'")
+    return clsResult
+
+def _describe(clsRecord):
+    """
+    Helper function to create the JSON serializable description of the
+    layout of a struct record class.
+    
+    Signature:
+        class StructRecordABC -> dict(str -> type A)
+    
+    Version 0.0.1.0
+    """
+    lstFields = []
+    for strName in clsRecord.getStructFields():
+        objField = getattr(clsRecord, strName).Field
+        lstFields.append({'name' : strName, 'format' : _getFormat(objField),
+                            'default' : objField.Default, 'min' : objField.Min,
+                            'max' : objField.Max})
+    return {'name' : clsRecord.__name__, 'byte_order' : clsRecord._ByteOrder,
+            'size' : clsRecord.getRecordSize(), 'fields' : lstFields}
+
+def _fromDescription(dictLayout):
+    """
+    Helper function to re-create a struct record class from the description
+    of the layout.
+    
+    Signature:
+        dict(str -> type A) -> class StructRecordABC
+    
+    Raises:
+        pos.exceptions.CustomValueError: improper description
+    
+    Version 0.0.1.0
+    """
+    try:
+        lstLayout = [(str(dictField['name']),
+                        _FIELD_CLASSES[dictField['format']](
+                            dictField['default'], dictField['min'],
+                            dictField['max']))
+                                        for dictField in dictLayout['fields']]
+        clsResult = makeStructRecord(str(dictLayout['name']), lstLayout,
+                                            str(dictLayout['byte_order']))
+    except (KeyError, TypeError):
+        raise CustomValueError(dictLayout, "'record store layout'")
+    return clsResult
+
+def _isCompatible(dictFirst, dictSecond):
+    """
+    Helper function to compare the binary layouts of two descriptions: the
+    byte order, the names and formats of the fields must be the same.
+    
+    Signature:
+        dict(str -> type A), dict(str -> type A) -> bool
+    
+    Version 0.0.1.0
+    """
+    return (dictFirst['byte_order'] == dictSecond['byte_order'] and
+            [(dictField['name'], dictField['format'])
+                                    for dictField in dictFirst['fields']] ==
+            [(dictField['name'], dictField['format'])
+                                    for dictField in dictSecond['fields']])
+
+#classes
+
+class RecordStore(object):
+    """
+    Memory mapped file of the fixed size records with the header describing
+    the layout. Opened in the read-write mode, the store supports appending of
+    the records and modification of them via the views; the file grows by
+    doubling of its capacity and is truncated to the actual content upon
+    closing. Opened in the read-only mode, the store can be used by any
+    number of processes at once.
+    
+    Indexing returns a view (see StructRecordABC.fromBuffer()) over the
+    memory map, the entire columns are read by getColumn(), and the values
+    of all records are iterated by iterValues() without creation of the views.
+    
+    Properties:
+        Schema: class StructRecordABC, the struct record class of the views
+        Fields: tuple(str), names of the fields in the layout order
+        Path: str, path to the file
+        ReadOnly: bool, flag of the read-only mode
+    
+    Methods:
+        append(): /StructRecordABC OR DescriptedABC OR dict/ -> int
+        extend(): seq(StructRecordABC OR DescriptedABC OR dict) -> None
+        getColumn(): str -> array.array OR list
+        iterRecords(): /bool/ -> iterator(StructRecordABC)
+        iterValues(): None -> iterator(tuple)
+        refresh(): None -> int
+        flush(): None -> None
+        close(): None -> None
+    
+    Version 0.0.1.0
+    """
+    
+    #special methods
+    
+    def __init__(self, strPath, clsSchema = None, strMode = 'r',
+                                            iCapacity = DEFAULT_CAPACITY):
+        """
+        Initialization. Opens an existing file ('r' - read-only, 'r+' -
+        read-write) or creates a new one ('w', overwrites an existing file).
+        
+        Signature:
+            str/, class DescriptedABC OR None, str, int/ -> None
+        
+        Args:
+            strPath: str, path to the file
+            clsSchema: (optional) class DescriptedABC OR None, the schema;
+                required for a new file, and for an existing file it must be
+                compatible with the stored layout; defaults to None - the
+                struct record class is re-created from the header
+            strMode: (optional) str, one of 'r', 'r+' or 'w', defaults to 'r'
+            iCapacity: (optional) positive int, the initial capacity of a new
+                file in records, defaults to DEFAULT_CAPACITY
+        
+        Raises:
+            IOError: the file cannot be opened or created
+            pos.exceptions.CustomTypeError: improper type of any argument, or
+                the schema cannot be converted into a struct record class
+            pos.exceptions.CustomValueError: unknown mode, no schema for a new
+                file, non-positive capacity, not a record store file, or the
+                schema is not compatible with the stored layout
+        
+        Version 0.0.1.0
+        """
+        if not isinstance(strPath, basestring):
+            raise CustomTypeError(strPath, str)
+        if not isinstance(strMode, basestring):
+            raise CustomTypeError(strMode, str)
+        if not (strMode in ('r', 'r+', 'w')):
+            raise CustomValueError(strMode, "'r', 'r+' or 'w'")
+        if not isinstance(iCapacity, (int, long)) or isinstance(iCapacity,
+                                                                        bool):
+            raise CustomTypeError(iCapacity, int)
+        if iCapacity < 1:
+            raise CustomValueError(iCapacity, "'positive'")
+        if clsSchema is None:
+            clsRecord = None
+        else:
+            clsRecord = _getStructClass(clsSchema)
+        self._strPath = strPath
+        self._bReadOnly = strMode == 'r'
+        self._objFile = None
+        self._objMap = None
+        if strMode == 'w':
+            if clsRecord is None:
+                raise CustomValueError(clsSchema, "'schema for a new file'")
+            self._create(clsRecord, iCapacity)
+        else:
+            self._open(clsRecord)
+    
+    def __len__(self):
+        """
+        Returns the number of the records.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return self._iCount
+    
+    def __getitem__(self, gIndex):
+        """
+        Returns a view of the record for an integer index (negative indexes
+        are counted from the end), or a list of the views for a slice.
+        
+        Signature:
+            int OR slice -> StructRecordABC OR list(StructRecordABC)
+        
+        Raises:
+            ValueError: the store is closed
+            IndexError: the index is out of range
+            pos.exceptions.CustomTypeError: the index is neither integer nor
+                slice
+        
+        Version 0.0.1.1
+        """
+        self._checkOpen()
+        if isinstance(gIndex, slice):
+            gResult = [self._getView(iIndex)
+                        for iIndex in xrange(*gIndex.indices(self._iCount))]
+        elif isinstance(gIndex, (int, long)):
+            iIndex = gIndex
+            if iIndex < 0:
+                iIndex += self._iCount
+            if iIndex < 0 or iIndex >= self._iCount:
+                raise IndexError('record index out of range')
+            gResult = self._getView(iIndex)
+        else:
+            raise CustomTypeError(gIndex, int)
+        return gResult
+    
+    def __iter__(self):
+        """
+        Iterates over the views of the records.
+        
+        Signature:
+            None -> iterator(StructRecordABC)
+        
+        Version 0.0.1.0
+        """
+        return self.iterRecords()
+    
+    def __enter__(self):
+        """
+        Context manager support.
+        
+        Signature:
+            None -> RecordStore
+        
+        Version 0.0.1.0
+        """
+        return self
+    
+    def __exit__(self, *args):
+        """
+        Context manager support - closes the store.
+        
+        Signature:
+            type A, type B, type C -> None
+        
+        Version 0.0.1.0
+        """
+        self.close()
+    
+    #'private' / helper methods
+    
+    def _create(self, clsRecord, iCapacity):
+        """
+        Creates a new file with the header and the reserved capacity, and
+        maps it.
+        
+        Signature:
+            class StructRecordABC, int -> None
+        
+        Version 0.0.1.1
+        """
+        dictLayout = _describe(clsRecord)
+        strLayout = json.dumps(dictLayout, sort_keys = True)
+        iDataOffset = _HEADER.size + len(strLayout)
+        iDataOffset += (-iDataOffset) % 8
+        strLayout = strLayout.ljust(iDataOffset - _HEADER.size)
+        iSize = clsRecord.getRecordSize()
+        self._objFile = open(self._strPath, 'w+b')
+        try:
+            self._objFile.write(_HEADER.pack(MAGIC, iDataOffset, iSize, 0))
+            self._objFile.write(strLayout)
+            self._objFile.truncate(iDataOffset + iCapacity * iSize)
+            self._objFile.flush()
+            self._objMap = mmap.mmap(self._objFile.fileno(), 0)
+        except Exception:
+            self._objFile.close()
+            self._objFile = None
+            raise
+        self._clsRecord = clsRecord
+        self._dictLayout = dictLayout
+        self._iDataOffset = iDataOffset
+        self._iSize = iSize
+        self._iCount = 0
+        self._iCapacity = iCapacity
+    
+    def _open(self, clsRecord):
+        """
+        Opens and maps an existing file, checks the header and the
+        compatibility of the schema.
+        
+        Signature:
+            class StructRecordABC OR None -> None
+        
+        Version 0.0.1.0
+        """
+        if self._bReadOnly:
+            self._objFile = open(self._strPath, 'rb')
+            iAccess = mmap.ACCESS_READ
+        else:
+            self._objFile = open(self._strPath, 'r+b')
+            iAccess = mmap.ACCESS_WRITE
+        try:
+            strHeader = self._objFile.read(_HEADER.size)
+            if len(strHeader) < _HEADER.size:
+                raise CustomValueError(self._strPath, "'record store file'")
+            strMagic, iDataOffset, iSize, iCount = _HEADER.unpack(strHeader)
+            if strMagic != MAGIC:
+                raise CustomValueError(self._strPath, "'record store file'")
+            try:
+                dictLayout = json.loads(self._objFile.read(
+                                                iDataOffset - _HEADER.size))
+            except ValueError:
+                raise CustomValueError(self._strPath, "'record store file'")
+            if clsRecord is None:
+                clsRecord = _fromDescription(dictLayout)
+            elif not _isCompatible(_describe(clsRecord), dictLayout):
+                raise CustomValueError(clsRecord.__name__,
+                                    "'compatible with {}'".format(
+                                                        dictLayout['name']))
+            if clsRecord.getRecordSize() != iSize:
+                raise CustomValueError(iSize, "'equal to {}'".format(
+                                                clsRecord.getRecordSize()))
+            self._objMap = mmap.mmap(self._objFile.fileno(), 0,
+                                                        access = iAccess)
+        except Exception:
+            self._objFile.close()
+            self._objFile = None
+            raise
+        self._clsRecord = clsRecord
+        self._dictLayout = dictLayout
+        self._iDataOffset = iDataOffset
+        self._iSize = iSize
+        self._iCount = iCount
+        self._iCapacity = (len(self._objMap) - iDataOffset) // iSize
+    
+    def _getView(self, iIndex):
+        """
+        Creates a view of the record for a valid, non-negative index.
+        
+        Signature:
+            int -> StructRecordABC
+        
+        Version 0.0.1.0
+        """
+        return self._clsRecord.fromBuffer(self._objMap,
+                                        self._iDataOffset + iIndex * self._iSize)
+    
+    def _checkOpen(self):
+        """
+        Checks that the store is not closed.
+        
+        Signature:
+            None -> None
+        
+        Raises:
+            ValueError: the store is closed
+        
+        Version 0.0.1.0
+        """
+        if self._objMap is None:
+            raise ValueError('I/O operation on a closed record store')
+    
+    def _checkWritable(self):
+        """
+        Checks that the store is not closed and is open in the read-write
+        mode.
+        
+        Signature:
+            None -> None
+        
+        Raises:
+            ValueError: the store is closed
+            TypeError: the store is read-only
+        
+        Version 0.0.1.1
+        """
+        self._checkOpen()
+        if self._bReadOnly:
+            raise TypeError("can't modify a read-only record store")
+    
+    def _getValues(self, gRecord):
+        """
+        Returns the checked values of all fields from a record, mapping or any
+        other object; the missing fields get the default values.
+        
+        Signature:
+            StructRecordABC OR DescriptedABC OR dict OR None
+                -> list(int OR float)
+        
+        Raises:
+            pos.exceptions.CustomTypeError: a value is of the wrong type
+            pos.exceptions.CustomValueError: a value is out of the range
+        
+        Version 0.0.1.0
+        """
+        clsRecord = self._clsRecord
+        lstFields = [getattr(clsRecord, strName).Field
+                                    for strName in clsRecord.getStructFields()]
+        if gRecord is None:
+            lstValues = [objField.Default for objField in lstFields]
+        elif type(gRecord) is clsRecord:
+            lstValues = list(gRecord.getValues())
+        elif isinstance(gRecord, collections.Mapping):
+            lstValues = [objField._checkValue(gRecord.get(strName,
+                                                        objField.Default))
+                            for strName, objField
+                            in zip(clsRecord.getStructFields(), lstFields)]
+        else:
+            lstValues = [objField._checkValue(getattr(gRecord, strName,
+                                                        objField.Default))
+                            for strName, objField
+                            in zip(clsRecord.getStructFields(), lstFields)]
+        return lstValues
+    
+    def _reserve(self, iCount):
+        """
+        Grows the file (doubling the capacity) to fit the number of records.
+        
+        Signature:
+            int -> None
+        
+        Version 0.0.1.0
+        """
+        if iCount > self._iCapacity:
+            iCapacity = max(iCount, 2 * self._iCapacity)
+            self._objMap.resize(self._iDataOffset + iCapacity * self._iSize)
+            self._iCapacity = iCapacity
+    
+    def _setCount(self, iCount):
+        """
+        Stores the number of the records in the header.
+        
+        Signature:
+            int -> None
+        
+        Version 0.0.1.0
+        """
+        _COUNT.pack_into(self._objMap, _COUNT_OFFSET, iCount)
+        self._iCount = iCount
+    
+    #properties
+    
+    @property
+    def Schema(self):
+        """
+        Getter property. Returns the struct record class of the views.
+        
+        Signature:
+            None -> class StructRecordABC
+        
+        Version 0.0.1.0
+        """
+        return self._clsRecord
+    
+    @property
+    def Fields(self):
+        """
+        Getter property. Returns the names of the fields in the layout order.
+        
+        Signature:
+            None -> tuple(str)
+        
+        Version 0.0.1.0
+        """
+        return tuple(self._clsRecord.getStructFields())
+    
+    @property
+    def Path(self):
+        """
+        Getter property. Returns the path to the file.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return self._strPath
+    
+    @property
+    def ReadOnly(self):
+        """
+        Getter property. Returns the flag of the read-only mode.
+        
+        Signature:
+            None -> bool
+        
+        Version 0.0.1.0
+        """
+        return self._bReadOnly
+    
+    #public methods
+    
+    def append(self, gRecord = None):
+        """
+        Appends a record. Its values are taken from the passed record view or
+        instance, from the fields of any other object or from the passed
+        mapping; the missing fields get the default values.
+        
+        Signature:
+            /StructRecordABC OR DescriptedABC OR dict(str -> int OR float)/
+                -> int
+        
+        Args:
+            gRecord: (optional) StructRecordABC OR DescriptedABC OR
+                dict(str -> int OR float), the source of the values, defaults
+                to None - all values are default
+        
+        Returns:
+            int: index of the new record
+        
+        Raises:
+            ValueError: the store is closed
+            TypeError: the store is read-only
+            pos.exceptions.CustomTypeError: a value is of the wrong type
+            pos.exceptions.CustomValueError: a value is out of the range
+        
+        Version 0.0.1.1
+        """
+        self._checkWritable()
+        lstValues = self._getValues(gRecord)
+        iIndex = self._iCount
+        self._reserve(iIndex + 1)
+        self._clsRecord._objStruct.pack_into(self._objMap,
+                        self._iDataOffset + iIndex * self._iSize, *lstValues)
+        self._setCount(iIndex + 1)
+        return iIndex
+    
+    def extend(self, seqRecords):
+        """
+        Appends the records, see the method append(). All values are checked
+        before the first record is written.
+        
+        Signature:
+            seq(StructRecordABC OR DescriptedABC OR dict) -> None
+        
+        Raises:
+            ValueError: the store is closed
+            TypeError: the store is read-only
+            pos.exceptions.CustomTypeError: a value is of the wrong type
+            pos.exceptions.CustomValueError: a value is out of the range
+        
+        Version 0.0.1.1
+        """
+        self._checkWritable()
+        lstRecords = [self._getValues(gRecord) for gRecord in seqRecords]
+        iCount = self._iCount
+        self._reserve(iCount + len(lstRecords))
+        pack = self._clsRecord._objStruct.pack_into
+        iOffset = self._iDataOffset + iCount * self._iSize
+        for lstValues in lstRecords:
+            pack(self._objMap, iOffset, *lstValues)
+            iOffset += self._iSize
+        self._setCount(iCount + len(lstRecords))
+    
+    def getColumn(self, strName):
+        """
+        Returns a copy of an entire column as array.array (or list for the
+        64 bits unsigned integers, if the platform lacks the array type).
+        
+        Signature:
+            str -> array.array OR list
+        
+        Args:
+            strName: string, name of the field
+        
+        Raises:
+            ValueError: the store is closed
+            pos.exceptions.NotExistingAttribute: unknown field
+        
+        Version 0.0.1.1
+        """
+        self._checkOpen()
+        clsRecord = self._clsRecord
+        if not (strName in clsRecord._dictStructFields):
+            raise NotExistingAttribute(strName, clsRecord)
+        objDescriptor = clsRecord._dictStructFields[strName]
+        strFormat = objDescriptor.Format
+        iSize = self._iSize
+        iBefore = objDescriptor.Offset
+        iAfter = iSize - iBefore - struct.calcsize(strFormat)
+        strRecord = '{}x{}{}x'.format(iBefore, strFormat[1:], iAfter)
+        unpackChunk = struct.Struct(strFormat[0] +
+                                            strRecord * _CHUNK).unpack_from
+        objMap = self._objMap
+        iFull, iRest = divmod(self._iCount, _CHUNK)
+        lstChunks = [unpackChunk(objMap, self._iDataOffset + iChunk * _CHUNK *
+                                        iSize) for iChunk in xrange(iFull)]
+        if iRest:
+            lstChunks.append(struct.Struct(strFormat[0] + strRecord *
+                                    iRest).unpack_from(objMap,
+                                    self._iDataOffset + iFull * _CHUNK * iSize))
+        gValues = (gValue for tupChunk in lstChunks for gValue in tupChunk)
+        strTypecode = objDescriptor.Field.Typecode
+        if strTypecode is None:
+            gResult = list(gValues)
+        else:
+            gResult = array.array(strTypecode, gValues)
+        return gResult
+    
+    def iterRecords(self, bReuse = False):
+        """
+        Iterates over the views of the records, see the class method
+        StructRecordABC.iterBuffer().
+        
+        Signature:
+            /bool/ -> iterator(StructRecordABC)
+        
+        Args:
+            bReuse: (optional) bool, flag to re-use a single view, defaults
+                to False
+        
+        Raises:
+            ValueError: the store is closed
+        
+        Version 0.0.1.1
+        """
+        self._checkOpen()
+        return self._clsRecord.iterBuffer(self._objMap, self._iDataOffset,
+                                                    self._iCount, bReuse)
+    
+    def iterValues(self):
+        """
+        Iterates over the records as the tuples of the values in the layout
+        order, without creation of the views.
+        
+        Signature:
+            None -> iterator(tuple(int OR float))
+        
+        Raises:
+            ValueError: the store is closed
+        
+        Version 0.0.1.1
+        """
+        self._checkOpen()
+        return self._clsRecord.iterValues(self._objMap, self._iDataOffset,
+                                                                self._iCount)
+    
+    def refresh(self):
+        """
+        Re-reads the number of the records from the header, e.g. appended by
+        another process, and re-maps the file if its size has changed; in the
+        latter case the views created before must not be used afterwards.
+        
+        Signature:
+            None -> int
+        
+        Returns:
+            int: the number of the records
+        
+        Raises:
+            ValueError: the store is closed
+        
+        Version 0.0.1.1
+        """
+        self._checkOpen()
+        iCount = _COUNT.unpack_from(self._objMap, _COUNT_OFFSET)[0]
+        iLength = os.fstat(self._objFile.fileno()).st_size
+        if iLength != len(self._objMap):
+            iAccess = mmap.ACCESS_READ if self._bReadOnly else (
+                                                            mmap.ACCESS_WRITE)
+            self._objMap.close()
+            self._objMap = mmap.mmap(self._objFile.fileno(), 0,
+                                                        access = iAccess)
+            self._iCapacity = (iLength - self._iDataOffset) // self._iSize
+        self._iCount = min(iCount, self._iCapacity)
+        return self._iCount
+    
+    def flush(self):
+        """
+        Writes the changes to the disk.
+        
+        Signature:
+            None -> None
+        
+        Raises:
+            ValueError: the store is closed
+        
+        Version 0.0.1.1
+        """
+        self._checkOpen()
+        if not self._bReadOnly:
+            self._objMap.flush()
+    
+    def close(self):
+        """
+        Closes the memory map and the file; in the read-write mode the file is
+        truncated to the actual number of the records. The views created
+        before must not be used afterwards. Repeated calls are harmless.
+        
+        Signature:
+            None -> None
+        
+        Version 0.0.1.0
+        """
+        if not (self._objMap is None):
+            if not self._bReadOnly:
+                self._objMap.flush()
+                self._objMap.resize(self._iDataOffset +
+                                                self._iCount * self._iSize)
+            self._objMap.close()
+            self._objMap = None
+        if not (self._objFile is None):
+            self._objFile.close()
+            self._objFile = None
@@ -0,0 +1,804 @@
+#usr/bin/python
+"""
+Module pos.struct_records
+
+Records with the fixed width typed fields (see pos.typed_fields), which are
+views over a binary buffer packed according to the struct module format:
+bytearray, memoryview, mmap.mmap (read-write or read-only) or str (read-only).
+The layout of a record is defined by the ordered fields table _Layout of a
+StructRecordABC subclass, or it can be passed into the class generator
+makeStructRecord(). Each field is read and written by a pre-compiled
+struct.Struct at the pre-computed offset, with the same type and range checks
+and exceptions as the typed fields.
+
+The view objects do not hold the data, thus a multi-gigabyte file of the
+records can be memory mapped and iterated over either by a single re-used
+view (see StructRecordABC.iterBuffer()) or as tuples of the values without
+any view at all (see StructRecordABC.iterValues()).
+
+Classes:
+    StructRecordABC_Meta: meta-class computing the binary layout
+    StructRecordABC: base class for the struct backed records
+
+Functions:
+    makeStructRecord: creates a StructRecordABC subclass from a fields table
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+
+#imports
+
+#+ standard libraries
+
+import collections
+import struct
+import mmap
+
+#+ my libraries
+
+from pos.base_classes import DescriptedSlotsABC, DescriptedSlotsABC_Meta
+from pos.base_classes import _buildSlotMembers, _invalidateAttribute
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.typed_fields import TypedField, UInt8, UInt16, UInt32, UInt64
+from pos.typed_fields import Int8, Int16, Int32, Int64, BoundedFloat
+
+#globals
+
+#+ struct format characters of the typed fields (standard sizes)
+
+STRUCT_FORMATS = {UInt8 : 'B', UInt16 : 'H', UInt32 : 'I', UInt64 : 'Q',
+                    Int8 : 'b', Int16 : 'h', Int32 : 'i', Int64 : 'q',
+                    BoundedFloat : 'd'}
+
+#+ allowed byte order prefixes - standard sizes without alignment
+
+BYTE_ORDERS = ('<', '>', '!', '=')
+
+#+ accepted buffer types
+
+_BUFFER_TYPES = (bytearray, memoryview, mmap.mmap, str, buffer)
+
+#functions
+
+#+ helper functions
+
+def _getFormat(objField):
+    """
+    Helper function to find the struct format character of a typed field,
+    including the instances of the subclasses of the typed field classes.
+    
+    Signature:
+        TypedField -> str
+    
+    Args:
+        objField: TypedField, the field
+    
+    Raises:
+        pos.exceptions.CustomTypeError: not a typed field, or its class does
+            not have a fixed width format
+    
+    Version 0.0.1.0
+    """
+    strResult = None
+    if isinstance(objField, TypedField):
+        for clsBase in type(objField).__mro__:
+            strResult = STRUCT_FORMATS.get(clsBase, None)
+            if not (strResult is None):
+                break
+    if strResult is None:
+        raise CustomTypeError(objField, TypedField)
+    return strResult
+
+#+ public functions
+
+def makeStructRecord(strName, seqLayout, strByteOrder = '<',
+                                                clsBase = None):
+    """
+    Creates a new subclass of StructRecordABC (or of its passed subclass) with
+    the passed ordered fields table.
+    
+    Signature:
+        str, seq(tuple(str, TypedField))/, str, class StructRecordABC/
+            -> class StructRecordABC
+    
+    Args:
+        strName: str, name of the new class
+        seqLayout: seq(tuple(str, TypedField)), the ordered pairs of the names
+            and the typed fields
+        strByteOrder: (optional) str, the struct byte order prefix, defaults
+            to '<' - little-endian
+        clsBase: (optional) class StructRecordABC, the super class, defaults
+            to None - StructRecordABC itself
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper fields table, byte order or
+            super class
+        pos.exceptions.CustomValueError: unknown byte order or duplicate name
+    
+    Version 0.0.1.0
+    """
+    if clsBase is None:
+        clsBase = StructRecordABC
+    elif not (isinstance(clsBase, type) and issubclass(clsBase,
+                                                        StructRecordABC)):
+        raise CustomTypeError(clsBase, StructRecordABC_Meta)
+    if not isinstance(strName, basestring):
+        raise CustomTypeError(strName, str)
+    dictAttributes = {'__slots__' : (), '_Layout' : tuple(seqLayout),
+                        '_ByteOrder' : strByteOrder, '__module__' : __name__}
+    return type(clsBase)(strName, (clsBase, ), dictAttributes)
+
+#classes
+
+#+ helper classes
+
+class _StructField(object):
+    """
+    Data descriptor reading and writing a single typed field of a record at
+    the pre-computed offset within the buffer of the instance. The value is
+    checked by the typed field, from which the descriptor is created.
+    
+    Accessed via the class, the descriptor returns itself. The assignment via
+    the class as well as the deletion of the field are not allowed.
+    
+    Attributes:
+        Name: string, name of the field
+        Field: TypedField, the field defining the bounds and default value
+        Offset: int, offset of the field within the record
+        Format: string, the struct format of the field with the byte order
+    
+    Version 0.0.1.0
+    """
+    
+    #class fields
+    
+    __slots__ = ('Name', 'Field', 'Offset', 'Format', '_unpack', '_pack',
+                    '_getBuffer', '_getOffset')
+    
+    #special methods
+    
+    def __init__(self, strName, objField, iOffset, strFormat, objBuffer,
+                                                                objOffset):
+        """
+        Initialization.
+        
+        Signature:
+            str, TypedField, int, str, member_descriptor, member_descriptor
+                -> None
+        
+        Args:
+            strName: string, name of the field
+            objField: TypedField, the field defining the checks
+            iOffset: int, offset of the field within the record
+            strFormat: string, the struct format with the byte order prefix
+            objBuffer: member_descriptor, slot of the instances holding the
+                buffer
+            objOffset: member_descriptor, slot of the instances holding the
+                offset of the record
+        
+        Version 0.0.1.0
+        """
+        objStruct = struct.Struct(strFormat)
+        self.Name = strName
+        self.Field = objField
+        self.Offset = iOffset
+        self.Format = strFormat
+        self._unpack = objStruct.unpack_from
+        self._pack = objStruct.pack_into
+        self._getBuffer = objBuffer.__get__
+        self._getOffset = objOffset.__get__
+    
+    def __get__(self, objInstance, clsOwner):
+        """
+        Returns the value of the field for the instance, or the descriptor
+        itself if accessed via the class.
+        
+        Signature:
+            StructRecordABC OR None, class StructRecordABC
+                -> int OR float OR _StructField
+        
+        Version 0.0.1.0
+        """
+        if objInstance is None:
+            return self
+        return self._unpack(self._getBuffer(objInstance),
+                                self._getOffset(objInstance) + self.Offset)[0]
+    
+    def __set__(self, objInstance, gValue):
+        """
+        Checks the type and the range of the value and packs it into the
+        buffer.
+        
+        Signature:
+            StructRecordABC, int OR float -> None
+        
+        Raises:
+            AttributeError: assignment via the class
+            TypeError: the buffer is read-only
+            pos.exceptions.CustomTypeError: the value is of the wrong type
+            pos.exceptions.CustomValueError: the value is out of the range
+        
+        Version 0.0.1.0
+        """
+        try:
+            gBuffer = self._getBuffer(objInstance)
+        except TypeError: #via the class
+            raise AttributeError("can't set struct field {}".format(
+                                                                    self.Name))
+        self._pack(gBuffer, self._getOffset(objInstance) + self.Offset,
+                                                self.Field._checkValue(gValue))
+    
+    def __delete__(self, objInstance):
+        """
+        Deletion of the struct fields is not allowed.
+        
+        Signature:
+            type A -> None
+        
+        Raises:
+            AttributeError: always
+        
+        Version 0.0.1.0
+        """
+        raise AttributeError("can't delete struct field {}".format(self.Name))
+    
+    def __repr__(self):
+        """
+        Returns the string representation.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return '<struct field {} {!r} at offset {}>'.format(self.Name,
+                                                    self.Format, self.Offset)
+
+#+ meta-classes
+
+class StructRecordABC_Meta(DescriptedSlotsABC_Meta):
+    """
+    Meta-class for StructRecordABC. Same as DescriptedSlotsABC_Meta, but also
+    computes the binary layout of the class being created: the fields table
+    _Layout of the class is appended to the layout of the super class (a
+    field with the same name replaces the inherited one at its place), and
+    each field is replaced by a data descriptor reading and writing at the
+    pre-computed offset.
+    
+    Version 0.0.1.0
+    """
+    
+    def __new__(mcs, strName, tupBases, dictAttributes):
+        """
+        Special method - creation of a new class. Computes the layout and
+        creates the struct field descriptors.
+        
+        Signature:
+            str, tuple(class A), dict -> class B
+        
+        Args:
+            strName: string, name of the class to be created
+            tupBases: tuple of classes, the super classes
+            dictAttributes: dictionary, the namespace of the class
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper fields table or byte
+                order
+            pos.exceptions.CustomValueError: unknown byte order or duplicate
+                name in the fields table
+        
+        Version 0.0.1.0
+        """
+        lstLayout = []
+        for clsBase in tupBases:
+            if isinstance(clsBase, StructRecordABC_Meta):
+                lstLayout = list(clsBase._tupLayout)
+                break
+        tupOwn = dictAttributes.pop('_Layout', ())
+        if not isinstance(tupOwn, collections.Sequence):
+            raise CustomTypeError(tupOwn, tuple)
+        setSeen = set()
+        for gItem in tupOwn:
+            if not (isinstance(gItem, tuple) and len(gItem) == 2 and
+                                            isinstance(gItem[0], basestring)):
+                raise CustomTypeError(gItem, tuple)
+            strField, objField = gItem
+            _getFormat(objField)
+            if strField in setSeen:
+                raise CustomValueError(strField, "'unique field name'")
+            setSeen.add(strField)
+            for iIndex, (strOld, _) in enumerate(lstLayout):
+                if strOld == strField:
+                    lstLayout[iIndex] = (strField, objField)
+                    break
+            else:
+                lstLayout.append((strField, objField))
+        strByteOrder = dictAttributes.get('_ByteOrder', None)
+        if strByteOrder is None:
+            strByteOrder = '<'
+            for clsBase in tupBases:
+                strByteOrder = getattr(clsBase, '_ByteOrder', strByteOrder)
+                break
+        if not isinstance(strByteOrder, basestring):
+            raise CustomTypeError(strByteOrder, str)
+        if not (strByteOrder in BYTE_ORDERS):
+            raise CustomValueError(strByteOrder, 'one of {}'.format(
+                                                                BYTE_ORDERS))
+        dictAttributes['_ByteOrder'] = strByteOrder
+        clsNew = super(StructRecordABC_Meta, mcs).__new__(mcs, strName,
+                                                    tupBases, dictAttributes)
+        dictMembers = _buildSlotMembers(clsNew)
+        objBuffer = dictMembers['_gBuffer']
+        objOffset = dictMembers['_iOffset']
+        strFormat = strByteOrder
+        dictFields = {}
+        for strField, objField in lstLayout:
+            iOffset = struct.calcsize(strFormat)
+            strFieldFormat = strByteOrder + _getFormat(objField)
+            strFormat += _getFormat(objField)
+            dictFields[strField] = _StructField(strField, objField, iOffset,
+                                        strFieldFormat, objBuffer, objOffset)
+        for strField, objDescriptor in dictFields.items():
+            type.__setattr__(clsNew, strField, objDescriptor)
+            _invalidateAttribute(clsNew, strField)
+        objStruct = struct.Struct(strFormat)
+        for strAttr, gValue in (('_tupLayout', tuple(lstLayout)),
+                                ('_dictStructFields', dictFields),
+                                ('_objStruct', objStruct),
+                                ('_strDefaults', objStruct.pack(
+                                    *[objField.Default
+                                        for _, objField in lstLayout]))):
+            type.__setattr__(clsNew, strAttr, gValue)
+            _invalidateAttribute(clsNew, strAttr)
+        return clsNew
+
+#+ ABCs
+
+class StructRecordABC(DescriptedSlotsABC):
+    """
+    Abstract Base Class for the records backed by a struct packed binary
+    buffer, e.g.
+    
+        class Sample(StructRecordABC):
+            _Layout = (('Counter', UInt16()),
+                        ('Temperature', BoundedFloat(20.0, -40.0, 125.0)))
+    
+    The fields table _Layout is an ordered sequence of the pairs of the names
+    and typed fields, which define the binary layout, the bounds and the
+    default values. The byte order is defined by the class attribute
+    _ByteOrder (little-endian by default); the standard sizes without
+    alignment are used. A subclass may add new fields or redefine the
+    inherited ones.
+    
+    An instance created by the class call owns a new bytearray with the
+    default values, the subclasses with other instance attributes should
+    override the method onInit() to assign them; the views over an external
+    buffer are created by the class methods fromBuffer(), iterBuffer() without
+    a call of onInit(). The struct fields are read and written in the buffer
+    and cannot be deleted; same as for DescriptedSlotsABC, any other instance
+    attributes must be declared in the fields table _Fields.
+    
+    The copies (including unpickled ones) own new buffers with the same
+    values of the struct fields. The method close() detaches the instance
+    from the buffer and attaches it to a new own buffer with the default
+    values, which allows e.g. closing of a memory mapped file.
+    
+    Class methods:
+        fromBuffer(): buffer/, int/ -> StructRecordABC
+        fromMapping(): dict(str -> type A)/, *args, **kwargs/ -> DescriptedABC
+        getClassFields(): None -> list(str)
+        getClassInfo(): None -> str
+        getClassMethods(): None -> list(str)
+        getRecordSize(): None -> int
+        getStructFields(): None -> list(str)
+        inspectClassAttribute(): str -> FieldInfo OR MethodInfo
+        iterBuffer(): buffer/, int, int OR None, bool/
+            -> iterator(StructRecordABC)
+        iterValues(): buffer/, int, int OR None/ -> iterator(tuple)
+    
+    Methods:
+        getBuffer(): None -> buffer
+        getFields(): None -> list(str)
+        getInfo(): None -> str
+        getMethods(): None -> list(str)
+        getOffset(): None -> int
+        getValues(): None -> tuple(int OR float)
+        addFinalizer(): callable/, *args, **kwargs/ -> None
+        close(): None -> None
+        fastCopy(): None -> DescriptedABC
+        inspectAttribute(): str -> FieldInfo OR MethodInfo
+        setFields(): dict(str -> type A) -> None
+    
+    Version 0.0.1.0
+    """
+    
+    #class fields
+    
+    __metaclass__ = StructRecordABC_Meta
+    
+    __slots__ = ('_gBuffer', '_iOffset')
+    
+    #special methods
+    
+    def __new__(cls, *args, **kwargs):
+        """
+        Special method - creation of a new instance. Allocates the own buffer
+        with the default values.
+        
+        Signature:
+            /*args, **kwargs/ -> StructRecordABC
+        
+        Args:
+            *args: (optional), any amount of arguments of any types, not used
+            **kwargs: (optional), keyword, any amount of arguments of any types,
+                not used
+        
+        Version 0.0.1.0
+        """
+        objNew = super(StructRecordABC, cls).__new__(cls)
+        object.__setattr__(objNew, '_gBuffer', bytearray(cls._strDefaults))
+        object.__setattr__(objNew, '_iOffset', 0)
+        return objNew
+    
+    def __setattr__(self, strAttr, gValue):
+        """
+        Special method. The assignment to a struct field is packed into the
+        buffer, any other assignment is processed as by DescriptedSlotsABC.
+        
+        Signature:
+            str, type A -> None
+        
+        Args:
+            strAttr: string, name of the attribute to be changed in value
+            gValue: any type, value to be assigned to the attribute
+        
+        Raises:
+            TypeError: the buffer is read-only
+            pos.exceptions.CustomTypeError: the value assigned to a struct
+                field is of the wrong type
+            pos.exceptions.CustomValueError: the value assigned to a struct
+                field is out of the range
+        
+        Version 0.0.1.0
+        """
+        objField = type(self)._dictStructFields.get(strAttr, None)
+        if objField is None:
+            super(StructRecordABC, self).__setattr__(strAttr, gValue)
+        else:
+            objField.__set__(self, gValue)
+    
+    def __getstate__(self):
+        """
+        Special method. Returns the state of the instance for pickling and
+        copying - see DescriptedABC.__getstate__(). The values of the struct
+        fields are included with the assigned slots, whereas the buffer and
+        the offset are not.
+        
+        Signature:
+            None -> tuple(None, dict(str -> type A))
+        
+        Version 0.0.1.0
+        """
+        dictState, dictSlots = super(StructRecordABC, self).__getstate__()
+        dictSlots.pop('_gBuffer', None)
+        dictSlots.pop('_iOffset', None)
+        for strAttr, objField in type(self)._dictStructFields.iteritems():
+            dictSlots[strAttr] = objField.__get__(self, None)
+        return (dictState, dictSlots)
+    
+    def __setstate__(self, tupState):
+        """
+        Special method. Restores the state of the instance - see the method
+        DescriptedABC.__setstate__(). The values of the struct fields are
+        checked and packed into the buffer.
+        
+        Signature:
+            tuple(None, dict(str -> type A) OR None) -> None
+        
+        Args:
+            tupState: tuple(None, dict(str -> type A) OR None), the values of
+                the attributes stored in the slots and the struct fields
+        
+        Raises:
+            pos.exceptions.NotExistingAttribute: the instances of the class do
+                not have a slot, for which a value is passed
+            pos.exceptions.CustomTypeError: a value of a struct field is of the
+                wrong type
+            pos.exceptions.CustomValueError: a value of a struct field is out
+                of the range
+        
+        Version 0.0.1.0
+        """
+        dictState, dictSlots = tupState
+        if dictSlots:
+            dictSlots = dict(dictSlots)
+            dictSlots.pop('_gBuffer', None)
+            dictSlots.pop('_iOffset', None)
+            for strAttr, objField in type(self)._dictStructFields.iteritems():
+                if strAttr in dictSlots:
+                    objField.__set__(self, dictSlots.pop(strAttr))
+        super(StructRecordABC, self).__setstate__((dictState, dictSlots))
+    
+    def onInit(self, *args, **kwargs):
+        """
+        Does nothing - the struct fields already have the default values,
+        thus a subclass without other instance attributes can be instantiated
+        without overriding this method. The views are created without a call
+        of this method.
+        
+        Signature:
+            /*args, **kwargs/ -> None
+        
+        Args:
+            *args: (optional), any amount of arguments of any types, not used
+            **kwargs: (optional), keyword, any amount of arguments of any types,
+                not used
+        
+        Version 0.0.1.0
+        """
+        pass
+    
+    #'private' / helper class methods
+    
+    @classmethod
+    def _checkBuffer(cls, gBuffer, iOffset):
+        """
+        Checks the buffer type and the offset, and returns the number of the
+        complete records from the offset to the end of the buffer.
+        
+        Signature:
+            buffer, int -> int
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper buffer or offset type
+            pos.exceptions.CustomValueError: the offset is outside the buffer
+        
+        Version 0.0.1.0
+        """
+        if not isinstance(gBuffer, _BUFFER_TYPES):
+            raise CustomTypeError(gBuffer, bytearray)
+        if not isinstance(iOffset, (int, long)):
+            raise CustomTypeError(iOffset, int)
+        iLength = len(gBuffer)
+        if not (0 <= iOffset <= iLength):
+            raise CustomValueError(iOffset, 'in range [0, {}]'.format(iLength))
+        iSize = cls._objStruct.size
+        return (iLength - iOffset) // iSize if iSize else 0
+    
+    #public class methods
+    
+    @classmethod
+    def fromBuffer(cls, gBuffer, iOffset = 0):
+        """
+        Creates a view of a record over the buffer at the offset, without a
+        call of onInit(). The buffer is not copied.
+        
+        Signature:
+            buffer/, int/ -> StructRecordABC
+        
+        Args:
+            gBuffer: bytearray OR memoryview OR mmap.mmap OR str, the buffer
+            iOffset: (optional) int, the offset of the record in bytes,
+                defaults to 0
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper buffer or offset type
+            pos.exceptions.CustomValueError: the offset is outside the buffer,
+                or the record does not fit into the buffer
+        
+        Version 0.0.1.0
+        """
+        if not cls._checkBuffer(gBuffer, iOffset):
+            raise CustomValueError(iOffset, "'offset of a complete record'")
+        objNew = DescriptedSlotsABC.__new__(cls)
+        object.__setattr__(objNew, '_gBuffer', gBuffer)
+        object.__setattr__(objNew, '_iOffset', iOffset)
+        return objNew
+    
+    @classmethod
+    def iterBuffer(cls, gBuffer, iOffset = 0, iCount = None, bReuse = False):
+        """
+        Iterates over the consecutive records in the buffer starting from the
+        offset as the views, see fromBuffer(). With the reuse flag set a
+        single view is moved from a record to the next one, i.e. no object
+        is created per record, but the yielded view must not be stored.
+        
+        Signature:
+            buffer/, int, int OR None, bool/ -> iterator(StructRecordABC)
+        
+        Args:
+            gBuffer: bytearray OR memoryview OR mmap.mmap OR str, the buffer
+            iOffset: (optional) int, the offset of the first record in bytes,
+                defaults to 0
+            iCount: (optional) int OR None, the maximum number of the records,
+                defaults to None - all complete records
+            bReuse: (optional) bool, flag to re-use the view, defaults to False
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper buffer or offset type
+            pos.exceptions.CustomValueError: the offset is outside the buffer
+        
+        Version 0.0.1.0
+        """
+        iTotal = cls._checkBuffer(gBuffer, iOffset)
+        if not (iCount is None):
+            iTotal = min(iTotal, iCount)
+        iSize = cls._objStruct.size
+        if bReuse:
+            objView = DescriptedSlotsABC.__new__(cls)
+            object.__setattr__(objView, '_gBuffer', gBuffer)
+            for iIndex in xrange(iTotal):
+                object.__setattr__(objView, '_iOffset', iOffset + iIndex*iSize)
+                yield objView
+        else:
+            for iIndex in xrange(iTotal):
+                objView = DescriptedSlotsABC.__new__(cls)
+                object.__setattr__(objView, '_gBuffer', gBuffer)
+                object.__setattr__(objView, '_iOffset', iOffset + iIndex*iSize)
+                yield objView
+    
+    @classmethod
+    def iterValues(cls, gBuffer, iOffset = 0, iCount = None):
+        """
+        Iterates over the consecutive records in the buffer starting from the
+        offset as the tuples of the values of the struct fields in the layout
+        order, without creation of the views.
+        
+        Signature:
+            buffer/, int, int OR None/ -> iterator(tuple(int OR float))
+        
+        Args:
+            gBuffer: bytearray OR memoryview OR mmap.mmap OR str, the buffer
+            iOffset: (optional) int, the offset of the first record in bytes,
+                defaults to 0
+            iCount: (optional) int OR None, the maximum number of the records,
+                defaults to None - all complete records
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper buffer or offset type
+            pos.exceptions.CustomValueError: the offset is outside the buffer
+        
+        Version 0.0.1.0
+        """
+        iTotal = cls._checkBuffer(gBuffer, iOffset)
+        if not (iCount is None):
+            iTotal = min(iTotal, iCount)
+        objStruct = cls._objStruct
+        unpack = objStruct.unpack_from
+        iSize = objStruct.size
+        for iStart in xrange(iOffset, iOffset + iTotal * iSize, iSize):
+            yield unpack(gBuffer, iStart)
+    
+    @classmethod
+    def getClassFields(cls):
+        """
+        Returns as a list of strings the names of all 'public' class data fields
+        - see DescriptedABC.getClassFields(). The struct fields are instance
+        attributes, thus they are not included.
+        
+        Signature:
+            None -> list(str)
+        
+        Version 0.0.1.0
+        """
+        dictFields = cls._dictStructFields
+        return [strAttr for strAttr
+                        in super(StructRecordABC, cls).getClassFields()
+                                            if not (strAttr in dictFields)]
+    
+    @classmethod
+    def getStructFields(cls):
+        """
+        Returns as a list of strings the names of all struct fields of the
+        class in the layout order.
+        
+        Signature:
+            None -> list(str)
+        
+        Version 0.0.1.0
+        """
+        return [strField for strField, _ in cls._tupLayout]
+    
+    @classmethod
+    def getRecordSize(cls):
+        """
+        Returns the size of a record in bytes.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return cls._objStruct.size
+    
+    #public instance methods
+    
+    def getBuffer(self):
+        """
+        Returns the buffer of the instance.
+        
+        Signature:
+            None -> bytearray OR memoryview OR mmap.mmap OR str
+        
+        Version 0.0.1.0
+        """
+        return object.__getattribute__(self, '_gBuffer')
+    
+    def getOffset(self):
+        """
+        Returns the offset of the record within the buffer in bytes.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return object.__getattribute__(self, '_iOffset')
+    
+    def getValues(self):
+        """
+        Returns the values of all struct fields in the layout order, unpacked
+        at once.
+        
+        Signature:
+            None -> tuple(int OR float)
+        
+        Version 0.0.1.0
+        """
+        return type(self)._objStruct.unpack_from(
+                                    object.__getattribute__(self, '_gBuffer'),
+                                    object.__getattribute__(self, '_iOffset'))
+    
+    def close(self):
+        """
+        Releases the resources held by the instance - see the method
+        DescriptedSlotsABC.close(). The instance is detached from the buffer
+        and gets a new own buffer with the default values.
+        
+        Signature:
+            None -> None
+        
+        Version 0.0.1.0
+        """
+        super(StructRecordABC, self).close()
+        object.__setattr__(self, '_gBuffer',
+                                        bytearray(type(self)._strDefaults))
+        object.__setattr__(self, '_iOffset', 0)
+    
+    def setFields(self, dictMapping):
+        """
+        Assigns the values of several attributes at once with the same result
+        as assignment of them one by one - see DescriptedABC.setFields(). The
+        values of the struct fields are checked and packed into the buffer.
+        
+        Signature:
+            dict(str -> type A) -> None
+        
+        Args:
+            dictMapping: dict(str -> type A), mapping of the names of the
+                attributes onto their values
+        
+        Raises:
+            TypeError: the buffer is read-only
+            pos.exceptions.CustomTypeError: the argument is not a mapping, or
+                a value of a struct field is of the wrong type
+            pos.exceptions.CustomValueError: a value of a struct field is out
+                of the range
+        
+        Version 0.0.1.0
+        """
+        if not (type(dictMapping) is dict
+                        or isinstance(dictMapping, collections.Mapping)):
+            raise CustomTypeError(dictMapping, collections.Mapping)
+        getField = type(self)._dictStructFields.get
+        dictOther = {}
+        for strAttr, gValue in dictMapping.iteritems():
+            objField = getField(strAttr, None)
+            if objField is None:
+                dictOther[strAttr] = gValue
+            else:
+                objField.__set__(self, gValue)
+        if dictOther:
+            super(StructRecordABC, self).setFields(dictOther)
@@ -0,0 +1,1173 @@
+#usr/bin/python
+"""
+Module pos.typed_containers
+
+Containers with the element type declared upon instantiation: the elements
+are validated once - when they are inserted, appended, extended or updated -
+so the content of a typed container is valid at any moment, and the check of
+a container passed across a function boundary is reduced to the comparison of
+the declared types (see checkElements()) instead of a scan of all elements.
+
+The improper elements are rejected with CustomTypeError, the numeric values
+not fitting the storage with CustomValueError; the bulk operations are atomic,
+i.e. the container is not changed if any of the new elements is improper.
+
+TypedList with int or float elements keeps them in an array.array (see
+pos.record_arrays.DEFAULT_TYPECODES) instead of a list of boxed objects; in
+this case the validation is performed by the array itself, thus any value
+accepted by the array type is accepted (e.g. int for the float elements).
+
+Classes:
+    TypedList: mutable sequence of elements of the declared type
+    TypedDict: mutable mapping with the declared key and value types
+    TypedSet: mutable set of elements of the declared type
+
+Functions:
+    checkElements: checks the types of the elements of a container
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+
+#imports
+
+#+ standard libraries
+
+import collections
+import array
+import types
+
+#+ my libraries
+
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.record_arrays import DEFAULT_TYPECODES
+
+#functions
+
+#+ helper functions
+
+def _checkType(clsType):
+    """
+    Helper function to check that the declared type of the elements is a
+    class.
+    
+    Signature:
+        type A -> None
+    
+    Args:
+        clsType: type A, the declared type
+    
+    Raises:
+        pos.exceptions.CustomTypeError: not a class
+    
+    Version 0.0.1.0
+    """
+    if not isinstance(clsType, (type, types.ClassType)):
+        raise CustomTypeError(clsType, type)
+
+def _checkItem(gItem, clsType):
+    """
+    Helper function to validate a single element. The exact type match is
+    checked first as the cheapest one.
+    
+    Signature:
+        type A, class B -> None
+    
+    Args:
+        gItem: type A, the element
+        clsType: class B, the declared type
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper element
+    
+    Version 0.0.1.0
+    """
+    if not (type(gItem) is clsType or isinstance(gItem, clsType)):
+        raise CustomTypeError(gItem, clsType)
+
+def _checkItems(gItems, clsType):
+    """
+    Helper function to validate all elements of an iterable, which is
+    exhausted into a list before the first check, so the bulk operations
+    using the returned list are atomic.
+    
+    Signature:
+        iterable(type A), class B -> list(type A)
+    
+    Args:
+        gItems: iterable(type A), the elements
+        clsType: class B, the declared type
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper element
+    
+    Version 0.0.1.0
+    """
+    lstItems = list(gItems)
+    for gItem in lstItems:
+        if not (type(gItem) is clsType or isinstance(gItem, clsType)):
+            raise CustomTypeError(gItem, clsType)
+    return lstItems
+
+def _toArray(gItems, strTypecode, clsType):
+    """
+    Helper function to convert an iterable into a new array.array, which
+    performs the validation of all elements in C. Upon failure the first
+    improper element is located to be reported; if it cannot be located
+    (e.g. an element converting inconsistently), the original failure is
+    reported for the whole sequence.
+    
+    Signature:
+        iterable(type A), str, class B -> array.array
+    
+    Args:
+        gItems: iterable(type A), the elements
+        strTypecode: str, the array type code
+        clsType: class B, the declared type
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper element
+        pos.exceptions.CustomValueError: element value does not fit the array
+            type
+    
+    Version 0.0.1.1
+    """
+    if isinstance(gItems, array.array) and gItems.typecode == strTypecode:
+        arrResult = gItems[:]
+    else:
+        lstItems = list(gItems)
+        try:
+            arrResult = array.array(strTypecode, lstItems)
+        except (TypeError, OverflowError) as objError:
+            for gItem in lstItems:
+                _appendToArray(array.array(strTypecode), gItem, clsType)
+            #the improper element is not located
+            if isinstance(objError, OverflowError):
+                raise CustomValueError(lstItems,
+                        "'in range of array type {}'".format(strTypecode))
+            raise CustomTypeError(lstItems, clsType)
+    return arrResult
+
+def _appendToArray(arrData, gItem, clsType):
+    """
+    Helper function to append a single element to an array.array with the
+    conversion of the exceptions.
+    
+    Signature:
+        array.array, type A, class B -> None
+    
+    Args:
+        arrData: array.array, the storage
+        gItem: type A, the element
+        clsType: class B, the declared type
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper element
+        pos.exceptions.CustomValueError: element value does not fit the array
+            type
+    
+    Version 0.0.1.0
+    """
+    try:
+        arrData.append(gItem)
+    except TypeError:
+        raise CustomTypeError(gItem, clsType)
+    except OverflowError:
+        raise CustomValueError(gItem, "'in range of array type {}'".format(
+                                                            arrData.typecode))
+
+def _isCovered(clsOwn, clsRequired):
+    """
+    Helper function to compare the declared type of a typed container with
+    the required type. None as the required type means any type.
+    
+    Signature:
+        class A, class B OR None -> bool
+    
+    Version 0.0.1.0
+    """
+    return clsRequired is None or issubclass(clsOwn, clsRequired)
+
+#+ public functions
+
+def checkElements(gContainer, clsType = None, clsValueType = None):
+    """
+    Checks that all elements (keys for a mapping) of a container are of the
+    required type, and, for a mapping, that all its values are of the
+    required value type; None means any type. For the typed containers of
+    this module the check is O(1) - only the declared types are compared, the
+    elements themselves are not inspected. Any other iterable is scanned.
+    
+    Note that a typed container with a narrower declared type passes the
+    check, whereas one with a wider declared type fails it even if all of
+    its current elements are of the required type.
+    
+    Signature:
+        iterable(type A), /class B OR None, class C OR None/ -> bool
+    
+    Args:
+        gContainer: iterable(type A), the container to check
+        clsType: (optional) class B OR None, the required type of the
+            elements / keys, defaults to None (any)
+        clsValueType: (optional) class C OR None, the required type of the
+            mapping values, defaults to None (any)
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gContainer, TypedDict):
+        bResult = (_isCovered(gContainer.KeyType, clsType) and
+                            _isCovered(gContainer.ValueType, clsValueType))
+    elif isinstance(gContainer, (TypedList, TypedSet)):
+        bResult = _isCovered(gContainer.ElementType, clsType)
+    else:
+        bResult = True
+        if clsType is not None:
+            bResult = all(isinstance(gItem, clsType) for gItem in gContainer)
+        if bResult and clsValueType is not None:
+            bResult = isinstance(gContainer, collections.Mapping) and all(
+                                        isinstance(gItem, clsValueType)
+                                        for gItem in gContainer.itervalues())
+    return bResult
+
+#classes
+
+class TypedList(collections.MutableSequence):
+    """
+    Mutable sequence with the elements of the declared type validated upon
+    insertion. The int and float elements are stored in an array.array, any
+    other - in a list. The slices are typed lists of the same type, created
+    without re-validation.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('_clsElement', '_gData')
+    
+    #special methods
+    
+    def __init__(self, clsElement, gItems = ()):
+        """
+        Initialization. Validates the initial elements.
+        
+        Signature:
+            class A/, iterable(A)/ -> None
+        
+        Args:
+            clsElement: class A, the declared type of the elements
+            gItems: (optional) iterable(A), the initial elements, defaults to
+                an empty tuple
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the declared type is not a class,
+                OR improper element
+            pos.exceptions.CustomValueError: element value does not fit the
+                array type
+        
+        Version 0.0.1.0
+        """
+        _checkType(clsElement)
+        self._clsElement = clsElement
+        self._gData = self._validate(gItems)
+    
+    def __len__(self):
+        """
+        Returns the number of the elements.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return len(self._gData)
+    
+    def __getitem__(self, gIndex):
+        """
+        Returns an element or a typed list of the same type for a slice.
+        
+        Signature:
+            int OR slice -> A OR TypedList(A)
+        
+        Raises:
+            IndexError: the index is out of range
+        
+        Version 0.0.1.0
+        """
+        if isinstance(gIndex, slice):
+            gResult = self._fromStorage(self._gData[gIndex])
+        else:
+            gResult = self._gData[gIndex]
+        return gResult
+    
+    def __setitem__(self, gIndex, gValue):
+        """
+        Replaces an element or a slice after the validation of the new
+        element(s).
+        
+        Signature:
+            int, A -> None
+            slice, iterable(A) -> None
+        
+        Raises:
+            IndexError: the index is out of range
+            pos.exceptions.CustomTypeError: improper element
+            pos.exceptions.CustomValueError: element value does not fit the
+                array type
+        
+        Version 0.0.1.0
+        """
+        if isinstance(gIndex, slice):
+            self._gData[gIndex] = self._validate(gValue)
+        else:
+            self._gData[gIndex] = self._validate((gValue, ))[0]
+    
+    def __delitem__(self, gIndex):
+        """
+        Removes an element or a slice.
+        
+        Signature:
+            int OR slice -> None
+        
+        Raises:
+            IndexError: the index is out of range
+        
+        Version 0.0.1.0
+        """
+        del self._gData[gIndex]
+    
+    def __iter__(self):
+        """
+        Iterates over the elements.
+        
+        Signature:
+            None -> iterator(A)
+        
+        Version 0.0.1.0
+        """
+        return iter(self._gData)
+    
+    def __contains__(self, gItem):
+        """
+        Checks if the element is present.
+        
+        Signature:
+            type B -> bool
+        
+        Version 0.0.1.0
+        """
+        try:
+            bResult = gItem in self._gData
+        except TypeError: #array.array type mismatch
+            bResult = False
+        return bResult
+    
+    def __iadd__(self, gItems):
+        """
+        In-place concatenation, see extend().
+        
+        Signature:
+            iterable(A) -> TypedList(A)
+        
+        Version 0.0.1.0
+        """
+        self.extend(gItems)
+        return self
+    
+    def __eq__(self, gOther):
+        """
+        Element-wise comparison with any sequence, the declared types are not
+        compared.
+        
+        Signature:
+            type B -> bool
+        
+        Version 0.0.1.0
+        """
+        if isinstance(gOther, TypedList):
+            gOther = gOther._gData
+        elif not isinstance(gOther, collections.Sequence) or isinstance(gOther,
+                                                                basestring):
+            return NotImplemented
+        return len(self._gData) == len(gOther) and all(
+                        gFirst == gSecond
+                        for gFirst, gSecond in zip(self._gData, gOther))
+    
+    def __ne__(self, gOther):
+        """
+        Inverse of __eq__().
+        
+        Signature:
+            type B -> bool
+        
+        Version 0.0.1.0
+        """
+        bResult = self.__eq__(gOther)
+        if bResult is not NotImplemented:
+            bResult = not bResult
+        return bResult
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        """
+        Returns the string representation.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return '{}({}, {!r})'.format(self.__class__.__name__,
+                                self._clsElement.__name__, list(self._gData))
+    
+    def __reduce__(self):
+        """
+        Pickling and copying support - the elements are re-validated upon
+        restoring.
+        
+        Signature:
+            None -> tuple(class, tuple(class A, list(A)))
+        
+        Version 0.0.1.0
+        """
+        return (self.__class__, (self._clsElement, list(self._gData)))
+    
+    #'private' / helper methods
+    
+    def _validate(self, gItems):
+        """
+        Validates the elements and returns them as the storage type.
+        
+        Signature:
+            iterable(A) -> array.array OR list(A)
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper element
+            pos.exceptions.CustomValueError: element value does not fit the
+                array type
+        
+        Version 0.0.1.0
+        """
+        strTypecode = DEFAULT_TYPECODES.get(self._clsElement, None)
+        if strTypecode is None:
+            gResult = _checkItems(gItems, self._clsElement)
+        else:
+            gResult = _toArray(gItems, strTypecode, self._clsElement)
+        return gResult
+    
+    def _fromStorage(self, gData):
+        """
+        Creates a typed list of the same type wrapping the already validated
+        storage.
+        
+        Signature:
+            array.array OR list(A) -> TypedList(A)
+        
+        Version 0.0.1.0
+        """
+        objResult = object.__new__(self.__class__)
+        objResult._clsElement = self._clsElement
+        objResult._gData = gData
+        return objResult
+    
+    #properties
+    
+    @property
+    def ElementType(self):
+        """
+        Getter property. Returns the declared type of the elements.
+        
+        Signature:
+            None -> class A
+        
+        Version 0.0.1.0
+        """
+        return self._clsElement
+    
+    #public methods
+    
+    def insert(self, iIndex, gItem):
+        """
+        Inserts a validated element before the index.
+        
+        Signature:
+            int, A -> None
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper element
+            pos.exceptions.CustomValueError: element value does not fit the
+                array type
+        
+        Version 0.0.1.0
+        """
+        self._gData.insert(iIndex, self._validate((gItem, ))[0])
+    
+    def append(self, gItem):
+        """
+        Appends a validated element.
+        
+        Signature:
+            A -> None
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper element
+            pos.exceptions.CustomValueError: element value does not fit the
+                array type
+        
+        Version 0.0.1.0
+        """
+        gData = self._gData
+        if isinstance(gData, list):
+            _checkItem(gItem, self._clsElement)
+            gData.append(gItem)
+        else:
+            _appendToArray(gData, gItem, self._clsElement)
+    
+    def extend(self, gItems):
+        """
+        Appends the elements after validation of all of them. The elements of
+        a typed list with a covered declared type are not re-validated.
+        
+        Signature:
+            iterable(A) -> None
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper element
+            pos.exceptions.CustomValueError: element value does not fit the
+                array type
+        
+        Version 0.0.1.0
+        """
+        if isinstance(gItems, TypedList) and (type(gItems._gData) is
+                                                    type(self._gData)) and (
+                        issubclass(gItems._clsElement, self._clsElement)):
+            self._gData.extend(gItems._gData)
+        else:
+            self._gData.extend(self._validate(gItems))
+    
+    def index(self, gItem, *args):
+        """
+        Returns the index of the first occurrence of the element.
+        
+        Signature:
+            type B/, int/, int// -> int
+        
+        Raises:
+            ValueError: the element is not present
+        
+        Version 0.0.1.0
+        """
+        if gItem not in self:
+            raise ValueError('{!r} is not in list'.format(gItem))
+        return list(self._gData).index(gItem, *args)
+    
+    def count(self, gItem):
+        """
+        Returns the number of the occurrences of the element.
+        
+        Signature:
+            type B -> int
+        
+        Version 0.0.1.0
+        """
+        return self._gData.count(gItem) if gItem in self else 0
+    
+    def pop(self, iIndex = -1):
+        """
+        Removes and returns an element.
+        
+        Signature:
+            /int/ -> A
+        
+        Raises:
+            IndexError: the list is empty or the index is out of range
+        
+        Version 0.0.1.0
+        """
+        return self._gData.pop(iIndex)
+    
+    def reverse(self):
+        """
+        Reverses the order of the elements in place.
+        
+        Signature:
+            None -> None
+        
+        Version 0.0.1.0
+        """
+        self._gData.reverse()
+    
+    def sort(self, *args, **kwargs):
+        """
+        Sorts the elements in place, the arguments are the same as for the
+        method list.sort().
+        
+        Signature:
+            /.../ -> None
+        
+        Version 0.0.1.0
+        """
+        gData = self._gData
+        if isinstance(gData, list):
+            gData.sort(*args, **kwargs)
+        else:
+            lstItems = gData.tolist()
+            lstItems.sort(*args, **kwargs)
+            gData[:] = array.array(gData.typecode, lstItems)
+
+class TypedDict(collections.MutableMapping):
+    """
+    Mutable mapping with the keys and values of the declared types validated
+    upon insertion. The elements are stored in a dict.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('_clsKey', '_clsValue', '_dictData')
+    
+    #special methods
+    
+    def __init__(self, clsKey, clsValue, *args, **kwargs):
+        """
+        Initialization. The initial content is given in the same way as for
+        dict() and is validated.
+        
+        Signature:
+            class A, class B/, .../ -> None
+        
+        Args:
+            clsKey: class A, the declared type of the keys
+            clsValue: class B, the declared type of the values
+            *args: (optional) mapping or iterable of the key, value pairs
+            **kwargs: (optional) key, value pairs
+        
+        Raises:
+            pos.exceptions.CustomTypeError: any of the declared types is not a
+                class, OR improper key or value
+        
+        Version 0.0.1.0
+        """
+        _checkType(clsKey)
+        _checkType(clsValue)
+        self._clsKey = clsKey
+        self._clsValue = clsValue
+        self._dictData = {}
+        self.update(*args, **kwargs)
+    
+    def __len__(self):
+        """
+        Returns the number of the elements.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return len(self._dictData)
+    
+    def __getitem__(self, gKey):
+        """
+        Returns the value for the key.
+        
+        Signature:
+            A -> B
+        
+        Raises:
+            KeyError: the key is not present
+        
+        Version 0.0.1.0
+        """
+        return self._dictData[gKey]
+    
+    def __setitem__(self, gKey, gValue):
+        """
+        Sets the value for the key after validation of both.
+        
+        Signature:
+            A, B -> None
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper key or value
+        
+        Version 0.0.1.0
+        """
+        _checkItem(gKey, self._clsKey)
+        _checkItem(gValue, self._clsValue)
+        self._dictData[gKey] = gValue
+    
+    def __delitem__(self, gKey):
+        """
+        Removes the key.
+        
+        Signature:
+            A -> None
+        
+        Raises:
+            KeyError: the key is not present
+        
+        Version 0.0.1.0
+        """
+        del self._dictData[gKey]
+    
+    def __iter__(self):
+        """
+        Iterates over the keys.
+        
+        Signature:
+            None -> iterator(A)
+        
+        Version 0.0.1.0
+        """
+        return iter(self._dictData)
+    
+    def __contains__(self, gKey):
+        """
+        Checks if the key is present.
+        
+        Signature:
+            type C -> bool
+        
+        Version 0.0.1.0
+        """
+        return gKey in self._dictData
+    
+    def __eq__(self, gOther):
+        """
+        Comparison with any mapping, the declared types are not compared.
+        
+        Signature:
+            type C -> bool
+        
+        Version 0.0.1.0
+        """
+        if isinstance(gOther, TypedDict):
+            gOther = gOther._dictData
+        elif not isinstance(gOther, collections.Mapping):
+            return NotImplemented
+        return self._dictData == dict(gOther.items())
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        """
+        Returns the string representation.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return '{}({}, {}, {!r})'.format(self.__class__.__name__,
+                                        self._clsKey.__name__,
+                                        self._clsValue.__name__, self._dictData)
+    
+    def __reduce__(self):
+        """
+        Pickling and copying support - the elements are re-validated upon
+        restoring.
+        
+        Signature:
+            None -> tuple(class, tuple(class A, class B, dict(A -> B)))
+        
+        Version 0.0.1.0
+        """
+        return (self.__class__, (self._clsKey, self._clsValue,
+                                                        dict(self._dictData)))
+    
+    #properties
+    
+    @property
+    def KeyType(self):
+        """
+        Getter property. Returns the declared type of the keys.
+        
+        Signature:
+            None -> class A
+        
+        Version 0.0.1.0
+        """
+        return self._clsKey
+    
+    @property
+    def ValueType(self):
+        """
+        Getter property. Returns the declared type of the values.
+        
+        Signature:
+            None -> class B
+        
+        Version 0.0.1.0
+        """
+        return self._clsValue
+    
+    #public methods
+    
+    def get(self, gKey, gDefault = None):
+        """
+        Returns the value for the key or the default value.
+        
+        Signature:
+            A/, type C/ -> B OR type C
+        
+        Version 0.0.1.0
+        """
+        return self._dictData.get(gKey, gDefault)
+    
+    def keys(self):
+        """
+        Returns the list of the keys.
+        
+        Signature:
+            None -> list(A)
+        
+        Version 0.0.1.0
+        """
+        return self._dictData.keys()
+    
+    def values(self):
+        """
+        Returns the list of the values.
+        
+        Signature:
+            None -> list(B)
+        
+        Version 0.0.1.0
+        """
+        return self._dictData.values()
+    
+    def items(self):
+        """
+        Returns the list of the key, value pairs.
+        
+        Signature:
+            None -> list(tuple(A, B))
+        
+        Version 0.0.1.0
+        """
+        return self._dictData.items()
+    
+    def iterkeys(self):
+        """
+        Iterates over the keys.
+        
+        Signature:
+            None -> iterator(A)
+        
+        Version 0.0.1.0
+        """
+        return self._dictData.iterkeys()
+    
+    def itervalues(self):
+        """
+        Iterates over the values.
+        
+        Signature:
+            None -> iterator(B)
+        
+        Version 0.0.1.0
+        """
+        return self._dictData.itervalues()
+    
+    def iteritems(self):
+        """
+        Iterates over the key, value pairs.
+        
+        Signature:
+            None -> iterator(tuple(A, B))
+        
+        Version 0.0.1.0
+        """
+        return self._dictData.iteritems()
+    
+    def clear(self):
+        """
+        Removes all elements.
+        
+        Signature:
+            None -> None
+        
+        Version 0.0.1.0
+        """
+        self._dictData.clear()
+    
+    def copy(self):
+        """
+        Returns a shallow copy as a typed dictionary of the same types,
+        without re-validation.
+        
+        Signature:
+            None -> TypedDict(A -> B)
+        
+        Version 0.0.1.0
+        """
+        objResult = object.__new__(self.__class__)
+        objResult._clsKey = self._clsKey
+        objResult._clsValue = self._clsValue
+        objResult._dictData = self._dictData.copy()
+        return objResult
+    
+    def setdefault(self, gKey, gDefault = None):
+        """
+        Returns the value for the key; if the key is not present, the
+        validated key and default value are inserted first.
+        
+        Signature:
+            A/, B/ -> B
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper key or value
+        
+        Version 0.0.1.0
+        """
+        if gKey not in self._dictData:
+            self[gKey] = gDefault
+        return self._dictData[gKey]
+    
+    def update(self, *args, **kwargs):
+        """
+        Updates the mapping with the key, value pairs given in the same way as
+        for dict.update(). All keys and values are validated before the first
+        modification. The content of a typed dictionary with the covered
+        declared types is not re-validated.
+        
+        Signature:
+            /.../ -> None
+        
+        Raises:
+            TypeError: more than one positional argument
+            pos.exceptions.CustomTypeError: improper key or value
+        
+        Version 0.0.1.0
+        """
+        if len(args) > 1:
+            raise TypeError('update expected at most 1 arguments, got {}'.format(
+                                                                    len(args)))
+        if (args and not kwargs and isinstance(args[0], TypedDict) and
+                                checkElements(args[0], self._clsKey,
+                                                            self._clsValue)):
+            self._dictData.update(args[0]._dictData)
+        else:
+            dictNew = dict(*args, **kwargs)
+            _checkItems(dictNew.iterkeys(), self._clsKey)
+            _checkItems(dictNew.itervalues(), self._clsValue)
+            self._dictData.update(dictNew)
+
+class TypedSet(collections.MutableSet):
+    """
+    Mutable set of the elements of the declared type validated upon
+    insertion. The elements are stored in a set. The results of the binary
+    set operations are typed sets of the same type.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('_clsElement', '_setData')
+    
+    #special methods
+    
+    def __init__(self, clsElement, gItems = ()):
+        """
+        Initialization. Validates the initial elements.
+        
+        Signature:
+            class A/, iterable(A)/ -> None
+        
+        Args:
+            clsElement: class A, the declared type of the elements
+            gItems: (optional) iterable(A), the initial elements, defaults to
+                an empty tuple
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the declared type is not a class,
+                OR improper element
+        
+        Version 0.0.1.0
+        """
+        _checkType(clsElement)
+        self._clsElement = clsElement
+        self._setData = set(_checkItems(gItems, clsElement))
+    
+    def __len__(self):
+        """
+        Returns the number of the elements.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return len(self._setData)
+    
+    def __iter__(self):
+        """
+        Iterates over the elements.
+        
+        Signature:
+            None -> iterator(A)
+        
+        Version 0.0.1.0
+        """
+        return iter(self._setData)
+    
+    def __contains__(self, gItem):
+        """
+        Checks if the element is present.
+        
+        Signature:
+            type B -> bool
+        
+        Version 0.0.1.0
+        """
+        try:
+            bResult = gItem in self._setData
+        except TypeError: #unhashable
+            bResult = False
+        return bResult
+    
+    def __ior__(self, gItems):
+        """
+        In-place union, see update().
+        
+        Signature:
+            iterable(A) -> TypedSet(A)
+        
+        Version 0.0.1.0
+        """
+        self.update(gItems)
+        return self
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        """
+        Returns the string representation.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return '{}({}, {!r})'.format(self.__class__.__name__,
+                                self._clsElement.__name__, list(self._setData))
+    
+    def __reduce__(self):
+        """
+        Pickling and copying support - the elements are re-validated upon
+        restoring.
+        
+        Signature:
+            None -> tuple(class, tuple(class A, list(A)))
+        
+        Version 0.0.1.0
+        """
+        return (self.__class__, (self._clsElement, list(self._setData)))
+    
+    #'private' / helper methods
+    
+    def _from_iterable(self, gItems):
+        """
+        Hook of the collections.Set mix-in methods, which construct the
+        results of the binary set operations. Returns a typed set of the same
+        type.
+        
+        Signature:
+            iterable(A) -> TypedSet(A)
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper element
+        
+        Version 0.0.1.0
+        """
+        return self.__class__(self._clsElement, gItems)
+    
+    #properties
+    
+    @property
+    def ElementType(self):
+        """
+        Getter property. Returns the declared type of the elements.
+        
+        Signature:
+            None -> class A
+        
+        Version 0.0.1.0
+        """
+        return self._clsElement
+    
+    #public methods
+    
+    def add(self, gItem):
+        """
+        Adds a validated element.
+        
+        Signature:
+            A -> None
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper element
+        
+        Version 0.0.1.0
+        """
+        _checkItem(gItem, self._clsElement)
+        self._setData.add(gItem)
+    
+    def discard(self, gItem):
+        """
+        Removes the element if present.
+        
+        Signature:
+            type B -> None
+        
+        Version 0.0.1.0
+        """
+        if gItem in self:
+            self._setData.discard(gItem)
+    
+    def clear(self):
+        """
+        Removes all elements.
+        
+        Signature:
+            None -> None
+        
+        Version 0.0.1.0
+        """
+        self._setData.clear()
+    
+    def copy(self):
+        """
+        Returns a shallow copy as a typed set of the same type, without
+        re-validation.
+        
+        Signature:
+            None -> TypedSet(A)
+        
+        Version 0.0.1.0
+        """
+        objResult = object.__new__(self.__class__)
+        objResult._clsElement = self._clsElement
+        objResult._setData = self._setData.copy()
+        return objResult
+    
+    def update(self, *args):
+        """
+        Adds the elements of all passed iterables. All elements are validated
+        before the first modification. The elements of a typed set with a
+        covered declared type are not re-validated.
+        
+        Signature:
+            /iterable(A), .../ -> None
+        
+        Raises:
+            pos.exceptions.CustomTypeError: improper element
+        
+        Version 0.0.1.0
+        """
+        lstNew = []
+        for gItems in args:
+            if isinstance(gItems, TypedSet) and issubclass(gItems._clsElement,
+                                                            self._clsElement):
+                lstNew.append(gItems._setData)
+            else:
+                lstNew.append(_checkItems(gItems, self._clsElement))
+        self._setData.update(*lstNew)
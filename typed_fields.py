@@ -0,0 +1,938 @@
+#usr/bin/python
+"""
+Module pos.typed_fields
+
+Typed numeric fields resembling the fixed width types of the static typed
+languages: unsigned and signed integers of 8, 16, 32 and 64 bits and bounded
+(double precision) floating point numbers. The fields are data descriptors
+declared at the class level of the TypedRecordABC subclasses, which check the
+type and the range of the assigned value against the precomputed bounds.
+
+The values are not stored in the instances. Instead, each class has its own
+slab - one array.array per typed field - and each instance holds only the
+index of its row in the slab, which is allocated upon creation of the instance
+and released (re-used) upon its destruction.
+
+Classes:
+    TypedField: base class of the typed numeric fields
+    UInt8, UInt16, UInt32, UInt64: unsigned integer fields
+    Int8, Int16, Int32, Int64: signed integer fields
+    BoundedFloat: floating point field
+    TypedRecordABC_Meta: meta-class binding the typed fields to the slab
+    TypedRecordABC: base class for the records with the typed fields
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+
+#imports
+
+#+ standard libraries
+
+import array
+import collections
+import weakref
+
+#+ my libraries
+
+from pos.base_classes import DescriptedSlotsABC, DescriptedSlotsABC_Meta
+from pos.base_classes import _buildSlotMembers, _invalidateAttribute
+from pos.exceptions import CustomTypeError, CustomValueError
+
+#globals
+
+#+ allocated rows: the weak reference to the instance, the slab and the row
+#+ index per id of that weak reference
+
+_dictRows = {}
+
+#functions
+
+#+ helper functions
+
+def _findTypecode(strTypecodes, iSize):
+    """
+    Helper function to find the array type code with the required item size
+    among the candidates, since the sizes of the C types are platform
+    dependent.
+    
+    Signature:
+        str, int -> str OR None
+    
+    Args:
+        strTypecodes: string, the candidate type codes in the order of
+            preference
+        iSize: int, the required item size in bytes
+    
+    Version 0.0.1.0
+    """
+    strResult = None
+    for strTypecode in strTypecodes:
+        if array.array(strTypecode).itemsize == iSize:
+            strResult = strTypecode
+            break
+    return strResult
+
+def _newColumn(strTypecode):
+    """
+    Helper function to create an empty column of the slab: array.array of the
+    specified type code, or a list if the platform does not provide an array
+    type of the required size.
+    
+    Signature:
+        str OR None -> array.array OR list
+    
+    Args:
+        strTypecode: string OR None, the array type code
+    
+    Version 0.0.1.0
+    """
+    if strTypecode is None:
+        gResult = []
+    else:
+        gResult = array.array(strTypecode)
+    return gResult
+
+def _releaseRow(objRef):
+    """
+    Helper function - callback of the weak reference to a TypedRecordABC
+    instance, which is called after the instance has been garbage collected.
+    Releases the row of the instance for re-use. Refers only to the slab and
+    the row index, thus the instances can be part of the reference cycles.
+    
+    Signature:
+        weakref.ref -> None
+    
+    Args:
+        objRef: weakref.ref, the dead weak reference
+    
+    Version 0.0.1.0
+    """
+    tupEntry = _dictRows.pop(id(objRef), None)
+    if not (tupEntry is None):
+        _, objSlab, iRow = tupEntry
+        objSlab.release(iRow)
+
+#classes
+
+#+ helper classes
+
+class _TypedSlab(object):
+    """
+    Per class storage of the values of the typed fields: one column per field
+    and one row per (alive) instance. The rows of the destroyed instances are
+    re-used.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('Fields', '_tupColumns', '_tupDefaults', '_lstFree',
+                                                                    '_iSize')
+    
+    def __init__(self, dictFields):
+        """
+        Initialization.
+        
+        Signature:
+            dict(str -> TypedField) -> None
+        
+        Args:
+            dictFields: dict(str -> TypedField), the typed fields of the class
+                bound to the columns, per name
+        
+        Version 0.0.1.0
+        """
+        self.Fields = dictFields
+        tupFields = tuple(dictFields[strName]
+                                        for strName in sorted(dictFields))
+        self._tupColumns = tuple(objField._arrData for objField in tupFields)
+        self._tupDefaults = tuple(objField.Default for objField in tupFields)
+        self._lstFree = []
+        self._iSize = 0
+    
+    def __len__(self):
+        """
+        Returns the number of the allocated (used) rows.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return self._iSize - len(self._lstFree)
+    
+    def allocate(self):
+        """
+        Allocates a row filled with the default values of the fields and
+        returns its index.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        if self._lstFree:
+            iRow = self._lstFree.pop()
+            for gColumn, gDefault in zip(self._tupColumns, self._tupDefaults):
+                gColumn[iRow] = gDefault
+        else:
+            iRow = self._iSize
+            self._iSize += 1
+            for gColumn, gDefault in zip(self._tupColumns, self._tupDefaults):
+                gColumn.append(gDefault)
+        return iRow
+    
+    def reset(self, iRow):
+        """
+        Fills the row with the default values of the fields.
+        
+        Signature:
+            int -> None
+        
+        Args:
+            iRow: int, index of the row
+        
+        Version 0.0.1.0
+        """
+        for gColumn, gDefault in zip(self._tupColumns, self._tupDefaults):
+            gColumn[iRow] = gDefault
+    
+    def release(self, iRow):
+        """
+        Marks the row as free for re-use.
+        
+        Signature:
+            int -> None
+        
+        Args:
+            iRow: int, index of the row
+        
+        Version 0.0.1.0
+        """
+        self._lstFree.append(iRow)
+
+#+ typed fields
+
+class TypedField(object):
+    """
+    Base class of the typed numeric fields - data descriptors, which check the
+    type and the range of the assigned value and store it in the column of the
+    slab of the owner class (see TypedRecordABC) at the row of the instance.
+    The range is defined by the class attributes _MIN and _MAX (natural range
+    of the type), which can be narrowed per field by the optional arguments
+    of the initialization method, and it is checked by two comparisons. The
+    accepted types and the array type code are also defined by the class
+    attributes _TYPES and Typecode.
+    
+    Accessed via the class, the field returns itself. The assignment via the
+    class as well as the deletion of the field are not allowed.
+    
+    Attributes:
+        Name: string, name of the field, None for an unbound field
+        Default: int OR float, the initial value of the field
+        Min: int OR float, the minimal allowed value
+        Max: int OR float, the maximal allowed value
+        Typecode: string OR None, the array type code of the column
+    
+    Version 0.0.1.0
+    """
+    
+    #class fields
+    
+    __slots__ = ('Name', 'Default', 'Min', 'Max', '_arrData', '_getRow')
+    
+    _TYPES = (int, long, float)
+    
+    _MIN = float('-inf')
+    
+    _MAX = float('inf')
+    
+    Typecode = 'd'
+    
+    #special methods
+    
+    def __init__(self, gDefault = None, gMin = None, gMax = None):
+        """
+        Initialization. Checks the bounds and the default value.
+        
+        Signature:
+            /int OR float, int OR float, int OR float/ -> None
+        
+        Args:
+            gDefault: (optional) int OR float, the initial value of the field,
+                defaults to zero if it is within the range, otherwise to the
+                minimal allowed value
+            gMin: (optional) int OR float, the minimal allowed value, defaults
+                to the minimal value of the type
+            gMax: (optional) int OR float, the maximal allowed value, defaults
+                to the maximal value of the type
+        
+        Raises:
+            pos.exceptions.CustomTypeError: any of the arguments is of the
+                wrong type
+            pos.exceptions.CustomValueError: any of the bounds is outside the
+                natural range of the type, the bounds are in the wrong order,
+                or the default value is out of the bounds
+        
+        Version 0.0.1.0
+        """
+        clsField = type(self)
+        strRange = 'in range [{}, {}]'.format(clsField._MIN, clsField._MAX)
+        if gMin is None:
+            gMin = clsField._MIN
+        else:
+            gMin = self._checkType(gMin)
+            if not (clsField._MIN <= gMin <= clsField._MAX):
+                raise CustomValueError(gMin, strRange)
+        if gMax is None:
+            gMax = clsField._MAX
+        else:
+            gMax = self._checkType(gMax)
+            if not (clsField._MIN <= gMax <= clsField._MAX):
+                raise CustomValueError(gMax, strRange)
+        if gMax < gMin:
+            raise CustomValueError(gMax, "'not less than {}'".format(gMin))
+        self.Min = gMin
+        self.Max = gMax
+        if gDefault is None:
+            if gMin <= 0 <= gMax:
+                gDefault = 0
+            else:
+                gDefault = gMin
+        self.Default = self._checkValue(gDefault)
+        self.Name = None
+        self._arrData = None
+        self._getRow = None
+    
+    def __get__(self, objInstance, clsOwner):
+        """
+        Returns the value of the field for the instance, or the field itself
+        if accessed via the class.
+        
+        Signature:
+            type A, class A -> int OR float OR TypedField
+        
+        Args:
+            objInstance: type A, instance of the owner class or None
+            clsOwner: class A, the owner class
+        
+        Raises:
+            AttributeError: the field is not bound to a slab, i.e. it is not
+                declared in a TypedRecordABC subclass
+        
+        Version 0.0.1.0
+        """
+        try:
+            gResult = self._arrData[self._getRow(objInstance)]
+        except TypeError: #via the class, or not bound to a slab
+            if not (objInstance is None or isinstance(objInstance, type)):
+                raise AttributeError('unbound typed field {}'.format(
+                                                                    self.Name))
+            gResult = self
+        return gResult
+    
+    def __set__(self, objInstance, gValue):
+        """
+        Checks the type and the range of the value and stores it in the slab.
+        
+        Signature:
+            type A, int OR float -> None
+        
+        Args:
+            objInstance: type A, instance of the owner class
+            gValue: int OR float, the value to assign
+        
+        Raises:
+            AttributeError: assignment via the class, or the field is not bound
+                to a slab
+            pos.exceptions.CustomTypeError: the value is of the wrong type
+            pos.exceptions.CustomValueError: the value is out of the range
+        
+        Version 0.0.1.0
+        """
+        try:
+            iRow = self._getRow(objInstance)
+        except TypeError: #via the class, or not bound to a slab
+            raise AttributeError("can't set typed field {}".format(self.Name))
+        if not (type(gValue) is float or isinstance(gValue, self._TYPES)):
+            raise CustomTypeError(gValue, float)
+        if not (self.Min <= gValue <= self.Max): #also catches NaN
+            raise CustomValueError(gValue, 'in range [{}, {}]'.format(
+                                                        self.Min, self.Max))
+        self._arrData[iRow] = gValue
+    
+    def __delete__(self, objInstance):
+        """
+        Deletion of the typed fields is not allowed.
+        
+        Signature:
+            type A -> None
+        
+        Args:
+            objInstance: type A, instance of the owner class or the class
+        
+        Raises:
+            AttributeError: always
+        
+        Version 0.0.1.0
+        """
+        raise AttributeError("can't delete typed field {}".format(self.Name))
+    
+    def __repr__(self):
+        """
+        Special method - the string representation of the field.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return '{}({!r}, {!r}, {!r})'.format(type(self).__name__,
+                                            self.Default, self.Min, self.Max)
+    
+    #private methods
+    
+    def _checkType(self, gValue):
+        """
+        Checks the type of the value and converts it into the stored type.
+        
+        Signature:
+            type A -> int OR float
+        
+        Args:
+            gValue: type A, the value to check
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the value is of the wrong type
+        
+        Version 0.0.1.0
+        """
+        if not isinstance(gValue, self._TYPES):
+            raise CustomTypeError(gValue, float)
+        return float(gValue)
+    
+    def _checkValue(self, gValue):
+        """
+        Checks the type and the range of the value and converts it into the
+        stored type.
+        
+        Signature:
+            type A -> int OR float
+        
+        Args:
+            gValue: type A, the value to check
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the value is of the wrong type
+            pos.exceptions.CustomValueError: the value is out of the range
+        
+        Version 0.0.1.0
+        """
+        gValue = self._checkType(gValue)
+        if not (self.Min <= gValue <= self.Max): #also catches NaN
+            raise CustomValueError(gValue, 'in range [{}, {}]'.format(
+                                                        self.Min, self.Max))
+        return gValue
+    
+    def _bind(self, strName, objRow):
+        """
+        Creates a copy of the field bound to a new (empty) column and to the
+        slot of the owner class instances storing the row index.
+        
+        Signature:
+            str, member_descriptor -> TypedField
+        
+        Args:
+            strName: string, name of the field
+            objRow: member_descriptor, slot of the instances storing the index
+                of the row
+        
+        Version 0.0.1.0
+        """
+        clsField = type(self)
+        objNew = clsField.__new__(clsField)
+        objNew.Name = strName
+        objNew.Default = self.Default
+        objNew.Min = self.Min
+        objNew.Max = self.Max
+        objNew._arrData = _newColumn(self.Typecode)
+        objNew._getRow = objRow.__get__
+        return objNew
+
+class _IntegerField(TypedField):
+    """
+    Base class of the typed integer fields.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ()
+    
+    _TYPES = (int, long)
+    
+    def __set__(self, objInstance, gValue):
+        """
+        Checks the type and the range of the value and stores it in the slab.
+        
+        Signature:
+            type A, int -> None
+        
+        Args:
+            objInstance: type A, instance of the owner class
+            gValue: int, the value to assign
+        
+        Raises:
+            AttributeError: assignment via the class, or the field is not bound
+                to a slab
+            pos.exceptions.CustomTypeError: the value is not an integer
+            pos.exceptions.CustomValueError: the value is out of the range
+        
+        Version 0.0.1.0
+        """
+        try:
+            iRow = self._getRow(objInstance)
+        except TypeError: #via the class, or not bound to a slab
+            raise AttributeError("can't set typed field {}".format(self.Name))
+        if not (type(gValue) is int or isinstance(gValue, self._TYPES)):
+            raise CustomTypeError(gValue, int)
+        if not (self.Min <= gValue <= self.Max):
+            raise CustomValueError(gValue, 'in range [{}, {}]'.format(
+                                                        self.Min, self.Max))
+        self._arrData[iRow] = gValue
+    
+    def _checkType(self, gValue):
+        """
+        Checks the type of the value, which must be an integer.
+        
+        Signature:
+            type A -> int
+        
+        Args:
+            gValue: type A, the value to check
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the value is not an integer
+        
+        Version 0.0.1.0
+        """
+        if not (type(gValue) is int or isinstance(gValue, self._TYPES)):
+            raise CustomTypeError(gValue, int)
+        return gValue
+
+class UInt8(_IntegerField):
+    """
+    Unsigned 8-bit integer field, range [0, 255].
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ()
+    
+    _MIN = 0
+    
+    _MAX = 2**8 - 1
+    
+    Typecode = _findTypecode('B', 1)
+
+class UInt16(_IntegerField):
+    """
+    Unsigned 16-bit integer field, range [0, 65535].
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ()
+    
+    _MIN = 0
+    
+    _MAX = 2**16 - 1
+    
+    Typecode = _findTypecode('HI', 2)
+
+class UInt32(_IntegerField):
+    """
+    Unsigned 32-bit integer field, range [0, 2**32 - 1].
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ()
+    
+    _MIN = 0
+    
+    _MAX = 2**32 - 1
+    
+    Typecode = _findTypecode('IL', 4)
+
+class UInt64(_IntegerField):
+    """
+    Unsigned 64-bit integer field, range [0, 2**64 - 1]. Stored in a list on
+    the platforms without an 8 bytes unsigned array type.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ()
+    
+    _MIN = 0
+    
+    _MAX = 2**64 - 1
+    
+    Typecode = _findTypecode('L', 8)
+
+class Int8(_IntegerField):
+    """
+    Signed 8-bit integer field, range [-128, 127].
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ()
+    
+    _MIN = -2**7
+    
+    _MAX = 2**7 - 1
+    
+    Typecode = _findTypecode('b', 1)
+
+class Int16(_IntegerField):
+    """
+    Signed 16-bit integer field, range [-32768, 32767].
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ()
+    
+    _MIN = -2**15
+    
+    _MAX = 2**15 - 1
+    
+    Typecode = _findTypecode('hi', 2)
+
+class Int32(_IntegerField):
+    """
+    Signed 32-bit integer field, range [-2**31, 2**31 - 1].
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ()
+    
+    _MIN = -2**31
+    
+    _MAX = 2**31 - 1
+    
+    Typecode = _findTypecode('il', 4)
+
+class Int64(_IntegerField):
+    """
+    Signed 64-bit integer field, range [-2**63, 2**63 - 1]. Stored in a list on
+    the platforms without an 8 bytes signed array type.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ()
+    
+    _MIN = -2**63
+    
+    _MAX = 2**63 - 1
+    
+    Typecode = _findTypecode('l', 8)
+
+class BoundedFloat(TypedField):
+    """
+    Double precision floating point field with the optional bounds, e.g.
+    BoundedFloat(20.0, -40.0, 125.0). The integer values are accepted and
+    converted, NaN is always rejected.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ()
+
+#+ meta-class
+
+class TypedRecordABC_Meta(DescriptedSlotsABC_Meta):
+    """
+    Meta-class for TypedRecordABC. Same as DescriptedSlotsABC_Meta, but also
+    binds the typed fields declared by the class being created and by its
+    super classes to the new slab of this class: each class gets its own
+    bound copies of the typed fields and its own slab (class attribute
+    _objSlab). A typed field of a super class shadowed by any other attribute
+    is not inherited.
+    
+    Version 0.0.1.0
+    """
+    
+    def __new__(mcs, strName, tupBases, dictAttributes):
+        """
+        Special method - creation of a new class. Binds the typed fields to
+        the slab of the new class.
+        
+        Signature:
+            str, tuple(class A), dict -> class B
+        
+        Args:
+            strName: string, name of the class to be created
+            tupBases: tuple of classes, the super classes
+            dictAttributes: dictionary, the namespace of the class
+        
+        Version 0.0.1.0
+        """
+        clsNew = super(TypedRecordABC_Meta, mcs).__new__(mcs, strName,
+                                                    tupBases, dictAttributes)
+        objRow = _buildSlotMembers(clsNew)['_iRow']
+        setSeen = set()
+        dictFields = {}
+        for clsBase in clsNew.__mro__:
+            for strAttr, gValue in clsBase.__dict__.items():
+                if not (strAttr in setSeen):
+                    setSeen.add(strAttr)
+                    if isinstance(gValue, TypedField):
+                        dictFields[strAttr] = gValue._bind(strAttr, objRow)
+        for strAttr, objField in dictFields.items():
+            type.__setattr__(clsNew, strAttr, objField)
+            _invalidateAttribute(clsNew, strAttr)
+        type.__setattr__(clsNew, '_objSlab', _TypedSlab(dictFields))
+        _invalidateAttribute(clsNew, '_objSlab')
+        return clsNew
+
+#+ ABCs
+
+class TypedRecordABC(DescriptedSlotsABC):
+    """
+    Abstract Base Class for the records with the typed numeric fields, e.g.
+    
+        class Telemetry(TypedRecordABC):
+            Counter = UInt16()
+            Temperature = BoundedFloat(20.0, -40.0, 125.0)
+    
+    The typed fields are declared at the class level, but they are instance
+    attributes: the values are stored in the slab of the class, whereas an
+    instance stores only the index of its row. The fields are set to their
+    default values upon instantiation, they can be re-assigned with the type
+    and range checks, but cannot be deleted. Same as for DescriptedSlotsABC,
+    any other instance attributes must be declared in the fields table
+    _Fields.
+    
+    The row is released by the callback of a weak reference once the instance
+    is garbage collected, thus the instances can be part of the reference
+    cycles, as any other DescriptedABC subclass instances. The method close()
+    resets the typed fields to the default values, but keeps the row.
+    
+    Class methods:
+        fromMapping(): dict(str -> type A)/, *args, **kwargs/ -> DescriptedABC
+        getClassFields(): None -> list(str)
+        getClassInfo(): None -> str
+        getClassMethods(): None -> list(str)
+        getTypedFields(): None -> list(str)
+        inspectClassAttribute(): str -> FieldInfo OR MethodInfo
+    
+    Methods:
+        getFields(): None -> list(str)
+        getInfo(): None -> str
+        getMethods(): None -> list(str)
+        addFinalizer(): callable/, *args, **kwargs/ -> None
+        close(): None -> None
+        fastCopy(): None -> DescriptedABC
+        inspectAttribute(): str -> FieldInfo OR MethodInfo
+        setFields(): dict(str -> type A) -> None
+    
+    Version 0.0.1.0
+    """
+    
+    #class fields
+    
+    __metaclass__ = TypedRecordABC_Meta
+    
+    __slots__ = ('_iRow', )
+    
+    #special methods
+    
+    def __new__(cls, *args, **kwargs):
+        """
+        Special method - creation of a new instance. Allocates the row of the
+        instance in the slab of the class and registers its release upon the
+        garbage collection of the instance.
+        
+        Signature:
+            /*args, **kwargs/ -> TypedRecordABC
+        
+        Args:
+            *args: (optional), any amount of arguments of any types, not used
+            **kwargs: (optional), keyword, any amount of arguments of any types,
+                not used
+        
+        Version 0.0.1.1
+        """
+        objNew = super(TypedRecordABC, cls).__new__(cls)
+        objSlab = cls._objSlab
+        iRow = objSlab.allocate()
+        object.__setattr__(objNew, '_iRow', iRow)
+        objRef = weakref.ref(objNew, _releaseRow)
+        _dictRows[id(objRef)] = (objRef, objSlab, iRow)
+        return objNew
+    
+    def __setattr__(self, strAttr, gValue):
+        """
+        Special method. The assignment to a typed field is redirected into the
+        slab, any other assignment is processed as by DescriptedSlotsABC.
+        
+        Signature:
+            str, type A -> None
+        
+        Args:
+            strAttr: string, name of the attribute to be changed in value
+            gValue: any type, value to be assigned to the attribute
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the value assigned to a typed field
+                is of the wrong type
+            pos.exceptions.CustomValueError: the value assigned to a typed
+                field is out of the range
+        
+        Version 0.0.1.0
+        """
+        objField = type(self)._objSlab.Fields.get(strAttr, None)
+        if objField is None:
+            super(TypedRecordABC, self).__setattr__(strAttr, gValue)
+        else:
+            objField.__set__(self, gValue)
+    
+    def __getstate__(self):
+        """
+        Special method. Returns the state of the instance for pickling and
+        copying - see DescriptedABC.__getstate__(). The values of the typed
+        fields are included with the assigned slots, whereas the row index is
+        not.
+        
+        Signature:
+            None -> tuple(None, dict(str -> type A))
+        
+        Version 0.0.1.0
+        """
+        dictState, dictSlots = super(TypedRecordABC, self).__getstate__()
+        del dictSlots['_iRow']
+        for strAttr, objField in type(self)._objSlab.Fields.iteritems():
+            dictSlots[strAttr] = objField.__get__(self, None)
+        return (dictState, dictSlots)
+    
+    def __setstate__(self, tupState):
+        """
+        Special method. Restores the state of the instance - see the method
+        DescriptedABC.__setstate__(). The values of the typed fields are
+        checked and written into the slab.
+        
+        Signature:
+            tuple(None, dict(str -> type A) OR None) -> None
+        
+        Args:
+            tupState: tuple(None, dict(str -> type A) OR None), the values of
+                the attributes stored in the slots and the typed fields
+        
+        Raises:
+            pos.exceptions.NotExistingAttribute: the instances of the class do
+                not have a slot, for which a value is passed
+            pos.exceptions.CustomTypeError: a value of a typed field is of the
+                wrong type
+            pos.exceptions.CustomValueError: a value of a typed field is out of
+                the range
+        
+        Version 0.0.1.0
+        """
+        dictState, dictSlots = tupState
+        if dictSlots:
+            dictSlots = dict(dictSlots)
+            dictSlots.pop('_iRow', None)
+            for strAttr, objField in type(self)._objSlab.Fields.iteritems():
+                if strAttr in dictSlots:
+                    objField.__set__(self, dictSlots.pop(strAttr))
+        super(TypedRecordABC, self).__setstate__((dictState, dictSlots))
+    
+    #public class methods
+    
+    @classmethod
+    def getClassFields(cls):
+        """
+        Returns as a list of strings the names of all 'public' class data fields
+        - see DescriptedABC.getClassFields(). The typed fields are instance
+        attributes, thus they are not included.
+        
+        Signature:
+            None -> list(str)
+        
+        Version 0.0.1.0
+        """
+        dictFields = cls._objSlab.Fields
+        return [strAttr for strAttr
+                        in super(TypedRecordABC, cls).getClassFields()
+                                            if not (strAttr in dictFields)]
+    
+    @classmethod
+    def getTypedFields(cls):
+        """
+        Returns as a list of strings the names of all typed fields of the
+        class, sorted alphabetically.
+        
+        Signature:
+            None -> list(str)
+        
+        Version 0.0.1.0
+        """
+        return list(sorted(cls._objSlab.Fields))
+    
+    #public instance methods
+    
+    def close(self):
+        """
+        Releases the resources held by the instance - see the method
+        DescriptedSlotsABC.close(). The typed fields are reset to the default
+        values, whereas the row of the instance is kept.
+        
+        Signature:
+            None -> None
+        
+        Version 0.0.1.0
+        """
+        iRow = object.__getattribute__(self, '_iRow')
+        super(TypedRecordABC, self).close()
+        object.__setattr__(self, '_iRow', iRow)
+        type(self)._objSlab.reset(iRow)
+    
+    def setFields(self, dictMapping):
+        """
+        Assigns the values of several attributes at once with the same result
+        as assignment of them one by one - see DescriptedABC.setFields(). The
+        values of the typed fields are checked and written into the slab.
+        
+        Signature:
+            dict(str -> type A) -> None
+        
+        Args:
+            dictMapping: dict(str -> type A), mapping of the names of the
+                attributes onto their values
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the argument is not a mapping, or
+                a value of a typed field is of the wrong type
+            pos.exceptions.CustomValueError: a value of a typed field is out of
+                the range
+        
+        Version 0.0.1.0
+        """
+        if not (type(dictMapping) is dict
+                        or isinstance(dictMapping, collections.Mapping)):
+            raise CustomTypeError(dictMapping, collections.Mapping)
+        getField = type(self)._objSlab.Fields.get
+        dictOther = {}
+        for strAttr, gValue in dictMapping.iteritems():
+            objField = getField(strAttr, None)
+            if objField is None:
+                dictOther[strAttr] = gValue
+            else:
+                objField.__set__(self, gValue)
+        if dictOther:
+            super(TypedRecordABC, self).setFields(dictOther)
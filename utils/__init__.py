@@ -7,7 +7,9 @@ Utility / helper modules of the pos library.
 Modules:
     attr_info - classes to store and produce a string information on the class'
         attributes
-    contracts - ???
+    contract_files - loading of the Design by Contract tables from the JSON
+        files with the on-disk cache
+    contracts - compiled Design by Contract checks of the functions and methods
     docstring_parsers - extraction or removal of documentation auto-generation
         related data from the docstring
     dynamic_import - import of modules or objects from modules dynamically, i.e.
@@ -18,9 +20,9 @@ Modules:
         traceback
 """
 
-__version__ = "0.0.1.3"
-__date__ = "26-10-2018"
+__version__ = "0.0.1.5"
+__date__ = "18-10-2026"
 __status__ = "Development"
 
 __all__ = ['traceback', 'attr_info', 'docstring_parsers', 'dynamic_import',
-            'loggers']
\ No newline at end of file
+            'loggers', 'contracts', 'contract_files']
\ No newline at end of file
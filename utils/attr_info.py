@@ -11,10 +11,17 @@ Classes:
         MethodInfo
 """
 
-__version__ = "0.0.1.0"
-__date__ = "10-07-2018"
+__version__ = "0.0.1.1"
+__date__ = "18-10-2026"
 __status__ = "Development"
 
+#imports
+
+#+ my libraries
+
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.utils.docstring_parsers import AAParser
+
 #classes
 
 class AttributeInfo(object):
@@ -28,24 +35,34 @@ class AttributeInfo(object):
         Contract: ??? OR None,
             design contract associated with this method / property
     
-    Version 0.0.1.0
+    The signature is extracted from the source docstring (if passed upon
+    instantiation) lazily, i.e. upon the first read access to the property
+    Signature, unless it is assigned explicitly before.
+    
+    Version 0.0.1.1
     """
     
     #special methods
     
-    def __init__(self):
+    def __init__(self, strDocstring = None):
         """
-        Initialization methods. Sets all instance attributes to None.
+        Initialization methods. Sets all instance attributes to None, and stores
+        the source docstring to be parsed upon the first access.
         
         Signature:
-            None -> None
+            /str OR None/ -> None
         
-        Version 0.0.1.0
+        Args:
+            strDocstring: (optional) str OR None, the docstring of the inspected
+                attribute
+        
+        Version 0.0.1.1
         """
         self.Name = None
         self.Type = None
-        self.Signature = None
         self.Contract = None
+        self._Docstring = strDocstring
+        self._dictParsed = {}
     
     def __repr__(self):
         """
@@ -58,6 +75,63 @@ class AttributeInfo(object):
         Version 0.0.1.0
         """
         return '{}({})'.format(self.__class__.__name__, self.Name)
+    
+    #'private' / helper methods
+    
+    def _getParsed(self, strField, funcParser):
+        """
+        Returns the value of a field extracted from the source docstring using
+        the passed parser function upon the first call, and the stored value
+        afterwards. An improper (empty) or missing docstring results in None.
+        
+        Signature:
+            str, function(str -> str OR None) -> str OR None
+        
+        Args:
+            strField: str, name of the field
+            funcParser: function(str -> str OR None), the docstring parser
+        
+        Version 0.0.1.0
+        """
+        if not (strField in self._dictParsed):
+            gResult = None
+            if not (self._Docstring is None):
+                try:
+                    gResult = funcParser(self._Docstring)
+                except (CustomTypeError, CustomValueError):
+                    pass
+            self._dictParsed[strField] = gResult
+        return self._dictParsed[strField]
+    
+    #properties
+    
+    @property
+    def Signature(self):
+        """
+        Getter property. The method / property signature, e.g. 'int -> str',
+        extracted from the source docstring upon the first access.
+        
+        Signature:
+            None -> str OR None
+        
+        Version 0.0.1.0
+        """
+        return self._getParsed('Signature', AAParser.extractSignature)
+    
+    @Signature.setter
+    def Signature(self, strSignature):
+        """
+        Setter property. Sets the method / property signature explicitly.
+        
+        Signature:
+            str OR None -> None
+        
+        Args:
+            strSignature: str OR None, the signature
+        
+        Version 0.0.1.0
+        """
+        self._dictParsed['Signature'] = strSignature
 
 class FieldInfo(AttributeInfo):
     """
@@ -78,21 +152,26 @@ class FieldInfo(AttributeInfo):
             only read access
         Scope: str OR None, if this field is a class or instance attribute
     
-    Version 0.0.1.0
+    Version 0.0.1.1
     """
     
     #special methods
     
-    def __init__(self):
+    def __init__(self, strDocstring = None):
         """
-        Initialization methods. Sets all instance attributes to None.
+        Initialization methods. Sets all instance attributes to None, and stores
+        the source docstring to be parsed upon the first access.
         
         Signature:
-            None -> None
+            /str OR None/ -> None
         
-        Version 0.0.1.0
+        Args:
+            strDocstring: (optional) str OR None, the docstring of the inspected
+                attribute
+        
+        Version 0.0.1.1
         """
-        super(FieldInfo, self).__init__()
+        super(FieldInfo, self).__init__(strDocstring)
         self.RealType = None
         self.Access = None
         self.Scope = None
@@ -112,19 +191,57 @@ class MethodInfo(AttributeInfo):
             all data related to the auto-generation of documentation being
             removed
     
-    Version 0.0.1.0
+    The reduced docstring is produced from the source docstring (if passed
+    upon instantiation) lazily, i.e. upon the first read access to the property
+    DocString, unless it is assigned explicitly before.
+    
+    Version 0.0.1.1
     """
     
     #special methods
     
-    def __init__(self):
+    def __init__(self, strDocstring = None):
         """
-        Initialization methods. Sets all instance attributes to None.
+        Initialization methods. Sets all instance attributes to None, and stores
+        the source docstring to be parsed upon the first access.
         
         Signature:
-            None -> None
+            /str OR None/ -> None
+        
+        Args:
+            strDocstring: (optional) str OR None, the docstring of the inspected
+                method
+        
+        Version 0.0.1.1
+        """
+        super(MethodInfo, self).__init__(strDocstring)
+    
+    #properties
+    
+    @property
+    def DocString(self):
+        """
+        Getter property. The reduced docstring of the method, produced from the
+        source docstring upon the first access.
+        
+        Signature:
+            None -> str OR None
+        
+        Version 0.0.1.0
+        """
+        return self._getParsed('DocString', AAParser.reduceDocstring)
+    
+    @DocString.setter
+    def DocString(self, strDocstring):
+        """
+        Setter property. Sets the reduced docstring explicitly.
+        
+        Signature:
+            str OR None -> None
+        
+        Args:
+            strDocstring: str OR None, the reduced docstring
         
         Version 0.0.1.0
         """
-        super(MethodInfo, self).__init__()
-        self.DocString = None
\ No newline at end of file
+        self._dictParsed['DocString'] = strDocstring
\ No newline at end of file
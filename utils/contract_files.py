@@ -0,0 +1,546 @@
+#usr/bin/python
+"""
+Module pos.utils.contract_files
+
+Implements the loading of the Design by Contract look-up tables (see
+pos.utils.contracts) from the JSON files. The structure of a table is
+validated, the names of the classes are resolved and all contracts are
+compiled once, after which the validated table is stored beside the source
+file in the marshal format together with the hash of the source content and
+the version of the library. The later loads of the same file skip the
+parsing, validation and compilation: the cached table is unmarshalled, the
+classes are resolved at the known locations and the contracts are compiled
+lazily, when they are bound to the functions.
+
+The compiled check closures cannot be serialized, therefore the cache stores
+the validated table, from which the closures are re-created on demand.
+
+JSON contract file - object mapping the function / method names to the
+contracts with the same structure as the dictionaries (see pos.utils.contracts)
+with the following representation of the rules:
+    "name" - class: a built-in class name (e.g. "int") or the dotted path of
+        a class within an importable module (e.g. "collections.Mapping")
+    null - the value must be None
+    [rule, ...] - alternative rules
+    {...} - rule with the same keys as the dictionary rules, the classes of
+        the 'Type', 'NotType' and 'SubClass' keys are given by the names;
+        'Items' can be either an object (string keys of a mapping) or a list
+        of [key, rule] pairs, e.g. for the integer indexes of a sequence
+
+Usage as a script - precompiles all JSON files in the folders recursively:
+    python -m pos.utils.contract_files FOLDER [FOLDER ...]
+
+Functions:
+    getCachePath(strPath):
+        str -> str
+    loadContractFile(strPath, bCache = True):
+        str/, bool/ -> pos.utils.contracts.ContractTable
+    precompileFolder(strFolder, bRecursive = True):
+        str/, bool/ -> list(tuple(str, str/None))
+    main(lstArgs = None):
+        /list(str)/ -> int
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+
+#imports
+
+#+ standard libraries
+
+import __builtin__
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+import types
+
+#+ other modules from this library
+
+import pos
+
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.utils.contracts import CONTRACT_KEYS, RULE_KEYS, STREAM_KEYS
+from pos.utils.contracts import ContractTable
+from pos.utils.contracts import __version__ as CONTRACTS_VERSION
+from pos.utils.dynamic_import import import_from_module
+
+#globals
+
+CACHE_SUFFIX = '.dbc' #extension added to the source file name
+
+CACHE_MAGIC = 'pos.dbc' #marker of the cache files
+
+#+ version of the library, which the cache is valid for
+
+CACHE_VERSION = '{}/{}/{}'.format(pos.__version__, CONTRACTS_VERSION,
+                                                                __version__)
+
+#+ rule keys by the kind of their values
+
+_CLASS_KEYS = ('Type', 'NotType', 'SubClass')
+
+_RULE_VALUE_KEYS = ('Elements', 'Keys')
+
+#functions
+
+#+ helper functions
+
+def _checkName(gName):
+    """
+    Helper function to check that a name is a string and to convert it into a
+    byte string.
+    
+    Signature:
+        type A -> str
+    
+    Raises:
+        pos.exceptions.CustomTypeError: not a string
+        pos.exceptions.CustomValueError: not ASCII string
+    
+    Version 0.0.1.0
+    """
+    if not isinstance(gName, basestring):
+        raise CustomTypeError(gName, basestring)
+    try:
+        return str(gName)
+    except UnicodeError:
+        raise CustomValueError(gName, 'ASCII name')
+
+def _normalizeClasses(gValue, tupPath, lstClasses):
+    """
+    Helper function to validate a class name or a list of the class names
+    and to record their locations.
+    
+    Signature:
+        type A, tuple, list(tuple) -> str/list(str)
+    
+    Raises:
+        pos.exceptions.CustomTypeError: not a string or a list of strings
+        pos.exceptions.CustomValueError: empty list or not ASCII string
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gValue, list):
+        if not gValue:
+            raise CustomValueError(gValue, 'not empty list of class names')
+        lstClasses.extend(tupPath + (iIndex, )
+                                        for iIndex in range(len(gValue)))
+        return [_checkName(gName) for gName in gValue]
+    lstClasses.append(tupPath)
+    return _checkName(gValue)
+
+def _normalizeItems(gItems, tupPath, lstClasses):
+    """
+    Helper function to validate and convert the 'Items' rules given as an
+    object or a list of [key, rule] pairs into a dictionary.
+    
+    Signature:
+        dict/list, tuple, list(tuple) -> dict
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper type of an element
+        pos.exceptions.CustomValueError: improper value of an element
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gItems, dict):
+        lstPairs = gItems.items()
+    elif isinstance(gItems, list):
+        lstPairs = []
+        for gPair in gItems:
+            if not isinstance(gPair, list):
+                raise CustomTypeError(gPair, list)
+            if len(gPair) != 2:
+                raise CustomValueError(gPair, '[key, rule] pair')
+            lstPairs.append(tuple(gPair))
+    else:
+        raise CustomTypeError(gItems, dict)
+    dictItems = {}
+    for gKey, gRule in lstPairs:
+        if isinstance(gKey, (dict, list)):
+            raise CustomTypeError(gKey, basestring)
+        dictItems[gKey] = _normalizeRule(gRule, tupPath + (gKey, ),
+                                                                lstClasses)
+    return dictItems
+
+def _normalizeRule(gRule, tupPath, lstClasses):
+    """
+    Helper function to validate the structure of a rule decoded from JSON, to
+    convert it into the form accepted by pos.utils.contracts (except for the
+    class names) and to record the locations of the class names.
+    
+    Signature:
+        type A, tuple, list(tuple) -> type B
+    
+    Args:
+        gRule: type A, the decoded rule
+        tupPath: tuple, keys / indexes of the rule location within the table
+        lstClasses: list(tuple), the locations of the class names found so
+            far, modified in place
+    
+    Returns:
+        type B: the normalized rule
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper type of a rule element
+        pos.exceptions.CustomValueError: unknown key or improper value of a
+            rule element
+    
+    Version 0.0.1.0
+    """
+    if gRule is None:
+        return None
+    if isinstance(gRule, basestring):
+        return _normalizeClasses(gRule, tupPath, lstClasses)
+    if isinstance(gRule, list):
+        return [_normalizeRule(gItem, tupPath + (iIndex, ), lstClasses)
+                                        for iIndex, gItem in enumerate(gRule)]
+    if not isinstance(gRule, dict):
+        raise CustomTypeError(gRule, dict)
+    dictRule = {}
+    for gKey, gValue in gRule.items():
+        strKey = _checkName(gKey)
+        if not (strKey in RULE_KEYS):
+            raise CustomValueError(strKey, 'a rule key in {}'.format(
+                                                                RULE_KEYS))
+        tupKey = tupPath + (strKey, )
+        if strKey in _CLASS_KEYS:
+            gValue = _normalizeClasses(gValue, tupKey, lstClasses)
+        elif strKey in _RULE_VALUE_KEYS:
+            gValue = _normalizeRule(gValue, tupKey, lstClasses)
+        elif strKey == 'Items':
+            gValue = _normalizeItems(gValue, tupKey, lstClasses)
+        elif strKey == 'Attributes':
+            if not isinstance(gValue, dict):
+                raise CustomTypeError(gValue, dict)
+            gValue = dict((_checkName(gName), _normalizeRule(gAttr,
+                                        tupKey + (_checkName(gName), ),
+                                                                lstClasses))
+                                            for gName, gAttr in gValue.items())
+        elif strKey == 'Stream':
+            if not isinstance(gValue, dict):
+                raise CustomTypeError(gValue, dict)
+            dictStream = {}
+            for gName, gItem in gValue.items():
+                strName = _checkName(gName)
+                if not (strName in STREAM_KEYS):
+                    raise CustomValueError(strName,
+                                'a stream rule key in {}'.format(STREAM_KEYS))
+                if strName == 'Elements':
+                    gItem = _normalizeRule(gItem, tupKey + (strName, ),
+                                                                lstClasses)
+                dictStream[strName] = gItem
+            gValue = dictStream
+        dictRule[strKey] = gValue
+    return dictRule
+
+def _normalizeTable(gTable):
+    """
+    Helper function to validate the structure of a contracts table decoded
+    from JSON and to convert it into the form accepted by pos.utils.contracts
+    except for the class names, which locations are returned separately.
+    
+    Signature:
+        type A -> tuple(dict(str -> dict), list(tuple))
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper type of a table element
+        pos.exceptions.CustomValueError: unknown key or improper value of a
+            table element
+    
+    Version 0.0.1.0
+    """
+    if not isinstance(gTable, dict):
+        raise CustomTypeError(gTable, dict)
+    dictTable = {}
+    lstClasses = []
+    for gName, gContract in gTable.items():
+        strName = _checkName(gName)
+        if not isinstance(gContract, dict):
+            raise CustomTypeError(gContract, dict)
+        dictContract = {}
+        for gKey, gValue in gContract.items():
+            strKey = _checkName(gKey)
+            tupPath = (strName, strKey)
+            if not (strKey in CONTRACT_KEYS):
+                raise CustomValueError(strKey, 'a contract key in {}'.format(
+                                                            CONTRACT_KEYS))
+            if strKey == 'Args':
+                if not isinstance(gValue, dict):
+                    raise CustomTypeError(gValue, dict)
+                gValue = dict((_checkName(gArg), _normalizeRule(gRule,
+                                        tupPath + (_checkName(gArg), ),
+                                                                lstClasses))
+                                            for gArg, gRule in gValue.items())
+            elif strKey == 'Keywords':
+                if not isinstance(gValue, list):
+                    raise CustomTypeError(gValue, list)
+                gValue = [_checkName(gArg) for gArg in gValue]
+            else:
+                gValue = _normalizeRule(gValue, tupPath, lstClasses)
+            dictContract[strKey] = gValue
+        dictTable[strName] = dictContract
+    return dictTable, lstClasses
+
+def _resolveClass(strName, dictResolved):
+    """
+    Helper function to find a class by its built-in name or dotted path. The
+    resolved classes are cached in the passed dictionary.
+    
+    Signature:
+        str, dict(str -> class) -> class
+    
+    Raises:
+        pos.exceptions.CustomTypeError: the name refers not to a class
+        pos.exceptions.CustomValueError: the class is not found
+    
+    Version 0.0.1.0
+    """
+    if strName in dictResolved:
+        return dictResolved[strName]
+    strModule, _, strClass = strName.rpartition('.')
+    try:
+        if strModule:
+            gObject = import_from_module(strModule, strClass, dictGlobals = {})
+        else:
+            gObject = getattr(__builtin__, strClass)
+    except (ImportError, AttributeError, ValueError):
+        raise CustomValueError(strName, 'name of an existing class')
+    if not isinstance(gObject, (type, types.ClassType)):
+        raise CustomTypeError(gObject, type)
+    dictResolved[strName] = gObject
+    return gObject
+
+def _resolveTable(dictTable, lstClasses):
+    """
+    Helper function to replace the class names at the recorded locations
+    within a normalized table by the classes themselves, in place.
+    
+    Signature:
+        dict(str -> dict), list(tuple) -> None
+    
+    Raises:
+        pos.exceptions.CustomTypeError: a name refers not to a class
+        pos.exceptions.CustomValueError: a class is not found
+    
+    Version 0.0.1.0
+    """
+    dictResolved = {}
+    for tupPath in lstClasses:
+        gContainer = dictTable
+        for gKey in tupPath[:-1]:
+            gContainer = gContainer[gKey]
+        gContainer[tupPath[-1]] = _resolveClass(gContainer[tupPath[-1]],
+                                                                dictResolved)
+
+def _readCache(strPath, strHash):
+    """
+    Helper function to read the cached normalized table, if it exists and is
+    valid for the hash of the source file content and the library version.
+    
+    Signature:
+        str, str -> tuple(dict(str -> dict), list(tuple))/None
+    
+    Version 0.0.1.0
+    """
+    try:
+        with open(getCachePath(strPath), 'rb') as fileCache:
+            tupCache = marshal.load(fileCache)
+    except (IOError, OSError, EOFError, ValueError, TypeError):
+        return None
+    if (isinstance(tupCache, tuple) and len(tupCache) == 5
+            and tupCache[:3] == (CACHE_MAGIC, CACHE_VERSION, strHash)
+                and isinstance(tupCache[3], dict)
+                                        and isinstance(tupCache[4], list)):
+        return tupCache[3], tupCache[4]
+    return None
+
+def _writeCache(strPath, strData):
+    """
+    Helper function to store the marshalled normalized table beside the
+    source file. The file is replaced atomically, and the write errors (e.g.
+    read-only folder) are ignored.
+    
+    Signature:
+        str, str -> bool
+    
+    Version 0.0.1.0
+    """
+    strCache = getCachePath(strPath)
+    try:
+        iHandle, strTemp = tempfile.mkstemp(suffix = CACHE_SUFFIX,
+                                        dir = os.path.dirname(strCache) or '.')
+    except (IOError, OSError):
+        return False
+    try:
+        with os.fdopen(iHandle, 'wb') as fileCache:
+            fileCache.write(strData)
+        try:
+            os.rename(strTemp, strCache)
+        except OSError: #Windows does not replace the existing files
+            os.remove(strCache)
+            os.rename(strTemp, strCache)
+    except (IOError, OSError):
+        if os.path.exists(strTemp):
+            os.remove(strTemp)
+        return False
+    return True
+
+#+ main functions
+
+def getCachePath(strPath):
+    """
+    Returns the path to the cache file of a JSON contract file.
+    
+    Signature:
+        str -> str
+    
+    Raises:
+        pos.exceptions.CustomTypeError: the path is not a string
+    
+    Version 0.0.1.0
+    """
+    if not isinstance(strPath, basestring):
+        raise CustomTypeError(strPath, basestring)
+    return strPath + CACHE_SUFFIX
+
+def loadContractFile(strPath, bCache = True):
+    """
+    Loads the Design by Contract look-up table from a JSON file. If the valid
+    cache exists, the table is read from it, and the contracts are compiled
+    lazily. Otherwise, the file is parsed, the table is validated, all its
+    contracts are compiled, and the cache is (re-) created.
+    
+    Signature:
+        str/, bool/ -> pos.utils.contracts.ContractTable
+    
+    Args:
+        strPath: string, path to the JSON file
+        bCache: (optional) boolean, the cache is used and updated
+    
+    Returns:
+        pos.utils.contracts.ContractTable: the look-up table of the contracts
+    
+    Raises:
+        IOError: the file cannot be read
+        pos.exceptions.CustomTypeError: the path is not a string, or improper
+            type of a table element
+        pos.exceptions.CustomValueError: not a valid JSON, or unknown key or
+            improper value of a table element, or unknown class
+    
+    Version 0.0.1.0
+    """
+    if not isinstance(strPath, basestring):
+        raise CustomTypeError(strPath, basestring)
+    with open(strPath, 'rb') as fileSource:
+        strSource = fileSource.read()
+    strHash = hashlib.sha1(strSource).hexdigest()
+    tupCache = _readCache(strPath, strHash) if bCache else None
+    if tupCache is not None:
+        dictTable, lstClasses = tupCache
+        _resolveTable(dictTable, lstClasses)
+        return ContractTable(dictTable)
+    try:
+        gTable = json.loads(strSource)
+    except ValueError as objError:
+        raise CustomValueError(strPath, 'valid JSON file: {}'.format(objError))
+    dictTable, lstClasses = _normalizeTable(gTable)
+    strData = marshal.dumps((CACHE_MAGIC, CACHE_VERSION, strHash, dictTable,
+                                                                lstClasses))
+    _resolveTable(dictTable, lstClasses)
+    objTable = ContractTable(dictTable)
+    for strName in objTable:
+        objTable.getContract(strName)
+    if bCache:
+        _writeCache(strPath, strData)
+    return objTable
+
+def precompileFolder(strFolder, bRecursive = True):
+    """
+    Loads all JSON contract files in a folder, optionally, recursively, thus
+    (re-) creating the outdated caches.
+    
+    Signature:
+        str/, bool/ -> list(tuple(str, str/None))
+    
+    Args:
+        strFolder: string, path to the folder
+        bRecursive: (optional) boolean, the sub-folders are processed as well
+    
+    Returns:
+        list(tuple(str, str/None)): the paths to the processed files paired
+            with the error messages or None if the file is loaded
+    
+    Raises:
+        pos.exceptions.CustomTypeError: the path is not a string
+        pos.exceptions.CustomValueError: the path is not a folder
+    
+    Version 0.0.1.0
+    """
+    if not isinstance(strFolder, basestring):
+        raise CustomTypeError(strFolder, basestring)
+    if not os.path.isdir(strFolder):
+        raise CustomValueError(strFolder, 'path to a folder')
+    lstResult = []
+    for strRoot, lstFolders, lstFiles in os.walk(strFolder):
+        lstFolders.sort()
+        if not bRecursive:
+            del lstFolders[:]
+        for strFile in sorted(lstFiles):
+            if strFile.lower().endswith('.json'):
+                strPath = os.path.join(strRoot, strFile)
+                try:
+                    loadContractFile(strPath)
+                    strError = None
+                except (IOError, CustomTypeError, CustomValueError) as objErr:
+                    strError = '{}: {}'.format(objErr.__class__.__name__,
+                                                                    objErr)
+                lstResult.append((strPath, strError))
+    return lstResult
+
+def main(lstArgs = None):
+    """
+    Command line entry point: precompiles the JSON contract files in the
+    passed folders and prints out the results.
+    
+    Signature:
+        /list(str)/ -> int
+    
+    Args:
+        lstArgs: (optional) list(str), the paths to the folders, by default -
+            the command line arguments
+    
+    Returns:
+        int: the exit code, 0 - all files are compiled, 1 - errors, 2 - usage
+    
+    Version 0.0.1.0
+    """
+    if lstArgs is None:
+        lstArgs = sys.argv[1:]
+    if not lstArgs:
+        sys.stderr.write('Usage: python -m pos.utils.contract_files FOLDER '
+                                                            '[FOLDER ...]\n')
+        return 2
+    iResult = 0
+    for strFolder in lstArgs:
+        try:
+            lstFiles = precompileFolder(strFolder)
+        except CustomValueError:
+            sys.stderr.write('Not a folder: {}\n'.format(strFolder))
+            iResult = 1
+            continue
+        for strPath, strError in lstFiles:
+            if strError is None:
+                sys.stdout.write('Compiled: {}\n'.format(strPath))
+            else:
+                sys.stderr.write('Failed: {} - {}\n'.format(strPath, strError))
+                iResult = 1
+    sys.stdout.flush()
+    return iResult
+
+if __name__ == '__main__':
+    sys.exit(main())
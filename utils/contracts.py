@@ -0,0 +1,3070 @@
+#usr/bin/python
+"""
+Module pos.utils.contracts
+
+Implements the Design by Contract checks of the functions and methods. A
+contract is defined as a dictionary (see below), and it is compiled only once,
+when the decorator is applied, into a specialized checking closure. The
+closure finds the controlled arguments by their precomputed positions / names
+in the received positional and keyword arguments, performs the cheapest
+checks first and calls the actual function only if all checks are passed.
+
+The contracts are grouped into the look-up tables (dictionaries) using the
+names of the functions / methods as the keys, see DE001 and DE002.
+
+The checks can be enabled / disabled at the run-time globally or per module.
+The decorated functions, methods, properties and class methods are registered,
+and the switch rebinds them in the module of their definition and its classes
+either to the checked versions or to the unchecked callables, so the disabled
+checks cost nothing at all.
+
+A sampling policy can be passed to the decorator to check only a part of the
+calls, e.g. in production. Such call sites keep the counters of the calls,
+checked calls and violations, which are reported by getContractStats().
+
+The verdicts of the type checks against the classes with the custom
+meta-classes (e.g. ABCs with __subclasshook__() or virtual subclasses) are
+cached per rule and keyed on the type of the value, so the repeated calls with
+the same argument types skip the isinstance() machinery. It is assumed that
+such verdicts depend only on the type of the value, not on its state.
+
+The 'Elements' rules consisting only of a type check and / or comparisons are
+evaluated in the vectorized form on the numeric arrays: array.array, the
+1-dimensional memoryview buffers and, if NumPy is installed, 1-dimensional
+numpy.ndarray. The type is checked once per array typecode / dtype, and the
+bounds - by the min / max or mask reductions; the element-wise check is
+performed only on the first offending element found, so the reported failure
+and its index are the same as with the generic per-element loop. Since the
+memoryview does not expose the typed elements under Python 2, the content of
+a buffer is copied once: into an array.array, if its format is supported by
+the array module in the native byte order, or otherwise decoded into a list
+(e.g. the formats '?', 'q', 'Q', the non-native byte order or the
+multi-dimensional buffers), which is checked element by element.
+
+The iterators and generators passed as the arguments or returned are checked
+lazily: the 'Stream' rule (see below) replaces such a value by a checking
+iterator, which validates each element as it is consumed and the length bounds
+upon the exhaustion, thus in the constant memory. The other iterables (e.g.
+lists) are checked eagerly against the same 'Stream' rule and passed as they
+are.
+
+The argument rules of a contract can be applied to a batch of records (dicts
+or tuples of the argument values) with validateBatch(), which distributes the
+chunks of the records among a pool of processes and collects the violations as
+(index, rule, value representation) tuples instead of raising exceptions.
+
+Design Contract - dictionary with the optional keys:
+    'Args' : dict(str -> rule) - rules on the arguments mapped onto the named
+        parameters or collected by the **kwargs placeholder
+    'VarArgs' : rule - rule on the tuple of the optional positional arguments
+        collected by the *args placeholder, e.g. the length bounds, 'Items' by
+        the position and 'Elements' as the generic rule
+    'Keywords' : seq(str) - all allowed names of the keyword arguments
+    'Returns' : rule - rule on the returned value
+
+The rules on the arguments and on the returned value (but not the nested ones
+and not the 'VarArgs' rule) can have the key 'Stream' : dict - the value must
+be an iterable, which elements are checked lazily (see above), with the
+optional keys:
+    'Elements' : rule - rule on each element
+    'Length', 'MinLength', 'MaxLength' : int - the number of the elements is
+        exactly / at least / at most the specified number
+
+Rule - one of:
+    class or old-style class - the value must be an instance of it
+    None - the value must be None
+    list or tuple of rules - any of the rules must be passed (OR)
+    dict - all defined checks must be passed (AND):
+        'Type' : class or seq(class) - the value is an instance of any
+        'NotType' : class or seq(class) - the value is not an instance of any
+        'SubClass' : class or seq(class) - the value is a subclass of any
+        'Callable' : bool - the value is callable
+        'In' / 'NotIn' : seq - the value is / is not one of the values
+        'NE', 'GT', 'GE', 'LT', 'LE' : type A - the value is not equal to /
+            greater than / greater than or equal to / less than / less than or
+            equal to the specified value
+        'Length', 'MinLength', 'MaxLength' : int - the length of the value is
+            exactly / at least / at most the specified number
+        'Attributes' : dict(str -> rule or None) - the value has the
+            attributes, optionally with the rules applied to them
+        'Items' : dict(int or type A -> rule) - rules on the elements of a
+            sequence (not a string) by index or on the values of a mapping by
+            key
+        'Elements' : rule - rule on all other elements of a sequence or all
+            other values of a mapping
+        'Keys' : rule - rule on all keys of a mapping
+
+Classes:
+    SamplingPolicy: abstract base class of the sampling policies
+    SampleEveryNth: check the first and then every N-th call
+    SampleFirstThenEveryNth: check the first K calls, then every N-th call
+    SampleTimeBudget: check while the checks take at most a fraction of the
+        wall time
+    Contract: compiled Design Contract of a single function / method
+    ContractTable: look-up table of the Design Contracts
+
+Functions:
+    applyContract(gTable, strName = None, objSampling = None):
+        dict(str -> dict)/ContractTable/, str, SamplingPolicy/ -> function
+    enableContracts(strModule = None):
+        /str/ -> int
+    disableContracts(strModule = None):
+        /str/ -> int
+    areContractsEnabled(strModule = None):
+        /str/ -> bool
+    getContractStats(strModule = None):
+        /str/ -> dict(str -> dict(str -> int/float))
+    resetContractStats(strModule = None):
+        /str/ -> None
+    clearTypeCaches():
+        None -> None
+    validateBatch(gContract, seqRecords, iWorkers = 1, iChunk = 1000,
+                    seqFields = None):
+        Contract/function, iterable(dict/tuple)/, int, int, seq(str)/
+            -> list(tuple(int, str, str))
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+
+#imports
+
+#+ standard libraries
+
+import abc
+import array
+import collections
+import functools
+import inspect
+import itertools
+import multiprocessing
+import operator
+import struct
+import sys
+import threading
+import timeit
+import types
+
+#+ third party libraries (optional)
+
+try:
+    import numpy
+except ImportError: #NumPy is not installed
+    numpy = None
+
+#+ other modules from this library
+
+from pos.exceptions import CustomTypeError, CustomValueError
+from pos.exceptions import NotInDCError
+from pos.exceptions import DCArgumentType, DCArgumentValue
+from pos.exceptions import DCReturnType, DCReturnValue
+from pos.base_classes import _invalidateAttribute
+
+#globals
+
+#+ allowed keys of a contract and of a rule
+
+CONTRACT_KEYS = ('Args', 'VarArgs', 'Keywords', 'Returns')
+
+RULE_KEYS = ('Type', 'NotType', 'SubClass', 'Callable', 'In', 'NotIn', 'NE',
+                'GT', 'GE', 'LT', 'LE', 'Length', 'MinLength', 'MaxLength',
+                'Attributes', 'Items', 'Elements', 'Keys', 'Stream')
+
+STREAM_KEYS = ('Elements', 'Length', 'MinLength', 'MaxLength')
+
+#+ comparison checks: key -> (function, sign)
+
+_COMPARISONS = {
+    'NE' : (operator.ne, '!='),
+    'GT' : (operator.gt, '>'),
+    'GE' : (operator.ge, '>='),
+    'LT' : (operator.lt, '<'),
+    'LE' : (operator.le, '<=')
+}
+
+#+ relative costs of the checks, the cheapest are performed first
+
+_COST_TYPE = 1
+
+_COST_VALUE = 2
+
+_COST_ATTRIBUTE = 3
+
+_COST_ITEMS = 5
+
+_COST_ELEMENTS = 20
+
+#+ class types
+
+_CLASS_TYPES = (type, types.ClassType)
+
+#+ registry of the controlled callables and the states of the checks per
+#+ module name, None is the key of the global state
+
+_LOCK = threading.RLock()
+
+_REGISTRY = []
+
+_SWITCHES = {None : True}
+
+#+ counters of the call sites with the sampling policies
+
+_SITES = []
+
+_timer = timeit.default_timer
+
+#+ contract violation exceptions
+
+_DC_ERRORS = (DCArgumentType, DCArgumentValue, DCReturnType, DCReturnValue)
+
+#+ caches of the type checks verdicts and their maximum size
+
+_TYPE_CACHES = []
+
+_CACHE_SIZE = 256
+
+#+ batch validation: contract and field names in a worker process, max length
+#+ of the offending value representation
+
+_BATCH = None
+
+_REPR_SIZE = 80
+
+#+ numeric arrays checked in the vectorized form
+
+_ARRAY_TYPES = (array.array, memoryview)
+
+if not (numpy is None):
+    _ARRAY_TYPES += (numpy.ndarray, )
+
+#+ rule keys allowed in the vectorized checks
+
+_VECTOR_KEYS = ('Type', 'NE', 'GT', 'GE', 'LT', 'LE')
+
+#+ numeric array typecode -> samples of the element values (min, max)
+
+_ARRAY_SAMPLES = {'f' : (0.0, ), 'd' : (0.0, )}
+
+for _strCode in 'bBhHiIlL':
+    _iBits = 8 * array.array(_strCode).itemsize - (not _strCode.isupper())
+    _ARRAY_SAMPLES[_strCode] = tuple(array.array(_strCode,
+                                            [- (_strCode.islower() << _iBits),
+                                                            (1 << _iBits) - 1]))
+
+del _strCode, _iBits
+
+#classes
+
+#+ helper classes
+
+class _Expected(object):
+    """
+    Helper class to describe the expected type(s) of a value, which is not a
+    single class, in the type check error messages. Has the attribute __name__
+    as it is required by the CustomTypeError exception.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('__name__', )
+    
+    def __init__(self, strName):
+        """
+        Initialization.
+        
+        Signature:
+            str -> None
+        
+        Version 0.0.1.0
+        """
+        self.__name__ = strName
+    
+    def __repr__(self):
+        """
+        Returns the description.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return self.__name__
+
+class _Binding(object):
+    """
+    Helper class to store a controlled callable registered by the decorator:
+    the module of its definition, the unchecked and checked versions and the
+    namespaces (module or classes) and names, under which it is bound.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('Module', 'Original', 'Checked', 'Returned', 'Locations')
+    
+    def __init__(self, strModule, gOriginal, gChecked, gReturned):
+        """
+        Initialization.
+        
+        Signature:
+            str, type A, type A, type A -> None
+        
+        Version 0.0.1.0
+        """
+        self.Module = strModule
+        self.Original = gOriginal
+        self.Checked = gChecked
+        self.Returned = gReturned
+        self.Locations = None
+
+class _Site(object):
+    """
+    Helper class to store the counters of a call site, i.e. of a controlled
+    function with a sampling policy: the number of the calls, of the checked
+    calls and of the contract violations, and the time spent in the checks.
+    Also stores the state of the time budget of the checks (see
+    SampleTimeBudget): the remaining budget, the time of its last update
+    (None before the first call) and the total time spent in the checks at
+    that moment.
+    
+    Version 0.0.1.1
+    """
+    
+    __slots__ = ('Module', 'Name', 'Calls', 'Checks', 'Violations',
+                    'CheckTime', 'Budget', 'Updated', 'Spent')
+    
+    def __init__(self, strModule, strName):
+        """
+        Initialization.
+        
+        Signature:
+            str, str -> None
+        
+        Version 0.0.1.0
+        """
+        self.Module = strModule
+        self.Name = strName
+        self.reset()
+    
+    def reset(self):
+        """
+        Resets the counters.
+        
+        Signature:
+            None -> None
+        
+        Version 0.0.1.1
+        """
+        self.Calls = 0
+        self.Checks = 0
+        self.Violations = 0
+        self.CheckTime = 0.0
+        self.Budget = 0.0
+        self.Updated = None
+        self.Spent = 0.0
+
+class _CheckedIterator(object):
+    """
+    Helper class wrapping an iterator, which elements are checked as they are
+    consumed, and the number of the elements - as soon as the maximum is
+    exceeded or upon the exhaustion. Only the iteration protocol is supported.
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('_funcNext', '_tupStream', '_strTarget', '_strFunction',
+                    '_bResult', '_objSite', '_iCount')
+    
+    def __init__(self, objIterator, tupStream, strTarget, strFunction,
+                                            bResult = False, objSite = None):
+        """
+        Initialization.
+        
+        Signature:
+            iterator, tuple(function/None, int, int/None), str, str/, bool,
+                _Site/None/ -> None
+        
+        Args:
+            objIterator: iterator, the checked iterator
+            tupStream: tuple(function/None, int, int/None), the compiled
+                'Stream' rule as the elements check, min and max length
+            strTarget: string, the checked argument description
+            strFunction: string, the name of the controlled function
+            bResult: (optional) boolean, the returned value is checked
+            objSite: (optional) _Site, the counters of the sampled call site
+        
+        Version 0.0.1.0
+        """
+        self._funcNext = objIterator.next
+        self._tupStream = tupStream
+        self._strTarget = strTarget
+        self._strFunction = strFunction
+        self._bResult = bResult
+        self._objSite = objSite
+        self._iCount = 0
+    
+    def __iter__(self):
+        """
+        Returns the iterator itself.
+        
+        Signature:
+            None -> _CheckedIterator
+        
+        Version 0.0.1.0
+        """
+        return self
+    
+    def next(self):
+        """
+        Returns the next element of the wrapped iterator after the checks.
+        
+        Signature:
+            None -> type A
+        
+        Raises:
+            StopIteration: the wrapped iterator is exhausted
+            pos.exceptions.DCArgumentType: type check on an element of an
+                argument is failed
+            pos.exceptions.DCArgumentValue: value check on an element or on
+                the length of an argument is failed
+            pos.exceptions.DCReturnType: type check on an element of the
+                result is failed
+            pos.exceptions.DCReturnValue: value check on an element or on the
+                length of the result is failed
+        
+        Version 0.0.1.0
+        """
+        fElements, iMin, iMax = self._tupStream
+        try:
+            gItem = self._funcNext()
+        except StopIteration:
+            if self._iCount < iMin:
+                self._fail((False, self._iCount, 'length >= {}'.format(iMin),
+                                                                        ''))
+            raise
+        iIndex = self._iCount
+        self._iCount += 1
+        if iMax is not None and self._iCount > iMax:
+            self._fail((False, self._iCount, 'length <= {}'.format(iMax), ''))
+        if fElements is not None:
+            tupFailure = fElements(gItem)
+            if tupFailure is not None:
+                self._fail(_prefixPath(tupFailure, '[{}]'.format(iIndex)))
+        return gItem
+    
+    def _fail(self, tupFailure):
+        """
+        Counts the violation for a sampled call site and raises the exception.
+        
+        Signature:
+            tuple(bool, type A, type B, str) -> None
+        
+        Version 0.0.1.0
+        """
+        if self._objSite is not None:
+            self._objSite.Violations += 1
+        _raiseFailure(tupFailure, self._strTarget, self._strFunction,
+                                                                self._bResult)
+
+_CALLABLE = _Expected('callable')
+
+_ITERABLE = _Expected('iterable')
+
+_RECORD = _Expected('dict, or tuple with the field names')
+
+_SIZED = _Expected('sized container')
+
+_CONTAINER = _Expected('sequence or mapping')
+
+_MAPPING = _Expected('mapping')
+
+_RULE = _Expected('class, list, tuple, dict or None')
+
+#+ sampling policies
+
+class SamplingPolicy(object):
+    """
+    Abstract base class of the sampling policies, which define the calls of
+    a controlled function to be checked. Each controlled function (call site)
+    keeps its own counters, which are passed to the sampler.
+    
+    Methods:
+        makeSampler():
+            None -> function(_Site -> bool)
+    
+    Version 0.0.1.0
+    """
+    
+    __metaclass__ = abc.ABCMeta
+    
+    __slots__ = ()
+    
+    @abc.abstractmethod
+    def makeSampler(self):
+        """
+        Creates the function, which receives the counters of a call site with
+        the current call already counted and returns True if this call must
+        be checked.
+        
+        Signature:
+            None -> function(_Site -> bool)
+        
+        Version 0.0.1.0
+        """
+        pass
+
+class SampleEveryNth(SamplingPolicy):
+    """
+    Sampling policy: the first call and then every N-th call are checked.
+    
+    Properties:
+        Period: int, read-only
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('_iPeriod', )
+    
+    def __init__(self, iPeriod):
+        """
+        Initialization.
+        
+        Signature:
+            int -> None
+        
+        Args:
+            iPeriod: int >= 1, one in so many calls is checked
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the period is not an integer
+            pos.exceptions.CustomValueError: the period is less than 1
+        
+        Version 0.0.1.0
+        """
+        self._iPeriod = _checkCount(iPeriod, 1)
+    
+    @property
+    def Period(self):
+        """
+        Getter property for the sampling period.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return self._iPeriod
+    
+    def makeSampler(self):
+        """
+        Creates the sampler function.
+        
+        Signature:
+            None -> function(_Site -> bool)
+        
+        Version 0.0.1.0
+        """
+        iPeriod = self._iPeriod
+        
+        def fSample(objSite):
+            return not ((objSite.Calls - 1) % iPeriod)
+        
+        return fSample
+
+class SampleFirstThenEveryNth(SamplingPolicy):
+    """
+    Sampling policy: the first K calls are always checked, then every N-th
+    call is checked.
+    
+    Properties:
+        First: int, read-only
+        Period: int, read-only
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('_iFirst', '_iPeriod')
+    
+    def __init__(self, iFirst, iPeriod):
+        """
+        Initialization.
+        
+        Signature:
+            int, int -> None
+        
+        Args:
+            iFirst: int >= 0, number of the first calls to be always checked
+            iPeriod: int >= 1, then one in so many calls is checked
+        
+        Raises:
+            pos.exceptions.CustomTypeError: any of the arguments is not an
+                integer
+            pos.exceptions.CustomValueError: negative number of the first
+                calls or the period is less than 1
+        
+        Version 0.0.1.0
+        """
+        self._iFirst = _checkCount(iFirst, 0)
+        self._iPeriod = _checkCount(iPeriod, 1)
+    
+    @property
+    def First(self):
+        """
+        Getter property for the number of the always checked first calls.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return self._iFirst
+    
+    @property
+    def Period(self):
+        """
+        Getter property for the sampling period after the first calls.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return self._iPeriod
+    
+    def makeSampler(self):
+        """
+        Creates the sampler function.
+        
+        Signature:
+            None -> function(_Site -> bool)
+        
+        Version 0.0.1.0
+        """
+        iFirst = self._iFirst
+        iPeriod = self._iPeriod
+        
+        def fSample(objSite):
+            iCalls = objSite.Calls
+            return iCalls <= iFirst or not ((iCalls - iFirst) % iPeriod)
+        
+        return fSample
+
+class SampleTimeBudget(SamplingPolicy):
+    """
+    Sampling policy: the time spent in the checks of the call site is limited
+    to the specified fraction of the wall time. The call site earns the budget
+    of the checks at that rate from its first call (or the first call after
+    the reset of the counters), and a call is checked only if the budget is
+    not exhausted; the time spent in the check is then taken from the budget.
+    The saved-up budget is capped at the fraction of the window (in seconds),
+    thus an idle period does not allow a burst of the checks longer than that.
+    The first call is always checked.
+    
+    Properties:
+        Fraction: float, read-only
+        Window: float, read-only
+    
+    Version 0.0.1.1
+    """
+    
+    __slots__ = ('_fFraction', '_fWindow')
+    
+    def __init__(self, fFraction, fWindow = 0.1):
+        """
+        Initialization.
+        
+        Signature:
+            int/float/, int/float/ -> None
+        
+        Args:
+            fFraction: int or float in the range (0, 1], the maximum fraction
+                of the wall time to be spent in the checks, e.g. 0.01 for 1%
+            fWindow: (optional) positive int or float, the window in seconds
+                defining the maximum saved-up budget, defaults to 0.1
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the fraction or the window is not
+                a number
+            pos.exceptions.CustomValueError: the fraction is not in (0, 1], or
+                the window is not positive
+        
+        Version 0.0.1.1
+        """
+        for gValue in (fFraction, fWindow):
+            if (not isinstance(gValue, (int, long, float))
+                                            or isinstance(gValue, bool)):
+                raise CustomTypeError(gValue, float)
+        if not (0 < fFraction <= 1):
+            raise CustomValueError(fFraction, 'in (0, 1]')
+        if not (fWindow > 0):
+            raise CustomValueError(fWindow, 'positive')
+        self._fFraction = float(fFraction)
+        self._fWindow = float(fWindow)
+    
+    @property
+    def Fraction(self):
+        """
+        Getter property for the maximum fraction of the wall time.
+        
+        Signature:
+            None -> float
+        
+        Version 0.0.1.0
+        """
+        return self._fFraction
+    
+    @property
+    def Window(self):
+        """
+        Getter property for the window defining the maximum saved-up budget.
+        
+        Signature:
+            None -> float
+        
+        Version 0.0.1.0
+        """
+        return self._fWindow
+    
+    def makeSampler(self):
+        """
+        Creates the sampler function.
+        
+        Signature:
+            None -> function(_Site -> bool)
+        
+        Version 0.0.1.1
+        """
+        fFraction = self._fFraction
+        fLimit = fFraction * self._fWindow
+        
+        def fSample(objSite):
+            fNow = _timer()
+            if objSite.Updated is None: #first call - start the clock
+                fBudget = 0.0
+            else:
+                fBudget = min(fLimit, objSite.Budget
+                                    - (objSite.CheckTime - objSite.Spent)
+                                    + fFraction * (fNow - objSite.Updated))
+            objSite.Budget = fBudget
+            objSite.Updated = fNow
+            objSite.Spent = objSite.CheckTime
+            return fBudget >= 0
+        
+        return fSample
+
+#+ contracts
+
+class Contract(object):
+    """
+    Compiled Design Contract of a single function / method. The rules are
+    compiled into the check functions upon instantiation, so a contract can be
+    bound to any number of functions with the compatible signatures.
+    
+    Properties:
+        Name: str, read-only
+        Arguments: tuple(str), read-only, names of the arguments with rules,
+            including the 'Stream' rules
+    
+    Methods:
+        checkArgument(strName, gValue):
+            str, type A -> bool
+        checkVarArgs(tupArgs):
+            tuple -> bool
+        checkResult(gValue):
+            type A -> bool
+        checkRecord(gRecord, seqFields = None):
+            dict/tuple, seq(str)/ -> list(tuple(str, str))
+        bind(gCallable, objSampling = None):
+            function/staticmethod/classmethod/property/, SamplingPolicy/
+                -> function/staticmethod/classmethod/property
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('_strName', '_dictContract', '_dictArgs', '_dictStreams',
+                    '_tupArguments', '_tupVarArgs', '_setKeywords',
+                    '_tupResult', '_tupResultStream')
+    
+    def __init__(self, dictContract, strName = None):
+        """
+        Initialization. Checks and compiles the contract.
+        
+        Signature:
+            dict(str -> type A)/, str/ -> None
+        
+        Args:
+            dictContract: dictionary, the contract definition
+            strName: (optional) string, name of the contract
+        
+        Raises:
+            pos.exceptions.CustomTypeError: the contract is not a dictionary,
+                or improper type of a contract element or rule
+            pos.exceptions.CustomValueError: unknown key or improper value of a
+                contract element or rule
+        
+        Version 0.0.1.0
+        """
+        if not isinstance(dictContract, dict):
+            raise CustomTypeError(dictContract, dict)
+        if not (strName is None or isinstance(strName, basestring)):
+            raise CustomTypeError(strName, str)
+        for strKey in dictContract:
+            if not (strKey in CONTRACT_KEYS):
+                raise CustomValueError(strKey, 'a contract key in {}'.format(
+                                                            CONTRACT_KEYS))
+        self._strName = strName
+        self._dictContract = dict(dictContract)
+        self._dictArgs = {}
+        self._dictStreams = {}
+        dictArgs = dictContract.get('Args', {})
+        if not isinstance(dictArgs, dict):
+            raise CustomTypeError(dictArgs, dict)
+        for strArg, gRule in dictArgs.items():
+            if not isinstance(strArg, basestring):
+                raise CustomTypeError(strArg, str)
+            tupRule, tupStream = _compileTopRule(gRule)
+            if tupRule is not None:
+                self._dictArgs[strArg] = tupRule
+            if tupStream is not None:
+                self._dictStreams[strArg] = tupStream
+        self._tupArguments = tuple(sorted(set(self._dictArgs)
+                                                    | set(self._dictStreams)))
+        if 'VarArgs' in dictContract:
+            self._tupVarArgs = _compileRule(dictContract['VarArgs'])
+        else:
+            self._tupVarArgs = None
+        if 'Keywords' in dictContract:
+            seqNames = dictContract['Keywords']
+            if (isinstance(seqNames, basestring) or not isinstance(seqNames,
+                                            (list, tuple, set, frozenset))):
+                raise CustomTypeError(seqNames, list)
+            for strArg in seqNames:
+                if not isinstance(strArg, basestring):
+                    raise CustomTypeError(strArg, str)
+            self._setKeywords = frozenset(seqNames)
+        else:
+            self._setKeywords = None
+        if 'Returns' in dictContract:
+            self._tupResult, self._tupResultStream = _compileTopRule(
+                                                    dictContract['Returns'])
+        else:
+            self._tupResult = None
+            self._tupResultStream = None
+    
+    def __repr__(self):
+        """
+        Returns the string representation of the contract.
+        
+        Signature:
+            None -> str
+        
+        Version 0.0.1.0
+        """
+        return '{}({!r})'.format(self.__class__.__name__, self._strName)
+    
+    def __reduce__(self):
+        """
+        Pickling support: the contract is re-compiled from its definition,
+        thus all classes and values used in the rules must be picklable.
+        
+        Signature:
+            None -> tuple(class, tuple(dict, str/None))
+        
+        Version 0.0.1.0
+        """
+        return (self.__class__, (self._dictContract, self._strName))
+    
+    @property
+    def Name(self):
+        """
+        Getter property for the name of the contract.
+        
+        Signature:
+            None -> str/None
+        
+        Version 0.0.1.0
+        """
+        return self._strName
+    
+    @property
+    def Arguments(self):
+        """
+        Getter property for the sorted names of the arguments with the rules.
+        
+        Signature:
+            None -> tuple(str)
+        
+        Version 0.0.1.0
+        """
+        return self._tupArguments
+    
+    def checkArgument(self, strName, gValue):
+        """
+        Checks if a value passes the rule on the argument with the given name.
+        An argument without a rule always passes. The 'Stream' rule is not
+        applied to an iterator, since it would be consumed.
+        
+        Signature:
+            str, type A -> bool
+        
+        Version 0.0.1.0
+        """
+        tupRule = self._dictArgs.get(strName, None)
+        if not (tupRule is None or tupRule[0](gValue) is None):
+            return False
+        return _passesStream(self._dictStreams.get(strName, None), gValue)
+    
+    def checkVarArgs(self, tupArgs):
+        """
+        Checks if a tuple of the optional positional arguments passes the
+        'VarArgs' rule, if it is defined.
+        
+        Signature:
+            tuple -> bool
+        
+        Version 0.0.1.0
+        """
+        return self._tupVarArgs is None or self._tupVarArgs[0](
+                                                        tuple(tupArgs)) is None
+    
+    def checkResult(self, gValue):
+        """
+        Checks if a value passes the 'Returns' rule, if it is defined. The
+        'Stream' rule is not applied to an iterator, since it would be consumed.
+        
+        Signature:
+            type A -> bool
+        
+        Version 0.0.1.0
+        """
+        if not (self._tupResult is None or self._tupResult[0](gValue) is None):
+            return False
+        return _passesStream(self._tupResultStream, gValue)
+    
+    def checkRecord(self, gRecord, seqFields = None):
+        """
+        Applies the rules on the arguments to a record of the argument values:
+        a dictionary (argument names as the keys) or a tuple / list of the
+        values in the order of the field names, where the values beyond the
+        field names are checked against the 'VarArgs' rule. The missing values
+        are not checked, and the 'Stream' rules are not applied to the
+        iterators. Returns the descriptions of the violations of the rules
+        (one per argument at most) instead of raising the exceptions.
+        
+        Signature:
+            dict/tuple/list, seq(str)/ -> list(tuple(str, str))
+        
+        Args:
+            gRecord: dict/tuple/list, the record
+            seqFields: (optional) seq(str), the field names of a tuple record
+        
+        Returns:
+            list(tuple(str, str)): pairs of the violated rule (including the
+                argument name) and the representation of the offending value
+        
+        Version 0.0.1.0
+        """
+        tupExtra = None
+        if isinstance(gRecord, (dict, collections.Mapping)):
+            dictValues = gRecord
+        elif isinstance(gRecord, (tuple, list)) and seqFields is not None:
+            dictValues = dict(itertools.izip(seqFields, gRecord))
+            tupExtra = tuple(gRecord[len(seqFields):])
+        else:
+            return [_describeFailure((True, gRecord, _RECORD, ''), 'record')]
+        lstResult = []
+        for strArg in self._tupArguments:
+            if strArg in dictValues:
+                gValue = dictValues[strArg]
+                tupRule = self._dictArgs.get(strArg, None)
+                if tupRule is None:
+                    tupFailure = None
+                else:
+                    tupFailure = tupRule[0](gValue)
+                if tupFailure is None and strArg in self._dictStreams:
+                    tupFailure = _getStreamFailure(self._dictStreams[strArg],
+                                                                        gValue)
+                if tupFailure is not None:
+                    lstResult.append(_describeFailure(tupFailure, strArg))
+        if tupExtra is not None and self._tupVarArgs is not None:
+            tupFailure = self._tupVarArgs[0](tupExtra)
+            if tupFailure is not None:
+                lstResult.append(_describeFailure(tupFailure, '*args'))
+        return lstResult
+    
+    def _bindFunction(self, funcTarget, objSampling = None, bArguments = True,
+                                        bResult = True, bReturnsNone = False):
+        """
+        Creates the checking closure for a function using its signature.
+        
+        Signature:
+            function/, SamplingPolicy, bool, bool, bool/ -> function
+        
+        Args:
+            funcTarget: function to be controlled
+            objSampling: (optional) SamplingPolicy, the calls to be checked
+            bArguments: (optional) boolean, the arguments rules are applied
+            bResult: (optional) boolean, the 'Returns' rule is applied
+            bReturnsNone: (optional) boolean, the result must be None
+        
+        Raises:
+            pos.exceptions.CustomValueError: the contract refers to the
+                parameters not present in the signature
+        
+        Version 0.0.1.0
+        """
+        strFunction = funcTarget.__name__
+        tupSpec = inspect.getargspec(funcTarget)
+        if objSampling is None:
+            objSite = None
+        else:
+            objSite = _Site(funcTarget.__module__, strFunction)
+        lstChecks = []
+        lstStreams = []
+        if bArguments:
+            if self._setKeywords is not None:
+                lstChecks.append((0, '', _makeKeywordsCheck(self._setKeywords,
+                                                                strFunction)))
+            for strArg in self.Arguments:
+                if strArg in tupSpec.args:
+                    iPosition = tupSpec.args.index(strArg)
+                elif tupSpec.keywords is not None:
+                    iPosition = None
+                else:
+                    raise CustomValueError(strArg, 'parameter of {}'.format(
+                                                                strFunction))
+                if strArg in self._dictArgs:
+                    tupRule = self._dictArgs[strArg]
+                    lstChecks.append((tupRule[1], strArg, _makeNamedCheck(
+                                    strArg, iPosition, tupRule, strFunction)))
+                if strArg in self._dictStreams:
+                    lstStreams.append(_makeStreamCheck(strArg, iPosition,
+                            self._dictStreams[strArg], strFunction, objSite))
+            if self._tupVarArgs is not None:
+                if tupSpec.varargs is None:
+                    raise CustomValueError('*args', 'parameter of {}'.format(
+                                                                strFunction))
+                lstChecks.append((self._tupVarArgs[1], '*', _makeVarArgsCheck(
+                        len(tupSpec.args), self._tupVarArgs, strFunction)))
+        lstChecks.sort()
+        if bReturnsNone:
+            fResult = _compileRule(None)[0]
+        elif bResult and self._tupResult is not None:
+            fResult = self._tupResult[0]
+        else:
+            fResult = None
+        if bResult and not bReturnsNone:
+            tupResultStream = self._tupResultStream
+        else:
+            tupResultStream = None
+        tupChecks = tuple(fCheck for _, _, fCheck in lstChecks)
+        tupStreams = tuple(lstStreams)
+        if objSampling is not None:
+            with _LOCK:
+                _SITES.append(objSite)
+            funcChecked = _makeSampledWrapper(funcTarget, tupChecks, fResult,
+                                strFunction, objSite, objSampling.makeSampler(),
+                                tupStreams, tupResultStream)
+        elif tupStreams or tupResultStream is not None:
+            funcChecked = _makeStreamWrapper(funcTarget, tupChecks, fResult,
+                                    strFunction, tupStreams, tupResultStream)
+        else:
+            funcChecked = _makeWrapper(funcTarget, tupChecks, fResult,
+                                                                strFunction)
+        funcChecked = functools.wraps(funcTarget)(funcChecked)
+        funcChecked.__wrapped__ = funcTarget
+        funcChecked.Contract = self
+        return funcChecked
+    
+    def bind(self, gCallable, objSampling = None):
+        """
+        Creates the checking version of a function, static method, class
+        method, property or instance method. With a sampling policy only the
+        selected calls are checked, and the counters are kept.
+        
+        Signature:
+            function/staticmethod/classmethod/property/, SamplingPolicy/
+                -> function/staticmethod/classmethod/property
+        
+        Raises:
+            pos.exceptions.CustomTypeError: not a function, static / class
+                method or property, or the sampling policy is not a
+                SamplingPolicy instance or None
+            pos.exceptions.CustomValueError: the contract refers to the
+                parameters not present in the signature
+        
+        Version 0.0.1.0
+        """
+        if not (objSampling is None or isinstance(objSampling,
+                                                            SamplingPolicy)):
+            raise CustomTypeError(objSampling, SamplingPolicy)
+        if isinstance(gCallable, staticmethod):
+            _getFunction(gCallable)
+            return staticmethod(self._bindFunction(gCallable.__func__,
+                                                                objSampling))
+        if isinstance(gCallable, classmethod):
+            _getFunction(gCallable)
+            return classmethod(self._bindFunction(gCallable.__func__,
+                                                                objSampling))
+        if isinstance(gCallable, property):
+            _getFunction(gCallable)
+            if gCallable.fget is None:
+                funcGetter = None
+            else:
+                funcGetter = self._bindFunction(gCallable.fget, objSampling,
+                                                        bArguments = False)
+            if gCallable.fset is None:
+                funcSetter = None
+            else:
+                funcSetter = self._bindFunction(gCallable.fset, objSampling,
+                                        bResult = False, bReturnsNone = True)
+            return property(funcGetter, funcSetter, gCallable.fdel,
+                                                        gCallable.__doc__)
+        _getFunction(gCallable)
+        return self._bindFunction(gCallable, objSampling)
+
+class ContractTable(object):
+    """
+    Look-up table of the Design Contracts. Each contract is compiled upon the
+    first request and cached.
+    
+    Methods:
+        getContract(strName):
+            str -> Contract
+    
+    Version 0.0.1.0
+    """
+    
+    __slots__ = ('_dictSource', '_dictCompiled')
+    
+    def __init__(self, dictTable):
+        """
+        Initialization.
+        
+        Signature:
+            dict(str -> dict) -> None
+        
+        Raises:
+            pos.exceptions.CustomTypeError: not a dictionary, a name is not a
+                string or a contract is not a dictionary
+        
+        Version 0.0.1.0
+        """
+        if not isinstance(dictTable, dict):
+            raise CustomTypeError(dictTable, dict)
+        for strName, dictContract in dictTable.items():
+            if not isinstance(strName, basestring):
+                raise CustomTypeError(strName, str)
+            if not isinstance(dictContract, dict):
+                raise CustomTypeError(dictContract, dict)
+        self._dictSource = dict(dictTable)
+        self._dictCompiled = {}
+    
+    def __contains__(self, strName):
+        """
+        Checks if the table has a contract with the given name.
+        
+        Signature:
+            str -> bool
+        
+        Version 0.0.1.0
+        """
+        return strName in self._dictSource
+    
+    def __len__(self):
+        """
+        Returns the number of the contracts.
+        
+        Signature:
+            None -> int
+        
+        Version 0.0.1.0
+        """
+        return len(self._dictSource)
+    
+    def __iter__(self):
+        """
+        Iterates over the sorted names of the contracts.
+        
+        Signature:
+            None -> iterator(str)
+        
+        Version 0.0.1.0
+        """
+        return iter(sorted(self._dictSource))
+    
+    def getContract(self, strName):
+        """
+        Returns the compiled contract by name.
+        
+        Signature:
+            str -> Contract
+        
+        Raises:
+            pos.exceptions.NotInDCError: the contract is not found
+            pos.exceptions.CustomTypeError: improper type of a contract
+                element or rule
+            pos.exceptions.CustomValueError: improper value of a contract
+                element or rule
+        
+        Version 0.0.1.0
+        """
+        objContract = self._dictCompiled.get(strName, None)
+        if objContract is None:
+            if not (strName in self._dictSource):
+                raise NotInDCError(strName)
+            objContract = Contract(self._dictSource[strName], strName)
+            self._dictCompiled[strName] = objContract
+        return objContract
+
+#functions
+
+#+ helper functions
+
+def _getFunction(gCallable):
+    """
+    Helper function to obtain a function or the function wrapped by a static /
+    class method or a property.
+    
+    Signature:
+        function/staticmethod/classmethod/property -> function
+    
+    Raises:
+        pos.exceptions.CustomTypeError: not a function, static / class method
+            or property
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gCallable, (staticmethod, classmethod)):
+        gCallable = gCallable.__func__
+    elif isinstance(gCallable, property):
+        gCallable = gCallable.fget or gCallable.fset
+    if not isinstance(gCallable, types.FunctionType):
+        raise CustomTypeError(gCallable, types.FunctionType)
+    return gCallable
+
+def _getClasses(gValue):
+    """
+    Helper function to convert a class or a sequence of classes into a tuple
+    of classes.
+    
+    Signature:
+        class/seq(class) -> tuple(class)
+    
+    Raises:
+        pos.exceptions.CustomTypeError: not a class or a non-empty sequence of
+            classes
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gValue, _CLASS_TYPES):
+        return (gValue, )
+    if isinstance(gValue, (list, tuple)) and len(gValue):
+        for gItem in gValue:
+            if not isinstance(gItem, _CLASS_TYPES):
+                raise CustomTypeError(gItem, type)
+        return tuple(gValue)
+    raise CustomTypeError(gValue, type)
+
+def _getExpected(tupClasses, strPrefix = ''):
+    """
+    Helper function to obtain the expected type description for the error
+    message: the class itself for a single class without the prefix, or an
+    instance of _Expected otherwise.
+    
+    Signature:
+        tuple(class)/, str/ -> class/_Expected
+    
+    Version 0.0.1.0
+    """
+    if len(tupClasses) == 1 and not strPrefix:
+        return tupClasses[0]
+    return _Expected(strPrefix + ' or '.join(clsItem.__name__
+                                                for clsItem in tupClasses))
+
+def _prefixPath(tupFailure, strPath):
+    """
+    Helper function to prepend the location of a nested value to the path
+    stored in a failure description.
+    
+    Signature:
+        tuple(bool, type A, type B, str), str
+            -> tuple(bool, type A, type B, str)
+    
+    Version 0.0.1.0
+    """
+    return (tupFailure[0], tupFailure[1], tupFailure[2],
+                                                    strPath + tupFailure[3])
+
+def _raiseFailure(tupFailure, strTarget, strFunction, bResult = False):
+    """
+    Helper function to raise the exception corresponding to a failed check.
+    
+    Signature:
+        tuple(bool, type A, type B, str), str, str/, bool/ -> None
+    
+    Args:
+        tupFailure: tuple(bool, type A, type B, str), the failure description
+            as (is type check, offending value, expected type or violated
+            criteria, path to the value within the argument)
+        strTarget: string, the checked argument description
+        strFunction: string, the name of the controlled function
+        bResult: (optional) boolean, the returned value is checked
+    
+    Raises:
+        pos.exceptions.DCArgumentType: type check on an argument is failed
+        pos.exceptions.DCArgumentValue: value check on an argument is failed
+        pos.exceptions.DCReturnType: type check on the result is failed
+        pos.exceptions.DCReturnValue: value check on the result is failed
+    
+    Version 0.0.1.0
+    """
+    bType, gValue, gExpected, strPath = tupFailure
+    if bType:
+        if bResult:
+            raise DCReturnType(gValue, gExpected)
+        raise DCArgumentType(gValue, gExpected)
+    strError = '{} for {}{} of {}'.format(gExpected, strTarget, strPath,
+                                                                strFunction)
+    if bResult:
+        raise DCReturnValue(gValue, strError)
+    raise DCArgumentValue(gValue, strError)
+
+def _checkCount(iValue, iMin):
+    """
+    Helper function to check a non-negative integer parameter.
+    
+    Signature:
+        int, int -> int
+    
+    Raises:
+        pos.exceptions.CustomTypeError: not an integer
+        pos.exceptions.CustomValueError: less than the minimum
+    
+    Version 0.0.1.0
+    """
+    if not isinstance(iValue, (int, long)) or isinstance(iValue, bool):
+        raise CustomTypeError(iValue, int)
+    if iValue < iMin:
+        raise CustomValueError(iValue, '>= {}'.format(iMin))
+    return iValue
+
+#+ rules compilation
+
+def _isHooked(tupClasses):
+    """
+    Helper function to check if any of the classes has a custom meta-class,
+    e.g. ABCMeta, thus the isinstance() and issubclass() checks against them
+    may go through the __instancecheck__(), __subclasscheck__() and
+    __subclasshook__() methods instead of a simple MRO look-up.
+    
+    Signature:
+        tuple(class) -> bool
+    
+    Version 0.0.1.0
+    """
+    return any(not (type(clsItem) in _CLASS_TYPES) for clsItem in tupClasses)
+
+def _makeCachedVerdict(tupClasses, bSubClass = False):
+    """
+    Helper function to create the isinstance() or issubclass() check with the
+    cache of the verdicts keyed on the type of the value (or on the value
+    itself, which is a class, for the issubclass() check). The cache is
+    cleared when a virtual subclass is registered with any ABC, i.e. the
+    invalidation counter of ABCMeta changes, by clearTypeCaches() or when it
+    reaches the maximum size. The instances of the old-style classes are not
+    cached, since they all have the same type.
+    
+    Signature:
+        tuple(class)/, bool/ -> function(type A -> bool)
+    
+    Version 0.0.1.0
+    """
+    dictCache = {}
+    lstToken = [abc.ABCMeta._abc_invalidation_counter]
+    with _LOCK:
+        _TYPE_CACHES.append(dictCache)
+    
+    def fVerdict(gValue):
+        if lstToken[0] != abc.ABCMeta._abc_invalidation_counter:
+            dictCache.clear()
+            lstToken[0] = abc.ABCMeta._abc_invalidation_counter
+        if bSubClass:
+            if not isinstance(gValue, _CLASS_TYPES):
+                return False
+            gKey = gValue
+        else:
+            gKey = type(gValue)
+        bResult = dictCache.get(gKey, None)
+        if bResult is None:
+            if bSubClass:
+                bResult = issubclass(gValue, tupClasses)
+            else:
+                bResult = isinstance(gValue, tupClasses)
+            if not (gKey is types.InstanceType):
+                if len(dictCache) >= _CACHE_SIZE:
+                    dictCache.clear()
+                dictCache[gKey] = bResult
+        return bResult
+    
+    return fVerdict
+
+def _makeTypeCheck(tupClasses):
+    """
+    Helper function to create the isinstance() check. The verdicts are cached
+    for the classes with the custom meta-classes.
+    
+    Signature:
+        tuple(class) -> function(type A -> None/tuple)
+    
+    Version 0.0.1.0
+    """
+    gExpected = _getExpected(tupClasses)
+    if _isHooked(tupClasses):
+        fVerdict = _makeCachedVerdict(tupClasses)
+        
+        def fTest(gValue):
+            if not fVerdict(gValue):
+                return (True, gValue, gExpected, '')
+    
+    else:
+    
+        def fTest(gValue):
+            if not isinstance(gValue, tupClasses):
+                return (True, gValue, gExpected, '')
+    
+    return fTest
+
+def _makeNotTypeCheck(tupClasses):
+    """
+    Helper function to create the negated isinstance() check. The verdicts
+    are cached for the classes with the custom meta-classes.
+    
+    Signature:
+        tuple(class) -> function(type A -> None/tuple)
+    
+    Version 0.0.1.0
+    """
+    gExpected = _getExpected(tupClasses, 'not ')
+    if _isHooked(tupClasses):
+        fVerdict = _makeCachedVerdict(tupClasses)
+    else:
+        fVerdict = lambda gValue: isinstance(gValue, tupClasses)
+    
+    def fTest(gValue):
+        if fVerdict(gValue):
+            return (True, gValue, gExpected, '')
+    
+    return fTest
+
+def _makeSubClassCheck(tupClasses):
+    """
+    Helper function to create the issubclass() check. The verdicts are cached
+    for the classes with the custom meta-classes.
+    
+    Signature:
+        tuple(class) -> function(type A -> None/tuple)
+    
+    Version 0.0.1.0
+    """
+    gExpected = _getExpected(tupClasses, 'subclass of ')
+    if _isHooked(tupClasses):
+        fVerdict = _makeCachedVerdict(tupClasses, True)
+    else:
+        fVerdict = lambda gValue: (isinstance(gValue, _CLASS_TYPES)
+                                        and issubclass(gValue, tupClasses))
+    
+    def fTest(gValue):
+        if not fVerdict(gValue):
+            return (True, gValue, gExpected, '')
+    
+    return fTest
+
+def _makeCallableCheck():
+    """
+    Helper function to create the callable() check.
+    
+    Signature:
+        None -> function(type A -> None/tuple)
+    
+    Version 0.0.1.0
+    """
+    
+    def fTest(gValue):
+        if not callable(gValue):
+            return (True, gValue, _CALLABLE, '')
+    
+    return fTest
+
+def _makeComparison(strKey, gLimit):
+    """
+    Helper function to create a comparison check.
+    
+    Signature:
+        str, type A -> function(type B -> None/tuple)
+    
+    Version 0.0.1.0
+    """
+    fCompare, strSign = _COMPARISONS[strKey]
+    strError = '{} {!r}'.format(strSign, gLimit)
+    
+    def fTest(gValue):
+        if not fCompare(gValue, gLimit):
+            return (False, gValue, strError, '')
+    
+    return fTest
+
+def _makeMembership(gValues, bNegate):
+    """
+    Helper function to create the check of the value being or not being one
+    of the specified values. Uses a frozenset if all values are hashable.
+    
+    Signature:
+        seq(type A), bool -> function(type B -> None/tuple)
+    
+    Raises:
+        pos.exceptions.CustomTypeError: the values are not a sequence or a set
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gValues, basestring) or not isinstance(gValues,
+                                    (collections.Sequence, collections.Set)):
+        raise CustomTypeError(gValues, collections.Sequence)
+    tupValues = tuple(gValues)
+    try:
+        gContainer = frozenset(tupValues)
+    except TypeError:
+        gContainer = tupValues
+    strError = '{}in {!r}'.format('not ' if bNegate else '', tupValues)
+    
+    def fTest(gValue):
+        try:
+            bFound = gValue in gContainer
+        except TypeError: #unhashable value
+            bFound = gValue in tupValues
+        if bFound is bNegate:
+            return (False, gValue, strError, '')
+    
+    return fTest
+
+def _makeLengthCheck(iMin, iMax):
+    """
+    Helper function to create the check on the length of the value.
+    
+    Signature:
+        int, int/None -> function(type A -> None/tuple)
+    
+    Version 0.0.1.0
+    """
+    if iMin == iMax:
+        strError = 'length == {}'.format(iMin)
+    elif iMax is None:
+        strError = 'length >= {}'.format(iMin)
+    else:
+        strError = 'length in [{}, {}]'.format(iMin, iMax)
+    
+    def fTest(gValue):
+        try:
+            iLength = len(gValue)
+        except TypeError:
+            return (True, gValue, _SIZED, '')
+        if iLength < iMin or (iMax is not None and iLength > iMax):
+            return (False, gValue, strError, '')
+    
+    return fTest
+
+def _makeAttributesCheck(dictAttributes):
+    """
+    Helper function to create the check on the presence of the attributes and,
+    optionally, on their values.
+    
+    Signature:
+        dict(str -> rule/None) -> tuple(function(type A -> None/tuple), int)
+    
+    Raises:
+        pos.exceptions.CustomTypeError: not a dictionary, attribute name is
+            not a string or improper nested rule
+        pos.exceptions.CustomValueError: improper nested rule
+    
+    Version 0.0.1.0
+    """
+    if not isinstance(dictAttributes, dict):
+        raise CustomTypeError(dictAttributes, dict)
+    lstAttributes = []
+    iCost = _COST_ATTRIBUTE
+    for strAttr, gRule in sorted(dictAttributes.items()):
+        if not isinstance(strAttr, basestring):
+            raise CustomTypeError(strAttr, str)
+        if gRule is None:
+            fRule = None
+        else:
+            fRule, iRuleCost, _ = _compileRule(gRule)
+            iCost += iRuleCost
+        lstAttributes.append((strAttr, fRule,
+                            _Expected('object with attribute ' + strAttr)))
+    tupAttributes = tuple(lstAttributes)
+    
+    def fTest(gValue):
+        for strAttr, fRule, gExpected in tupAttributes:
+            if not hasattr(gValue, strAttr):
+                return (True, gValue, gExpected, '')
+            if fRule is not None:
+                tupFailure = fRule(getattr(gValue, strAttr))
+                if tupFailure is not None:
+                    return _prefixPath(tupFailure, '.' + strAttr)
+    
+    return fTest, iCost
+
+def _splitFormat(objView):
+    """
+    Helper function to split the struct format of the elements of a buffer
+    into the byte order prefix and the element format.
+    
+    Signature:
+        memoryview -> tuple(str, str)
+    
+    Version 0.0.1.0
+    """
+    strFormat = objView.format
+    if strFormat[:1] in ('@', '=', '<', '>', '!'):
+        return strFormat[0], strFormat[1:]
+    return '@', strFormat
+
+def _fromBuffer(objView):
+    """
+    Helper function to copy the content of a 1-dimensional memoryview buffer
+    with a numeric format in the native byte order into an array.array - a
+    single copy of the raw bytes, the element values are not created. Returns
+    None for the multi-dimensional buffers and the formats not supported by
+    the array module.
+    
+    Signature:
+        memoryview -> array.array/None
+    
+    Version 0.0.1.1
+    """
+    strOrder, strCode = _splitFormat(objView)
+    if strOrder in ('<', '>', '!'):
+        bNative = (strOrder == '<') == (sys.byteorder == 'little')
+    else:
+        bNative = True
+    if (bNative and objView.ndim == 1 and strCode in _ARRAY_SAMPLES
+                        and array.array(strCode).itemsize == objView.itemsize):
+        return array.array(strCode, objView.tobytes())
+    return None
+
+def _listBuffer(objView):
+    """
+    Helper function to decode the content of a memoryview buffer into a list
+    of the element values (nested lists for the multi-dimensional buffers),
+    as memoryview.tolist() under Python 3, which supports only the byte views
+    under Python 2. Returns None for the 0-dimensional buffers and the formats
+    not supported by the struct module.
+    
+    Signature:
+        memoryview -> list/None
+    
+    Version 0.0.1.0
+    """
+    if not objView.ndim:
+        return None
+    try:
+        return objView.tolist()
+    except NotImplementedError: #Python 2 - not a byte view
+        pass
+    strOrder, strCode = _splitFormat(objView)
+    iCount = functools.reduce(operator.mul, objView.shape, 1)
+    try:
+        lstItems = list(struct.unpack(strOrder + strCode * iCount,
+                                                        objView.tobytes()))
+    except struct.error: #not supported format
+        return None
+    for iSize in reversed(objView.shape[1:]):
+        lstItems = [lstItems[iIndex : iIndex + iSize]
+                                for iIndex in xrange(0, len(lstItems), iSize)]
+    return lstItems
+
+def _makeVectorSearch(gRule):
+    """
+    Helper function to create the vectorized search of the first element of a
+    numeric array violating the rule, which can consist only of a type check
+    and / or comparisons. The search function returns None if all elements
+    pass the rule, the index of the first offending element, or -1 if the
+    array cannot be checked in the vectorized form (e.g. not numeric typecode /
+    dtype, multi-dimensional array or the element type verdict depending on
+    the value), thus the generic per-element check must be used.
+    
+    Signature:
+        rule -> function(array.array/numpy.ndarray -> int/None)/None
+    
+    Returns:
+        function(array.array/numpy.ndarray -> int/None): the search function
+        None: the rule cannot be vectorized
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper type of a rule element
+        pos.exceptions.CustomValueError: improper value of a rule element
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gRule, dict):
+        if not gRule or any(not (strKey in _VECTOR_KEYS) for strKey in gRule):
+            return None
+        if 'Type' in gRule:
+            tupClasses = _getClasses(gRule['Type'])
+        else:
+            tupClasses = None
+        tupLimits = tuple((strKey, _COMPARISONS[strKey][0], gRule[strKey])
+                                    for strKey in ('NE', 'GT', 'GE', 'LT', 'LE')
+                                                            if strKey in gRule)
+    else:
+        tupClasses = _compileRule(gRule)[2]
+        if tupClasses is None:
+            return None
+        tupLimits = ()
+    
+    def fSearchArray(arrValue):
+        tupSamples = _ARRAY_SAMPLES.get(arrValue.typecode, None)
+        if tupSamples is None:
+            return -1
+        if tupClasses is not None:
+            iPassed = sum(1 for gItem in tupSamples
+                                            if isinstance(gItem, tupClasses))
+            if not iPassed:
+                return 0
+            if iPassed < len(tupSamples):
+                return -1
+        if not tupLimits:
+            return None
+        gMin = min(arrValue)
+        gMax = max(arrValue)
+        if arrValue.typecode in 'fd':
+            fSum = sum(arrValue)
+            bNaN = fSum != fSum #NaN or both infinities are present
+        else:
+            bNaN = False
+        iFirst = None
+        for strKey, fCompare, gLimit in tupLimits:
+            if strKey == 'NE':
+                if arrValue.count(gLimit):
+                    iIndex = arrValue.index(gLimit)
+                else:
+                    continue
+            elif bNaN or not fCompare(gMin if strKey[0] == 'G' else gMax,
+                                                                    gLimit):
+                arrMask = array.array('b', itertools.imap(fCompare, arrValue,
+                                                    itertools.repeat(gLimit)))
+                if 0 in arrMask:
+                    iIndex = arrMask.index(0)
+                else:
+                    continue
+            else:
+                continue
+            if iFirst is None or iIndex < iFirst:
+                iFirst = iIndex
+        return iFirst
+    
+    def fSearchNumpy(arrValue):
+        if arrValue.ndim != 1 or not (arrValue.dtype.kind in 'biuf'):
+            return -1
+        if (tupClasses is not None
+                and not isinstance(arrValue.dtype.type(0), tupClasses)):
+            return 0
+        arrPassed = None
+        for _, fCompare, gLimit in tupLimits:
+            arrMask = fCompare(arrValue, gLimit)
+            if not isinstance(arrMask, numpy.ndarray):
+                return -1
+            if arrPassed is None:
+                arrPassed = arrMask
+            else:
+                arrPassed &= arrMask
+        if arrPassed is None or arrPassed.all():
+            return None
+        return int(arrPassed.argmin())
+    
+    def fSearch(arrValue):
+        if not len(arrValue):
+            return None
+        if isinstance(arrValue, array.array):
+            return fSearchArray(arrValue)
+        return fSearchNumpy(arrValue)
+    
+    return fSearch
+
+def _makeContainerCheck(dictItems, gElements, gKeys):
+    """
+    Helper function to create the checks on the elements of a sequence (not a
+    string) or the keys and values of a mapping. The numeric arrays (see
+    _ARRAY_TYPES) are accepted as sequences, and the rule on their elements is
+    evaluated in the vectorized form if possible, see _makeVectorSearch(). The
+    memoryview buffers not convertible into an array.array are decoded into
+    lists and checked element by element.
+    
+    Signature:
+        dict(type A -> rule)/None, rule/None, rule/None
+            -> tuple(function(type B -> None/tuple), int)
+    
+    Raises:
+        pos.exceptions.CustomTypeError: items rules are not a dictionary or
+            improper nested rule
+        pos.exceptions.CustomValueError: improper nested rule
+    
+    Version 0.0.1.1
+    """
+    iCost = 0
+    lstItems = []
+    if dictItems is not None:
+        if not isinstance(dictItems, dict):
+            raise CustomTypeError(dictItems, dict)
+        for gKey, gRule in dictItems.items():
+            fRule, iRuleCost, _ = _compileRule(gRule)
+            lstItems.append((gKey, fRule))
+            iCost += _COST_ITEMS + iRuleCost
+    tupItems = tuple(lstItems)
+    tupIndexes = tuple((gKey, fRule) for gKey, fRule in lstItems
+                        if isinstance(gKey, (int, long)) and gKey >= 0
+                                                and not isinstance(gKey, bool))
+    setCovered = frozenset(gKey for gKey, _ in lstItems)
+    if gElements is None:
+        fElements = None
+        fSearch = None
+    else:
+        fElements, iRuleCost, _ = _compileRule(gElements)
+        iCost += _COST_ELEMENTS * iRuleCost
+        fSearch = None if tupIndexes else _makeVectorSearch(gElements)
+    if gKeys is None:
+        fKeys = None
+        gExpected = _CONTAINER
+    else:
+        fKeys, iRuleCost, _ = _compileRule(gKeys)
+        iCost += _COST_ELEMENTS * iRuleCost
+        gExpected = _MAPPING
+    
+    def fSequence(gValue):
+        iLength = len(gValue)
+        for iIndex, fRule in tupIndexes:
+            if iIndex < iLength:
+                tupFailure = fRule(gValue[iIndex])
+                if tupFailure is not None:
+                    return _prefixPath(tupFailure, '[{}]'.format(iIndex))
+        if fElements is None:
+            pass
+        elif tupIndexes:
+            for iIndex, gItem in enumerate(gValue):
+                if not (iIndex in setCovered):
+                    tupFailure = fElements(gItem)
+                    if tupFailure is not None:
+                        return _prefixPath(tupFailure, '[{}]'.format(iIndex))
+        else:
+            for iIndex, gItem in enumerate(gValue):
+                tupFailure = fElements(gItem)
+                if tupFailure is not None:
+                    return _prefixPath(tupFailure, '[{}]'.format(iIndex))
+    
+    def fArray(gValue):
+        if isinstance(gValue, memoryview):
+            gView = gValue
+            gValue = _fromBuffer(gView)
+            if gValue is None: #per element
+                gValue = _listBuffer(gView)
+                if gValue is None:
+                    return (True, gView, gExpected, '')
+                return fSequence(gValue)
+        if fSearch is not None:
+            iIndex = fSearch(gValue)
+            if iIndex is None:
+                return None
+            if iIndex >= 0:
+                tupFailure = fElements(gValue[iIndex])
+                if tupFailure is not None:
+                    return _prefixPath(tupFailure, '[{}]'.format(iIndex))
+        return fSequence(gValue)
+    
+    def fTest(gValue):
+        if isinstance(gValue, (dict, collections.Mapping)):
+            for gKey, fRule in tupItems:
+                if gKey in gValue:
+                    tupFailure = fRule(gValue[gKey])
+                    if tupFailure is not None:
+                        return _prefixPath(tupFailure, '[{!r}]'.format(gKey))
+            if fKeys is not None:
+                for gKey in gValue:
+                    tupFailure = fKeys(gKey)
+                    if tupFailure is not None:
+                        return _prefixPath(tupFailure,
+                                                ' key {!r}'.format(gKey))
+            if fElements is not None:
+                for gKey, gItem in gValue.iteritems():
+                    if gKey in setCovered:
+                        continue
+                    tupFailure = fElements(gItem)
+                    if tupFailure is not None:
+                        return _prefixPath(tupFailure, '[{!r}]'.format(gKey))
+        elif fKeys is not None:
+            return (True, gValue, gExpected, '')
+        elif isinstance(gValue, _ARRAY_TYPES):
+            return fArray(gValue)
+        elif (isinstance(gValue, basestring) or
+                not isinstance(gValue, (list, tuple, collections.Sequence))):
+            return (True, gValue, gExpected, '')
+        else:
+            return fSequence(gValue)
+    
+    return fTest, iCost
+
+def _combine(lstTests):
+    """
+    Helper function to combine the checks with the logical AND in the order
+    of their costs.
+    
+    Signature:
+        list(tuple(int, int, function)) -> function(type A -> None/tuple)
+    
+    Version 0.0.1.0
+    """
+    lstTests.sort()
+    if len(lstTests) == 1:
+        return lstTests[0][2]
+    tupTests = tuple(fTest for _, _, fTest in lstTests)
+    
+    def fTest(gValue):
+        for fCheck in tupTests:
+            tupFailure = fCheck(gValue)
+            if tupFailure is not None:
+                return tupFailure
+    
+    return fTest
+
+def _getLengthBounds(dictRule):
+    """
+    Helper function to obtain the length bounds defined by the 'Length',
+    'MinLength' and 'MaxLength' keys of a rule.
+    
+    Signature:
+        dict(str -> type A) -> tuple(int, int/None)
+    
+    Raises:
+        pos.exceptions.CustomTypeError: a bound is not an integer
+        pos.exceptions.CustomValueError: a bound is negative or the maximum is
+            less than the minimum
+    
+    Version 0.0.1.0
+    """
+    for strKey in ('Length', 'MinLength', 'MaxLength'):
+        gLength = dictRule.get(strKey, 0)
+        if not isinstance(gLength, (int, long)) or isinstance(gLength, bool):
+            raise CustomTypeError(gLength, int)
+        if gLength < 0:
+            raise CustomValueError(gLength, '>= 0')
+    if 'Length' in dictRule:
+        iMin = iMax = dictRule['Length']
+    else:
+        iMin = dictRule.get('MinLength', 0)
+        iMax = dictRule.get('MaxLength', None)
+        if iMax is not None and iMax < iMin:
+            raise CustomValueError(iMax, '>= {}'.format(iMin))
+    return iMin, iMax
+
+def _compileDict(dictRule):
+    """
+    Helper function to compile a rule defined as a dictionary.
+    
+    Signature:
+        dict(str -> type A) -> tuple(function, int, tuple(class)/None)
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper type of a rule element
+        pos.exceptions.CustomValueError: unknown key, empty rule or improper
+            value of a rule element
+    
+    Version 0.0.1.0
+    """
+    for strKey in dictRule:
+        if not (strKey in RULE_KEYS):
+            raise CustomValueError(strKey, 'a rule key in {}'.format(
+                                                                RULE_KEYS))
+    if not dictRule:
+        raise CustomValueError(dictRule, 'not empty rule')
+    if 'Stream' in dictRule:
+        raise CustomValueError('Stream',
+                        'key of a rule on an argument or on the returned value')
+    if len(dictRule) == 1 and 'Type' in dictRule:
+        tupClasses = _getClasses(dictRule['Type'])
+        return _makeTypeCheck(tupClasses), _COST_TYPE, tupClasses
+    lstTests = []
+    if 'Type' in dictRule:
+        lstTests.append((_COST_TYPE, 0,
+                            _makeTypeCheck(_getClasses(dictRule['Type']))))
+    if 'NotType' in dictRule:
+        lstTests.append((_COST_TYPE, 1,
+                        _makeNotTypeCheck(_getClasses(dictRule['NotType']))))
+    if 'SubClass' in dictRule:
+        lstTests.append((_COST_TYPE, 2,
+                        _makeSubClassCheck(_getClasses(dictRule['SubClass']))))
+    if dictRule.get('Callable', False):
+        lstTests.append((_COST_TYPE, 3, _makeCallableCheck()))
+    for iOrder, strKey in enumerate(('NE', 'GT', 'GE', 'LT', 'LE')):
+        if strKey in dictRule:
+            lstTests.append((_COST_VALUE, 10 + iOrder,
+                                _makeComparison(strKey, dictRule[strKey])))
+    for iOrder, strKey in enumerate(('In', 'NotIn')):
+        if strKey in dictRule:
+            lstTests.append((_COST_VALUE, 20 + iOrder,
+                        _makeMembership(dictRule[strKey], strKey == 'NotIn')))
+    if any(strKey in dictRule for strKey in ('Length', 'MinLength',
+                                                                'MaxLength')):
+        iMin, iMax = _getLengthBounds(dictRule)
+        lstTests.append((_COST_VALUE, 30, _makeLengthCheck(iMin, iMax)))
+    if 'Attributes' in dictRule:
+        fTest, iCost = _makeAttributesCheck(dictRule['Attributes'])
+        lstTests.append((iCost, 40, fTest))
+    if any(strKey in dictRule for strKey in ('Items', 'Elements', 'Keys')):
+        fTest, iCost = _makeContainerCheck(dictRule.get('Items', None),
+                                            dictRule.get('Elements', None),
+                                            dictRule.get('Keys', None))
+        lstTests.append((iCost, 50, fTest))
+    if not lstTests:
+        raise CustomValueError(dictRule, 'rule with at least one check')
+    return _combine(lstTests), sum(tupTest[0] for tupTest in lstTests), None
+
+def _compileAlternatives(seqRules):
+    """
+    Helper function to compile a sequence of the alternative rules (logical
+    OR). The alternatives, which are the pure type checks, are merged into a
+    single isinstance() check with a tuple of classes.
+    
+    Signature:
+        list/tuple(rule) -> tuple(function, int, tuple(class)/None)
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper type of a rule element
+        pos.exceptions.CustomValueError: empty sequence or improper value of a
+            rule element
+    
+    Version 0.0.1.0
+    """
+    if not len(seqRules):
+        raise CustomValueError(seqRules, 'not empty sequence of rules')
+    lstClasses = []
+    lstOthers = []
+    for gRule in seqRules:
+        fTest, iCost, tupClasses = _compileRule(gRule)
+        if tupClasses is None:
+            lstOthers.append((iCost, len(lstOthers), fTest))
+        else:
+            lstClasses.extend(clsItem for clsItem in tupClasses
+                                                if not clsItem in lstClasses)
+    if lstClasses:
+        tupClasses = tuple(lstClasses)
+        fTypes = _makeTypeCheck(tupClasses)
+        if not lstOthers:
+            return fTypes, _COST_TYPE, tupClasses
+        lstOthers.append((_COST_TYPE, -1, fTypes))
+    if len(lstOthers) == 1:
+        return lstOthers[0][2], lstOthers[0][0], None
+    lstOthers.sort()
+    tupTests = tuple(fTest for _, _, fTest in lstOthers)
+    
+    def fTest(gValue):
+        tupFirst = None
+        for fCheck in tupTests:
+            tupFailure = fCheck(gValue)
+            if tupFailure is None:
+                return None
+            if tupFirst is None or (tupFirst[0] and not tupFailure[0]):
+                tupFirst = tupFailure
+        return tupFirst
+    
+    return fTest, sum(tupTest[0] for tupTest in lstOthers), None
+
+def _compileRule(gRule):
+    """
+    Helper function to compile a single rule into a check function, which
+    returns None if the value passes the check, or a failure description as a
+    tuple (is type check, offending value, expected type or violated criteria,
+    path to the value).
+    
+    Signature:
+        type A -> tuple(function(type B -> None/tuple), int, tuple(class)/None)
+    
+    Returns:
+        tuple(function, int, tuple(class)/None): the check function, its
+            relative cost and the tuple of classes if the rule is a pure
+            isinstance() check (or None)
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper type of a rule element
+        pos.exceptions.CustomValueError: improper value of a rule element
+    
+    Version 0.0.1.0
+    """
+    if gRule is None:
+        tupClasses = (types.NoneType, )
+    elif isinstance(gRule, _CLASS_TYPES):
+        tupClasses = (gRule, )
+    elif isinstance(gRule, (list, tuple)):
+        return _compileAlternatives(gRule)
+    elif isinstance(gRule, dict):
+        return _compileDict(gRule)
+    else:
+        raise CustomTypeError(gRule, _RULE)
+    return _makeTypeCheck(tupClasses), _COST_TYPE, tupClasses
+
+def _compileStream(dictStream):
+    """
+    Helper function to compile the 'Stream' rule.
+    
+    Signature:
+        dict(str -> type A) -> tuple(function/None, int, int/None)
+    
+    Returns:
+        tuple(function/None, int, int/None): the elements check (or None),
+            the minimum and the maximum (or None) number of the elements
+    
+    Raises:
+        pos.exceptions.CustomTypeError: not a dictionary or improper type of a
+            rule element
+        pos.exceptions.CustomValueError: unknown key or improper value of a
+            rule element
+    
+    Version 0.0.1.0
+    """
+    if not isinstance(dictStream, dict):
+        raise CustomTypeError(dictStream, dict)
+    for strKey in dictStream:
+        if not (strKey in STREAM_KEYS):
+            raise CustomValueError(strKey, 'a stream rule key in {}'.format(
+                                                                STREAM_KEYS))
+    if 'Elements' in dictStream:
+        fElements = _compileRule(dictStream['Elements'])[0]
+    else:
+        fElements = None
+    iMin, iMax = _getLengthBounds(dictStream)
+    return fElements, iMin, iMax
+
+def _compileTopRule(gRule):
+    """
+    Helper function to compile a rule on an argument or on the returned
+    value, which can have the 'Stream' key.
+    
+    Signature:
+        type A -> tuple(tuple(function, int, tuple(class)/None)/None,
+                        tuple(function/None, int, int/None)/None)
+    
+    Returns:
+        tuple(tuple/None, tuple/None): the compiled rule without the 'Stream'
+            key (or None if it is the only key) and the compiled 'Stream' rule
+            (or None if it is not defined)
+    
+    Raises:
+        pos.exceptions.CustomTypeError: improper type of a rule element
+        pos.exceptions.CustomValueError: improper value of a rule element
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gRule, dict) and 'Stream' in gRule:
+        tupStream = _compileStream(gRule['Stream'])
+        dictRule = dict((strKey, gValue) for strKey, gValue in gRule.items()
+                                                    if strKey != 'Stream')
+        if dictRule:
+            return _compileRule(dictRule), tupStream
+        return None, tupStream
+    return _compileRule(gRule), None
+
+def _wrapStream(gValue, tupStream, strTarget, strFunction, bResult = False,
+                                                            objSite = None):
+    """
+    Helper function to apply the 'Stream' rule: an iterator is wrapped into
+    the checking iterator, any other iterable is checked at once and returned
+    as it is.
+    
+    Signature:
+        type A, tuple(function/None, int, int/None), str, str/, bool,
+            _Site/None/ -> type A/_CheckedIterator
+    
+    Raises:
+        pos.exceptions.DCArgumentType: not iterable argument or type check on
+            an element is failed
+        pos.exceptions.DCArgumentValue: value check on an element or on the
+            length of the argument is failed
+        pos.exceptions.DCReturnType: not iterable result or type check on an
+            element is failed
+        pos.exceptions.DCReturnValue: value check on an element or on the
+            length of the result is failed
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gValue, collections.Iterator):
+        return _CheckedIterator(gValue, tupStream, strTarget, strFunction,
+                                                            bResult, objSite)
+    tupFailure = _getStreamFailure(tupStream, gValue)
+    if tupFailure is not None:
+        _raiseFailure(tupFailure, strTarget, strFunction, bResult)
+    return gValue
+
+def _getStreamFailure(tupStream, gValue):
+    """
+    Helper function to apply the 'Stream' rule to a value at once. The
+    iterators always pass, since they are not consumed.
+    
+    Signature:
+        tuple(function/None, int, int/None), type A -> None/tuple
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gValue, collections.Iterator):
+        return None
+    if not isinstance(gValue, collections.Iterable):
+        return (True, gValue, _ITERABLE, '')
+    fElements, iMin, iMax = tupStream
+    iCount = 0
+    for gItem in gValue:
+        if iMax is not None and iCount >= iMax:
+            return (False, iCount + 1, 'length <= {}'.format(iMax), '')
+        if fElements is not None:
+            tupFailure = fElements(gItem)
+            if tupFailure is not None:
+                return _prefixPath(tupFailure, '[{}]'.format(iCount))
+        iCount += 1
+    if iCount < iMin:
+        return (False, iCount, 'length >= {}'.format(iMin), '')
+    return None
+
+def _passesStream(tupStream, gValue):
+    """
+    Helper function to check if a value passes the 'Stream' rule without
+    raising an exception. The iterators always pass, since they are not
+    consumed.
+    
+    Signature:
+        tuple(function/None, int, int/None)/None, type A -> bool
+    
+    Version 0.0.1.0
+    """
+    return tupStream is None or _getStreamFailure(tupStream, gValue) is None
+
+#+ arguments binding
+
+def _makeNamedCheck(strName, iPosition, tupRule, strFunction):
+    """
+    Helper function to create the check on an argument, which is found either
+    at the precomputed position among the positional arguments or by its name
+    among the keyword arguments. Missing arguments are not checked.
+    
+    Signature:
+        str, int/None, tuple(function, int, tuple(class)/None), str
+            -> function(tuple, dict -> None)
+    
+    Version 0.0.1.0
+    """
+    fTest, _, tupClasses = tupRule
+    strTarget = 'argument {}'.format(strName)
+    if iPosition is None:
+    
+        def fCheck(tupArgs, dictKwargs):
+            if strName in dictKwargs:
+                tupFailure = fTest(dictKwargs[strName])
+                if tupFailure is not None:
+                    _raiseFailure(tupFailure, strTarget, strFunction)
+    
+    elif tupClasses is not None and not _isHooked(tupClasses):
+        gExpected = _getExpected(tupClasses)
+        
+        def fCheck(tupArgs, dictKwargs):
+            if len(tupArgs) > iPosition:
+                gValue = tupArgs[iPosition]
+            elif strName in dictKwargs:
+                gValue = dictKwargs[strName]
+            else:
+                return
+            if not isinstance(gValue, tupClasses):
+                raise DCArgumentType(gValue, gExpected)
+    
+    else:
+    
+        def fCheck(tupArgs, dictKwargs):
+            if len(tupArgs) > iPosition:
+                gValue = tupArgs[iPosition]
+            elif strName in dictKwargs:
+                gValue = dictKwargs[strName]
+            else:
+                return
+            tupFailure = fTest(gValue)
+            if tupFailure is not None:
+                _raiseFailure(tupFailure, strTarget, strFunction)
+    
+    return fCheck
+
+def _makeVarArgsCheck(iStart, tupRule, strFunction):
+    """
+    Helper function to create the check on the tuple of the optional
+    positional arguments collected by the *args placeholder.
+    
+    Signature:
+        int, tuple(function, int, tuple(class)/None), str
+            -> function(tuple, dict -> None)
+    
+    Version 0.0.1.0
+    """
+    fTest = tupRule[0]
+    
+    def fCheck(tupArgs, dictKwargs):
+        tupFailure = fTest(tupArgs[iStart:])
+        if tupFailure is not None:
+            _raiseFailure(tupFailure, '*args', strFunction)
+    
+    return fCheck
+
+def _makeStreamCheck(strName, iPosition, tupStream, strFunction,
+                                                            objSite = None):
+    """
+    Helper function to create the application of the 'Stream' rule to an
+    argument, which is found either at the precomputed position among the
+    positional arguments or by its name among the keyword arguments. An
+    iterator argument is replaced by the checking iterator: in the returned
+    tuple of the positional arguments or in the dictionary of the keyword
+    arguments, which is modified in place.
+    
+    Signature:
+        str, int/None, tuple(function/None, int, int/None), str/, _Site/None/
+            -> function(tuple, dict -> tuple)
+    
+    Version 0.0.1.0
+    """
+    strTarget = 'argument {}'.format(strName)
+    
+    def fStream(tupArgs, dictKwargs):
+        if iPosition is not None and len(tupArgs) > iPosition:
+            gValue = tupArgs[iPosition]
+            gChecked = _wrapStream(gValue, tupStream, strTarget, strFunction,
+                                                            objSite = objSite)
+            if gChecked is not gValue:
+                tupArgs = (tupArgs[:iPosition] + (gChecked, )
+                                                + tupArgs[iPosition + 1:])
+        elif strName in dictKwargs:
+            dictKwargs[strName] = _wrapStream(dictKwargs[strName], tupStream,
+                                strTarget, strFunction, objSite = objSite)
+        return tupArgs
+    
+    return fStream
+
+def _makeKeywordsCheck(setNames, strFunction):
+    """
+    Helper function to create the check on the names of the keyword
+    arguments.
+    
+    Signature:
+        frozenset(str), str -> function(tuple, dict -> None)
+    
+    Version 0.0.1.0
+    """
+    strError = 'keyword argument name in {} of {}'.format(sorted(setNames),
+                                                                strFunction)
+    
+    def fCheck(tupArgs, dictKwargs):
+        if dictKwargs and not setNames.issuperset(dictKwargs):
+            for strName in dictKwargs:
+                if not (strName in setNames):
+                    raise DCArgumentValue(strName, strError)
+    
+    return fCheck
+
+def _makeWrapper(funcTarget, tupChecks, fResult, strFunction):
+    """
+    Helper function to create the checking closure with the minimal number of
+    the internal calls for the defined checks.
+    
+    Signature:
+        function, tuple(function), function/None, str -> function
+    
+    Version 0.0.1.0
+    """
+    if not tupChecks and fResult is None:
+    
+        def wrapper(*args, **kwargs):
+            return funcTarget(*args, **kwargs)
+    
+    elif len(tupChecks) == 1 and fResult is None:
+        fCheck = tupChecks[0]
+        
+        def wrapper(*args, **kwargs):
+            fCheck(args, kwargs)
+            return funcTarget(*args, **kwargs)
+    
+    elif fResult is None:
+    
+        def wrapper(*args, **kwargs):
+            for fCheck in tupChecks:
+                fCheck(args, kwargs)
+            return funcTarget(*args, **kwargs)
+    
+    else:
+    
+        def wrapper(*args, **kwargs):
+            for fCheck in tupChecks:
+                fCheck(args, kwargs)
+            gResult = funcTarget(*args, **kwargs)
+            tupFailure = fResult(gResult)
+            if tupFailure is not None:
+                _raiseFailure(tupFailure, 'result', strFunction, True)
+            return gResult
+    
+    return wrapper
+
+def _makeStreamWrapper(funcTarget, tupChecks, fResult, strFunction,
+                                                tupStreams, tupResultStream):
+    """
+    Helper function to create the checking closure, which also applies the
+    'Stream' rules, i.e. replaces the iterator arguments and result by the
+    checking iterators.
+    
+    Signature:
+        function, tuple(function), function/None, str,
+            tuple(function), tuple(function/None, int, int/None)/None
+                -> function
+    
+    Version 0.0.1.0
+    """
+    
+    def wrapper(*args, **kwargs):
+        for fCheck in tupChecks:
+            fCheck(args, kwargs)
+        for fStream in tupStreams:
+            args = fStream(args, kwargs)
+        gResult = funcTarget(*args, **kwargs)
+        if fResult is not None:
+            tupFailure = fResult(gResult)
+            if tupFailure is not None:
+                _raiseFailure(tupFailure, 'result', strFunction, True)
+        if tupResultStream is not None:
+            gResult = _wrapStream(gResult, tupResultStream, 'result',
+                                                            strFunction, True)
+        return gResult
+    
+    return wrapper
+
+def _makeSampledWrapper(funcTarget, tupChecks, fResult, strFunction,
+                        objSite, fSample, tupStreams = (),
+                                                    tupResultStream = None):
+    """
+    Helper function to create the checking closure, which checks only the
+    calls selected by the sampler and updates the counters of the call site.
+    The violations found by the checking iterators are counted when the
+    offending elements are consumed.
+    
+    Signature:
+        function, tuple(function), function/None, str, _Site,
+            function(_Site -> bool)/, tuple(function),
+                tuple(function/None, int, int/None)/None/ -> function
+    
+    Version 0.0.1.0
+    """
+    
+    def wrapper(*args, **kwargs):
+        objSite.Calls += 1
+        if not fSample(objSite):
+            return funcTarget(*args, **kwargs)
+        objSite.Checks += 1
+        fStart = _timer()
+        try:
+            for fCheck in tupChecks:
+                fCheck(args, kwargs)
+            for fStream in tupStreams:
+                args = fStream(args, kwargs)
+        except _DC_ERRORS:
+            objSite.Violations += 1
+            objSite.CheckTime += _timer() - fStart
+            raise
+        fCheckTime = _timer() - fStart
+        gResult = funcTarget(*args, **kwargs)
+        if fResult is not None or tupResultStream is not None:
+            fStart = _timer()
+            try:
+                if fResult is not None:
+                    tupFailure = fResult(gResult)
+                    if tupFailure is not None:
+                        _raiseFailure(tupFailure, 'result', strFunction, True)
+                if tupResultStream is not None:
+                    gResult = _wrapStream(gResult, tupResultStream, 'result',
+                                                    strFunction, True, objSite)
+            except _DC_ERRORS:
+                objSite.Violations += 1
+                objSite.CheckTime += fCheckTime + _timer() - fStart
+                raise
+            fCheckTime += _timer() - fStart
+        objSite.CheckTime += fCheckTime
+        return gResult
+    
+    return wrapper
+
+#+ run-time switch
+
+def _isEnabled(strModule):
+    """
+    Helper function to obtain the effective state of the checks for a module:
+    the module's own state if it is set, or the global state otherwise.
+    
+    Signature:
+        str -> bool
+    
+    Version 0.0.1.0
+    """
+    return _SWITCHES.get(strModule, _SWITCHES[None])
+
+def _copyCallable(gCallable):
+    """
+    Helper function to create a distinct but equivalent copy of a function,
+    static / class method or property, which is bound instead of the checked
+    version when the checks are disabled. Thus the original object, which may
+    be also bound elsewhere, is never rebound by the switch.
+    
+    Signature:
+        function/staticmethod/classmethod/property
+            -> function/staticmethod/classmethod/property
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gCallable, (staticmethod, classmethod)):
+        return type(gCallable)(gCallable.__func__)
+    if isinstance(gCallable, property):
+        return property(gCallable.fget, gCallable.fset, gCallable.fdel,
+                                                        gCallable.__doc__)
+    funcCopy = types.FunctionType(gCallable.__code__, gCallable.__globals__,
+                        gCallable.__name__, gCallable.__defaults__,
+                        gCallable.__closure__)
+    funcCopy.__dict__.update(gCallable.__dict__)
+    funcCopy.__doc__ = gCallable.__doc__
+    funcCopy.__module__ = gCallable.__module__
+    return funcCopy
+
+def _register(gCallable, gChecked):
+    """
+    Helper function to register a controlled callable. Returns the checked
+    version if the checks are enabled for the module of its definition, and
+    a copy of the unchecked one otherwise.
+    
+    Signature:
+        function/staticmethod/classmethod/property,
+            function/staticmethod/classmethod/property
+                -> function/staticmethod/classmethod/property
+    
+    Version 0.0.1.0
+    """
+    strModule = _getFunction(gCallable).__module__
+    with _LOCK:
+        gOriginal = _copyCallable(gCallable)
+        if _isEnabled(strModule):
+            gReturned = gChecked
+        else:
+            gReturned = gOriginal
+        _REGISTRY.append(_Binding(strModule, gOriginal, gChecked, gReturned))
+    return gReturned
+
+def _swapValue(gValue, gFrom, gTo):
+    """
+    Helper function to create the replacement of a value bound in a
+    namespace, which is either the object to be replaced itself, or a static /
+    class method or property wrapping it. Returns None if the value is not
+    related to the object to be replaced.
+    
+    Signature:
+        type A, type B, type B -> type A/type B/None
+    
+    Version 0.0.1.0
+    """
+    if gValue is gFrom:
+        return gTo
+    if isinstance(gValue, (staticmethod, classmethod)):
+        if gValue.__func__ is gFrom:
+            return type(gValue)(gTo)
+    elif isinstance(gValue, property):
+        tupFunctions = (gValue.fget, gValue.fset, gValue.fdel)
+        if any(funcItem is gFrom for funcItem in tupFunctions):
+            return property(*([gTo if funcItem is gFrom else funcItem
+                                for funcItem in tupFunctions]
+                                                    + [gValue.__doc__]))
+    return None
+
+def _iterNamespaces(strModule):
+    """
+    Generator of the namespaces of a module: the module itself and all
+    classes (including the nested ones) defined in it.
+    
+    Signature:
+        str -> iterator(module/class)
+    
+    Version 0.0.1.0
+    """
+    objModule = sys.modules.get(strModule, None)
+    if objModule is None:
+        return
+    yield objModule
+    lstClasses = list(vars(objModule).values())
+    setVisited = set()
+    while lstClasses:
+        gItem = lstClasses.pop()
+        if (isinstance(gItem, _CLASS_TYPES) and not (id(gItem) in setVisited)
+                    and getattr(gItem, '__module__', None) == strModule):
+            setVisited.add(id(gItem))
+            yield gItem
+            lstClasses.extend(vars(gItem).values())
+
+def _resolve(lstBindings):
+    """
+    Helper function to find the namespaces and names, under which the
+    objects returned by the decorator are bound, for the not yet resolved
+    bindings of the same module.
+    
+    Signature:
+        list(_Binding) -> None
+    
+    Version 0.0.1.0
+    """
+    dictReturned = {}
+    for objBinding in lstBindings:
+        dictReturned.setdefault(id(objBinding.Returned), []).append(objBinding)
+    for objNamespace in _iterNamespaces(lstBindings[0].Module):
+        for strName, gValue in vars(objNamespace).items():
+            if isinstance(gValue, (staticmethod, classmethod)):
+                tupCandidates = (gValue, gValue.__func__)
+            elif isinstance(gValue, property):
+                tupCandidates = (gValue, gValue.fget, gValue.fset, gValue.fdel)
+            else:
+                tupCandidates = (gValue, )
+            for gItem in tupCandidates:
+                for objBinding in dictReturned.get(id(gItem), ()):
+                    if objBinding.Locations is None:
+                        objBinding.Locations = []
+                    objBinding.Locations.append((objNamespace, strName))
+
+def _setAttribute(objNamespace, strName, gValue):
+    """
+    Helper function to rebind a name in a module or class namespace,
+    bypassing the attribute assignment hooks of the meta-classes. The cached
+    attribute resolution of the DescriptedABC classes is invalidated, either
+    of the class itself or of its DescriptedABC subclasses, if the class is
+    a plain one (e.g. mix-in).
+    
+    Signature:
+        module/class, str, type A -> None
+    
+    Version 0.0.1.2
+    """
+    if isinstance(objNamespace, type):
+        type.__setattr__(objNamespace, strName, gValue)
+        _invalidateAttribute(objNamespace, strName)
+    else:
+        setattr(objNamespace, strName, gValue)
+
+def _switch(strModule, bEnable):
+    """
+    Helper function to change the state of the checks globally or for a
+    single module, and to rebind all affected registered callables. The
+    registry is processed as an atomic snapshot: all replacements are
+    computed first and applied afterwards while holding the lock.
+    
+    Signature:
+        str/None, bool -> int
+    
+    Version 0.0.1.0
+    """
+    if not (strModule is None or isinstance(strModule, basestring)):
+        raise CustomTypeError(strModule, str)
+    with _LOCK:
+        if strModule is None:
+            _SWITCHES.clear()
+        _SWITCHES[strModule] = bEnable
+        dictPending = {}
+        lstBindings = []
+        for objBinding in _REGISTRY:
+            if strModule is None or objBinding.Module == strModule:
+                lstBindings.append(objBinding)
+                if objBinding.Locations is None:
+                    dictPending.setdefault(objBinding.Module,
+                                                    []).append(objBinding)
+        for lstPending in dictPending.values():
+            _resolve(lstPending)
+        lstChanges = []
+        for objBinding in lstBindings:
+            if _isEnabled(objBinding.Module):
+                gFrom, gTo = objBinding.Original, objBinding.Checked
+            else:
+                gFrom, gTo = objBinding.Checked, objBinding.Original
+            for objNamespace, strName in objBinding.Locations or ():
+                gNew = _swapValue(vars(objNamespace).get(strName, None),
+                                                                gFrom, gTo)
+                if gNew is not None:
+                    lstChanges.append((objNamespace, strName, gNew))
+        for objNamespace, strName, gNew in lstChanges:
+            _setAttribute(objNamespace, strName, gNew)
+    return len(lstChanges)
+
+#+ batch validation
+
+def _describeFailure(tupFailure, strTarget):
+    """
+    Helper function to convert a failure description into the compact pair of
+    the violated rule and the (truncated) representation of the value.
+    
+    Signature:
+        tuple(bool, type A, type B, str), str -> tuple(str, str)
+    
+    Version 0.0.1.0
+    """
+    bType, gValue, gExpected, strPath = tupFailure
+    if bType:
+        strRule = '{}{}: type {}'.format(strTarget, strPath,
+                                                        gExpected.__name__)
+    else:
+        strRule = '{}{}: {}'.format(strTarget, strPath, gExpected)
+    strValue = repr(gValue)
+    if len(strValue) > _REPR_SIZE:
+        strValue = strValue[:_REPR_SIZE - 3] + '...'
+    return strRule, strValue
+
+def _validateRecords(objContract, tupFields, iStart, seqRecords):
+    """
+    Helper function to validate the records and to collect the violations
+    with the records indexes counted from the given start.
+    
+    Signature:
+        Contract, tuple(str)/None, int, iterable(dict/tuple)
+            -> list(tuple(int, str, str))
+    
+    Version 0.0.1.0
+    """
+    lstResult = []
+    for iIndex, gRecord in enumerate(seqRecords, iStart):
+        for strRule, strValue in objContract.checkRecord(gRecord, tupFields):
+            lstResult.append((iIndex, strRule, strValue))
+    return lstResult
+
+def _initBatch(objContract, tupFields):
+    """
+    Helper function to initialize a worker process of the batch validation.
+    
+    Signature:
+        Contract, tuple(str)/None -> None
+    
+    Version 0.0.1.0
+    """
+    global _BATCH
+    _BATCH = (objContract, tupFields)
+
+def _validateChunk(tupChunk):
+    """
+    Helper function to validate a chunk of records in a worker process.
+    
+    Signature:
+        tuple(int, list(dict/tuple)) -> list(tuple(int, str, str))
+    
+    Version 0.0.1.0
+    """
+    objContract, tupFields = _BATCH
+    return _validateRecords(objContract, tupFields, tupChunk[0], tupChunk[1])
+
+def _iterChunks(seqRecords, iChunk):
+    """
+    Helper generator to split the records into the chunks paired with the
+    index of the first record.
+    
+    Signature:
+        iterable(dict/tuple), int -> iterator(tuple(int, list(dict/tuple)))
+    
+    Version 0.0.1.0
+    """
+    objRecords = iter(seqRecords)
+    iStart = 0
+    while True:
+        lstChunk = list(itertools.islice(objRecords, iChunk))
+        if not lstChunk:
+            break
+        yield iStart, lstChunk
+        iStart += len(lstChunk)
+
+#+ public API
+
+def applyContract(gTable, strName = None, objSampling = None):
+    """
+    Parametric decorator to put a function, static method, class method,
+    property or instance method under the Design by Contract control. The
+    contract is looked up in the table by the name of the decorated function
+    (or the explicitly passed name) and compiled immediately.
+    
+    Can be applied directly to a function (also inside staticmethod(),
+    classmethod() or property() decorators) or to a static / class method or
+    property object. In the case of a property the getter is checked only for
+    the 'Returns' rule, the setter - for the arguments rules and that it
+    returns None.
+    
+    With a sampling policy only the selected calls are checked, and each
+    decorated function (call site) keeps its counters, see getContractStats().
+    
+    Signature:
+        dict(str -> dict)/ContractTable/, str, SamplingPolicy/ -> function
+    
+    Args:
+        gTable: dictionary or ContractTable, the look-up table of contracts
+        strName: (optional) string, name of the contract to use instead of the
+            name of the decorated function
+        objSampling: (optional) SamplingPolicy, the calls to be checked
+    
+    Returns:
+        function: the decorator
+    
+    Raises:
+        pos.exceptions.CustomTypeError: the table is not a dictionary or a
+            ContractTable instance, or the name is not a string, or the
+            sampling policy is not a SamplingPolicy instance or None; or the
+            decorated object is not a function, static / class method or
+            property
+        pos.exceptions.NotInDCError: the contract is not found in the table
+        pos.exceptions.CustomValueError: the contract refers to the parameters
+            not present in the signature of the decorated function
+    
+    Example:
+        DBC = {'divide' : {'Args' : {'b' : {'Type' : int, 'NE' : 0}}}}
+        
+        @applyContract(DBC)
+        def divide(a, b):
+            return a / b
+    
+    Version 0.0.1.0
+    """
+    if not isinstance(gTable, (dict, ContractTable)):
+        raise CustomTypeError(gTable, dict)
+    if not (strName is None or isinstance(strName, basestring)):
+        raise CustomTypeError(strName, str)
+    if not (objSampling is None or isinstance(objSampling, SamplingPolicy)):
+        raise CustomTypeError(objSampling, SamplingPolicy)
+    
+    def decorator(gCallable):
+        """
+        Closure of applyContract() decorator. Compiles the contract and binds
+        it to the decorated object.
+        
+        Version 0.0.1.0
+        """
+        if strName is None:
+            strContract = _getFunction(gCallable).__name__
+        else:
+            strContract = strName
+        if isinstance(gTable, ContractTable):
+            objContract = gTable.getContract(strContract)
+        elif strContract in gTable:
+            objContract = Contract(gTable[strContract], strContract)
+        else:
+            raise NotInDCError(strContract)
+        return _register(gCallable, objContract.bind(gCallable, objSampling))
+    
+    return decorator
+
+def enableContracts(strModule = None):
+    """
+    Enables the Design by Contract checks globally or for a single module by
+    rebinding the registered functions, methods, properties and class methods
+    to their checked versions. The global switch also resets the states of
+    all modules.
+    
+    Signature:
+        /str/ -> int
+    
+    Args:
+        strModule: (optional) string, the full name of a module
+    
+    Returns:
+        int: number of the rebound attributes
+    
+    Raises:
+        pos.exceptions.CustomTypeError: the name is not a string or None
+    
+    Version 0.0.1.0
+    """
+    return _switch(strModule, True)
+
+def disableContracts(strModule = None):
+    """
+    Disables the Design by Contract checks globally or for a single module by
+    rebinding the registered functions, methods, properties and class methods
+    to the unchecked callables, so the calls cost exactly as much as the calls
+    of the undecorated functions. The functions decorated while the checks
+    are disabled are bound unchecked from the start. Only the names bound in
+    the module of the definition or in its classes are rebound, the references
+    imported into other modules are not affected.
+    
+    Signature:
+        /str/ -> int
+    
+    Args:
+        strModule: (optional) string, the full name of a module
+    
+    Returns:
+        int: number of the rebound attributes
+    
+    Raises:
+        pos.exceptions.CustomTypeError: the name is not a string or None
+    
+    Version 0.0.1.0
+    """
+    return _switch(strModule, False)
+
+def areContractsEnabled(strModule = None):
+    """
+    Checks if the Design by Contract checks are enabled globally or for a
+    single module.
+    
+    Signature:
+        /str/ -> bool
+    
+    Version 0.0.1.0
+    """
+    with _LOCK:
+        return _isEnabled(strModule)
+
+def getContractStats(strModule = None):
+    """
+    Reports the counters of the controlled functions with a sampling policy,
+    globally or for a single module. The counters of the functions / methods
+    with the same name within a module (e.g. property getter and setter or
+    methods of different classes) are summed.
+    
+    Signature:
+        /str/ -> dict(str -> dict(str -> int/float))
+    
+    Args:
+        strModule: (optional) string, the full name of a module
+    
+    Returns:
+        dict(str -> dict(str -> int/float)): 'module.function' name -> counters
+            'Calls', 'Checks' (checked calls), 'Violations' and the effective
+            sampling 'Rate' (checked calls / calls)
+    
+    Version 0.0.1.0
+    """
+    dictResult = {}
+    with _LOCK:
+        tupSites = tuple(_SITES)
+    for objSite in tupSites:
+        if strModule is None or objSite.Module == strModule:
+            dictStats = dictResult.setdefault('{}.{}'.format(objSite.Module,
+                        objSite.Name), {'Calls' : 0, 'Checks' : 0,
+                                                            'Violations' : 0})
+            dictStats['Calls'] += objSite.Calls
+            dictStats['Checks'] += objSite.Checks
+            dictStats['Violations'] += objSite.Violations
+    for dictStats in dictResult.values():
+        if dictStats['Calls']:
+            dictStats['Rate'] = float(dictStats['Checks']) / dictStats['Calls']
+        else:
+            dictStats['Rate'] = 0.0
+    return dictResult
+
+def resetContractStats(strModule = None):
+    """
+    Resets the counters of the controlled functions with a sampling policy,
+    globally or for a single module.
+    
+    Signature:
+        /str/ -> None
+    
+    Args:
+        strModule: (optional) string, the full name of a module
+    
+    Version 0.0.1.0
+    """
+    with _LOCK:
+        for objSite in _SITES:
+            if strModule is None or objSite.Module == strModule:
+                objSite.reset()
+
+def clearTypeCaches():
+    """
+    Clears the caches of the verdicts of the type checks against the classes
+    with the custom meta-classes (e.g. ABCs). The caches are cleared
+    automatically when a virtual subclass is registered with any ABC; this
+    function is required only if the outcome of a custom __instancecheck__(),
+    __subclasscheck__() or __subclasshook__() has changed otherwise.
+    
+    Signature:
+        None -> None
+    
+    Version 0.0.1.0
+    """
+    with _LOCK:
+        for dictCache in _TYPE_CACHES:
+            dictCache.clear()
+
+def validateBatch(gContract, seqRecords, iWorkers = 1, iChunk = 1000,
+                                                            seqFields = None):
+    """
+    Applies the rules on the arguments of a contract to the records of the
+    argument values (see Contract.checkRecord()) and collects the violations
+    instead of raising the exceptions. With more than one worker the chunks of
+    the records are validated by a pool of processes, to which the contract is
+    passed by pickling, i.e. all classes and values used in its rules must be
+    picklable. The contract can be passed as a Contract instance or as a
+    controlled function, in which case the names of its parameters are the
+    default field names of the tuple records.
+    
+    Signature:
+        Contract/function, iterable(dict/tuple)/, int, int, seq(str)/
+            -> list(tuple(int, str, str))
+    
+    Args:
+        gContract: Contract or controlled function, the contract to apply
+        seqRecords: iterable(dict/tuple), the records
+        iWorkers: (optional) int > 0, the number of the processes, 1 - the
+            records are validated in the current process
+        iChunk: (optional) int > 0, the number of the records per task
+        seqFields: (optional) seq(str), the field names of the tuple records
+    
+    Returns:
+        list(tuple(int, str, str)): the violations as the index of the record,
+            the violated rule (including the argument name) and the truncated
+            representation of the offending value, sorted by the index
+    
+    Raises:
+        pos.exceptions.CustomTypeError: not a contract or a controlled
+            function, or not integer number of the workers or of the records
+            per task, or the field names are not a sequence of strings
+        pos.exceptions.CustomValueError: not positive number of the workers
+            or of the records per task
+    
+    Version 0.0.1.0
+    """
+    if isinstance(gContract, Contract):
+        objContract = gContract
+        tupFields = None
+    elif isinstance(getattr(gContract, 'Contract', None), Contract):
+        objContract = gContract.Contract
+        tupFields = tuple(inspect.getargspec(gContract.__wrapped__).args)
+    else:
+        raise CustomTypeError(gContract, Contract)
+    for gValue in (iWorkers, iChunk):
+        if not isinstance(gValue, (int, long)) or isinstance(gValue, bool):
+            raise CustomTypeError(gValue, int)
+        if gValue < 1:
+            raise CustomValueError(gValue, '> 0')
+    if seqFields is not None:
+        if isinstance(seqFields, basestring) or not isinstance(seqFields,
+                                                        (list, tuple)):
+            raise CustomTypeError(seqFields, tuple)
+        for strField in seqFields:
+            if not isinstance(strField, basestring):
+                raise CustomTypeError(strField, str)
+        tupFields = tuple(seqFields)
+    if iWorkers == 1:
+        return _validateRecords(objContract, tupFields, 0, seqRecords)
+    objPool = multiprocessing.Pool(iWorkers, _initBatch,
+                                                    (objContract, tupFields))
+    try:
+        lstResult = []
+        for lstViolations in objPool.imap(_validateChunk,
+                                            _iterChunks(seqRecords, iChunk)):
+            lstResult.extend(lstViolations)
+        objPool.close()
+    finally:
+        objPool.terminate()
+        objPool.join()
+    return lstResult